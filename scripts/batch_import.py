@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""Batch import SBML/KGML files into .shy models.
+
+Thin wrapper around shypn.importer.batch (see there for the API).
+
+Usage:
+    python3 scripts/batch_import.py data/biomodels_test -o workspace/models/biomodels
+    python3 scripts/batch_import.py pathways/ -o models/ -j 8 --offline --report report.json
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from shypn.importer.batch import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""Parameter sweeps and sensitivity analysis of a .shy model.
+
+Thin wrapper around shypn.analyses.parameter_sweep (see there for the API).
+
+Usage:
+    python3 scripts/parameter_sweep.py model.shy -p T1.vmax=1:100 -p T1.km=0.5,5 --lhs 100 -o sweep.npz
+    python3 scripts/parameter_sweep.py model.shy -p T1.vmax -p T1.km --sensitivity -o sensitivity.csv
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from shypn.analyses.parameter_sweep import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -92,7 +92,7 @@ def test_persistent_cache():
     print("="*70)
     
     # Create cache with custom location
-    cache_file = Path.home() / ".shypn" / "kegg_ec_cache_test.json"
+    cache_file = Path.home() / ".shypn" / "kegg_ec_cache_test.db"
     cache_file.unlink(missing_ok=True)  # Delete old test cache
     
     print(f"\nCache file: {cache_file}")
@@ -143,7 +143,7 @@ def test_integration_with_fetcher():
     print("="*70)
     
     # Clear default cache
-    cache_file = Path.home() / ".shypn" / "kegg_ec_cache.json"
+    cache_file = Path.home() / ".shypn" / "kegg_ec_cache.db"
     if cache_file.exists():
         print(f"\nFound existing cache: {cache_file}")
         cache = PersistentECCache(cache_file=cache_file)
@@ -178,7 +178,7 @@ def test_cache_cleanup():
     print("TEST 4: Cache Cleanup")
     print("="*70)
     
-    cache_file = Path.home() / ".shypn" / "kegg_ec_cache_cleanup_test.json"
+    cache_file = Path.home() / ".shypn" / "kegg_ec_cache_cleanup_test.db"
     cache_file.unlink(missing_ok=True)
     
     cache = PersistentECCache(cache_file=cache_file, ttl_days=0)  # Expire immediately
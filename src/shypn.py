@@ -18,6 +18,17 @@ import logging
 REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
 UI_PATH = os.path.join(REPO_ROOT, 'ui', 'main', 'main_window.ui')
 
+# Import-time profiling: `--profile-imports` or SHYPN_PROFILE_IMPORTS=1 times
+# every import from here until the main window is up, then prints the
+# slowest modules (same layout as `python -X importtime`)
+PROFILE_IMPORTS = '--profile-imports' in sys.argv or os.environ.get('SHYPN_PROFILE_IMPORTS', '0') == '1'
+if '--profile-imports' in sys.argv:
+	sys.argv.remove('--profile-imports')  # Not a Gtk.Application option
+import_profiler = None
+if PROFILE_IMPORTS:
+	from shypn.utils.lazy_loading import ImportProfiler
+	import_profiler = ImportProfiler().install()
+
 try:
 	import gi
 	gi.require_version('Gtk', '3.0')
@@ -65,12 +76,12 @@ try:
 	else:
 		from shypn.helpers.left_panel_loader import create_left_panel
 	from shypn.helpers.right_panel_loader import create_right_panel
-	from shypn.helpers.pathway_panel_loader import create_pathway_panel
-	from shypn.helpers.topology_panel_loader import TopologyPanelLoader
-	from shypn.helpers.viability_panel_loader import ViabilityPanelLoader
 	from shypn.helpers.model_canvas_loader import create_model_canvas
 	from shypn.file import create_persistency_manager
 	from shypn.ui import MasterPalette
+	from shypn.utils.lazy_loading import PanelRegistry
+	# Pathways and Topology panel loaders are imported by their factories
+	# in main(): they pull in libsbml, the crossfetch stack, networkx and scipy
 except ImportError as e:
 	logging.getLogger(__name__).error('Cannot import loaders: %s', e)
 	sys.exit(1)
@@ -317,8 +328,17 @@ def main(argv=None):
 			print(f'ERROR: Failed to load right panel: {e}', file=sys.stderr)
 			sys.exit(5)
 		
-		# Load topology panel FIRST (needed by pathway panel wiring)
-		try:
+		# ====================================================================
+		# Lazily built panels: registered by name, built on first show
+		# Pathways and Topology pull in the import/enrichment stack (libsbml,
+		# crossfetch) and networkx/scipy, so they are kept off the startup path
+		# ====================================================================
+		panels = PanelRegistry()
+		
+		def create_topology_panel():
+			"""Build the Topology panel and wire it to model lifecycle events."""
+			from shypn.helpers.topology_panel_loader import TopologyPanelLoader
+			
 			# Topology panel doesn't need model at init - will get it at analysis time
 			topology_panel_loader = TopologyPanelLoader(model=None)
 			
@@ -331,11 +351,6 @@ def main(argv=None):
 				# Use the proper method to set model_canvas_loader
 				topology_panel_loader.set_model_canvas_loader(model_canvas_loader)
 				
-				# ===================================================================
-				# WIRE TOPOLOGY PANEL TO MODEL LIFECYCLE EVENTS
-				# This ensures cache is invalidated when models change/switch
-				# ===================================================================
-				
 				# Event 1: Tab Switching (user creates multiple models and switches)
 				# Connect to notebook's page-changed signal
 				def on_canvas_tab_switched(notebook, page, page_num):
@@ -346,10 +361,9 @@ def main(argv=None):
 				
 				if model_canvas_loader.notebook:
 					model_canvas_loader.notebook.connect('switch-page', on_canvas_tab_switched)
-				
+			
 			# Event 2: File Operations (user opens .shy file)
 			# Wire to file explorer's open callback
-			# Store the original handler before any wrapping
 			topology_original_on_file_open = getattr(file_explorer, 'on_file_open_requested', None) if file_explorer else None
 			
 			if file_explorer and topology_original_on_file_open:
@@ -363,99 +377,62 @@ def main(argv=None):
 					if drawing_area and topology_panel_loader.controller:
 						topology_panel_loader.controller.on_file_opened(drawing_area)
 				
-				file_explorer.on_file_open_requested = on_file_open_with_topology_notify				# Event 3: Pathway Import (KEGG/SBML import)
-				# Will be wired after pathway_panel_loader is created (see below)
-				
-		except Exception as e:
-			logging.getLogger(__name__).warning('Failed to load topology panel: %s', e)
-			topology_panel_loader = None
+				file_explorer.on_file_open_requested = on_file_open_with_topology_notify
+			
+			# Documents created before this point have Report and Viability
+			# panels without a topology source; connect them now
+			for overlay_manager in list(model_canvas_loader.overlay_managers.values()):
+				report_loader = getattr(overlay_manager, 'report_panel_loader', None)
+				if report_loader and getattr(report_loader, 'panel', None):
+					report_loader.panel.set_topology_panel(topology_panel_loader.panel)
+				viability_loader = getattr(overlay_manager, 'viability_panel_loader', None)
+				viability_panel = getattr(viability_loader, 'panel', None) if viability_loader else None
+				if viability_panel and hasattr(viability_panel, 'set_topology_panel'):
+					viability_panel.set_topology_panel(topology_panel_loader.panel)
+			
+			# Event 3: Pathway Import (KEGG/SBML import)
+			# DISABLED: Topology notification can trigger expensive calculations
+			return topology_panel_loader
 		
-		# Load pathway panel via its loader
-		try:
-			pathway_panel_loader = create_pathway_panel(
+		def create_pathway_panel():
+			"""Build the Pathways panel and wire it to the canvas and file panel."""
+			from shypn.helpers.pathway_panel_loader import create_pathway_panel as load_pathway_panel
+			
+			pathway_panel_loader = load_pathway_panel(
 				model_canvas=model_canvas_loader,
 				workspace_settings=workspace_settings
 			)
-
+			
 			# Store on canvas loader so it can keep it in sync on tab switches
-			try:
-				model_canvas_loader.pathway_panel_loader = pathway_panel_loader
-			except Exception:
-				pass
+			model_canvas_loader.pathway_panel_loader = pathway_panel_loader
 			
 			# WAYLAND FIX: Set parent window for SBML Import panel immediately
 			# This ensures FileChooserDialog has valid parent before panel is attached
-			if pathway_panel_loader and hasattr(pathway_panel_loader, 'sbml_import_controller'):
+			if hasattr(pathway_panel_loader, 'sbml_import_controller'):
 				if pathway_panel_loader.sbml_import_controller:
 					pathway_panel_loader.sbml_import_controller.set_parent_window(window)
 			
-			# Wire topology panel to pathway import events (if both panels loaded)
-			if topology_panel_loader and topology_panel_loader.controller and pathway_panel_loader:
-				# KEGG Import: Wrap import completion callback to notify topology
-				# DISABLED: Topology notification can trigger expensive calculations
-				pass
-				# if hasattr(pathway_panel_loader, 'kegg_import_controller') and pathway_panel_loader.kegg_import_controller:
-				# 	kegg_ctrl = pathway_panel_loader.kegg_import_controller
-				# 	original_kegg_complete = kegg_ctrl._on_import_complete
-				# 	
-				# 	def kegg_import_with_topology_notify(document_model):
-				# 		"""Wrapper for KEGG import completion that notifies topology panel."""
-				# 		# Run original completion handler
-				# 		result = original_kegg_complete(document_model)
-				# 		
-				# 		# Notify topology that model was imported (with error handling)
-				# 		try:
-				# 			drawing_area = model_canvas_loader.get_current_document()
-				# 			if drawing_area and topology_panel_loader and topology_panel_loader.controller:
-				# 				topology_panel_loader.controller.on_pathway_imported(drawing_area)
-				# 		except Exception as e:
-				# 			print(f"[KEGG] Warning: Failed to notify topology panel: {e}", file=sys.stderr)
-				# 			import traceback
-				# 			traceback.print_exc()
-				# 		
-				# 		return result
-				# 	
-				# 	kegg_ctrl._on_import_complete = kegg_import_with_topology_notify
-				
-				# SBML Import: Wrap load completion callback to notify topology
-				# DISABLED: Topology notification can trigger expensive calculations
-				# if hasattr(pathway_panel_loader, 'sbml_import_controller') and pathway_panel_loader.sbml_import_controller:
-				# 	sbml_ctrl = pathway_panel_loader.sbml_import_controller
-				# 	original_sbml_complete = sbml_ctrl._on_load_complete
-				# 	
-				# 	def sbml_load_with_topology_notify(document_model, pathway_name):
-				# 		"""Wrapper for SBML load completion that notifies topology panel."""
-				# 		# Run original completion handler
-				# 		result = original_sbml_complete(document_model, pathway_name)
-				# 		
-				# 		# Notify topology that model was imported (with error handling)
-				# 		try:
-				# 			drawing_area = model_canvas_loader.get_current_document()
-				# 			if drawing_area and topology_panel_loader and topology_panel_loader.controller:
-				# 				topology_panel_loader.controller.on_pathway_imported(drawing_area)
-				# 		except Exception as e:
-				# 			print(f"[SBML] Warning: Failed to notify topology panel: {e}", file=sys.stderr)
-				# 			import traceback
-				# 			traceback.print_exc()
-				# 		
-				# 		return result
-				# 	
-				# 	sbml_ctrl._on_load_complete = sbml_load_with_topology_notify
-				
-		except Exception as e:
-			logging.getLogger(__name__).warning('Failed to load pathway panel: %s', e)
-			pathway_panel_loader = None
-			topology_panel_loader = None
+			# Wire pathway panel loader to file panel for project synchronization
+			# This ensures pathway import controllers get updated when project is opened
+			if left_panel_loader and hasattr(left_panel_loader, 'set_pathway_panel_loader'):
+				left_panel_loader.set_pathway_panel_loader(pathway_panel_loader)
+				# Catch up with a project opened before the panel was built
+				project = getattr(left_panel_loader, 'project', None)
+				if project:
+					pathway_panel_loader.set_project(project)
+			
+			# Ensure Pathway Operations panel resolves the current manager
+			pathway_panel_loader.set_model_canvas(model_canvas_loader)
+			return pathway_panel_loader
 		
+		panels.register('topology', create_topology_panel)
+		panels.register('pathways', create_pathway_panel)
+		
+
 		# NOTE: Viability panel is now ONLY created per-document in model_canvas_loader.py
 		# No global viability panel loader - this matches Report panel architecture
 		# Each document gets its own ViabilityPanel instance with independent state
 		
-		# Wire pathway panel loader to file panel for project synchronization
-		# This ensures pathway import controllers get updated when project is opened
-		if pathway_panel_loader and left_panel_loader:
-			left_panel_loader.set_pathway_panel_loader(pathway_panel_loader)
-		
 		# Wire model canvas loader to file panel for project synchronization
 		# This ensures all canvas managers save to correct project directories
 		if model_canvas_loader and left_panel_loader:
@@ -489,16 +466,12 @@ def main(argv=None):
 			model_canvas_loader.set_context_menu_handler(right_panel_loader.context_menu_handler)
 			
 			# Wire pathway operations panel to context menu handler for BRENDA enrichment
-			if pathway_panel_loader and hasattr(pathway_panel_loader, 'panel'):
-				right_panel_loader.context_menu_handler.set_pathway_operations_panel(pathway_panel_loader.panel)
-
-		# Ensure Pathway Operations panel re-resolves the current manager
-		# after all canvas wiring is complete (startup default tab)
-		try:
-			if pathway_panel_loader:
-				pathway_panel_loader.set_model_canvas(model_canvas_loader)
-		except Exception:
-			pass
+			# (the Pathways panel is built when an enrichment item is first used)
+			def get_pathway_operations_panel():
+				pathway_panel_loader = panels.get('pathways')
+				return getattr(pathway_panel_loader, 'panel', None)
+			
+			right_panel_loader.context_menu_handler.set_pathway_operations_provider(get_pathway_operations_panel)
 		
 		# Wire file explorer panel to canvas loader
 		# This allows keyboard shortcuts (Ctrl+S, Ctrl+Shift+S) to trigger save operations
@@ -635,17 +608,17 @@ def main(argv=None):
 		if left_panel_loader:
 			left_panel_loader.add_to_stack(left_dock_stack, files_panel_container, 'files')
 		
-		# Add Pathways panel to stack
-		if pathway_panel_loader:
-			pathway_panel_loader.add_to_stack(left_dock_stack, pathways_panel_container, 'pathways')
+		# Add Pathways panel to stack once it is built
+		panels.on_built('pathways', lambda loader: loader.add_to_stack(
+			left_dock_stack, pathways_panel_container, 'pathways'))
 		
 		# Add Analyses panel to stack
 		if right_panel_loader:
 			right_panel_loader.add_to_stack(left_dock_stack, analyses_panel_container, 'analyses')
 		
-		# Add Topology panel to stack
-		if topology_panel_loader:
-			topology_panel_loader.add_to_stack(left_dock_stack, topology_panel_container, 'topology')
+		# Add Topology panel to stack once it is built
+		panels.on_built('topology', lambda loader: loader.add_to_stack(
+			left_dock_stack, topology_panel_container, 'topology'))
 		
 		# Add Viability panel container to stack
 		# NOTE: Per-document ViabilityPanel instances will be swapped in/out of this container
@@ -678,9 +651,7 @@ def main(argv=None):
 					any_docked = True
 				elif right_panel_loader and right_panel_loader.is_hanged:
 					any_docked = True
-				elif pathway_panel_loader and pathway_panel_loader.is_hanged:
-					any_docked = True
-				elif topology_panel_loader and topology_panel_loader.is_hanged:
+				elif any(loader.is_hanged for loader in panels.built().values()):
 					any_docked = True
 				# Only collapse if NO panels remain docked
 				if not any_docked and left_paned:
@@ -885,11 +856,8 @@ def main(argv=None):
 		if right_panel_loader:
 			right_panel_loader.parent_window = window
 		
-		if pathway_panel_loader:
-			pathway_panel_loader.parent_window = window
-		
-		if topology_panel_loader:
-			topology_panel_loader.parent_window = window
+		for name in ('pathways', 'topology'):
+			panels.on_built(name, lambda loader: setattr(loader, 'parent_window', window))
 		
 		# Store main window reference in model_canvas_loader for per-document Report panels
 		if model_canvas_loader:
@@ -979,6 +947,7 @@ def main(argv=None):
 			EXCLUSIVE MODE: Only one panel active at a time.
 			When button is activated, deactivate others.
 			"""
+			pathway_panel_loader = panels.get('pathways') if is_active else panels.peek('pathways')
 			if not pathway_panel_loader:
 				return
 			
@@ -1015,7 +984,10 @@ def main(argv=None):
 			EXCLUSIVE MODE: Only one panel active at a time.
 			When button is activated, deactivate others.
 			"""
+			topology_panel_loader = panels.get('topology') if is_active else panels.peek('topology')
 			if not topology_panel_loader:
+				if panels.is_built('topology'):
+					master_palette.set_sensitive('topology', False)
 				return
 			
 			if is_active:
@@ -1304,9 +1276,7 @@ def main(argv=None):
 				any_docked = True
 			elif right_panel_loader and right_panel_loader.is_hanged:
 				any_docked = True
-			elif pathway_panel_loader and pathway_panel_loader.is_hanged:
-				any_docked = True
-			elif topology_panel_loader and topology_panel_loader.is_hanged:
+			elif any(loader.is_hanged for loader in panels.built().values()):
 				any_docked = True
 			# Only collapse if NO panels remain docked
 			if not any_docked and left_paned:
@@ -1330,12 +1300,14 @@ def main(argv=None):
 		left_panel_loader.on_attach_callback = on_left_attach
 		right_panel_loader.on_float_callback = on_right_float
 		right_panel_loader.on_attach_callback = on_right_attach
-		if pathway_panel_loader:
-			pathway_panel_loader.on_float_callback = on_pathway_float
-			pathway_panel_loader.on_attach_callback = on_pathway_attach
-		if topology_panel_loader:
-			topology_panel_loader.on_float_callback = on_topology_float
-			topology_panel_loader.on_attach_callback = on_topology_attach
+		def wire_float_callbacks(on_float, on_attach):
+			def wire(loader):
+				loader.on_float_callback = on_float
+				loader.on_attach_callback = on_attach
+			return wire
+		
+		panels.on_built('pathways', wire_float_callbacks(on_pathway_float, on_pathway_attach))
+		panels.on_built('topology', wire_float_callbacks(on_topology_float, on_topology_attach))
 
 		# Expose viability callbacks to model_canvas_loader so per-document
 		# ViabilityPanelLoader instances can wire them on creation
@@ -1353,8 +1325,9 @@ def main(argv=None):
 		master_palette.connect('viability', on_viability_toggle)
 		master_palette.connect('report', on_report_toggle)
 		
-		# Enable topology button if panel loaded successfully
-		if topology_panel_loader:
+		# Enable topology button (panel is built on first show; the button is
+		# disabled again if it fails to load)
+		if 'topology' in panels:
 			master_palette.set_sensitive('topology', True)
 			# Update tooltip to remove "Coming Soon"
 			if 'topology' in master_palette.buttons:
@@ -1459,6 +1432,14 @@ def main(argv=None):
 			return False  # Allow window to close
 		
 		window.connect('delete-event', on_window_delete)
+		
+		# Startup import report, once the main loop is idle (window drawn)
+		if import_profiler:
+			def report_startup_imports():
+				import_profiler.uninstall()
+				print(import_profiler.report(limit=40), file=sys.stderr)
+				return False  # Don't repeat
+			GLib.idle_add(report_startup_imports)
 
 		# Window already presented earlier (before toggle handlers)
 		# This was moved up to fix Wayland initialization timing
@@ -5,6 +5,8 @@ including rate-based plotting of place token dynamics and transition firing rate
 
 Modules:
     data_collector: Collects raw simulation data for analysis
+    firing_log: Struct-of-arrays log of transition firing events
+    parameter_sweep: Headless parameter sweeps and sensitivity analysis (API and CLI)
     rate_calculator: Calculates rates (token flow, firing frequency) from raw data
     plot_panel: Base class for matplotlib-based plotting panels
     place_rate_panel: Place token rate plotting
@@ -15,6 +17,7 @@ Modules:
 
 __all__ = [
     'SimulationDataCollector',
+    'FiringLog',
     'RateCalculator',
     'AnalysisPlotPanel',
     'PlaceRatePanel',
@@ -28,6 +31,9 @@ def __getattr__(name):
     if name == 'SimulationDataCollector':
         from .data_collector import SimulationDataCollector
         return SimulationDataCollector
+    elif name == 'FiringLog':
+        from .firing_log import FiringLog
+        return FiringLog
     elif name == 'RateCalculator':
         from .rate_calculator import RateCalculator
         return RateCalculator
@@ -46,7 +46,8 @@ class ContextMenuHandler:
         self.place_panel = place_panel
         self.transition_panel = transition_panel
         self.diagnostics_panel = diagnostics_panel
-        self.pathway_operations_panel = pathway_operations_panel
+        self._pathway_operations_panel = pathway_operations_panel
+        self._pathway_operations_provider = None  # Builds the panel on first use
         self.viability_panel = viability_panel  # DEPRECATED: kept for backward compatibility
         self.model_canvas_loader = model_canvas_loader  # For per-document viability panels
         self.model = model
@@ -75,7 +76,30 @@ class ContextMenuHandler:
         Args:
             pathway_operations_panel: PathwayOperationsPanel instance
         """
-        self.pathway_operations_panel = pathway_operations_panel
+        self._pathway_operations_panel = pathway_operations_panel
+    
+    def set_pathway_operations_provider(self, provider):
+        """Set a callable returning the pathway operations panel.
+        
+        Used when the Pathways panel is built on first show: the enrichment
+        menu items are offered right away and the panel is built when one
+        of them is activated.
+        
+        Args:
+            provider: Zero-argument callable returning a PathwayOperationsPanel (or None)
+        """
+        self._pathway_operations_provider = provider
+    
+    @property
+    def pathway_operations_panel(self):
+        """PathwayOperationsPanel for enrichment, built via the provider if needed."""
+        if self._pathway_operations_panel is None and self._pathway_operations_provider:
+            self._pathway_operations_panel = self._pathway_operations_provider()
+        return self._pathway_operations_panel
+    
+    @pathway_operations_panel.setter
+    def pathway_operations_panel(self, panel):
+        self._pathway_operations_panel = panel
     
     def set_viability_panel(self, viability_panel):
         """Set or update the viability panel for model viability analysis.
@@ -192,7 +216,9 @@ class ContextMenuHandler:
             menu.append(menu_item)
         
         # Add BRENDA enrichment option for transitions
-        if isinstance(obj, Transition) and self.pathway_operations_panel:
+        has_pathway_operations = (self._pathway_operations_panel is not None or
+                                  self._pathway_operations_provider is not None)
+        if isinstance(obj, Transition) and has_pathway_operations:
             self._add_brenda_enrichment_menu(menu, obj)
             self._add_sabio_rk_enrichment_menu(menu, obj)
         
@@ -5,13 +5,64 @@ from Petri net simulations for subsequent rate analysis and plotting.
 
 Data collected:
     - Place token counts at each simulation step
-    - Transition firing events (timestamp, event type)
+    - Transition firing events (timestamp, kind, rate, token deltas)
 
-The data is stored in memory-efficient structures optimized for rate calculations.
+Firing events are kept in a struct-of-arrays FiringLog rather than one tuple
+per event, so continuous transitions (one event per step) are never downsampled.
 """
+from bisect import bisect_left
 from collections import defaultdict
+from collections.abc import Mapping, Sequence
 from typing import Dict, List, Tuple, Optional, Any
 
+import numpy as np
+
+from shypn.analyses.decimation import m4_indices
+from shypn.analyses.firing_log import FiringLog
+from shypn.analyses.online_stats import RunningStats, SlidingWindow
+
+
+class FiringEventSequence(Sequence):
+    """Read-only ``(time, 'fired', details)`` view of one transition's events.
+
+    Kept for callers written against the old tuple lists; tuples are built
+    on access. New code should use the FiringLog arrays directly.
+    """
+
+    def __init__(self, log: FiringLog, transition_id: Any):
+        self._log = log
+        self._transition_id = transition_id
+
+    def __len__(self):
+        return self._log.count(self._transition_id)
+
+    def __getitem__(self, item):
+        rows = self._log.rows(self._transition_id)
+        if isinstance(item, slice):
+            return [self._event(int(row)) for row in rows[item]]
+        return self._event(int(rows[item]))
+
+    def _event(self, row: int) -> Tuple[float, str, Any]:
+        return (float(self._log.times[row]), 'fired', self._log.details(row))
+
+
+class _TransitionDataView(Mapping):
+    """Mapping of transition_id to FiringEventSequence over a FiringLog."""
+
+    def __init__(self, log: FiringLog):
+        self._log = log
+
+    def __getitem__(self, transition_id):
+        if self._log.count(transition_id) == 0:
+            raise KeyError(transition_id)
+        return FiringEventSequence(self._log, transition_id)
+
+    def __iter__(self):
+        return (tid for tid in self._log.transition_ids if self._log.count(tid))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
 class SimulationDataCollector:
     """Collects raw simulation data for rate-based analysis.
     
@@ -20,40 +71,52 @@ class SimulationDataCollector:
     - Place token counts over time for rate calculations (d(tokens)/dt)
     - Transition firing events for firing rate calculations (firings/time)
     
-    The collector implements automatic data management to prevent unbounded memory growth:
-        pass
-    - Maximum data points limit per object
-    - Automatic downsampling when threshold is exceeded
+    Place histories are downsampled (min/max preserving) once they exceed a threshold. Firing events
+    go to a FiringLog, which grows in chunks (optionally spilling to disk) and
+    keeps every event.
     
     Attributes:
         place_data: Dictionary mapping place_id to list of (time, tokens) tuples
-        transition_data: Dictionary mapping transition_id to list of (time, event_type, details) tuples
+        firing_log: FiringLog holding all transition firing events
+        transition_data: Read-only mapping of transition_id to (time, event_type, details) sequences
         max_data_points: Maximum number of data points to keep per object
-        downsample_threshold: Threshold at which downsampling is triggered
+        downsample_threshold: Threshold at which place downsampling is triggered
     
     Example:
         collector = SimulationDataCollector()
-        controller.add_step_listener(collector.on_simulation_step)
-        controller.data_collector = collector  # For transition firing notifications
+        controller.subscribe(SimulationEvent.STEP, collector.on_simulation_step)
+        controller.subscribe(SimulationEvent.FIRING, collector.on_firings)
         
         # After simulation runs, access data:
         place_history = collector.place_data[place_id]  # [(time, tokens), ...]
-        firing_events = collector.transition_data[trans_id]  # [(time, 'fired', None), ...]
+        firing_times = collector.get_firing_times(trans_id)  # numpy array
+        
+        # O(1) queries on incrementally maintained statistics:
+        collector.get_place_stats(place_id).mean
+        collector.get_token_rate(place_id, time_window=0.1)
+        collector.get_firing_rate(trans_id, current_time, time_window=1.0)
     """
 
-    def __init__(self, max_data_points: int=10000, downsample_threshold: int=8000):
+    def __init__(self, max_data_points: int=10000, downsample_threshold: int=8000,
+                 spill_dir: Optional[str]=None):
         """Initialize the data collector.
         
         Args:
             max_data_points: Maximum number of data points to keep per object
-            downsample_threshold: Trigger downsampling when this many points are reached
+            downsample_threshold: Trigger place downsampling when this many points are reached
+            spill_dir: Optional directory the firing log may spill to on long runs
         """
         self.place_data: Dict[Any, List[Tuple[float, int]]] = defaultdict(list)
-        self.transition_data: Dict[Any, List[Tuple[float, str, Any]]] = defaultdict(list)
+        self.firing_log = FiringLog(spill_dir=spill_dir)
+        # Online statistics; windows are created on first query and then fed per sample
+        self.place_stats: Dict[Any, RunningStats] = defaultdict(RunningStats)
+        self._place_windows: Dict[Any, Dict[float, SlidingWindow]] = defaultdict(dict)
+        self._firing_windows: Dict[Any, Dict[float, SlidingWindow]] = defaultdict(dict)
         self.max_data_points = max_data_points
         self.downsample_threshold = downsample_threshold
         self.step_count = 0
         self.total_firings = 0
+        self.controller = None  # Controller whose steps are being collected
 
     def on_simulation_step(self, controller, time: float):
         """Collect data on each simulation step.
@@ -66,14 +129,21 @@ class SimulationDataCollector:
             time: Current simulation time
         """
         self.step_count += 1
+        self.controller = controller
         # Debug output disabled to reduce console spam
         # if self.step_count <= 3:
         #     print(f"[OLD_DC] Step {self.step_count} at time {time:.4f}")
         #     print(f"[OLD_DC]   Collecting data for {len(controller.model.places)} places")
         
+        place_windows = self._place_windows
         for place in controller.model.places:
             data = self.place_data[place.id]
-            data.append((time, place.tokens))
+            tokens = place.tokens
+            data.append((time, tokens))
+            self.place_stats[place.id].push(tokens)
+            if place.id in place_windows:
+                for window in place_windows[place.id].values():
+                    window.push(time, tokens)
             # if self.step_count <= 3:
             #     print(f"[OLD_DC]     Place {place.id} ({place.name}): {place.tokens} tokens")
             if len(data) > self.downsample_threshold:
@@ -97,41 +167,45 @@ class SimulationDataCollector:
         #     if details:
         #         print(f"[OLD_DC]   Details: {details}")
         
-        data = self.transition_data[transition.id]
-        data.append((time, 'fired', details))
-        if len(data) > self.downsample_threshold:
-            self._downsample_transition_data(transition.id)
+        self.firing_log.record_details(transition.id, time, details)
+        if transition.id in self._firing_windows:
+            for window in self._firing_windows[transition.id].values():
+                window.push(time)
 
-    def _downsample_place_data(self, place_id: Any):
-        """Downsample place data by keeping every 2nd point.
+    def on_firings(self, controller, batch):
+        """Record the firings of one step (SimulationEvent.FIRING subscriber).
         
         Args:
-            place_id: ID of the place to downsample
+            controller: The simulation controller instance
+            batch: FiringBatch with the step's firings
         """
-        data = self.place_data[place_id]
-        if len(data) > 2:
-            downsampled = [data[0]]
-            downsampled.extend(data[1:-1:2])
-            downsampled.append(data[-1])
-            self.place_data[place_id] = downsampled
+        for transition, time, details in batch:
+            self.on_transition_fired(transition, time, details)
 
-    def _downsample_transition_data(self, transition_id: Any):
-        """Downsample transition data by keeping every 2nd firing event.
+    def _downsample_place_data(self, place_id: Any):
+        """Downsample place data, keeping the extremes of every time bucket.
+        
+        Uses M4 decimation (first, last, min and max point of each bucket) so
+        spikes survive; the history is reduced to about half the threshold.
         
         Args:
-            transition_id: ID of the transition to downsample
+            place_id: ID of the place to downsample
         """
-        data = self.transition_data[transition_id]
+        data = self.place_data[place_id]
         if len(data) > 2:
-            downsampled = [data[0]]
-            downsampled.extend(data[1:-1:2])
-            downsampled.append(data[-1])
-            self.transition_data[transition_id] = downsampled
+            series = np.asarray(data, dtype=np.float64)
+            times = series[:, 0]
+            keep = m4_indices(times, series[:, 1], (times[0], times[-1]),
+                              max(1, self.downsample_threshold // 8))
+            self.place_data[place_id] = [data[i] for i in keep]
 
     def clear(self):
         """Clear all collected data."""
         self.place_data.clear()
-        self.transition_data.clear()
+        self.firing_log.clear()
+        self.place_stats.clear()
+        self._place_windows.clear()
+        self._firing_windows.clear()
         self.step_count = 0
         self.total_firings = 0
 
@@ -143,6 +217,8 @@ class SimulationDataCollector:
         """
         if place_id in self.place_data:
             del self.place_data[place_id]
+        self.place_stats.pop(place_id, None)
+        self._place_windows.pop(place_id, None)
 
     def clear_transition(self, transition_id: Any):
         """Clear data for a specific transition.
@@ -150,8 +226,8 @@ class SimulationDataCollector:
         Args:
             transition_id: ID of the transition to clear
         """
-        if transition_id in self.transition_data:
-            del self.transition_data[transition_id]
+        self.firing_log.discard(transition_id)
+        self._firing_windows.pop(transition_id, None)
 
     def get_place_data(self, place_id: Any) -> List[Tuple[float, int]]:
         """Get the data for a specific place.
@@ -164,16 +240,84 @@ class SimulationDataCollector:
         """
         return self.place_data.get(place_id, [])
 
-    def get_transition_data(self, transition_id: Any) -> List[Tuple[float, str, Any]]:
+    @property
+    def transition_data(self) -> Mapping:
+        """Read-only mapping of transition_id to (time, event_type, details) sequences."""
+        return _TransitionDataView(self.firing_log)
+
+    def get_transition_data(self, transition_id: Any) -> Sequence:
         """Get the data for a specific transition.
         
         Args:
             transition_id: ID of the transition
             
         Returns:
-            List of (time, event_type, details) tuples, or empty list if transition not found
+            Sequence of (time, event_type, details) tuples (empty if transition not found)
+        """
+        return FiringEventSequence(self.firing_log, transition_id)
+
+    def get_firing_count(self, transition_id: Any) -> int:
+        """Number of recorded firing events of a transition."""
+        return self.firing_log.count(transition_id)
+
+    def get_firing_times(self, transition_id: Any):
+        """Event times of a transition as a float64 numpy array."""
+        return self.firing_log.event_times(transition_id)
+
+    def get_rate_series(self, transition_id: Any):
+        """(times, rates) numpy arrays of a continuous transition's flow steps."""
+        return (self.firing_log.event_times(transition_id),
+                self.firing_log.event_rates(transition_id))
+
+    def is_continuous(self, transition_id: Any) -> bool:
+        """True if the transition's events carry a continuous rate."""
+        return self.firing_log.is_continuous(transition_id)
+
+    def get_place_stats(self, place_id: Any) -> Optional[RunningStats]:
+        """Running count/mean/variance/min/max of a place's token count.
+        
+        Covers every recorded step, including points later downsampled away.
+        """
+        return self.place_stats.get(place_id)
+
+    def get_place_window(self, place_id: Any, time_window: float) -> SlidingWindow:
+        """Sliding window over a place's recent token counts.
+        
+        The window is built from the stored history on first request and
+        updated on every step afterwards.
         """
-        return self.transition_data.get(transition_id, [])
+        windows = self._place_windows[place_id]
+        window = windows.get(time_window)
+        if window is None:
+            window = windows[time_window] = SlidingWindow(time_window)
+            data = self.place_data.get(place_id, [])
+            if data:
+                start = bisect_left(data, (data[-1][0] - time_window,))
+                for time, tokens in data[start:]:
+                    window.push(time, tokens)
+        return window
+
+    def get_token_rate(self, place_id: Any, time_window: float = 0.1) -> float:
+        """Token rate (Δtokens/Δt) of a place over the last time_window."""
+        return self.get_place_window(place_id, time_window).rate()
+
+    def get_firing_window(self, transition_id: Any, time_window: float) -> SlidingWindow:
+        """Sliding window over a transition's recent firing events."""
+        windows = self._firing_windows[transition_id]
+        window = windows.get(time_window)
+        if window is None:
+            window = windows[time_window] = SlidingWindow(time_window)
+            times = self.firing_log.event_times(transition_id)
+            if len(times):
+                start = np.searchsorted(times, times[-1] - time_window, side='left')
+                for time in times[start:].tolist():
+                    window.push(time)
+        return window
+
+    def get_firing_rate(self, transition_id: Any, current_time: float,
+                        time_window: float = 1.0) -> float:
+        """Firings per time unit of a transition in the window ending at current_time."""
+        return self.get_firing_window(transition_id, time_window).event_rate(current_time)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get collection statistics.
@@ -181,4 +325,4 @@ class SimulationDataCollector:
         Returns:
             Dictionary with statistics about the collected data
         """
-        return {'step_count': self.step_count, 'total_firings': self.total_firings, 'places_tracked': len(self.place_data), 'transitions_tracked': len(self.transition_data), 'total_place_points': sum((len(data) for data in self.place_data.values())), 'total_transition_events': sum((len(data) for data in self.transition_data.values()))}
\ No newline at end of file
+        return {'step_count': self.step_count, 'total_firings': self.total_firings, 'places_tracked': len(self.place_data), 'transitions_tracked': int((self.firing_log.counts() > 0).sum()), 'total_place_points': sum((len(data) for data in self.place_data.values())), 'total_transition_events': len(self.firing_log)}
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""Min/max-preserving decimation of time series for plotting.
+
+Implements M4 decimation: the visible x range is split into one bucket per
+pixel column and only the first, last, minimum and maximum sample of each
+bucket is kept. Drawing those at most 4 points per column renders the same
+line as drawing every sample, so no spike is lost however long the run.
+
+Series are assumed to have non-decreasing x (simulation time). For a fixed
+view, buckets are updated incrementally as the series grows, so a live plot
+only pays for the newly appended samples on each refresh.
+"""
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+import numpy as np
+
+
+class M4Aggregate:
+    """Per-column first/last/min/max sample indices of a growing series.
+
+    Args:
+        x_range: (lo, hi) x interval mapped onto the columns
+        columns: Number of buckets (pixel columns)
+    """
+
+    def __init__(self, x_range: Tuple[float, float], columns: int):
+        self.lo, self.hi = float(x_range[0]), float(x_range[1])
+        self.columns = max(1, int(columns))
+        span = self.hi - self.lo
+        self._scale = self.columns / span if span > 0 else 0.0
+        self.first = np.full(self.columns, -1, dtype=np.int64)
+        self.last = np.full(self.columns, -1, dtype=np.int64)
+        self.argmin = np.full(self.columns, -1, dtype=np.int64)
+        self.argmax = np.full(self.columns, -1, dtype=np.int64)
+        self.count = 0
+        self._anchor = None  # (x[0], x[count-1], y[count-1]) of the consumed prefix
+
+    def extends(self, x: np.ndarray, y: np.ndarray) -> bool:
+        """True if (x, y) is the already consumed series with samples appended."""
+        if self.count == 0:
+            return True
+        if len(x) < self.count:
+            return False
+        last = self.count - 1
+        current = (x[0], x[last], y[last])
+        return all(a == b or (a != a and b != b) for a, b in zip(current, self._anchor))
+
+    def update(self, x: np.ndarray, y: np.ndarray):
+        """Fold samples appended since the last update into the buckets."""
+        n = len(x)
+        start = self.count
+        if start >= n:
+            return
+        begin = start + int(np.searchsorted(x[start:], self.lo, side='left'))
+        end = start + int(np.searchsorted(x[start:], self.hi, side='right'))
+        if end > begin:
+            idx = np.arange(begin, end)
+            cols = ((x[begin:end] - self.lo) * self._scale).astype(np.int64)
+            np.clip(cols, 0, self.columns - 1, out=cols)
+
+            # x is sorted, so each column is one contiguous block
+            buckets, starts = np.unique(cols, return_index=True)
+            ends = np.append(starts[1:], len(cols)) - 1
+            order = np.lexsort((y[begin:end], cols))
+            new_min = idx[order[starts]]
+            new_max = idx[order[ends]]
+
+            empty = self.first[buckets] < 0
+            self.first[buckets[empty]] = idx[starts[empty]]
+            self.last[buckets] = idx[ends]
+            old_min = self.argmin[buckets]
+            old_max = self.argmax[buckets]
+            take_min = empty | (y[new_min] < y[old_min])
+            take_max = empty | (y[new_max] > y[old_max])
+            self.argmin[buckets[take_min]] = new_min[take_min]
+            self.argmax[buckets[take_max]] = new_max[take_max]
+
+        self.count = n
+        self._anchor = (x[0], x[n - 1], y[n - 1])
+
+    def indices(self) -> np.ndarray:
+        """Sorted, unique indices of the retained samples."""
+        filled = self.first >= 0
+        return np.unique(np.concatenate((self.first[filled], self.argmin[filled],
+                                         self.argmax[filled], self.last[filled])))
+
+
+def m4_indices(x: np.ndarray, y: np.ndarray, x_range: Tuple[float, float],
+               columns: int) -> np.ndarray:
+    """Indices of the M4 samples of (x, y) over x_range in one pass."""
+    aggregate = M4Aggregate(x_range, columns)
+    aggregate.update(np.asarray(x), np.asarray(y))
+    return aggregate.indices()
+
+
+class DecimationCache:
+    """M4 decimation with aggregates cached per series and zoom level.
+
+    A cache entry is keyed by (series key, x range, columns); returning to
+    a previous zoom level reuses its buckets, and a growing series only
+    folds in its new samples.
+
+    Args:
+        max_entries: Number of aggregates kept (least recently used evicted)
+        points_per_column: Series at or below columns * this size are not decimated
+    """
+
+    def __init__(self, max_entries: int = 64, points_per_column: int = 4):
+        self.max_entries = max_entries
+        self.points_per_column = points_per_column
+        self._entries: 'OrderedDict[Tuple, M4Aggregate]' = OrderedDict()
+
+    def decimate(self, key: Hashable, x: np.ndarray, y: np.ndarray,
+                 x_range: Tuple[float, float], columns: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the decimated (x, y) of a series for the given view.
+
+        Samples just outside x_range are kept so the line runs to the edges.
+        """
+        n = len(x)
+        columns = max(1, int(columns))
+        if n <= columns * self.points_per_column:
+            return x, y
+
+        entry_key = (key, float(x_range[0]), float(x_range[1]), columns)
+        aggregate = self._entries.get(entry_key)
+        if aggregate is None or not aggregate.extends(x, y):
+            aggregate = M4Aggregate(x_range, columns)
+            self._entries[entry_key] = aggregate
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(entry_key)
+        aggregate.update(x, y)
+
+        idx = aggregate.indices()
+        before = int(np.searchsorted(x, aggregate.lo, side='left')) - 1
+        after = int(np.searchsorted(x, aggregate.hi, side='right'))
+        if before >= 0 or after < n:
+            edges = [i for i in (before, after) if 0 <= i < n]
+            idx = np.unique(np.concatenate((idx, edges)).astype(np.int64))
+        return x[idx], y[idx]
+
+    def discard(self, key: Optional[Any] = None):
+        """Drop the aggregates of one series (all series if key is None)."""
+        if key is None:
+            self._entries.clear()
+            return
+        for entry_key in [k for k in self._entries if k[0] == key]:
+            del self._entries[entry_key]
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,358 @@
+"""Compact firing-event log.
+
+Stores transition firing events as a struct of arrays instead of one
+``(time, 'fired', details)`` tuple per firing:
+
+    time        float64   simulation time of the event
+    transition  int32     index into ``FiringLog.transition_ids``
+    kind        uint8     KIND_FIRED (discrete firing) or KIND_FLOW (continuous step)
+    rate        float32   instantaneous rate (NaN for discrete firings)
+    flow        float32   tokens produced by the event
+
+Consumed/produced token amounts are kept as sparse deltas in flat arrays
+(place index and signed amount), addressed through a per-event offset.
+
+Columns grow in whole chunks and can optionally spill to memory-mapped
+files once the log exceeds a row threshold, so long continuous runs
+(which log one event per transition per step) never need to discard
+events. Column accessors return views; per-transition series are one
+vectorized gather over a per-transition row index.
+"""
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+KIND_FIRED = 0
+KIND_FLOW = 1
+
+DEFAULT_CHUNK_SIZE = 16384
+
+
+class _Column:
+    """Growable 1-D array held in memory or in a memory-mapped file."""
+
+    def __init__(self, dtype, chunk_size: int):
+        self.dtype = np.dtype(dtype)
+        self.chunk_size = chunk_size
+        self.size = 0
+        self.path: Optional[str] = None
+        self._data = np.empty(chunk_size, dtype=self.dtype)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def view(self) -> np.ndarray:
+        """Filled part of the column (no copy)."""
+        return self._data[:self.size]
+
+    def append(self, value):
+        if self.size == len(self._data):
+            self._grow(self.size + 1)
+        self._data[self.size] = value
+        self.size += 1
+
+    def extend(self, values):
+        count = len(values)
+        if count == 0:
+            return
+        if self.size + count > len(self._data):
+            self._grow(self.size + count)
+        self._data[self.size:self.size + count] = values
+        self.size += count
+
+    def replace(self, values: np.ndarray):
+        """Replace the content of the column (used when compacting)."""
+        self.size = 0
+        self.extend(values)
+
+    def spill(self, path: str):
+        """Move the column to a memory-mapped file at ``path``."""
+        if self.path is not None:
+            return
+        self._data[:self.size].tofile(path)
+        self.path = path
+        self._data = self._map(len(self._data))
+
+    def _map(self, capacity: int) -> np.ndarray:
+        with open(self.path, 'r+b') as handle:
+            handle.truncate(capacity * self.dtype.itemsize)
+        return np.memmap(self.path, dtype=self.dtype, mode='r+', shape=(capacity,))
+
+    def _grow(self, needed: int):
+        # Geometric growth rounded up to whole chunks keeps appends amortized O(1)
+        capacity = max(needed, 2 * len(self._data))
+        capacity = -(-capacity // self.chunk_size) * self.chunk_size
+        if self.path is not None:
+            self._data.flush()
+            self._data = self._map(capacity)
+        else:
+            data = np.empty(capacity, dtype=self.dtype)
+            data[:self.size] = self._data[:self.size]
+            self._data = data
+
+
+class FiringLog:
+    """Struct-of-arrays log of transition firing events.
+
+    Example:
+        log = FiringLog()
+        log.record('T1', 0.5, KIND_FIRED, consumed={'P1': 1}, produced={'P2': 1})
+        log.event_times('T1')   # array([0.5])
+        log.counts()            # array([1]) aligned with log.transition_ids
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 spill_dir: Optional[str] = None,
+                 spill_threshold: int = 1_000_000):
+        """Initialize an empty log.
+
+        Args:
+            chunk_size: Number of rows columns grow by
+            spill_dir: Directory for memory-mapped columns; None keeps the log in memory
+            spill_threshold: Number of events after which columns move to ``spill_dir``
+        """
+        self.chunk_size = chunk_size
+        self.spill_dir = spill_dir
+        self.spill_threshold = spill_threshold
+        self._spill_path: Optional[str] = None
+        self._reset()
+
+    def _reset(self):
+        chunk = self.chunk_size
+        self._columns: Dict[str, _Column] = {
+            'time': _Column(np.float64, chunk),
+            'transition': _Column(np.int32, chunk),
+            'kind': _Column(np.uint8, chunk),
+            'rate': _Column(np.float32, chunk),
+            'flow': _Column(np.float32, chunk),
+            'delta_start': _Column(np.int64, chunk),
+            'delta_place': _Column(np.int32, chunk),
+            'delta_amount': _Column(np.float32, chunk),
+        }
+        self.transition_ids: List[Any] = []
+        self.place_ids: List[Any] = []
+        self._transition_index: Dict[Any, int] = {}
+        self._place_index: Dict[Any, int] = {}
+        self._rows: List[_Column] = []
+
+    def __len__(self) -> int:
+        return self._columns['time'].size
+
+    @property
+    def is_spilled(self) -> bool:
+        return self._spill_path is not None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def transition_index(self, transition_id: Any) -> int:
+        """Index of a transition in the log, registering it if new."""
+        index = self._transition_index.get(transition_id)
+        if index is None:
+            index = len(self.transition_ids)
+            self._transition_index[transition_id] = index
+            self.transition_ids.append(transition_id)
+            self._rows.append(_Column(np.int64, 256))
+        return index
+
+    def _place(self, place_id: Any) -> int:
+        index = self._place_index.get(place_id)
+        if index is None:
+            index = len(self.place_ids)
+            self._place_index[place_id] = index
+            self.place_ids.append(place_id)
+        return index
+
+    def record(self, transition_id: Any, time: float, kind: int = KIND_FIRED,
+               rate: float = float('nan'),
+               consumed: Optional[Dict[Any, float]] = None,
+               produced: Optional[Dict[Any, float]] = None) -> int:
+        """Append one event and return its row number."""
+        columns = self._columns
+        row = columns['time'].size
+        index = self.transition_index(transition_id)
+
+        columns['delta_start'].append(columns['delta_place'].size)
+        flow = 0.0
+        if consumed:
+            for place_id, amount in consumed.items():
+                columns['delta_place'].append(self._place(place_id))
+                columns['delta_amount'].append(-amount)
+        if produced:
+            for place_id, amount in produced.items():
+                columns['delta_place'].append(self._place(place_id))
+                columns['delta_amount'].append(amount)
+                flow += amount
+
+        columns['time'].append(time)
+        columns['transition'].append(index)
+        columns['kind'].append(kind)
+        columns['rate'].append(rate)
+        columns['flow'].append(flow)
+        self._rows[index].append(row)
+
+        if (self.spill_dir is not None and self._spill_path is None
+                and row + 1 >= self.spill_threshold):
+            self.spill()
+        return row
+
+    def record_details(self, transition_id: Any, time: float, details: Any = None) -> int:
+        """Append an event from a controller ``details`` dict.
+
+        Events whose details carry a ``rate`` are continuous flow steps;
+        everything else is a discrete firing.
+        """
+        if not isinstance(details, dict):
+            return self.record(transition_id, time)
+        rate = details.get('rate')
+        kind = KIND_FIRED if rate is None else KIND_FLOW
+        return self.record(
+            transition_id, time, kind,
+            rate=float('nan') if rate is None else float(rate),
+            consumed=details.get('consumed'),
+            produced=details.get('produced'),
+        )
+
+    def spill(self):
+        """Move all global columns to memory-mapped files."""
+        if self._spill_path is not None:
+            return
+        os.makedirs(self.spill_dir or tempfile.gettempdir(), exist_ok=True)
+        self._spill_path = tempfile.mkdtemp(prefix='firing_log_', dir=self.spill_dir)
+        for name, column in self._columns.items():
+            column.spill(os.path.join(self._spill_path, f'{name}.bin'))
+
+    # ------------------------------------------------------------------
+    # Column views
+    # ------------------------------------------------------------------
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._columns['time'].view()
+
+    @property
+    def transitions(self) -> np.ndarray:
+        return self._columns['transition'].view()
+
+    @property
+    def kinds(self) -> np.ndarray:
+        return self._columns['kind'].view()
+
+    @property
+    def rates(self) -> np.ndarray:
+        return self._columns['rate'].view()
+
+    @property
+    def flows(self) -> np.ndarray:
+        return self._columns['flow'].view()
+
+    # ------------------------------------------------------------------
+    # Per-transition queries
+    # ------------------------------------------------------------------
+
+    def rows(self, transition_id: Any) -> np.ndarray:
+        """Row numbers of a transition's events (view, in time order)."""
+        index = self._transition_index.get(transition_id)
+        if index is None:
+            return np.empty(0, dtype=np.int64)
+        return self._rows[index].view()
+
+    def count(self, transition_id: Any) -> int:
+        index = self._transition_index.get(transition_id)
+        return 0 if index is None else self._rows[index].size
+
+    def event_times(self, transition_id: Any) -> np.ndarray:
+        return self.times[self.rows(transition_id)]
+
+    def event_rates(self, transition_id: Any) -> np.ndarray:
+        return self.rates[self.rows(transition_id)]
+
+    def is_continuous(self, transition_id: Any) -> bool:
+        """True if the transition's first event was a continuous flow step."""
+        rows = self.rows(transition_id)
+        return len(rows) > 0 and self.kinds[rows[0]] == KIND_FLOW
+
+    def deltas(self, row: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Place indexes and signed token amounts of one event (views)."""
+        starts = self._columns['delta_start']
+        start = int(starts.view()[row])
+        end = int(starts.view()[row + 1]) if row + 1 < starts.size \
+            else self._columns['delta_place'].size
+        return (self._columns['delta_place'].view()[start:end],
+                self._columns['delta_amount'].view()[start:end])
+
+    def details(self, row: int) -> Dict[str, Any]:
+        """Rebuild the controller ``details`` dict of one event."""
+        places, amounts = self.deltas(row)
+        consumed, produced = {}, {}
+        for place, amount in zip(places.tolist(), amounts.tolist()):
+            if amount < 0:
+                consumed[self.place_ids[place]] = -amount
+            else:
+                produced[self.place_ids[place]] = amount
+        details = {'consumed': consumed, 'produced': produced}
+        if self.kinds[row] == KIND_FLOW:
+            details['rate'] = float(self.rates[row])
+        return details
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+
+    def counts(self) -> np.ndarray:
+        """Number of events per transition, aligned with ``transition_ids``."""
+        return np.bincount(self.transitions, minlength=len(self.transition_ids))
+
+    def total_flows(self) -> np.ndarray:
+        """Tokens produced per transition, aligned with ``transition_ids``."""
+        return np.bincount(self.transitions, weights=self.flows,
+                           minlength=len(self.transition_ids))
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def discard(self, transition_id: Any):
+        """Drop all events of one transition, compacting the columns."""
+        index = self._transition_index.get(transition_id)
+        if index is None or self._rows[index].size == 0:
+            return
+        columns = self._columns
+        keep = self.transitions != index
+
+        starts = columns['delta_start'].view()
+        ends = np.append(starts[1:], columns['delta_place'].size)
+        lengths = (ends - starts)[keep]
+        delta_keep = np.repeat(keep, ends - starts)
+
+        places = columns['delta_place'].view()[delta_keep]
+        amounts = columns['delta_amount'].view()[delta_keep]
+        columns['delta_place'].replace(places)
+        columns['delta_amount'].replace(amounts)
+        columns['delta_start'].replace(np.cumsum(lengths) - lengths)
+        for name in ('time', 'transition', 'kind', 'rate', 'flow'):
+            columns[name].replace(columns[name].view()[keep])
+
+        transitions = self.transitions
+        order = np.argsort(transitions, kind='stable')
+        bounds = np.searchsorted(transitions[order], np.arange(len(self._rows) + 1))
+        for i, rows in enumerate(self._rows):
+            rows.replace(order[bounds[i]:bounds[i + 1]])
+
+    def clear(self):
+        """Remove all events and any spill files."""
+        self.close()
+        self._reset()
+
+    def close(self):
+        """Release spill files (the log is empty afterwards if spilled)."""
+        if self._spill_path is not None:
+            path, self._spill_path = self._spill_path, None
+            self._reset()
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,138 @@
+"""Online (incremental) statistics for simulation time series.
+
+Statistics are updated as samples arrive and queried in O(1), so panels
+refreshing on every tick do not rescan the whole history:
+
+- RunningStats: count, mean, variance (Welford), min and max of a stream
+- SlidingWindow: time-based window with running sum/mean, monotonic-deque
+  min/max, first-to-last rate and event rate
+
+Samples must arrive in non-decreasing time order (as simulation data does).
+"""
+from collections import deque
+from typing import Optional, Tuple
+
+
+class RunningStats:
+    """Streaming count/mean/variance/min/max using Welford's algorithm."""
+
+    __slots__ = ('count', 'mean', '_m2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def push(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 for fewer than two samples)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+
+
+class SlidingWindow:
+    """Statistics over the samples of the last ``time_window`` time units.
+
+    A sample at time t stays in the window while ``now - t <= time_window``.
+    Each sample is pushed and evicted once, so updates are amortized O(1);
+    all queries are O(1).
+
+    Example:
+        window = SlidingWindow(1.0)
+        for t, tokens in samples:
+            window.push(t, tokens)
+        window.rate()      # Δtokens/Δt across the window
+        window.max         # largest value in the window
+    """
+
+    def __init__(self, time_window: float):
+        self.time_window = time_window
+        self._samples = deque()   # (time, value), oldest first
+        self._minima = deque()    # samples with increasing values
+        self._maxima = deque()    # samples with decreasing values
+        self._sum = 0.0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def push(self, time: float, value: float = 1.0):
+        """Add a sample and evict those that fell out of the window."""
+        sample = (time, value)
+        self._samples.append(sample)
+        self._sum += value
+        while self._minima and self._minima[-1][1] > value:
+            self._minima.pop()
+        self._minima.append(sample)
+        while self._maxima and self._maxima[-1][1] < value:
+            self._maxima.pop()
+        self._maxima.append(sample)
+        self.evict(time)
+
+    def evict(self, now: float):
+        """Drop samples older than ``now - time_window``."""
+        samples = self._samples
+        while samples and now - samples[0][0] > self.time_window:
+            sample = samples.popleft()
+            self._sum -= sample[1]
+            if self._minima[0] is sample:
+                self._minima.popleft()
+            if self._maxima[0] is sample:
+                self._maxima.popleft()
+        if not samples:
+            self._sum = 0.0  # Drop accumulated rounding error
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        return self._sum / len(self._samples) if self._samples else 0.0
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._minima[0][1] if self._minima else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._maxima[0][1] if self._maxima else None
+
+    @property
+    def first(self) -> Optional[Tuple[float, float]]:
+        return self._samples[0] if self._samples else None
+
+    @property
+    def last(self) -> Optional[Tuple[float, float]]:
+        return self._samples[-1] if self._samples else None
+
+    def rate(self) -> float:
+        """Δvalue/Δtime between the oldest and newest sample (0.0 if undefined)."""
+        if len(self._samples) < 2:
+            return 0.0
+        (t0, v0), (t1, v1) = self._samples[0], self._samples[-1]
+        dt = t1 - t0
+        return (v1 - v0) / dt if dt > 0 else 0.0
+
+    def event_rate(self, now: float) -> float:
+        """Samples per time unit in the window ending at ``now``."""
+        self.evict(now)
+        return len(self._samples) / self.time_window if self.time_window > 0 else 0.0
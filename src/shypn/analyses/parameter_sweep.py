@@ -0,0 +1,761 @@
+#!/usr/bin/env python3
+"""Parameter sweeps and local sensitivity analysis of .shy models.
+
+Runs headless simulations of one model over many parameter sets in a
+process pool and summarizes each run by a few observables:
+
+    final.<place>    marking at the end of the run (the steady-state
+                     marking when the run stopped at steady state)
+    peak.<place>     largest marking during the run
+    flux.<transition> steady-state flux: mean flux over the detector's
+                     final window when the run stopped at steady state,
+                     otherwise over the whole run (continuous flow, or
+                     firings per time unit for discrete transitions)
+
+Runs stop early once the controller's SteadyStateDetector reports steady
+state (see SweepOptions). Parameters are addressed as ``<id>.<name>``:
+
+    P1.tokens        initial marking of place P1
+    T1.rate          rate of T1 (also its rate function, for continuous)
+    T1.vmax          entry of T1.kinetic_metadata.parameters, or a
+                     keyword argument in T1's rate function, e.g.
+                     ``michaelis_menten(P1, vmax=10.0, km=0.5)``
+
+Results are written column by column: .npz (NumPy), .parquet (requires
+pyarrow) or .csv.
+
+Usage:
+    from shypn.analyses.parameter_sweep import (
+        SweepOptions, latin_hypercube, run_sweep, sensitivity_analysis)
+
+    points = latin_hypercube({'T1.vmax': (1, 100), 'T1.km': (0.1, 10)}, 200,
+                             seed=1, log_scale=['T1.vmax'])
+    result = run_sweep('model.shy', points, SweepOptions(duration=500), max_workers=8)
+    result.save('sweep.npz')
+
+    sensitivities = sensitivity_analysis('model.shy', ['T1.vmax', 'T1.km'])
+    print(sensitivities.summary())
+
+Command line:
+    python -m shypn.analyses.parameter_sweep model.shy -p T1.vmax=1:100 --lhs 200 -o sweep.npz
+"""
+
+import argparse
+import csv
+import itertools
+import logging
+import multiprocessing
+import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pyarrow = None
+    PYARROW_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+# Output formats by file extension
+RESULT_FORMATS = ('.npz', '.parquet', '.csv')
+
+# Attributes of places that set the initial marking
+MARKING_NAMES = ('tokens', 'initial_marking')
+
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+
+
+@dataclass
+class SweepOptions:
+    """Simulation options shared by all runs of a sweep."""
+
+    duration: float = 100.0
+    """Simulated time per run (seconds)."""
+
+    time_step: Optional[float] = None
+    """Step size; None uses the controller's automatic dt (duration / 1000)."""
+
+    stop_at_steady_state: bool = True
+    """End a run once it reaches steady state."""
+
+    steady_state_window: int = 50
+    """Steps compared by the steady-state detector."""
+
+    steady_state_rtol: float = 1e-4
+    """Relative marking change tolerance of the detector."""
+
+    steady_state_flux_rtol: float = 1e-3
+    """Relative flux change tolerance of the detector."""
+
+    seed: Optional[int] = 0
+    """Seed of every run (common random numbers); None leaves RNGs alone."""
+
+    max_steps: Optional[int] = None
+    """Safety limit on steps per run."""
+
+
+@dataclass
+class RunResult:
+    """Observables of one simulation run."""
+
+    parameters: Dict[str, float]
+    observables: Dict[str, float] = field(default_factory=dict)
+    time: float = 0.0
+    steps: int = 0
+    steady_state: bool = False
+    time_to_steady_state: Optional[float] = None
+    wall_time: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+def _column_arrays(columns: Dict[str, list]) -> Dict[str, np.ndarray]:
+    arrays = {}
+    for name, values in columns.items():
+        if values and all(isinstance(v, str) for v in values):
+            arrays[name] = np.array(values, dtype=str)
+        elif values and all(isinstance(v, (bool, np.bool_)) for v in values):
+            arrays[name] = np.array(values, dtype=bool)
+        else:
+            arrays[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return arrays
+
+
+@dataclass
+class SweepResult:
+    """Results of a parameter sweep, one RunResult per point."""
+
+    model: str
+    parameters: List[str]
+    runs: List[RunResult] = field(default_factory=list)
+    wall_time: float = 0.0
+    workers: int = 1
+
+    @property
+    def failed(self) -> List[RunResult]:
+        return [run for run in self.runs if not run.success]
+
+    @property
+    def observables(self) -> List[str]:
+        """Observable names, in first-seen order."""
+        names = {}
+        for run in self.runs:
+            names.update(dict.fromkeys(run.observables))
+        return list(names)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """One array per parameter, observable and run statistic."""
+        columns = {'point': list(range(len(self.runs)))}
+        for name in self.parameters:
+            columns[name] = [run.parameters.get(name) for run in self.runs]
+        for name in self.observables:
+            columns[name] = [run.observables.get(name) for run in self.runs]
+        columns['time'] = [run.time for run in self.runs]
+        columns['steps'] = [run.steps for run in self.runs]
+        columns['steady_state'] = [run.steady_state for run in self.runs]
+        columns['time_to_steady_state'] = [run.time_to_steady_state for run in self.runs]
+        columns['wall_time'] = [run.wall_time for run in self.runs]
+        columns['error'] = [run.error or '' for run in self.runs]
+        return _column_arrays(columns)
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the columns to path (.npz, .parquet or .csv)."""
+        return write_columns(path, self.columns())
+
+    def summary(self) -> str:
+        steady = sum(1 for run in self.runs if run.steady_state)
+        simulated = sum(run.time for run in self.runs)
+        lines = [f"  ✗  point {i}: {run.error}" for i, run in enumerate(self.runs) if not run.success]
+        lines.append(
+            f"Ran {len(self.runs)} points of {len(self.parameters)} parameters in {self.wall_time:.2f}s "
+            f"({self.workers} workers): {steady} reached steady state, {len(self.failed)} failed, "
+            f"{simulated:g} time units simulated"
+        )
+        return '\n'.join(lines)
+
+
+@dataclass
+class Sensitivity:
+    """Local sensitivity of one observable to one parameter."""
+
+    parameter: str
+    observable: str
+    value: float
+    derivative: float
+    normalized: float
+    """(dO / O) / (dp / p); NaN where O or p is 0."""
+
+
+@dataclass
+class SensitivityResult:
+    """Finite-difference sensitivities around a base point."""
+
+    model: str
+    base: Dict[str, float]
+    method: str
+    relative_step: float
+    sensitivities: List[Sensitivity] = field(default_factory=list)
+    runs: List[RunResult] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def failed(self) -> List[RunResult]:
+        return [run for run in self.runs if not run.success]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        columns = {name: [getattr(s, name) for s in self.sensitivities]
+                   for name in ('parameter', 'observable', 'value', 'derivative', 'normalized')}
+        return _column_arrays(columns)
+
+    def save(self, path: Union[str, Path]) -> Path:
+        return write_columns(path, self.columns())
+
+    def summary(self, top: int = 10) -> str:
+        """The largest normalized sensitivities, one per line."""
+        ranked = sorted((s for s in self.sensitivities if np.isfinite(s.normalized)),
+                        key=lambda s: abs(s.normalized), reverse=True)
+        lines = [f"  {s.observable:<24} {s.parameter:<20} {s.normalized:+.4g}" for s in ranked[:top]]
+        lines.append(
+            f"{len(self.sensitivities)} sensitivities ({self.method} differences, step {self.relative_step:g}) "
+            f"from {len(self.runs)} runs in {self.wall_time:.2f}s, {len(self.failed)} failed"
+        )
+        return '\n'.join(lines)
+
+
+# ----------------------------------------------------------------------
+# Parameters
+# ----------------------------------------------------------------------
+
+def _find_object(document, object_id: str):
+    for obj in itertools.chain(document.places, document.transitions):
+        if str(obj.id) == object_id:
+            return obj
+    for obj in itertools.chain(document.places, document.transitions):
+        if obj.name == object_id:
+            return obj
+    raise ValueError(f"No place or transition '{object_id}'")
+
+
+def _rate_expression(transition) -> Optional[str]:
+    properties = getattr(transition, 'properties', None) or {}
+    expression = properties.get('rate_function')
+    if expression is None and isinstance(transition.rate, str):
+        expression = transition.rate
+    return expression if isinstance(expression, str) else None
+
+
+def _resolve(document, key: str) -> Tuple[Callable[[], float], Callable[[float], None]]:
+    """(getter, setter) of a parameter.
+
+    Raises:
+        ValueError: If the object or the parameter does not exist
+    """
+    object_id, _, name = key.rpartition('.')
+    if not object_id:
+        raise ValueError(f"Parameter '{key}' must be '<id>.<name>'")
+    obj = _find_object(document, object_id)
+
+    if hasattr(obj, 'initial_marking'):  # Place
+        if name not in MARKING_NAMES:
+            raise ValueError(f"Place parameter '{key}' must be one of {MARKING_NAMES}")
+
+        def set_marking(value):
+            obj.initial_marking = obj.tokens = value
+        return (lambda: float(obj.initial_marking)), set_marking
+
+    if name == 'rate':
+        def get_rate():
+            expression = _rate_expression(obj) if obj.transition_type == 'continuous' else None
+            try:
+                return float(expression if expression is not None else obj.rate)
+            except (TypeError, ValueError):
+                raise ValueError(f"Rate of '{object_id}' is not a number ({expression or obj.rate!r}); "
+                                 f"sweep its kinetic parameters or rate function keywords") from None
+        return get_rate, obj.set_rate
+
+    metadata = getattr(obj, 'kinetic_metadata', None)
+    if metadata is not None and name in metadata.parameters:
+        return (lambda: float(metadata.parameters[name])), \
+            (lambda value: metadata.parameters.__setitem__(name, value))
+
+    pattern = re.compile(rf'\b{re.escape(name)}\s*=\s*({_NUMBER})')
+    expression = _rate_expression(obj)
+    if expression is not None and pattern.search(expression):
+        def get_keyword():
+            return float(pattern.search(_rate_expression(obj)).group(1))
+
+        def set_keyword(value):
+            obj.set_rate(pattern.sub(f'{name}={float(value)!r}', _rate_expression(obj), count=1))
+        return get_keyword, set_keyword
+
+    raise ValueError(f"Transition '{object_id}' has no parameter '{name}' "
+                     f"(rate, kinetic parameter or rate function keyword)")
+
+
+def get_parameters(document, keys: Iterable[str]) -> Dict[str, float]:
+    """Current values of parameters in a document."""
+    return {key: _resolve(document, key)[0]() for key in keys}
+
+
+def apply_parameters(document, parameters: Mapping[str, float]):
+    """Set parameters in a document (see the module docstring for names)."""
+    for key, value in parameters.items():
+        _resolve(document, key)[1](float(value))
+
+
+# ----------------------------------------------------------------------
+# Sampling
+# ----------------------------------------------------------------------
+
+def parameter_grid(values: Mapping[str, Sequence[float]]) -> List[Dict[str, float]]:
+    """Every combination of the given values (full factorial grid)."""
+    keys = list(values)
+    return [dict(zip(keys, combination))
+            for combination in itertools.product(*(values[key] for key in keys))]
+
+
+def latin_hypercube(bounds: Mapping[str, Tuple[float, float]], samples: int,
+                    seed: Optional[int] = None,
+                    log_scale: Iterable[str] = ()) -> List[Dict[str, float]]:
+    """Latin-hypercube sample: each parameter's range is cut into ``samples``
+    strata, each stratum is sampled once.
+
+    Args:
+        bounds: Parameter -> (low, high)
+        samples: Number of points
+        seed: RNG seed
+        log_scale: Parameters sampled uniformly in log space (bounds > 0)
+    """
+    rng = np.random.default_rng(seed)
+    log_scale = set(log_scale)
+    points = [{} for _ in range(samples)]
+    for key, (low, high) in bounds.items():
+        unit = (rng.permutation(samples) + rng.random(samples)) / samples
+        if key in log_scale:
+            if low <= 0 or high <= 0:
+                raise ValueError(f"Log-scale bounds of '{key}' must be positive")
+            values = np.exp(np.log(low) + unit * (np.log(high) - np.log(low)))
+        else:
+            values = low + unit * (high - low)
+        for point, value in zip(points, values):
+            point[key] = float(value)
+    return points
+
+
+# ----------------------------------------------------------------------
+# Simulation
+# ----------------------------------------------------------------------
+
+_documents = {}  # Per process: (path, mtime) -> serialized document
+
+
+def _load_document(model_path: str):
+    from shypn.data.canvas.document_model import DocumentModel
+    key = (model_path, os.path.getmtime(model_path))
+    data = _documents.get(key)
+    if data is None:
+        _documents.clear()
+        data = _documents[key] = DocumentModel.load_from_file(model_path).to_dict()
+    return DocumentModel.from_dict(data)
+
+
+def simulate(document, options: Optional[SweepOptions] = None) -> RunResult:
+    """Run one headless simulation of document and collect its observables."""
+    from shypn.engine.simulation.controller import SimulationController
+    from shypn.engine.simulation.events import SimulationEvent
+    from shypn.engine.simulation.steady_state import SteadyStateAction
+
+    options = options or SweepOptions()
+    result = RunResult(parameters={})
+    started = time.perf_counter()
+    if options.seed is not None:
+        random.seed(options.seed)
+        np.random.seed(options.seed)
+
+    controller = SimulationController(document)
+    controller.settings.duration = options.duration
+    dt = options.time_step or controller.get_effective_dt()
+    if options.stop_at_steady_state:
+        controller.steady_state.configure(window=options.steady_state_window,
+                                          rtol=options.steady_state_rtol,
+                                          flux_rtol=options.steady_state_flux_rtol,
+                                          action=SteadyStateAction.STOP)
+        controller.steady_state.enabled = True
+
+    places, transitions = document.places, document.transitions
+    peaks = np.array([place.tokens for place in places], dtype=np.float64)
+    marking = np.empty_like(peaks)
+    flows = dict.fromkeys((transition.id for transition in transitions), 0.0)
+
+    def on_step(controller, now):
+        for i, place in enumerate(places):
+            marking[i] = place.tokens
+        np.maximum(peaks, marking, out=peaks)
+
+    def on_firings(controller, batch):
+        for (transition, _, _), rate in zip(batch, batch.rates):
+            flows[transition.id] += 1.0 if rate != rate else rate * dt  # NaN: discrete firing
+
+    controller.subscribe(SimulationEvent.STEP, on_step)
+    controller.subscribe(SimulationEvent.FIRING, on_firings)
+
+    steps = 0
+    while options.max_steps is None or steps < options.max_steps:
+        steps += 1
+        if not controller.step(dt):
+            break  # Duration, steady state or deadlock
+
+    result.steps = steps
+    result.time = controller.time
+    result.steady_state = controller.steady_state.reached
+    result.time_to_steady_state = controller.steady_state.time_to_steady_state
+    for place, peak in zip(places, peaks):
+        result.observables[f'final.{place.id}'] = float(place.tokens)
+        result.observables[f'peak.{place.id}'] = float(peak)
+    # The whole-run mean depends on when the run stopped, so a finite
+    # difference of it would mostly measure the change in stop time
+    window_flux = controller.steady_state.window_flux() if result.steady_state else None
+    for transition_id, flow in flows.items():
+        if window_flux is not None and transition_id in window_flux:
+            flux = window_flux[transition_id]
+        else:
+            flux = flow / controller.time if controller.time > 0 else 0.0
+        result.observables[f'flux.{transition_id}'] = flux
+    result.wall_time = time.perf_counter() - started
+    return result
+
+
+def run_point(model_path: Union[str, Path], parameters: Mapping[str, float],
+              options: Optional[SweepOptions] = None) -> RunResult:
+    """Load the model, apply parameters and simulate. Never raises."""
+    started = time.perf_counter()
+    try:
+        document = _load_document(str(model_path))
+        apply_parameters(document, parameters)
+        result = simulate(document, options)
+    except Exception as e:
+        result = RunResult(parameters={}, error=f"{type(e).__name__}: {e}",
+                           wall_time=time.perf_counter() - started)
+        logger.warning(f"Sweep run failed for {dict(parameters)}: {result.error}")
+    result.parameters = dict(parameters)
+    return result
+
+
+def _init_worker(log_level: int):
+    """Process pool initializer."""
+    logging.basicConfig(level=log_level)
+
+
+def _run_points(model_path: str, points: List[Dict[str, float]], options: SweepOptions,
+                max_workers: Optional[int],
+                progress_callback: Optional[Callable[[int, int, RunResult], None]]
+                ) -> Tuple[List[RunResult], int]:
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    workers = max(1, min(max_workers, len(points)))
+    results: List[Optional[RunResult]] = [None] * len(points)
+    done = 0
+
+    def finished(index, result):
+        nonlocal done
+        results[index] = result
+        done += 1
+        if progress_callback:
+            progress_callback(done, len(points), result)
+
+    if workers == 1:
+        for index, point in enumerate(points):
+            finished(index, run_point(model_path, point, options))
+    else:
+        # 'spawn' is safe in the GTK process (no forked GLib state)
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=context,
+                                 initializer=_init_worker,
+                                 initargs=(logging.getLogger().level,)) as executor:
+            futures = {executor.submit(run_point, model_path, point, options): index
+                       for index, point in enumerate(points)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker died (e.g. crash in a native library)
+                    result = RunResult(parameters=dict(points[index]),
+                                       error=f"{type(e).__name__}: {e}")
+                finished(index, result)
+    return results, workers
+
+
+def _check_parameters(model_path: str, keys: Iterable[str]) -> Dict[str, float]:
+    """Model values of the parameters; fails early on unknown names."""
+    return get_parameters(_load_document(model_path), keys)
+
+
+def run_sweep(model_path: Union[str, Path], points: Sequence[Mapping[str, float]],
+              options: Optional[SweepOptions] = None,
+              max_workers: Optional[int] = None,
+              progress_callback: Optional[Callable[[int, int, RunResult], None]] = None
+              ) -> SweepResult:
+    """Simulate a model once per parameter point, in parallel.
+
+    Args:
+        model_path: .shy model
+        points: Parameter dicts (see parameter_grid, latin_hypercube)
+        options: Simulation options (defaults if None)
+        max_workers: Worker processes (default: CPU count; 1 runs in this process)
+        progress_callback: Called as (done, total, result) after each run
+
+    Returns:
+        SweepResult, runs in point order
+
+    Raises:
+        ValueError: If a parameter does not exist in the model
+    """
+    model_path = str(model_path)
+    options = options or SweepOptions()
+    points = [dict(point) for point in points]
+    keys = list(dict.fromkeys(key for point in points for key in point))
+    _check_parameters(model_path, keys)
+
+    started = time.perf_counter()
+    runs, workers = _run_points(model_path, points, options, max_workers, progress_callback)
+    return SweepResult(model=model_path, parameters=keys, runs=runs,
+                       wall_time=time.perf_counter() - started, workers=workers)
+
+
+def sensitivity_analysis(model_path: Union[str, Path], parameters: Iterable[str],
+                         base: Optional[Mapping[str, float]] = None,
+                         options: Optional[SweepOptions] = None,
+                         relative_step: float = 0.01,
+                         method: str = 'central',
+                         max_workers: Optional[int] = None,
+                         progress_callback: Optional[Callable[[int, int, RunResult], None]] = None
+                         ) -> SensitivityResult:
+    """Local sensitivities of every observable by finite differences.
+
+    Each parameter p is perturbed by ``relative_step * |p|`` (or by
+    ``relative_step`` if p is 0); 'central' uses p ± h (2 runs per
+    parameter), 'forward' uses p + h (1 run). All runs share the seed of
+    options, so stochastic models are differenced with common random
+    numbers.
+
+    Args:
+        model_path: .shy model
+        parameters: Parameter names
+        base: Base point (default: the values in the model)
+        method: 'central' or 'forward'
+
+    Raises:
+        ValueError: On an unknown method or parameter
+    """
+    if method not in ('central', 'forward'):
+        raise ValueError(f"Unknown finite-difference method '{method}'")
+    model_path = str(model_path)
+    options = options or SweepOptions()
+    parameters = list(parameters)
+    base_point = _check_parameters(model_path, parameters)
+    base_point.update(base or {})
+
+    steps = {key: relative_step * abs(value) if value else relative_step
+             for key, value in base_point.items()}
+    points = [dict(base_point)]
+    for key in parameters:
+        offsets = (steps[key], -steps[key]) if method == 'central' else (steps[key],)
+        for offset in offsets:
+            points.append({**base_point, key: base_point[key] + offset})
+
+    started = time.perf_counter()
+    runs, _ = _run_points(model_path, points, options, max_workers, progress_callback)
+    result = SensitivityResult(model=model_path, base=base_point, method=method,
+                               relative_step=relative_step, runs=runs)
+
+    reference = runs[0]
+    position = 1
+    for key in parameters:
+        if method == 'central':
+            upper, lower = runs[position], runs[position + 1]
+            span = 2 * steps[key]
+            position += 2
+        else:
+            upper, lower = runs[position], reference
+            span = steps[key]
+            position += 1
+        if not (reference.success and upper.success and lower.success):
+            continue
+        for name, value in reference.observables.items():
+            derivative = (upper.observables[name] - lower.observables[name]) / span
+            normalized = derivative * base_point[key] / value if value and base_point[key] else float('nan')
+            result.sensitivities.append(Sensitivity(key, name, value, derivative, normalized))
+
+    result.wall_time = time.perf_counter() - started
+    return result
+
+
+# ----------------------------------------------------------------------
+# Columnar files
+# ----------------------------------------------------------------------
+
+def write_columns(path: Union[str, Path], columns: Mapping[str, np.ndarray]) -> Path:
+    """Write named columns of equal length (.npz, .parquet or .csv).
+
+    Raises:
+        ValueError: On an unknown extension
+        ImportError: For .parquet without pyarrow
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in RESULT_FORMATS:
+        raise ValueError(f"Unknown result format '{suffix}' (use one of {RESULT_FORMATS})")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if suffix == '.npz':
+        with open(path, 'wb') as f:  # Keeps the name (np.savez appends .npz)
+            np.savez_compressed(f, **columns)
+    elif suffix == '.parquet':
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Writing .parquet requires pyarrow (pip install pyarrow)")
+        table = pyarrow.table({name: np.asarray(values) for name, values in columns.items()})
+        pyarrow.parquet.write_table(table, str(path))
+    else:
+        names = list(columns)
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(names)
+            writer.writerows(zip(*(np.asarray(columns[name]).tolist() for name in names)))
+    return path
+
+
+def read_columns(path: Union[str, Path]) -> Dict[str, np.ndarray]:
+    """Read a file written by write_columns (CSV columns come back as strings)."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == '.npz':
+        with np.load(path, allow_pickle=False) as data:
+            return {name: data[name] for name in data.files}
+    if suffix == '.parquet':
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Reading .parquet requires pyarrow (pip install pyarrow)")
+        table = pyarrow.parquet.read_table(str(path))
+        return {name: table.column(name).to_numpy() for name in table.column_names}
+    if suffix == '.csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        return {name: np.array(values) for name, *values in zip(*rows)} if rows else {}
+    raise ValueError(f"Unknown result format '{suffix}' (use one of {RESULT_FORMATS})")
+
+
+# ----------------------------------------------------------------------
+# Command line
+# ----------------------------------------------------------------------
+
+def _parse_parameter(text: str) -> Tuple[str, Optional[object]]:
+    """'T1.rate=1,2,5' -> values, 'T1.rate=0.1:10' -> bounds,
+    'T1.rate=0.1:10:5' -> 5 evenly spaced values, 'T1.rate' -> None."""
+    key, _, spec = text.partition('=')
+    if not spec:
+        return key, None
+    try:
+        if ':' in spec:
+            parts = [float(part) for part in spec.split(':')]
+            if len(parts) == 2:
+                return key, tuple(parts)
+            if len(parts) == 3:
+                return key, list(np.linspace(parts[0], parts[1], int(parts[2])))
+        else:
+            return key, [float(part) for part in spec.split(',')]
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(f"Bad parameter specification '{text}'")
+
+
+def main(argv=None) -> int:
+    """Command line entry point (exit status 1 if any run failed)."""
+    parser = argparse.ArgumentParser(
+        description='Parameter sweeps and local sensitivity analysis of a .shy model'
+    )
+    parser.add_argument('model', type=Path, help='.shy model')
+    parser.add_argument('-p', '--param', dest='params', action='append', default=[],
+                        type=_parse_parameter, metavar='ID.NAME[=SPEC]',
+                        help="Parameter: '=v1,v2,...' grid values, '=low:high:n' n grid values, "
+                             "'=low:high' sampling bounds (with --lhs); no spec with --sensitivity")
+    parser.add_argument('-o', '--output', type=Path, required=True,
+                        help=f'Result file ({", ".join(RESULT_FORMATS)})')
+    parser.add_argument('--lhs', type=int, default=None, metavar='N',
+                        help='Latin-hypercube sample of N points over the low:high parameters')
+    parser.add_argument('--log', action='append', default=[], metavar='ID.NAME',
+                        help='Sample this parameter in log space (with --lhs)')
+    parser.add_argument('--sensitivity', action='store_true',
+                        help='Local sensitivities of the parameters at their model values')
+    parser.add_argument('--method', choices=['central', 'forward'], default='central',
+                        help='Finite differences for --sensitivity (default: central)')
+    parser.add_argument('--step', type=float, default=0.01,
+                        help='Relative finite-difference step (default: 0.01)')
+    parser.add_argument('--duration', type=float, default=100.0,
+                        help='Simulated time per run (default: 100)')
+    parser.add_argument('--dt', type=float, default=None,
+                        help='Time step (default: duration / 1000)')
+    parser.add_argument('--no-steady-state', action='store_true',
+                        help='Simulate the full duration even at steady state')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Random seed of every run (default: 0)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Only print the summary line')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+    if not args.params:
+        parser.error('no parameters given (-p)')
+
+    options = SweepOptions(duration=args.duration, time_step=args.dt,
+                           stop_at_steady_state=not args.no_steady_state, seed=args.seed)
+
+    def progress(done, total, result):
+        if not args.quiet:
+            status = 'FAILED' if not result.success else ('steady' if result.steady_state else 'ok')
+            print(f"[{done}/{total}] t={result.time:g} {status}", flush=True)
+
+    try:
+        if args.sensitivity:
+            result = sensitivity_analysis(args.model, [key for key, _ in args.params],
+                                          options=options, relative_step=args.step,
+                                          method=args.method, max_workers=args.jobs,
+                                          progress_callback=progress)
+        else:
+            bounds = {key: spec for key, spec in args.params if isinstance(spec, tuple)}
+            values = {key: spec for key, spec in args.params if isinstance(spec, list)}
+            if any(spec is None for _, spec in args.params) or (bounds and not args.lhs):
+                parser.error('sweeps need values for every parameter (and --lhs for low:high bounds)')
+            points = latin_hypercube(bounds, args.lhs, seed=args.seed, log_scale=args.log) \
+                if bounds else [{}]
+            points = [{**point, **grid} for point in points for grid in parameter_grid(values)]
+            result = run_sweep(args.model, points, options, max_workers=args.jobs,
+                               progress_callback=progress)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    result.save(args.output)
+    summary = result.summary()
+    print(summary if not args.quiet else summary.splitlines()[-1])
+    return 1 if result.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
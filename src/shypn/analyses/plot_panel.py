@@ -4,7 +4,7 @@ This module provides the base AnalysisPlotPanel class that handles:
     pass
 - Matplotlib canvas integration with GTK3
 - Selected objects list display with remove buttons
-- Real-time plot updates with throttling
+- Real-time plot updates with throttling, M4 decimation and blitting
 - Abstract methods for subclasses to implement specific plot types
 
 This is a SEPARATE MODULE - not implemented in loaders!
@@ -18,6 +18,9 @@ matplotlib.use('GTK3Agg')
 from matplotlib.backends.backend_gtk3agg import FigureCanvasGTK3Agg as FigureCanvas
 from matplotlib.figure import Figure
 from typing import List, Any, Optional, Tuple
+import numpy as np
+
+from shypn.analyses.decimation import DecimationCache
 
 class AnalysisPlotPanel(Gtk.Box):
     """Base class for rate-based analysis plotting panels.
@@ -37,6 +40,9 @@ class AnalysisPlotPanel(Gtk.Box):
     - _get_ylabel() -> str
     - _get_title() -> str
     
+    Subclasses backed by array storage may override _get_series(obj_id),
+    which the plot updates use, to skip building tuples.
+    
     Attributes:
         object_type: Type of objects this panel handles ('place' or 'transition')
         data_collector: SimulationDataCollector instance for accessing raw data
@@ -54,6 +60,8 @@ class AnalysisPlotPanel(Gtk.Box):
                 # Calculate token rate for this place
                 return rate_data
     """
+    VIEW_HEADROOM_X = 0.25  # Fraction of the span added right of the data when rescaling
+    VIEW_HEADROOM_Y = 0.1   # Fraction of the span added above the data when rescaling
     COLORS = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c', '#e67e22', '#34495e', '#16a085', '#c0392b']
 
     def __init__(self, object_type: str, data_collector):
@@ -74,7 +82,14 @@ class AnalysisPlotPanel(Gtk.Box):
         self.last_data_length = {}
         self._model_manager = None  # Will be set by register_with_model()
         self._plot_lines = {}  # Cache matplotlib line objects for efficient updates
+        self._line_series = {}  # line -> [key, fetch, times, values] of every plotted series
+        self._decimation = DecimationCache()
+        self._blit_background = None
+        self._live_lines = False
+        self._adjusting_view = False
+        self._redecimate_pending = False
         self._setup_ui()
+        self.canvas.mpl_connect('draw_event', self._on_draw_event)
         GLib.timeout_add(self.update_interval, self._periodic_update)
         # Periodic cleanup of stale objects (safety net)
         GLib.timeout_add(5000, self._cleanup_stale_objects)
@@ -302,6 +317,8 @@ class AnalysisPlotPanel(Gtk.Box):
         """
         # Clear plot lines cache
         self._plot_lines.clear()
+        self._reset_lines()
+        self._decimation.clear()
         
         # Clear the axes
         if hasattr(self, 'axes') and self.axes:
@@ -535,6 +552,9 @@ class AnalysisPlotPanel(Gtk.Box):
             # Force full redraw when needs_update (properties changed) to re-apply adjustments
             self.update_plot(force_full_redraw=self.needs_update)
             self.needs_update = False
+        elif self._live_lines:
+            # Data stopped changing: leave blitting mode so the figure is complete
+            self._end_live_updates()
         return True
 
     def update_plot(self, force_full_redraw=False):
@@ -560,37 +580,21 @@ class AnalysisPlotPanel(Gtk.Box):
             self._full_redraw()
             return
         
-        # Fast update - just update existing line data
-        for i, obj in enumerate(self.selected_objects):
-            rate_data = self._get_rate_data(obj.id)
-            if rate_data and obj.id in self._plot_lines:
-                times = [t for t, r in rate_data]
-                rates = [r for t, r in rate_data]
-                line = self._plot_lines[obj.id]
-                line.set_data(times, rates)
-        
-        # Update axis limits efficiently
-        self.axes.relim()
-        self.axes.autoscale_view()
-        
-        # Force immediate draw for smooth continuous curves
-        # draw_idle() can sometimes be too lazy during rapid updates
-        self.canvas.draw()
+        # Fast update - refresh the decimated data of the existing lines
+        self._update_lines()
+        self._refresh_canvas()
     
     def _full_redraw(self):
         """Perform a full plot redraw when object list changes."""
         self.axes.clear()
         self._plot_lines.clear()
+        self._reset_lines()
         
         if not self.selected_objects:
             self._show_empty_state()
             return
         
-        # Track if any data was plotted
-        has_data = False
-        
         for i, obj in enumerate(self.selected_objects):
-            rate_data = self._get_rate_data(obj.id)
             color = self._get_color(i)
             obj_name = getattr(obj, 'name', f'{self.object_type.title()}{obj.id}')
             
@@ -601,29 +605,26 @@ class AnalysisPlotPanel(Gtk.Box):
             else:
                 legend_label = f'{obj_name} ({self.object_type[0].upper()}{obj.id})'
             
-            if rate_data:
-                times = [t for t, r in rate_data]
-                rates = [r for t, r in rate_data]
-                line, = self.axes.plot(times, rates, label=legend_label, color=color, linewidth=2)
-                self._plot_lines[obj.id] = line
-                has_data = True
-            else:
-                # Plot empty line to maintain legend and color consistency
-                line, = self.axes.plot([], [], label=legend_label, color=color, linewidth=2)
-                self._plot_lines[obj.id] = line
+            # Empty series still get a line to keep legend and color consistency
+            line, = self.axes.plot([], [], label=legend_label, color=color, linewidth=2)
+            self._plot_lines[obj.id] = line
+            self._add_line_series(line, obj.id, lambda obj_id=obj.id: self._get_series(obj_id))
         
+        self._fit_view([self.axes])
+        self._watch_view(self.axes)
         self._format_plot()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def _show_empty_state(self):
         """Show empty state message when no objects selected."""
         # Clear the axes first to remove any existing plots
         self.axes.clear()
+        self._reset_lines()
         
         self.axes.text(0.5, 0.5, f'No {self.object_type}s selected\nAdd {self.object_type}s to analyze', ha='center', va='center', transform=self.axes.transAxes, fontsize=12, color='gray')
         self.axes.set_xticks([])
         self.axes.set_yticks([])
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def _format_plot(self):
         """Format the plot with labels, grid, and legend."""
@@ -648,6 +649,150 @@ class AnalysisPlotPanel(Gtk.Box):
         except:
             pass  # Ignore tight_layout errors
 
+    # ------------------------------------------------------------------
+    # Decimated lines and blitting
+    # ------------------------------------------------------------------
+
+    def _add_line_series(self, line, key, fetch):
+        """Register a plotted line whose data comes from fetch() -> (times, values).
+        
+        Registered lines are decimated to the current view (M4, one bucket per
+        pixel column) and refreshed by _update_lines().
+        """
+        self._line_series[line] = [key, fetch, None, None]
+        self._update_line(line)
+
+    def _update_line(self, line):
+        entry = self._line_series[line]
+        key, fetch = entry[0], entry[1]
+        times, values = fetch()
+        entry[2], entry[3] = times, values
+        line.set_data(*self._decimate(key, times, values, line.axes))
+
+    def _update_lines(self):
+        """Fetch the latest data of every registered line."""
+        for line in list(self._line_series):
+            self._update_line(line)
+
+    def _decimate(self, key, times, values, axes):
+        """Decimate a series to the pixel columns of the axes' x view."""
+        if len(times) == 0:
+            return times, values
+        lo, hi = axes.get_xlim()
+        if axes.get_autoscalex_on() and (times[0] < lo or times[-1] > hi):
+            # The view will be rescaled to the data: bucket over that range
+            lo, hi = self._headroom_range(times[0], times[-1], self.VIEW_HEADROOM_X)
+        columns = max(100, int(axes.bbox.width))
+        return self._decimation.decimate(key, times, values, (lo, hi), columns)
+
+    @staticmethod
+    def _headroom_range(lo, hi, headroom):
+        span = hi - lo
+        return lo, hi + (span * headroom if span > 0 else 1.0)
+
+    def _reset_lines(self):
+        """Forget registered lines (their axes are being cleared)."""
+        self._line_series.clear()
+        self._blit_background = None
+        self._live_lines = False
+
+    def _lines_in_view(self) -> bool:
+        """True if every registered line lies inside its axes' current limits."""
+        for line in self._line_series:
+            x, y = line.get_xdata(), line.get_ydata()
+            if len(x) == 0:
+                continue
+            x_lo, x_hi = line.axes.get_xlim()
+            y_lo, y_hi = line.axes.get_ylim()
+            if (np.nanmin(x) < x_lo or np.nanmax(x) > x_hi or
+                    np.nanmin(y) < y_lo or np.nanmax(y) > y_hi):
+                return False
+        return True
+
+    def _fit_view(self, axes_list):
+        """Autoscale axes to their data, leaving headroom for the data to grow into."""
+        self._adjusting_view = True
+        try:
+            for axes in axes_list:
+                axes.relim()
+                axes.autoscale_view()
+            fitted_x = []
+            for axes in axes_list:
+                # Twin axes share x: add the headroom once per group
+                shared = axes.get_shared_x_axes()
+                if axes.get_autoscalex_on() and not any(shared.joined(axes, other) for other in fitted_x):
+                    axes.set_xlim(*self._headroom_range(*axes.get_xlim(), self.VIEW_HEADROOM_X), auto=None)
+                    fitted_x.append(axes)
+                if axes.get_autoscaley_on():
+                    axes.set_ylim(*self._headroom_range(*axes.get_ylim(), self.VIEW_HEADROOM_Y), auto=None)
+        finally:
+            self._adjusting_view = False
+
+    def _rescale_view(self):
+        """Rescale after the data outgrew the view (subclasses may re-run formatting)."""
+        self._fit_view({line.axes for line in self._line_series} or {self.axes})
+        # Lines were decimated for the old range
+        self._update_lines()
+        self.canvas.draw_idle()
+
+    def _refresh_canvas(self):
+        """Show updated line data: blit if it fits the view, else rescale."""
+        if not self._live_lines:
+            # Live updates draw the lines over a cached background
+            for line in self._line_series:
+                line.set_animated(True)
+            self._live_lines = True
+            self._blit_background = None
+        
+        if not self._lines_in_view():
+            self._rescale_view()
+        elif self._blit_background is None:
+            # The draw event caches the background for the next refresh
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._blit_background)
+            self._draw_lines()
+            self.canvas.blit(self.figure.bbox)
+
+    def _draw_lines(self):
+        for line in self._line_series:
+            line.axes.draw_artist(line)
+
+    def _end_live_updates(self):
+        """Return lines to normal drawing (e.g. for saving the figure)."""
+        for line in self._line_series:
+            line.set_animated(False)
+        self._live_lines = False
+        self._blit_background = None
+        self.canvas.draw_idle()
+
+    def _on_draw_event(self, event):
+        """Cache the background (without animated lines) after each full draw."""
+        if not self._live_lines:
+            self._blit_background = None
+            return
+        self._blit_background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_lines()
+        self.canvas.blit(self.figure.bbox)
+
+    def _watch_view(self, axes):
+        """Re-decimate lines when the user zooms or pans (axes.clear() drops this)."""
+        axes.callbacks.connect('xlim_changed', self._on_xlim_changed)
+
+    def _on_xlim_changed(self, axes):
+        if self._adjusting_view or self._redecimate_pending:
+            return
+        self._redecimate_pending = True
+        GLib.idle_add(self._redecimate_lines)
+
+    def _redecimate_lines(self):
+        self._redecimate_pending = False
+        for line, (key, fetch, times, values) in self._line_series.items():
+            if times is not None:
+                line.set_data(*self._decimate(key, times, values, line.axes))
+        self.canvas.draw_idle()
+        return False
+
     def _get_color(self, index: int) -> str:
         """Get color for object at index.
         
@@ -681,6 +826,24 @@ class AnalysisPlotPanel(Gtk.Box):
         """
         raise NotImplementedError('Subclasses must implement _get_rate_data()')
 
+    def _get_series(self, obj_id: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the plotted series of an object as (times, values) arrays.
+        
+        Defaults to splitting _get_rate_data(); subclasses backed by
+        array storage override this to avoid building tuples.
+        
+        Args:
+            obj_id: ID of the object
+            
+        Returns:
+            (times, values) numpy arrays
+        """
+        rate_data = self._get_rate_data(obj_id)
+        if not rate_data:
+            return np.empty(0), np.empty(0)
+        data = np.asarray(rate_data, dtype=np.float64)
+        return data[:, 0], data[:, 1]
+
     def _get_ylabel(self) -> str:
         """Get Y-axis label.
         
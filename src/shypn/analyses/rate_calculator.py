@@ -8,7 +8,11 @@ The calculator supports:
 - Configurable time windows for rate calculation
 - Moving average smoothing for noisy data
 - Handling of edge cases (insufficient data, zero time windows)
+
+For values refreshed on every tick, prefer the incremental windows kept by
+SimulationDataCollector (see online_stats), which answer in O(1).
 """
+from bisect import bisect_left, bisect_right
 from typing import List, Tuple
 
 
@@ -24,7 +28,8 @@ class RateCalculator:
        - Measured in firings/second (Hz)
        - Uses a sliding time window for smoothing
     
-    All methods are static and stateless - no instance needed.
+    All methods are static and stateless - no instance needed. Input data
+    must be in chronological order; windows are located by binary search.
     
     Example:
         # Calculate token rate for a place
@@ -71,21 +76,32 @@ class RateCalculator:
             return 0.0
         
         # Get current time (last data point)
-        current_time = data_points[-1][0]
+        last = len(data_points) - 1
+        current_time = data_points[last][0]
         
-        # Find all points within the time window
-        recent_points = [(t, tokens) for t, tokens in data_points 
-                        if current_time - t <= time_window]
+        # First point within the time window
+        first = RateCalculator._window_start(data_points, last, current_time, time_window)
         
-        if len(recent_points) < 2:
+        if first >= last:
             return 0.0
         
         # Calculate rate using first and last points in window
-        dt = recent_points[-1][0] - recent_points[0][0]
-        dtokens = recent_points[-1][1] - recent_points[0][1]
+        dt = data_points[last][0] - data_points[first][0]
+        dtokens = data_points[last][1] - data_points[first][1]
         
         return dtokens / dt if dt > 0 else 0.0
     
+    @staticmethod
+    def _window_start(data_points, end: int, current_time: float, time_window: float) -> int:
+        """Index of the first point with current_time - t <= time_window (up to end)."""
+        index = bisect_left(data_points, (current_time - time_window,), 0, end)
+        # Binary search bounds on t; the inclusion test itself decides the edge
+        while index > 0 and current_time - data_points[index - 1][0] <= time_window:
+            index -= 1
+        while index < end and current_time - data_points[index][0] > time_window:
+            index += 1
+        return index
+    
     @staticmethod
     def calculate_firing_rate(event_times: List[float],
                              current_time: float,
@@ -119,10 +135,14 @@ class RateCalculator:
             return 0.0
         
         # Count firings within time window
-        recent_firings = [t for t in event_times 
-                         if current_time - t <= time_window and t <= current_time]
+        end = bisect_right(event_times, current_time)
+        start = bisect_left(event_times, current_time - time_window, 0, end)
+        while start > 0 and current_time - event_times[start - 1] <= time_window:
+            start -= 1
+        while start < end and current_time - event_times[start] > time_window:
+            start += 1
         
-        return len(recent_firings) / time_window
+        return (end - start) / time_window
     
     @staticmethod
     def moving_average(rates: List[float], window_size: int = 5) -> List[float]:
@@ -147,13 +167,13 @@ class RateCalculator:
             return rates.copy()
         
         smoothed = []
-        for i in range(len(rates)):
-            # Determine the window start (don't go below index 0)
-            start = max(0, i - window_size + 1)
-            # Get the window of values
-            window = rates[start:i+1]
-            # Calculate average
-            smoothed.append(sum(window) / len(window))
+        window_sum = 0.0
+        for i, rate in enumerate(rates):
+            # Running sum over the window (which starts shorter at index 0)
+            window_sum += rate
+            if i >= window_size:
+                window_sum -= rates[i - window_size]
+            smoothed.append(window_sum / min(i + 1, window_size))
         
         return smoothed
     
@@ -187,16 +207,17 @@ class RateCalculator:
             return []
         
         rate_series = []
+        first = 0
         
         # Start from the second data point (need at least 2 points for rate)
+        # The window start only moves forward: one pass over the data
         for i in range(1, len(data_points)):
-            time = data_points[i][0]
-            
-            # Get data up to this point
-            data_up_to_now = data_points[:i+1]
+            time, tokens = data_points[i][0], data_points[i][1]
+            while time - data_points[first][0] > time_window:
+                first += 1
             
-            # Calculate rate at this time
-            rate = RateCalculator.calculate_token_rate(data_up_to_now, time_window)
+            dt = time - data_points[first][0]
+            rate = (tokens - data_points[first][1]) / dt if first < i and dt > 0 else 0.0
             
             rate_series.append((time, rate))
         
@@ -10,8 +10,12 @@ from typing import List, Tuple, Any
 import logging
 logger = logging.getLogger(__name__)
 
+import numpy as np
+
 from shypn.analyses.plot_panel import AnalysisPlotPanel
 
+_EMPTY_SERIES = (np.empty(0), np.empty(0))
+
 
 class TransitionRatePanel(AnalysisPlotPanel):
     """Panel for plotting transition behavior characteristics over time.
@@ -156,87 +160,55 @@ class TransitionRatePanel(AnalysisPlotPanel):
         else:
             logger.debug("[LOCALITY_SYNC] No callback set for transition selection")
     
-    def _get_rate_data(self, transition_id: Any) -> List[Tuple[float, float]]:
-        """Get behavior-specific data for a transition.
+    def _get_series(self, transition_id: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Get behavior-specific data for a transition as arrays.
         
         The data plotted depends on transition type:
         - Continuous: (time, rate) - time vs rate value
         - Discrete (immediate/timed/stochastic): (time, cumulative_count)
         
+        Reads the collector's firing log directly, without building
+        per-event tuples.
+        
         Args:
             transition_id: ID of the transition
             
         Returns:
-            List of (time, rate) tuples
+            (times, values) numpy arrays (empty if no data)
         """
-        DEBUG_PLOT_DATA = True  # Enable debug output
-        
-        if DEBUG_PLOT_DATA and logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"[PLOT] _get_rate_data() called for transition {transition_id}")
-            # print(f"[PLOT]   self.data_collector={self.data_collector} (id={id(self.data_collector) if self.data_collector else 'None'})")
-        
-        # Safety check: return empty if no data collector
         if not self.data_collector:
-            if DEBUG_PLOT_DATA and logger.isEnabledFor(logging.DEBUG):
-                logger.debug("[PLOT] ERROR: No data collector")
-            return []
-        
-        # Get raw firing event data from collector
-        raw_events = self.data_collector.get_transition_data(transition_id)
+            logger.debug("[PLOT] No data collector")
+            return _EMPTY_SERIES
+        
+        log = getattr(self.data_collector, 'firing_log', None)
+        if log is None:
+            return _EMPTY_SERIES
+        
+        if log.is_continuous(transition_id):
+            # CONTINUOUS TRANSITION: rate over time
+            return log.event_times(transition_id), log.event_rates(transition_id)
+        
+        # DISCRETE TRANSITION: cumulative firing count, starting at (0, 0)
+        firing_times = log.event_times(transition_id)
+        if len(firing_times) == 0:
+            return _EMPTY_SERIES
+        counts = np.arange(1, len(firing_times) + 1, dtype=np.float64)
+        if firing_times[0] > 0:
+            firing_times = np.concatenate(([0.0], firing_times))
+            counts = np.concatenate(([0.0], counts))
+        return firing_times, counts
+    
+    def _get_rate_data(self, transition_id: Any) -> List[Tuple[float, float]]:
+        """Get behavior-specific data for a transition as (time, value) tuples.
         
-        if DEBUG_PLOT_DATA:
-            pass
-            # print(f"[PLOT]   raw_events count: {len(raw_events) if raw_events else 0}")
-        
-        if not raw_events:
-            if DEBUG_PLOT_DATA and logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"[PLOT] WARNING: No raw events for transition {transition_id}")
-            return []
-        
-        # Determine transition type by checking if details contain 'rate' field
-        # Continuous transitions store their rate in details
-        has_rate_data = False
-        if len(raw_events) > 0 and raw_events[0][2] is not None:
-            details = raw_events[0][2]
-            if isinstance(details, dict) and 'rate' in details:
-                has_rate_data = True
-        
-        if has_rate_data:
-            pass
-            # CONTINUOUS TRANSITION: Always use time on X-axis
-            rate_series = []
-            for time, event_type, details in raw_events:
-                if event_type == 'fired' and details and isinstance(details, dict):
-                    rate = details.get('rate', 0.0)
-                    rate_series.append((time, rate))
-            
-            return rate_series
-        else:
-            pass
-            # DISCRETE TRANSITION: Plot cumulative firing count
-            if DEBUG_PLOT_DATA:
-                pass
-            firing_times = [t for t, event_type, _ in raw_events 
-                           if event_type == 'fired']
-            
-            if len(firing_times) < 1:
-                if DEBUG_PLOT_DATA and logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f"[PLOT] No firing events for transition {transition_id}")
-                return []
-            
-            # Convert to cumulative count series
-            cumulative_series = []
-            
-            # Start at time 0 with count 0
-            if firing_times[0] > 0:
-                cumulative_series.append((0.0, 0))
-            
-            # Add each firing event with its cumulative count
-            for i, time in enumerate(firing_times):
-                count = i + 1  # Cumulative count (1-indexed)
-                cumulative_series.append((time, count))
+        Args:
+            transition_id: ID of the transition
             
-            return cumulative_series
+        Returns:
+            List of (time, rate) tuples
+        """
+        times, values = self._get_series(transition_id)
+        return list(zip(times.tolist(), values.tolist()))
     
     def _get_ylabel(self) -> str:
         """Get Y-axis label for transition plot.
@@ -260,13 +232,12 @@ class TransitionRatePanel(AnalysisPlotPanel):
         func_type = None
         
         for obj in self.selected_objects:
-            raw_events = self.data_collector.get_transition_data(obj.id)
-            if raw_events and len(raw_events) > 0:
-                details = raw_events[0][2]
-                if isinstance(details, dict) and 'rate' in details:
-                    has_continuous = True
-                else:
-                    has_discrete = True
+            if not self.data_collector.get_firing_count(obj.id):
+                continue
+            if self.data_collector.is_continuous(obj.id):
+                has_continuous = True
+            else:
+                has_discrete = True
         
         if has_continuous and not has_discrete:
             pass
@@ -994,23 +965,36 @@ class TransitionRatePanel(AnalysisPlotPanel):
                       family='monospace')
         self.axes.set_xticks([])
         self.axes.set_yticks([])
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def update_plot(self, force_full_redraw=False):
         """Update the plot with current data including locality places.
         
-        Overrides parent method to add locality place plotting.
+        Overrides parent method to add locality place plotting. Once every
+        selected transition has a line, ticks only refresh the line data.
         
         Args:
             force_full_redraw: If True, force a full redraw even if object list hasn't changed.
                               Used when properties change to re-apply adjustments.
         """
+        current_ids = [obj.id for obj in self.selected_objects]
+        if current_ids and current_ids == list(self._plot_lines) and not force_full_redraw:
+            self._update_lines()
+            self._refresh_canvas()
+            return
+        self._full_redraw()
+    
+    def _rescale_view(self):
+        """Data outgrew the view: redraw to re-apply smart scaling and adjustments."""
+        self._full_redraw()
+    
+    def _full_redraw(self):
+        """Replot transitions and their locality places from scratch."""
         DEBUG_UPDATE_PLOT = False  # Disable verbose logging
         
-        if DEBUG_UPDATE_PLOT:
-        
-            pass
         self.axes.clear()
+        self._plot_lines.clear()
+        self._reset_lines()
         
         # Clear secondary Y-axis for places if it exists
         if hasattr(self, '_places_axes'):
@@ -1027,7 +1011,7 @@ class TransitionRatePanel(AnalysisPlotPanel):
         # Check if we have any data at all
         has_any_data = False
         for obj in self.selected_objects:
-            if self._get_rate_data(obj.id):
+            if len(self._get_series(obj.id)[0]):
                 has_any_data = True
                 break
         
@@ -1045,12 +1029,7 @@ class TransitionRatePanel(AnalysisPlotPanel):
             if DEBUG_UPDATE_PLOT:
                 obj_name = getattr(obj, 'name', f'transition{obj.id}')
             
-            rate_data = self._get_rate_data(obj.id)
-            
-            if rate_data:
-                times = [t for t, r in rate_data]
-                rates = [r for t, r in rate_data]
-                
+            if len(self._get_series(obj.id)[0]):
                 color = self._get_color(i)
                 obj_name = getattr(obj, 'name', f'Transition{obj.id}')
                 
@@ -1064,18 +1043,35 @@ class TransitionRatePanel(AnalysisPlotPanel):
                 }.get(transition_type, transition_type[:3].upper())
                 legend_label = f'{obj_name} [{type_abbrev}]'
                 
-                self.axes.plot(times, rates,
+                line, = self.axes.plot([], [],
                               label=legend_label,
                               color=color,
                               linewidth=2.5,
                               zorder=10)  # Transitions on top
+                self._plot_lines[obj.id] = line
+                self._add_line_series(line, obj.id,
+                                      lambda obj_id=obj.id: self._get_series(obj_id))
                 
                 # Plot locality places if available
                 if obj.id in self._locality_places:
                     self._plot_locality_places(obj.id, color, DEBUG_UPDATE_PLOT)
         
+        view_axes = [self.axes]
+        if hasattr(self, '_places_axes'):
+            view_axes.append(self._places_axes)
+        self._fit_view(view_axes)
+        # Watch before formatting: rate function adjustments may narrow the x view
+        self._watch_view(self.axes)
         self._format_plot()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+    
+    def _get_place_series(self, place_id: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Token history of a locality place as (times, tokens) arrays."""
+        place_data = self.data_collector.get_place_data(place_id)
+        if not place_data:
+            return _EMPTY_SERIES
+        data = np.asarray(place_data, dtype=np.float64)
+        return data[:, 0], data[:, 1]
     
     def _plot_locality_places(self, transition_id, base_color, debug=False):
         """Plot input and output places for a transition's locality.
@@ -1108,27 +1104,22 @@ class TransitionRatePanel(AnalysisPlotPanel):
         # Plot input places (dashed lines, slightly lighter) on secondary axis
         for i, place in enumerate(locality_data['input_places']):
             pass
-            # Get place token data from data collector
-            place_data = self.data_collector.get_place_data(place.id)
-            
-            if place_data:
-                pass
-                # Place data format: (time, tokens) - only 2 values
-                times = [t for t, tokens in place_data]
-                tokens = [tok for t, tok in place_data]
+            if self.data_collector.get_place_data(place.id):
                 
                 # Lighten the color for input places
                 lighter_rgb = tuple(min(1.0, c + 0.2) for c in rgb)
                 lighter_hex = mcolors.rgb2hex(lighter_rgb)
                 
                 place_name = getattr(place, 'name', f'P{place.id}')
-                self._places_axes.plot(times, tokens,
+                line, = self._places_axes.plot([], [],
                              linestyle='--',
                              linewidth=1.5,
                              alpha=0.7,
                              color=lighter_hex,
                              label=f'  ↓ {place_name} (input)',
                              zorder=5)  # Behind transitions
+                self._add_line_series(line, ('place', place.id),
+                                      lambda place_id=place.id: self._get_place_series(place_id))
                 
                 if debug:
         
@@ -1136,27 +1127,22 @@ class TransitionRatePanel(AnalysisPlotPanel):
         # Plot output places (dotted lines, slightly darker) on secondary axis
         for i, place in enumerate(locality_data['output_places']):
             pass
-            # Get place token data from data collector
-            place_data = self.data_collector.get_place_data(place.id)
-            
-            if place_data:
-                pass
-                # Place data format: (time, tokens) - only 2 values
-                times = [t for t, tokens in place_data]
-                tokens = [tok for t, tok in place_data]
+            if self.data_collector.get_place_data(place.id):
                 
                 # Darken the color for output places
                 darker_rgb = tuple(max(0.0, c - 0.2) for c in rgb)
                 darker_hex = mcolors.rgb2hex(darker_rgb)
                 
                 place_name = getattr(place, 'name', f'P{place.id}')
-                self._places_axes.plot(times, tokens,
+                line, = self._places_axes.plot([], [],
                              linestyle=':',
                              linewidth=1.5,
                              alpha=0.7,
                              color=darker_hex,
                              label=f'  ↑ {place_name} (output)',
                              zorder=5)  # Behind transitions
+                self._add_line_series(line, ('place', place.id),
+                                      lambda place_id=place.id: self._get_place_series(place_id))
                 
                 if debug:
     
@@ -407,7 +407,10 @@ class CanvasLifecycleManager:
             context.palette.cleanup()
         
         # 3. Remove step listeners to prevent callbacks to destroyed objects
-        if hasattr(context.controller, 'step_listeners'):
+        if hasattr(context.controller, 'clear_listeners'):
+            logger.debug("  Clearing event listeners...")
+            context.controller.clear_listeners()
+        elif hasattr(context.controller, 'step_listeners'):
             logger.debug("  Clearing step listeners...")
             context.controller.step_listeners.clear()
         
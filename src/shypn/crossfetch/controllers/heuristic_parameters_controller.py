@@ -13,6 +13,7 @@ import logging
 
 from ..inference import HeuristicInferenceEngine
 from ..models import InferenceResult
+from shypn.utils.arc_index import build_arc_index, arcs_of
 
 
 class HeuristicParametersController:
@@ -85,37 +86,36 @@ class HeuristicParametersController:
             'unknown': []
         }
         
-        # Attach arcs to transitions for stoichiometry analysis
+        # Attach arcs to transitions for stoichiometry analysis (one pass)
+        arc_index = build_arc_index(document_model.arcs)
         for transition in document_model.transitions:
-            # Find input arcs (Place → Transition)
-            input_arcs = [arc for arc in document_model.arcs 
-                         if hasattr(arc, 'target') and arc.target == transition]
+            transition.input_arcs, transition.output_arcs = arcs_of(arc_index, transition)
+        
+        # Process all transitions in one batch (shared database lookups)
+        try:
+            inferred = self.inference_engine.infer_batch(document_model.transitions, organism)
+        except Exception as e:
+            self.logger.error(f"Error inferring parameters: {e}")
+            inferred = []
+        
+        for result in inferred:
+            if result.inference_metadata.get('error'):
+                # Failed transitions are isolated by infer_batch; report them
+                # as unknown and do not cache them
+                self.logger.warning(f"Could not infer parameters for {result.transition_id}: "
+                                    f"{result.inference_metadata['error']}")
+                results['unknown'].append(result)
+                continue
             
-            # Find output arcs (Transition → Place)
-            output_arcs = [arc for arc in document_model.arcs 
-                          if hasattr(arc, 'source') and arc.source == transition]
+            # Cache result
+            self._results_cache[result.transition_id] = result
             
-            # Attach as properties
-            transition.input_arcs = input_arcs
-            transition.output_arcs = output_arcs
-        
-        # Process each transition
-        for transition in document_model.transitions:
-            try:
-                result = self.inference_engine.infer_parameters(transition, organism)
-                
-                # Cache result
-                self._results_cache[result.transition_id] = result
-                
-                # Categorize by type
-                type_key = result.parameters.transition_type.value
-                if type_key in results:
-                    results[type_key].append(result)
-                else:
-                    results['unknown'].append(result)
-                    
-            except Exception as e:
-                self.logger.error(f"Error inferring parameters for {transition.id}: {e}")
+            # Categorize by type
+            type_key = result.parameters.transition_type.value
+            if type_key in results:
+                results[type_key].append(result)
+            else:
+                results['unknown'].append(result)
         
         return results
     
@@ -158,10 +158,9 @@ class HeuristicParametersController:
             return None
         
         # Attach arcs for stoichiometry analysis
-        transition.input_arcs = [arc for arc in document_model.arcs 
-                                if hasattr(arc, 'target') and arc.target == transition]
-        transition.output_arcs = [arc for arc in document_model.arcs 
-                                 if hasattr(arc, 'source') and arc.source == transition]
+        transition.input_arcs, transition.output_arcs = arcs_of(
+            build_arc_index(document_model.arcs), transition
+        )
         
         # Infer parameters
         try:
@@ -9,8 +9,12 @@ Date: October 2025
 
 from .enrichment_pipeline import EnrichmentPipeline
 from .quality_scorer import QualityScorer
+from .concurrent_fetcher import ConcurrentFetcher, RateLimiter, RequestCoalescer
 
 __all__ = [
     "EnrichmentPipeline",
     "QualityScorer",
+    "ConcurrentFetcher",
+    "RateLimiter",
+    "RequestCoalescer",
 ]
@@ -0,0 +1,283 @@
+"""
+Concurrent Fetcher
+
+Queries several data sources at once for the enrichment pipeline.
+
+Features:
+- Bounded thread pool (fetchers are blocking HTTP clients)
+- Per-source rate limits (token bucket) and timeouts
+- Early completion: stop waiting once a result is good enough
+- Request coalescing: identical in-flight requests share one fetch
+
+Author: Shypn Development Team
+Date: November 2025
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Hashable, List, Optional
+import logging
+import threading
+import time
+
+from shypn.utils.rate_limit import RateLimiter
+
+from ..fetchers import BaseFetcher
+from ..models import FetchResult, FetchStatus
+
+
+class RequestCoalescer:
+    """Shares one in-flight call among identical concurrent requests.
+
+    The first caller for a key runs the call; callers arriving while it is
+    in flight wait for and receive the same result (or exception). Nothing
+    is cached once the call completes.
+    """
+
+    def __init__(self):
+        """Initialize coalescer."""
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Run func for key, or join the identical call already in flight.
+
+        Args:
+            key: Request identity
+            func: Call producing the result
+
+        Returns:
+            Result of func (shared between coalesced callers)
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def in_flight(self) -> int:
+        """Number of distinct requests currently running."""
+        with self._lock:
+            return len(self._in_flight)
+
+
+class ConcurrentFetcher:
+    """Runs fetches against several sources concurrently.
+
+    Sources are queried on a shared, bounded thread pool. A source that
+    misses its timeout is reported as a TIMEOUT result; its worker thread
+    finishes in the background (blocking HTTP calls cannot be interrupted),
+    and identical requests issued meanwhile join it instead of starting
+    another one.
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """Initialize concurrent fetcher.
+
+        Args:
+            max_workers: Maximum number of fetches running at once
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_workers = max_workers
+        self.coalescer = RequestCoalescer()
+
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._timeouts: Dict[str, float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def set_rate_limit(self, source_name: str, rate: Optional[float], burst: int = 1):
+        """Limit calls to a source.
+
+        Args:
+            source_name: Source to limit
+            rate: Calls per second (None removes the limit)
+            burst: Maximum calls allowed back-to-back
+        """
+        if rate is None:
+            self._rate_limiters.pop(source_name, None)
+        else:
+            self._rate_limiters[source_name] = RateLimiter(rate, burst)
+
+    def set_timeout(self, source_name: str, seconds: Optional[float]):
+        """Set a per-source timeout (capped by the per-call timeout).
+
+        Args:
+            source_name: Source name
+            seconds: Timeout in seconds (None removes it)
+        """
+        if seconds is None:
+            self._timeouts.pop(source_name, None)
+        else:
+            self._timeouts[source_name] = seconds
+
+    def fetch_all(self,
+                  fetchers: List[BaseFetcher],
+                  pathway_id: str,
+                  data_type: str,
+                  timeout: Optional[float] = None,
+                  stop_when: Optional[Callable[[FetchResult], bool]] = None,
+                  **kwargs) -> List[FetchResult]:
+        """Fetch from all sources concurrently.
+
+        Args:
+            fetchers: Fetchers to query
+            pathway_id: Pathway identifier
+            data_type: Type of data to fetch
+            timeout: Seconds to wait for any source (per-source timeouts may be shorter)
+            stop_when: Optional predicate; once a result satisfies it, the
+                       remaining sources are no longer waited for
+            **kwargs: Additional fetch parameters
+
+        Returns:
+            FetchResults in fetcher order. Unavailable sources and fetches
+            that raised are omitted; sources that timed out get a TIMEOUT
+            result; sources skipped by early completion are omitted.
+        """
+        if not fetchers:
+            return []
+
+        executor = self._get_executor()
+        started = time.monotonic()
+        deadlines = {}
+        positions = {}
+
+        for position, fetcher in enumerate(fetchers):
+            source_timeout = self._timeouts.get(fetcher.source_name, timeout)
+            if timeout is not None and source_timeout is not None:
+                source_timeout = min(source_timeout, timeout)
+            deadline = None if source_timeout is None else started + source_timeout
+
+            future = executor.submit(
+                self._fetch_one, fetcher, pathway_id, data_type, deadline, kwargs
+            )
+            deadlines[future] = deadline
+            positions[future] = position
+
+        results: Dict[int, FetchResult] = {}
+        pending = set(deadlines)
+
+        while pending:
+            now = time.monotonic()
+            for future in [f for f in pending if deadlines[f] is not None and deadlines[f] <= now]:
+                pending.discard(future)
+                future.cancel()
+                fetcher = fetchers[positions[future]]
+                self.logger.warning(f"Fetch from {fetcher.source_name} timed out")
+                results[positions[future]] = FetchResult.create_failed(
+                    data_type=data_type,
+                    source_name=fetcher.source_name,
+                    error="Fetch timed out",
+                    status=FetchStatus.TIMEOUT
+                )
+            if not pending:
+                break
+
+            finite = [deadlines[f] for f in pending if deadlines[f] is not None]
+            wait_time = max(0.0, min(finite) - now) if finite else None
+            done, _ = wait(pending, timeout=wait_time, return_when=FIRST_COMPLETED)
+
+            satisfied = False
+            for future in done:
+                pending.discard(future)
+                fetcher = fetchers[positions[future]]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error(f"Fetch failed from {fetcher.source_name}: {e}")
+                    continue
+                if result is None:
+                    continue
+                results[positions[future]] = result
+                if stop_when is not None and stop_when(result):
+                    satisfied = True
+
+            if satisfied and pending:
+                self.logger.info(
+                    f"Early completion for {data_type}: "
+                    f"skipping {len(pending)} pending source(s)"
+                )
+                for future in pending:
+                    future.cancel()
+                break
+
+        return [results[position] for position in sorted(results)]
+
+    def _fetch_one(self,
+                   fetcher: BaseFetcher,
+                   pathway_id: str,
+                   data_type: str,
+                   deadline: Optional[float],
+                   kwargs: Dict[str, Any]) -> Optional[FetchResult]:
+        """Probe, rate-limit and fetch from one source (runs in a worker thread).
+
+        Returns:
+            FetchResult, or None if the source is unavailable
+        """
+        if not fetcher.is_available():
+            self.logger.warning(f"Source {fetcher.source_name} is not available")
+            return None
+
+        limiter = self._rate_limiters.get(fetcher.source_name)
+        if limiter is not None:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not limiter.acquire(timeout=remaining):
+                return FetchResult.create_failed(
+                    data_type=data_type,
+                    source_name=fetcher.source_name,
+                    error="Rate limit wait exceeds timeout",
+                    status=FetchStatus.RATE_LIMITED
+                )
+
+        def fetch():
+            return fetcher.fetch(pathway_id=pathway_id, data_type=data_type, **kwargs)
+
+        key = (fetcher.source_name, pathway_id, data_type, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable parameters: run without coalescing
+            return fetch()
+        return self.coalescer.run(key, fetch)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared thread pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="crossfetch"
+                )
+            return self._executor
+
+    def shutdown(self):
+        """Stop the thread pool (running fetches are not interrupted)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"ConcurrentFetcher("
+            f"max_workers={self.max_workers}, "
+            f"rate_limited={sorted(self._rate_limiters)})"
+        )
@@ -28,6 +28,7 @@ from ..enrichers import (
     CoordinateEnricher
 )
 from .quality_scorer import QualityScorer
+from .concurrent_fetcher import ConcurrentFetcher
 from ..metadata import create_metadata_manager, FileOperationsTracker
 
 
@@ -42,15 +43,36 @@ class EnrichmentPipeline:
     5. Resolve conflicts using voting policies
     6. Apply enrichments to pathway
     7. Log enrichments in metadata
+    
+    Sources are queried concurrently (see ConcurrentFetcher), with
+    per-source rate limits and timeouts. Once one source returns a result
+    the QualityScorer deems sufficient, the others are not waited for.
     """
     
-    def __init__(self):
-        """Initialize enrichment pipeline."""
+    # Calls per second allowed per source (KEGG asks for at most 3)
+    DEFAULT_RATE_LIMITS = {
+        "KEGG": 3.0,
+    }
+    
+    def __init__(self,
+                 max_workers: int = ConcurrentFetcher.DEFAULT_MAX_WORKERS,
+                 early_completion: bool = True):
+        """Initialize enrichment pipeline.
+        
+        Args:
+            max_workers: Maximum number of sources queried at once
+            early_completion: Stop waiting for other sources once a result
+                              reaches QualityScorer.EARLY_COMPLETION_SCORE
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # Components
         self.quality_scorer = QualityScorer()
         self.metadata_tracker = FileOperationsTracker()
+        self.concurrent_fetcher = ConcurrentFetcher(max_workers=max_workers)
+        self.early_completion = early_completion
+        for source_name, rate in self.DEFAULT_RATE_LIMITS.items():
+            self.concurrent_fetcher.set_rate_limit(source_name, rate)
         
         # Registry of fetchers
         self.fetchers: Dict[str, BaseFetcher] = {}
@@ -196,7 +218,7 @@ class EnrichmentPipeline:
             
             # Score quality of each result
             for result in successful:
-                result.quality_score = self.quality_scorer.score(result)
+                result.quality_score = self.quality_scorer.score_result(result)
             
             # Select best result for this data type
             best_result = max(successful, key=lambda r: r.quality_score)
@@ -456,42 +478,46 @@ class EnrichmentPipeline:
     def _fetch_from_sources(self,
                            request: EnrichmentRequest,
                            data_type: str) -> List[FetchResult]:
-        """Fetch data from multiple sources.
+        """Fetch data from multiple sources concurrently.
+        
+        Each allowed source supporting the data type is probed and fetched
+        on the concurrent fetcher, within request.timeout_seconds.
         
         Args:
             request: EnrichmentRequest
             data_type: Data type to fetch
             
         Returns:
-            List of FetchResults from different sources
+            List of FetchResults from different sources (in registration order)
         """
-        results = []
+        fetchers = [
+            fetcher for source_name, fetcher in self.fetchers.items()
+            # Check if source is allowed and supports this data type
+            if request.is_source_allowed(source_name) and fetcher.supports_data_type(data_type)
+        ]
         
-        for source_name, fetcher in self.fetchers.items():
-            # Check if source is allowed
-            if not request.is_source_allowed(source_name):
-                continue
-            
-            # Check if fetcher supports this data type
-            if not fetcher.supports_data_type(data_type):
-                continue
-            
-            # Check if source is available
-            if not fetcher.is_available():
-                self.logger.warning(f"Source {source_name} is not available")
-                continue
-            
-            # Fetch data
-            try:
-                fetch_result = fetcher.fetch(
-                    pathway_id=request.pathway_id,
-                    data_type=data_type
-                )
-                results.append(fetch_result)
-            except Exception as e:
-                self.logger.error(f"Fetch failed from {source_name}: {e}")
+        stop_when = self.quality_scorer.is_sufficient if self.early_completion else None
+        return self.concurrent_fetcher.fetch_all(
+            fetchers,
+            pathway_id=request.pathway_id,
+            data_type=data_type,
+            timeout=request.timeout_seconds,
+            stop_when=stop_when
+        )
+    
+    def set_source_limits(self,
+                          source_name: str,
+                          rate: Optional[float] = None,
+                          timeout: Optional[float] = None):
+        """Set rate limit and timeout for a source.
         
-        return results
+        Args:
+            source_name: Source name
+            rate: Calls per second (None = unlimited)
+            timeout: Timeout in seconds (None = request timeout only)
+        """
+        self.concurrent_fetcher.set_rate_limit(source_name, rate)
+        self.concurrent_fetcher.set_timeout(source_name, timeout)
     
     def _get_statistics(self) -> Dict[str, Any]:
         """Get pipeline statistics.
@@ -27,6 +27,9 @@ class QualityScorer:
     WEIGHT_CONSISTENCY = 0.20
     WEIGHT_VALIDATION = 0.25
     
+    # Score at which one result is good enough to stop querying other sources
+    EARLY_COMPLETION_SCORE = 0.9
+    
     def __init__(self):
         """Initialize quality scorer."""
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -101,6 +104,20 @@ class QualityScorer:
         ranked = self.rank_results(filtered)
         return ranked[0] if ranked else None
     
+    def is_sufficient(self,
+                     result: FetchResult,
+                     min_score: float = EARLY_COMPLETION_SCORE) -> bool:
+        """Check if a result is good enough to skip the remaining sources.
+        
+        Args:
+            result: FetchResult to check
+            min_score: Score required (default: EARLY_COMPLETION_SCORE)
+            
+        Returns:
+            True if the result is usable and scores at least min_score
+        """
+        return result.is_usable() and self.score_result(result) >= min_score
+    
     def calculate_completeness(self,
                               requested_fields: List[str],
                               filled_fields: List[str]) -> float:
@@ -24,12 +24,30 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from contextlib import contextmanager
 
+from shypn.utils.sqlite_pool import get_pool
+
+
+# Keys per IN (...) list; stays well below SQLite's host parameter limit
+QUERY_CHUNK_SIZE = 500
+
+
+def _chunks(values: List[Any], size: int = QUERY_CHUNK_SIZE):
+    """Split values into lists of at most size items."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _placeholders(values: List[Any]) -> str:
+    """Comma-separated '?' placeholders for an IN (...) list."""
+    return ', '.join('?' * len(values))
+
 
 class HeuristicDatabase:
     """SQLite database manager for heuristic parameters.
     
     Features:
-    - Thread-safe connection management
+    - Pooled connections (one persistent WAL connection per thread)
+    - Batched writes (executemany in one transaction)
     - Automatic schema creation/migration
     - Type-aware parameter storage (JSON blobs)
     - Usage tracking and learning
@@ -68,27 +86,29 @@ class HeuristicDatabase:
         
         self.logger.info(f"Using database: {self.db_path}")
         
+        # Shared with every other user of this file (per-thread connections)
+        self._pool = get_pool(self.db_path, row_factory=sqlite3.Row)
+        self._closed = False
+        
         # Initialize database schema
         self._init_schema()
     
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections.
+        """Context manager for a transaction on this thread's pooled connection.
+        
+        Commits on success and rolls back on error. The connection stays
+        open for the next call.
         
         Yields:
-            sqlite3.Connection: Database connection
+            sqlite3.Connection: Database connection (rows are sqlite3.Row)
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Access columns by name
         try:
-            yield conn
-            conn.commit()
+            with self._pool.transaction() as conn:
+                yield conn
         except Exception as e:
-            conn.rollback()
             self.logger.error(f"Database error: {e}")
             raise
-        finally:
-            conn.close()
     
     def _init_schema(self):
         """Initialize database schema if not exists."""
@@ -519,6 +539,75 @@ class HeuristicDatabase:
             self.logger.debug(f"Query returned {len(results)} parameters")
             return results
     
+    def get_parameters(self, parameter_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Retrieve several parameters by ID with set-based lookups.
+        
+        Args:
+            parameter_ids: Parameter IDs
+        
+        Returns:
+            Dict mapping ID → parameter dict (missing IDs are omitted)
+        """
+        results = {}
+        ids = list(dict.fromkeys(parameter_ids))
+        with self._get_connection() as conn:
+            for chunk in _chunks(ids):
+                rows = conn.execute(
+                    f"SELECT * FROM transition_parameters WHERE id IN ({_placeholders(chunk)})",
+                    chunk
+                )
+                for row in rows:
+                    results[row['id']] = self._row_to_dict(row)
+        return results
+    
+    def query_parameters_batch(self,
+                               transition_types: List[str],
+                               ec_numbers: List[str] = (),
+                               reaction_ids: List[str] = (),
+                               organism: Optional[str] = None,
+                               min_confidence: float = 0.0) -> List[Dict[str, Any]]:
+        """Query parameters for many EC numbers / reaction IDs at once.
+        
+        Returns every row whose type is in transition_types and whose EC
+        number or reaction ID is in the given sets, in query_parameters()
+        order (confidence, then usage). One statement per chunk of keys
+        instead of one per transition.
+        
+        Args:
+            transition_types: Transition types to include
+            ec_numbers: EC numbers to match
+            reaction_ids: Reaction IDs to match
+            organism: Optional organism filter
+            min_confidence: Minimum confidence score
+        
+        Returns:
+            List of parameter dicts
+        """
+        types = list(dict.fromkeys(transition_types))
+        if not types:
+            return []
+        
+        rows_by_id = {}
+        with self._get_connection() as conn:
+            for column, values in (('ec_number', ec_numbers), ('reaction_id', reaction_ids)):
+                for chunk in _chunks(list(dict.fromkeys(values))):
+                    query = (
+                        "SELECT * FROM transition_parameters WHERE confidence_score >= ?"
+                        f" AND transition_type IN ({_placeholders(types)})"
+                        f" AND {column} IN ({_placeholders(chunk)})"
+                    )
+                    params = [min_confidence, *types, *chunk]
+                    if organism:
+                        query += " AND organism = ?"
+                        params.append(organism)
+                    for row in conn.execute(query, params):
+                        rows_by_id[row['id']] = row
+        
+        results = [self._row_to_dict(row) for row in rows_by_id.values()]
+        results.sort(key=lambda r: (-r['confidence_score'], -(r['usage_count'] or 0)))
+        self.logger.debug(f"Batch query returned {len(results)} parameters")
+        return results
+    
     def update_usage(self, parameter_id: int):
         """Update usage statistics for a parameter.
         
@@ -538,6 +627,25 @@ class HeuristicDatabase:
             
             self.logger.debug(f"Updated usage for parameter {parameter_id}")
     
+    def update_usage_many(self, parameter_ids: List[int]):
+        """Update usage statistics for several parameters in one transaction.
+        
+        Args:
+            parameter_ids: Parameter IDs (repeated IDs count once per occurrence)
+        """
+        if not parameter_ids:
+            return
+        
+        now = datetime.now().isoformat()
+        self._pool.executemany("""
+            UPDATE transition_parameters
+            SET usage_count = usage_count + 1,
+                last_used = ?
+            WHERE id = ?
+        """, [(now, parameter_id) for parameter_id in parameter_ids])
+        
+        self.logger.debug(f"Updated usage for {len(parameter_ids)} parameters")
+    
     def set_user_rating(self, parameter_id: int, rating: int):
         """Set user rating for a parameter.
         
@@ -585,6 +693,28 @@ class HeuristicDatabase:
             
             self.logger.debug(f"Cached query: {query_key}")
     
+    def cache_queries(self, entries: List[Tuple[str, int, List[int], float]]):
+        """Cache several query results in one transaction.
+        
+        Args:
+            entries: (query_key, recommended_id, alternatives, confidence_score)
+                    tuples, as for cache_query()
+        """
+        if not entries:
+            return
+        
+        now = datetime.now().isoformat()
+        self._pool.executemany("""
+            INSERT OR REPLACE INTO heuristic_cache
+            (query_key, recommended_parameter_id, alternatives, confidence_score, last_updated, hit_count)
+            VALUES (?, ?, ?, ?, ?, COALESCE((SELECT hit_count FROM heuristic_cache WHERE query_key = ?), 0))
+        """, [
+            (query_key, recommended_id, json.dumps(alternatives), confidence_score, now, query_key)
+            for query_key, recommended_id, alternatives, confidence_score in entries
+        ])
+        
+        self.logger.debug(f"Cached {len(entries)} queries")
+    
     def get_cached_query(self, query_key: str) -> Optional[Dict[str, Any]]:
         """Retrieve cached query result.
         
@@ -617,6 +747,40 @@ class HeuristicDatabase:
             self.logger.debug(f"Cache miss: {query_key}")
             return None
     
+    def get_cached_queries(self, query_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several cached query results at once.
+        
+        Hit counts of the found keys are incremented in one batch.
+        
+        Args:
+            query_keys: Hash keys for queries
+        
+        Returns:
+            Dict mapping query key → cached result (misses are omitted)
+        """
+        results = {}
+        keys = list(dict.fromkeys(query_keys))
+        with self._get_connection() as conn:
+            for chunk in _chunks(keys):
+                rows = conn.execute(
+                    f"SELECT * FROM heuristic_cache WHERE query_key IN ({_placeholders(chunk)})",
+                    chunk
+                )
+                for row in rows:
+                    result = dict(row)
+                    result['alternatives'] = json.loads(result['alternatives'])
+                    results[result['query_key']] = result
+            
+            if results:
+                conn.executemany("""
+                    UPDATE heuristic_cache
+                    SET hit_count = hit_count + 1
+                    WHERE query_key = ?
+                """, [(key,) for key in results])
+        
+        self.logger.debug(f"Cache hits: {len(results)}/{len(keys)}")
+        return results
+    
     def clear_cache(self, older_than_days: Optional[int] = None):
         """Clear query cache.
         
@@ -835,37 +999,29 @@ class HeuristicDatabase:
         if not results:
             return 0
         
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            inserted = 0
-            
-            for result in results:
-                try:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO brenda_raw_data
-                        (ec_number, parameter_type, value, unit, substrate, organism,
-                         literature, commentary, query_date, source_quality)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), ?)
-                    """, (
-                        result.get('ec_number', ''),
-                        result.get('parameter_type', ''),
-                        result.get('value', 0.0),
-                        result.get('unit', ''),
-                        result.get('substrate', ''),
-                        result.get('organism', ''),
-                        result.get('literature', ''),
-                        result.get('commentary', ''),
-                        result.get('quality', 0.0)
-                    ))
-                    if cursor.rowcount > 0:
-                        inserted += 1
-                except sqlite3.IntegrityError:
-                    # Duplicate entry, skip
-                    continue
-            
-            conn.commit()
-            self.logger.info(f"Inserted {inserted}/{len(results)} BRENDA records")
-            return inserted
+        # INSERT OR IGNORE skips duplicates; rowcount counts inserted rows only
+        inserted = self._pool.executemany("""
+            INSERT OR IGNORE INTO brenda_raw_data
+            (ec_number, parameter_type, value, unit, substrate, organism,
+             literature, commentary, query_date, source_quality)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), ?)
+        """, [
+            (
+                result.get('ec_number', ''),
+                result.get('parameter_type', ''),
+                result.get('value', 0.0),
+                result.get('unit', ''),
+                result.get('substrate', ''),
+                result.get('organism', ''),
+                result.get('literature', ''),
+                result.get('commentary', ''),
+                result.get('quality', 0.0)
+            )
+            for result in results
+        ])
+        
+        self.logger.info(f"Inserted {inserted}/{len(results)} BRENDA records")
+        return inserted
     
     def query_brenda_data(self, 
                          ec_number: str = None,
@@ -1095,8 +1251,12 @@ class HeuristicDatabase:
         return result
     
     def close(self):
-        """Close database connection (if needed).
+        """Release the pooled connections to this database file.
         
-        Note: Using context managers, so this is optional.
+        The shared pool is closed once its last holder released it.
+        Note: Optional - threads reconnect on their next query.
         """
+        if not self._closed:
+            self._closed = True
+            self._pool.release()
         self.logger.info("Database closed")
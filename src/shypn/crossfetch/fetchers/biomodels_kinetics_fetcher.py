@@ -17,11 +17,12 @@ Date: November 2025
 import logging
 import xml.etree.ElementTree as ET
 import re
-import requests
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 from urllib.parse import urljoin
 
+from shypn.utils.http_cache import get_http_cache
+
 from .base_fetcher import BaseFetcher
 from ..models.fetch_result import FetchResult, FetchStatus
 from ..models import QualityMetrics, SourceAttribution
@@ -48,6 +49,9 @@ class BioModelsKineticsFetcher(BaseFetcher):
     MODEL_DOWNLOAD_URL = BASE_URL + "model/download/"
     SEARCH_URL = BASE_URL + "search"
     
+    # Seconds an availability probe answer is reused
+    PROBE_TTL = 3600
+    
     # SBML namespaces
     SBML_NS = {
         'sbml2': 'http://www.sbml.org/sbml/level2/version4',
@@ -87,7 +91,8 @@ class BioModelsKineticsFetcher(BaseFetcher):
             True if API responds
         """
         try:
-            response = requests.get(self.BASE_URL, timeout=5)
+            # Probe answers are cached briefly so repeated imports stay local
+            response = get_http_cache().get(self.BASE_URL, timeout=5, ttl=self.PROBE_TTL)
             return response.status_code == 200
         except Exception as e:
             self.logger.warning(f"BioModels not accessible: {e}")
@@ -235,7 +240,7 @@ class BioModelsKineticsFetcher(BaseFetcher):
             url = f"{self.MODEL_DOWNLOAD_URL}{model_id}?filename={model_id}_url.xml"
             self.logger.info(f"Downloading model {model_id} from BioModels...")
             
-            response = requests.get(url, timeout=30)
+            response = get_http_cache().get(url, timeout=30)
             response.raise_for_status()
             
             # Save to cache
@@ -11,6 +11,8 @@ import time
 from typing import Dict, Any, List, Optional
 import logging
 
+from shypn.utils.http_cache import HTTPCacheError, get_http_cache
+
 from .base_fetcher import BaseFetcher
 from ..models import FetchResult, FetchStatus
 
@@ -123,13 +125,11 @@ class KEGGFetcher(BaseFetcher):
             }
         """
         try:
-            import requests
-            
-            # Fetch KGML XML from KEGG API
+            # Fetch KGML XML from KEGG API (through the shared response cache)
             kgml_url = f"{self.KEGG_API_BASE}/get/{pathway_id}/kgml"
             self.logger.info(f"Fetching KGML from: {kgml_url}")
             
-            response = requests.get(kgml_url, timeout=30)
+            response = get_http_cache().get(kgml_url, timeout=30)
             response.raise_for_status()
             
             # Parse KGML using existing parser
@@ -196,7 +196,7 @@ class KEGGFetcher(BaseFetcher):
                 source_url=kgml_url
             )
             
-        except requests.exceptions.RequestException as e:
+        except HTTPCacheError as e:
             self.logger.error(f"Network error fetching KGML: {e}")
             return self._create_failure_result(
                 error=f"Network error: {str(e)}",
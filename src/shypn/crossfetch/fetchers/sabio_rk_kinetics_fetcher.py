@@ -9,11 +9,12 @@ Date: November 2025
 """
 
 from typing import Dict, Any, List, Optional
-import urllib.request
 import urllib.parse
 import xml.etree.ElementTree as ET
 from datetime import datetime
 
+from shypn.utils.http_cache import HTTPCacheError, get_http_cache
+
 from .base_fetcher import BaseFetcher
 from ..models import FetchResult, FetchStatus
 
@@ -33,6 +34,9 @@ class SabioRKKineticsFetcher(BaseFetcher):
         'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
     }
     
+    # Seconds an availability probe answer is reused
+    PROBE_TTL = 3600
+    
     def __init__(self):
         super().__init__(
             source_name="SABIO-RK",
@@ -68,9 +72,10 @@ class SabioRKKineticsFetcher(BaseFetcher):
             
             self.logger.info(f"Querying SABIO-RK: {url}")
             
-            # Fetch data
-            with urllib.request.urlopen(url, timeout=30) as response:
-                xml_content = response.read().decode('utf-8')
+            # Fetch data (through the shared response cache)
+            response = get_http_cache().get(url, timeout=30)
+            response.raise_for_status()
+            xml_content = response.text
             
             # Parse SBML
             root = ET.fromstring(xml_content)
@@ -99,12 +104,12 @@ class SabioRKKineticsFetcher(BaseFetcher):
                 source_url=url
             )
             
-        except urllib.error.URLError as e:
+        except HTTPCacheError as e:
             self.logger.error(f"Network error fetching from SABIO-RK: {e}")
             return self._create_failed_result(
                 data_type="kinetics",
                 error=f"Network error: {str(e)}",
-                status=FetchStatus.NETWORK_ERROR
+                status=FetchStatus.FAILED
             )
         except Exception as e:
             self.logger.error(f"Error fetching from SABIO-RK: {e}")
@@ -244,8 +249,8 @@ class SabioRKKineticsFetcher(BaseFetcher):
         """
         try:
             url = f"{self.base_url}?q=ECNumber:1.1.1.1"
-            with urllib.request.urlopen(url, timeout=5) as response:
-                return response.status == 200
+            response = get_http_cache().get(url, timeout=5, ttl=self.PROBE_TTL)
+            return response.status_code == 200
         except Exception:
             return False
     
@@ -8,8 +8,13 @@ Author: Shypn Development Team
 Date: November 2025
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from types import SimpleNamespace
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import copy
 import logging
+import multiprocessing
 
 from ..models.transition_types import (
     TransitionType, BiologicalSemantics,
@@ -19,6 +24,20 @@ from ..models.transition_types import (
 )
 from ..fetchers.sabio_rk_kinetics_fetcher import SabioRKKineticsFetcher
 from ..database.heuristic_db import HeuristicDatabase
+from shypn.utils.arc_index import build_arc_index, arcs_of
+
+
+# Transition types whose parameters are looked up in the database
+DATABASE_TYPES = (TransitionType.CONTINUOUS, TransitionType.STOCHASTIC)
+
+# Smallest batch worth starting worker processes for
+PARALLEL_MIN_TRANSITIONS = 500
+
+# Transition attributes read during inference (copied to worker processes)
+TRANSITION_ATTRIBUTES = (
+    'id', 'name', 'label', 'metadata', 'transition_type', 'rate_function',
+    'delay', 'reaction_id', 'ec_number', 'enzyme_name'
+)
 
 
 # Reaction mechanism patterns (learned from KEGG, applicable to any source)
@@ -303,8 +322,10 @@ class HeuristicInferenceEngine:
         # Type detector
         self.type_detector = TransitionTypeDetector()
         
-        # Local cache for database results (in-memory cache for session)
-        self._parameter_cache: Dict[Tuple[str, str], ContinuousParameters] = {}
+        # Local cache for database results (in-memory cache for session),
+        # keyed by (type, ec_number, reaction_id, organism); None = no match
+        self._parameter_cache: Dict[Tuple[str, Optional[str], Optional[str], str],
+                                    Optional[TransitionParameters]] = {}
     
     @property
     def sabio_rk_fetcher(self):
@@ -327,6 +348,95 @@ class HeuristicInferenceEngine:
         Returns:
             InferenceResult with inferred parameters and alternatives
         """
+        if use_cache:
+            try:
+                self._prefetch_parameters([transition], organism)
+            except Exception as e:
+                self.logger.warning(f"Parameter prefetch failed, using heuristics only: {e}")
+        
+        stoich_info = self._analyze_stoichiometry(transition)
+        return self._infer_single(transition, organism, stoich_info)
+    
+    def infer_batch(self,
+                    transitions: List[Any],
+                    organism: str = "Homo sapiens",
+                    arcs: Optional[List[Any]] = None,
+                    use_cache: bool = True,
+                    workers: Optional[int] = None) -> List[InferenceResult]:
+        """Infer parameters for many transitions (e.g., a whole model).
+        
+        Without arcs, same results as calling infer_parameters() per
+        transition, minus the per-transition overhead:
+        - EC numbers / reaction IDs are collected up front and resolved with
+          set-based database queries into the session memo
+        - Optionally, the CPU-bound inference runs in worker processes
+        
+        With arcs, stoichiometry is read from an arc index built once from
+        them rather than from input_arcs/output_arcs attached to each
+        transition. For transitions without attached arcs this adds
+        stoichiometry infer_parameters() would not see, which can refine
+        or change the detected type (and so the chosen parameters).
+        
+        Args:
+            transitions: Transition objects from model
+            organism: Target organism
+            arcs: Optional model arcs; if None, transition.input_arcs and
+                  transition.output_arcs are used when present
+            use_cache: If True, check database cache first
+            workers: Worker processes for large batches (None/1 = in-process)
+        
+        Returns:
+            List of InferenceResult, in transition order. A transition whose
+            inference raised gets a result with UNKNOWN parameters and the
+            error in inference_metadata['error'] (see failed_result()), so
+            one bad transition does not fail the batch.
+        """
+        transitions = list(transitions)
+        if use_cache:
+            try:
+                self._prefetch_parameters(transitions, organism)
+            except Exception as e:
+                self.logger.warning(f"Parameter prefetch failed, using heuristics only: {e}")
+        
+        arc_index = build_arc_index(arcs) if arcs is not None else None
+        stoichiometry = []
+        for transition in transitions:
+            try:
+                if arc_index is not None:
+                    input_arcs, output_arcs = arcs_of(arc_index, transition)
+                    stoichiometry.append(self._analyze_stoichiometry(transition, input_arcs, output_arcs))
+                else:
+                    stoichiometry.append(self._analyze_stoichiometry(transition))
+            except Exception as e:
+                self.logger.warning(f"Stoichiometry analysis failed for "
+                                    f"{getattr(transition, 'id', 'unknown')}: {e}")
+                stoichiometry.append(None)  # Infer without stoichiometry refinement
+        
+        if workers and workers > 1 and len(transitions) >= PARALLEL_MIN_TRANSITIONS:
+            return self._infer_parallel(transitions, organism, stoichiometry, workers)
+        
+        return [
+            self._infer_guarded(transition, organism, stoich_info)
+            for transition, stoich_info in zip(transitions, stoichiometry)
+        ]
+    
+    def _infer_guarded(self,
+                       transition: Any,
+                       organism: str,
+                       stoich_info: Optional[Dict[str, Any]]) -> InferenceResult:
+        """_infer_single(), with errors turned into a failed_result()."""
+        try:
+            return self._infer_single(transition, organism, stoich_info)
+        except Exception as e:
+            self.logger.warning(f"Parameter inference failed for "
+                                f"{getattr(transition, 'id', 'unknown')}: {e}")
+            return failed_result(transition, organism, e)
+    
+    def _infer_single(self,
+                      transition: Any,
+                      organism: str,
+                      stoich_info: Optional[Dict[str, Any]]) -> InferenceResult:
+        """Infer parameters for one transition with precomputed stoichiometry."""
         # Step 1: Detect transition type
         transition_type = self.type_detector.detect_type(transition)
         
@@ -351,7 +461,7 @@ class HeuristicInferenceEngine:
             )
         
         # Step 4: Refine with stoichiometry analysis
-        parameters = self.infer_from_stoichiometry(transition, parameters)
+        parameters = self._refine_by_stoichiometry(transition, parameters, stoich_info)
         
         # Create result
         result = InferenceResult(
@@ -366,6 +476,71 @@ class HeuristicInferenceEngine:
         
         return result
     
+    def _infer_parallel(self,
+                        transitions: List[Any],
+                        organism: str,
+                        stoichiometry: List[Optional[Dict[str, Any]]],
+                        workers: int) -> List[InferenceResult]:
+        """Run _infer_single over worker processes.
+        
+        Workers get picklable snapshots of the transitions and a copy of
+        the session memo, so they never touch the database.
+        """
+        jobs = [
+            (_snapshot_transition(transition), stoich_info)
+            for transition, stoich_info in zip(transitions, stoichiometry)
+        ]
+        chunk_size = max(1, -(-len(jobs) // (workers * 4)))
+        chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+        
+        # 'spawn' is safe in the GTK process (no forked GLib state)
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=context,
+                                 initializer=_init_worker,
+                                 initargs=(self.db.db_path, dict(self._parameter_cache))) as executor:
+            results = []
+            for chunk_results in executor.map(_infer_chunk, chunks, repeat(organism)):
+                results.extend(chunk_results)
+        return results
+    
+    def _prefetch_parameters(self, transitions: List[Any], organism: str):
+        """Resolve database parameters for all transitions into the session memo.
+        
+        Both database-backed types are fetched, since stoichiometry may
+        override the detected type. Misses are memoized too.
+        """
+        lookups = set()
+        for transition in transitions:
+            ec_number = getattr(transition, 'ec_number', None)
+            reaction_id = getattr(transition, 'reaction_id', None)
+            if not (ec_number or reaction_id):
+                continue
+            for transition_type in DATABASE_TYPES:
+                if (transition_type.value, ec_number, reaction_id, organism) not in self._parameter_cache:
+                    lookups.add((transition_type, ec_number, reaction_id))
+        
+        if not lookups:
+            return
+        
+        found = self._query_database_batch(lookups, organism)
+        for transition_type, ec_number, reaction_id in lookups:
+            key = (transition_type.value, ec_number, reaction_id, organism)
+            self._parameter_cache[key] = found.get((transition_type, ec_number, reaction_id))
+    
+    def _cached_parameters(self,
+                           transition_type: TransitionType,
+                           ec_number: Optional[str],
+                           reaction_id: Optional[str],
+                           organism: str) -> Optional[TransitionParameters]:
+        """Copy of the memoized database parameters for a lookup (or None)."""
+        cached = self._parameter_cache.get((transition_type.value, ec_number, reaction_id, organism))
+        if cached is None:
+            return None
+        self.logger.debug(f"Using cached parameters for {ec_number or reaction_id} ({organism})")
+        # Callers refine parameters in place
+        return copy.copy(cached)
+    
     def _query_database(self,
                        transition_type: TransitionType,
                        ec_number: Optional[str],
@@ -382,79 +557,146 @@ class HeuristicInferenceEngine:
         Returns:
             Cached parameters if found, None otherwise
         """
-        # Generate query key for cache lookup
-        type_str = transition_type.value if transition_type != TransitionType.UNKNOWN else None
-        if not type_str:
-            return None
+        lookup = (transition_type, ec_number, reaction_id)
+        return self._query_database_batch([lookup], organism).get(lookup)
+    
+    def _query_database_batch(self,
+                              lookups: Iterable[Tuple[TransitionType, Optional[str], Optional[str]]],
+                              organism: str) -> Dict[Tuple, TransitionParameters]:
+        """Query database for many (type, EC number, reaction ID) lookups.
         
-        # Try exact match first
-        if ec_number:
-            query_key = f"{type_str}|EC:{ec_number}|{organism}"
-        elif reaction_id:
-            query_key = f"{type_str}|R:{reaction_id}|{organism}"
-        else:
-            return None
+        Per lookup, in order: query cache → exact organism match →
+        best cross-species match. Each stage is one set-based query for
+        all pending lookups.
+        
+        Args:
+            lookups: (transition_type, ec_number, reaction_id) tuples
+            organism: Target organism
+        
+        Returns:
+            Dict mapping lookup → parameters (lookups without a match are omitted)
+        """
+        lookups = [
+            lookup for lookup in dict.fromkeys(lookups)
+            if lookup[0] != TransitionType.UNKNOWN and (lookup[1] or lookup[2])
+        ]
+        found = {}
+        if not lookups:
+            return found
         
         # Check query cache
-        cached = self.db.get_cached_query(query_key)
-        if cached:
-            # Get full parameter details
-            param = self.db.get_parameter(cached['recommended_parameter_id'])
+        query_keys = {}
+        for transition_type, ec_number, reaction_id in lookups:
+            if ec_number:
+                query_key = f"{transition_type.value}|EC:{ec_number}|{organism}"
+            else:
+                query_key = f"{transition_type.value}|R:{reaction_id}|{organism}"
+            query_keys[(transition_type, ec_number, reaction_id)] = query_key
+        
+        cached = self.db.get_cached_queries(list(query_keys.values()))
+        cached_params = self.db.get_parameters(
+            [entry['recommended_parameter_id'] for entry in cached.values()]
+        )
+        
+        pending = []
+        for lookup in lookups:
+            entry = cached.get(query_keys[lookup])
+            param = cached_params.get(entry['recommended_parameter_id']) if entry else None
             if param:
-                self.logger.info(f"Database cache hit: {query_key}")
-                return self._dict_to_parameters(param, transition_type)
+                self.logger.info(f"Database cache hit: {query_keys[lookup]}")
+                found[lookup] = self._dict_to_parameters(param, lookup[0])
+            else:
+                pending.append(lookup)
         
-        # Try direct parameter query
-        results = self.db.query_parameters(
-            transition_type=type_str,
-            ec_number=ec_number,
-            reaction_id=reaction_id,
-            organism=organism,
-            min_confidence=0.5,
-            limit=1
+        if not pending:
+            return found
+        
+        # Direct and cross-species candidates for all pending lookups at once
+        rows = self.db.query_parameters_batch(
+            transition_types=[transition_type.value for transition_type, _, _ in pending],
+            ec_numbers=[ec_number for _, ec_number, _ in pending if ec_number],
+            reaction_ids=[reaction_id for _, _, reaction_id in pending if reaction_id],
+            min_confidence=0.5
         )
+        by_ec_number = {}
+        by_reaction_id = {}
+        for row in rows:
+            if row.get('ec_number'):
+                by_ec_number.setdefault((row['transition_type'], row['ec_number']), []).append(row)
+            if row.get('reaction_id'):
+                by_reaction_id.setdefault((row['transition_type'], row['reaction_id']), []).append(row)
+        
+        compatibility = {}
+        for lookup in pending:
+            transition_type, ec_number, reaction_id = lookup
+            if ec_number:
+                candidates = by_ec_number.get((transition_type.value, ec_number), [])
+                if reaction_id:
+                    candidates = [row for row in candidates if row['reaction_id'] == reaction_id]
+            else:
+                candidates = by_reaction_id.get((transition_type.value, reaction_id), [])
+            
+            params = self._select_parameters(lookup, candidates, organism, compatibility)
+            if params:
+                found[lookup] = params
+        
+        return found
+    
+    def _select_parameters(self,
+                           lookup: Tuple[TransitionType, Optional[str], Optional[str]],
+                           candidates: List[Dict[str, Any]],
+                           organism: str,
+                           compatibility: Dict[Tuple[str, Optional[str]], float]) -> Optional[TransitionParameters]:
+        """Pick the best database row for a lookup.
+        
+        Args:
+            lookup: (transition_type, ec_number, reaction_id)
+            candidates: Matching rows, best first (confidence, then usage)
+            organism: Target organism
+            compatibility: Memo of organism compatibility scores
+        
+        Returns:
+            Parameters, or None if no row is good enough
+        """
+        transition_type, ec_number, reaction_id = lookup
         
-        if results:
-            self.logger.info(f"Database parameter found: {ec_number or reaction_id}")
-            return self._dict_to_parameters(results[0], transition_type)
+        # Try direct parameter match
+        for result in candidates:
+            if result['organism'] == organism:
+                self.logger.info(f"Database parameter found: {ec_number or reaction_id}")
+                return self._dict_to_parameters(result, transition_type)
         
         # Try cross-species match
-        if organism != "generic":
-            results = self.db.query_parameters(
-                transition_type=type_str,
-                ec_number=ec_number,
-                reaction_id=reaction_id,
-                min_confidence=0.5,
-                limit=5
-            )
+        if organism == "generic" or not candidates:
+            return None
+        
+        # Get enzyme class (first two parts of EC number, e.g., "2.7")
+        enzyme_class = '.'.join(ec_number.split('.')[0:2]) if ec_number and '.' in ec_number else None
+        
+        best_result = None
+        best_score = 0.0
+        for result in candidates[:5]:
+            # Get organism compatibility and adjust confidence
+            key = (result['organism'], enzyme_class)
+            if key not in compatibility:
+                compatibility[key] = self.db.get_compatibility_score(
+                    result['organism'],
+                    organism,
+                    enzyme_class
+                )
             
-            if results:
-                # Get organism compatibility and adjust confidence
-                best_result = None
-                best_score = 0.0
-                
-                for result in results:
-                    # Get enzyme class (first two parts of EC number, e.g., "2.7")
-                    enzyme_class = '.'.join(ec_number.split('.')[0:2]) if ec_number and '.' in ec_number else None
-                    
-                    compat_score = self.db.get_compatibility_score(
-                        result['organism'],
-                        organism,
-                        enzyme_class
-                    )
-                    
-                    adjusted_confidence = result['confidence_score'] * compat_score
-                    if adjusted_confidence > best_score:
-                        best_score = adjusted_confidence
-                        best_result = result
-                
-                if best_result and best_score >= 0.5:
-                    self.logger.info(f"Database cross-species match: {best_result['organism']} → {organism}")
-                    params = self._dict_to_parameters(best_result, transition_type)
-                    # Adjust confidence for cross-species
-                    params.confidence_score = best_score
-                    params.notes = f"Cross-species: {best_result['organism']} → {organism}"
-                    return params
+            adjusted_confidence = result['confidence_score'] * compatibility[key]
+            if adjusted_confidence > best_score:
+                best_score = adjusted_confidence
+                best_result = result
+        
+        if best_result and best_score >= 0.5:
+            self.logger.info(f"Database cross-species match: {best_result['organism']} → {organism}")
+            params = self._dict_to_parameters(best_result, transition_type)
+            # Adjust confidence for cross-species
+            params.confidence_score = best_score
+            params.notes = f"Cross-species: {best_result['organism']} → {organism}"
+            return params
         
         return None
     
@@ -644,12 +886,9 @@ class HeuristicInferenceEngine:
         label = getattr(transition, 'label', '').lower()
         
         # Check cache first (from previous fetches)
-        cache_key = (ec_number or reaction_id or 'generic', organism)
-        if cache_key in self._parameter_cache:
-            cached = self._parameter_cache[cache_key]
-            if isinstance(cached, StochasticParameters):
-                self.logger.info(f"Using cached parameters for {cache_key}")
-                return cached
+        cached = self._cached_parameters(TransitionType.STOCHASTIC, ec_number, reaction_id, organism)
+        if isinstance(cached, StochasticParameters):
+            return cached
         
         # Fast heuristic defaults based on label
         if 'expression' in label or 'gene' in label or 'transcription' in label:
@@ -708,12 +947,9 @@ class HeuristicInferenceEngine:
         name = getattr(transition, 'name', '').lower()
         
         # Check cache first
-        cache_key = (ec_number or reaction_id or 'generic', organism)
-        if cache_key in self._parameter_cache:
-            cached = self._parameter_cache[cache_key]
-            if isinstance(cached, ContinuousParameters):
-                self.logger.info(f"Using cached parameters for {cache_key}")
-                return cached
+        cached = self._cached_parameters(TransitionType.CONTINUOUS, ec_number, reaction_id, organism)
+        if isinstance(cached, ContinuousParameters):
+            return cached
         
         # Fast heuristic defaults by EC class and label
         vmax, km, kcat = self._get_default_kinetics(ec_number, label, organism)
@@ -885,7 +1121,13 @@ class HeuristicInferenceEngine:
         """
         # Extract stoichiometry information
         stoich_info = self._analyze_stoichiometry(transition)
-        
+        return self._refine_by_stoichiometry(transition, base_params, stoich_info)
+    
+    def _refine_by_stoichiometry(self,
+                                 transition: Any,
+                                 base_params: TransitionParameters,
+                                 stoich_info: Optional[Dict[str, Any]]) -> TransitionParameters:
+        """Apply infer_from_stoichiometry() with precomputed stoichiometry."""
         if not stoich_info:
             # No stoichiometry info available, return base params
             return base_params
@@ -1017,7 +1259,10 @@ class HeuristicInferenceEngine:
         params.notes = f"Type override (stoichiometry): {reason} | {params.notes or ''}"
         return params
     
-    def _analyze_stoichiometry(self, transition: Any) -> Optional[Dict[str, Any]]:
+    def _analyze_stoichiometry(self,
+                               transition: Any,
+                               input_arcs: Optional[List[Any]] = None,
+                               output_arcs: Optional[List[Any]] = None) -> Optional[Dict[str, Any]]:
         """Analyze stoichiometry from transition arcs.
         
         Extracts:
@@ -1028,15 +1273,22 @@ class HeuristicInferenceEngine:
         
         Args:
             transition: Transition object
+            input_arcs: Arcs into the transition (default: transition.input_arcs)
+            output_arcs: Arcs out of the transition (default: transition.output_arcs)
             
         Returns:
             Dict with stoichiometry info or None
         """
         try:
+            if input_arcs is None:
+                input_arcs = getattr(transition, 'input_arcs', None) or []
+            if output_arcs is None:
+                output_arcs = getattr(transition, 'output_arcs', None) or []
+            
             # Get input arcs (places → transition)
             inputs = []
-            if hasattr(transition, 'input_arcs'):
-                for arc in transition.input_arcs:
+            if input_arcs:
+                for arc in input_arcs:
                     weight = getattr(arc, 'weight', 1)
                     place_id = getattr(arc, 'source_id', None) or getattr(arc, 'place_id', None)
                     initial_marking = getattr(arc.source, 'initial_marking', 0) if hasattr(arc, 'source') else 0
@@ -1048,8 +1300,8 @@ class HeuristicInferenceEngine:
             
             # Get output arcs (transition → places)
             outputs = []
-            if hasattr(transition, 'output_arcs'):
-                for arc in transition.output_arcs:
+            if output_arcs:
+                for arc in output_arcs:
                     weight = getattr(arc, 'weight', 1)
                     place_id = getattr(arc, 'target_id', None) or getattr(arc, 'place_id', None)
                     initial_marking = getattr(arc.target, 'initial_marking', 0) if hasattr(arc, 'target') else 0
@@ -1225,3 +1477,44 @@ class HeuristicInferenceEngine:
         )
 
 
+def failed_result(transition: Any, organism: str, error: Exception) -> InferenceResult:
+    """Result for a transition whose inference raised (UNKNOWN type, zero confidence)."""
+    return InferenceResult(
+        transition_id=getattr(transition, 'id', 'unknown'),
+        parameters=TransitionParameters(
+            transition_type=TransitionType.UNKNOWN,
+            biological_semantics=BiologicalSemantics.UNKNOWN,
+            organism=organism
+        ),
+        inference_metadata={'error': f"{type(error).__name__}: {error}"}
+    )
+
+
+# ==================== Worker processes (infer_batch) ====================
+
+_worker_engine = None
+
+
+def _snapshot_transition(transition: Any) -> SimpleNamespace:
+    """Picklable copy of the transition attributes inference reads."""
+    return SimpleNamespace(**{
+        name: getattr(transition, name)
+        for name in TRANSITION_ATTRIBUTES
+        if hasattr(transition, name)
+    })
+
+
+def _init_worker(db_path: str, parameter_cache: Dict):
+    """Create the worker's engine with the parent's session memo."""
+    global _worker_engine
+    _worker_engine = HeuristicInferenceEngine(db_path=db_path)
+    _worker_engine._parameter_cache = parameter_cache
+
+
+def _infer_chunk(jobs: List[Tuple[SimpleNamespace, Optional[Dict[str, Any]]]],
+                 organism: str) -> List[InferenceResult]:
+    """Infer a chunk of (snapshot, stoichiometry) jobs in a worker."""
+    return [
+        _worker_engine._infer_guarded(transition, organism, stoich_info)
+        for transition, stoich_info in jobs
+    ]
@@ -592,11 +592,12 @@ class SBMLEnricher:
             List of pathway IDs, prioritizing organism-specific pathways
         """
         try:
-            import urllib.request
+            from shypn.utils.http_cache import get_http_cache
             
             url = f"https://rest.kegg.jp/link/pathway/{compound_id}"
-            with urllib.request.urlopen(url, timeout=5) as response:
-                data = response.read().decode('utf-8')
+            response = get_http_cache().get(url, timeout=5)
+            response.raise_for_status()
+            data = response.text
             
             # Parse response: "cpd:C00031\tpath:hsa00010"
             pathways = []
@@ -627,11 +628,12 @@ class SBMLEnricher:
             List of pathway IDs, prioritizing organism-specific pathways
         """
         try:
-            import urllib.request
+            from shypn.utils.http_cache import get_http_cache
             
             url = f"https://rest.kegg.jp/link/pathway/{reaction_id}"
-            with urllib.request.urlopen(url, timeout=5) as response:
-                data = response.read().decode('utf-8')
+            response = get_http_cache().get(url, timeout=5)
+            response.raise_for_status()
+            data = response.text
             
             # Parse response
             pathways = []
@@ -22,6 +22,9 @@ class DocumentModel:
     The model is independent of viewport and rendering concerns.
     """
     
+    # Documents with at least this many objects are saved without indentation
+    COMPACT_SAVE_THRESHOLD = 1000
+    
     def __init__(self):
         """Initialize empty document model."""
         self.places: List[Place] = []
@@ -415,75 +418,102 @@ class DocumentModel:
         Raises:
             ValueError: If data format is invalid
         """
+        return cls._from_members(data.items())
+    
+    @classmethod
+    def _from_members(cls, members) -> 'DocumentModel':
+        """Build a document from (key, value) pairs of the serialized dict.
+        
+        Values of 'places', 'transitions' and 'arcs' may be lazy iterators
+        (streaming load), so objects are created as elements are decoded.
+        Arcs are deferred if they come before places or transitions.
+        
+        Args:
+            members: Iterable of (key, value) pairs
+            
+        Returns:
+            DocumentModel instance with all objects restored
+        """
         # Create empty document
         document = cls()
+        id_manager = document.id_manager
         
-        # Check version (for future compatibility)
-        version = data.get("version", "1.0")
-        if not version.startswith("2."):
-            pass  # Version check - could add migration logic here
-        
-        # Restore places first (they have no dependencies)
         places_dict = {}
-        for place_data in data.get("places", []):
-            place = Place.from_dict(place_data)
-            document.places.append(place)
-            places_dict[place.id] = place  # Use string ID as dict key
-            # Register ID to update counter (LOCAL ONLY to avoid scope contamination)
-            with suspend_lifecycle_delegation():
-                document.id_manager.register_place_id(place.id)
-        
-        # Restore transitions second (they have no dependencies)
         transitions_dict = {}
-        for transition_data in data.get("transitions", []):
-            transition = Transition.from_dict(transition_data)
-            document.transitions.append(transition)
-            transitions_dict[transition.id] = transition  # Use string ID as dict key
-            # Register ID to update counter (LOCAL ONLY)
-            with suspend_lifecycle_delegation():
-                document.id_manager.register_transition_id(transition.id)
-        
-        # Restore arcs last (they depend on places and transitions)
-        for arc_data in data.get("arcs", []):
-            arc = Arc.from_dict(arc_data, places=places_dict, transitions=transitions_dict)
-            document.arcs.append(arc)
-            # Register ID to update counter (LOCAL ONLY)
-            with suspend_lifecycle_delegation():
-                document.id_manager.register_arc_id(arc.id)
-        
-        # IMPORTANT: Reset all places to their initial marking
-        # When loading a saved file, we want to start with the initial state,
-        # not the simulation state that was active when the file was saved
-        for place in document.places:
-            if hasattr(place, 'initial_marking'):
-                place.tokens = place.initial_marking
-        
-        # Restore view state if present
-        if "view_state" in data:
-            document.view_state = data["view_state"]
-        
-        # Restore metadata if present (source, has_test_arcs, model_type, etc.)
-        if "metadata" in data:
-            # Filter out serialization-only metadata (created, object_counts)
-            # and only restore application metadata
-            metadata = {k: v for k, v in data["metadata"].items() 
-                       if k not in ("created", "object_counts")}
-            if metadata:
-                document.metadata = metadata
+        sections_seen = set()
+        deferred_arcs = []
+        
+        def restore_arcs(arcs_data):
+            for arc_data in arcs_data:
+                arc = Arc.from_dict(arc_data, places=places_dict, transitions=transitions_dict)
+                document.arcs.append(arc)
+                id_manager.register_arc_id(arc.id)
+        
+        # Register IDs to update counters (LOCAL ONLY to avoid scope contamination)
+        with suspend_lifecycle_delegation():
+            for key, value in members:
+                if key == "places":
+                    for place_data in value:
+                        place = Place.from_dict(place_data)
+                        # IMPORTANT: Reset to the initial marking - when loading a
+                        # saved file we start from the initial state, not the
+                        # simulation state that was active when the file was saved
+                        if hasattr(place, 'initial_marking'):
+                            place.tokens = place.initial_marking
+                        document.places.append(place)
+                        places_dict[place.id] = place  # Use string ID as dict key
+                        id_manager.register_place_id(place.id)
+                
+                elif key == "transitions":
+                    for transition_data in value:
+                        transition = Transition.from_dict(transition_data)
+                        document.transitions.append(transition)
+                        transitions_dict[transition.id] = transition  # Use string ID as dict key
+                        id_manager.register_transition_id(transition.id)
+                
+                elif key == "arcs":
+                    # Arcs depend on places and transitions
+                    if "places" in sections_seen and "transitions" in sections_seen:
+                        restore_arcs(value)
+                    else:
+                        deferred_arcs.extend(value)
+                
+                elif key == "view_state":
+                    document.view_state = value
+                
+                elif key == "metadata":
+                    # Filter out serialization-only metadata (created, object_counts)
+                    # and only restore application metadata
+                    metadata = {k: v for k, v in value.items()
+                               if k not in ("created", "object_counts")}
+                    if metadata:
+                        document.metadata = metadata
+                
+                # "version" needs no handling yet (could add migration logic here)
+                sections_seen.add(key)
+            
+            restore_arcs(deferred_arcs)
         
         return document
     
-    def save_to_file(self, filepath: str) -> None:
+    def save_to_file(self, filepath: str, compact: Optional[bool] = None,
+                     compression: Optional[str] = None, columns: bool = False) -> None:
         """Save document to JSON file.
         
         Args:
             filepath: Path to save file (should already have extension like .shy)
+            compact: Write without indentation. Defaults to compact for
+                documents with COMPACT_SAVE_THRESHOLD objects or more, and
+                whenever compression is requested
+            compression: None, 'gzip' or 'zstd' (load detects it automatically)
+            columns: Also write the NumPy columnar sidecar (see shy_io)
             
         Raises:
             IOError: If file cannot be written
+            ValueError: If compression is unknown or unavailable
         """
-        import json
         import os
+        from . import shy_io
         
         # Don't modify filepath - it should already have the correct extension (.shy)
         # The .shy extension is used for SHYpn Petri net files (which are JSON internally)
@@ -493,16 +523,25 @@ class DocumentModel:
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
         
+        if compact is None:
+            object_count = len(self.places) + len(self.transitions) + len(self.arcs)
+            compact = compression is not None or object_count >= self.COMPACT_SAVE_THRESHOLD
+        
         # Serialize and save
-        data = self.to_dict()
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        shy_io.write_document(self.to_dict(), filepath, compact=compact, compression=compression)
         
+        if columns:
+            shy_io.write_columns(self, filepath)
+        else:
+            shy_io.remove_columns(filepath)
     
     @classmethod
     def load_from_file(cls, filepath: str) -> 'DocumentModel':
         """Load document from JSON file.
         
+        Plain, compact and compressed (gzip/zstd) files are accepted. The
+        object arrays are streamed, so objects are built while reading.
+        
         Args:
             filepath: Path to file to load
             
@@ -513,11 +552,22 @@ class DocumentModel:
             IOError: If file cannot be read
             ValueError: If file format is invalid
         """
-        import json
+        from . import shy_io
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        document = cls.from_dict(data)
+        with shy_io.open_document(filepath) as f:
+            document = cls._from_members(shy_io.iter_members(f))
         
         return document
+    
+    @staticmethod
+    def load_columns(filepath: str):
+        """Memory-map the columnar sidecar written by save_to_file(columns=True).
+        
+        Args:
+            filepath: Path of the .shy file
+            
+        Returns:
+            shy_io.ShyColumns, or None if missing or older than the file
+        """
+        from . import shy_io
+        return shy_io.load_columns(filepath)
@@ -0,0 +1,402 @@
+"""SHY File I/O - Compact, compressed and streaming .shy serialization.
+
+A .shy file is a JSON document (see DocumentModel.to_dict). This module
+adds three things on top of plain json.dump/json.load, all of which stay
+readable by the loader without any flag:
+
+- Compact encoding: no indentation, encoded by the C JSON encoder
+  (json.dump with indent uses the pure-Python encoder)
+- Optional compression: gzip (stdlib) or zstd (needs 'zstandard');
+  detected on load from the magic bytes, so the extension stays .shy
+- Streaming load: the places/transitions/arcs arrays are decoded one
+  element at a time, so objects are built while reading and the whole
+  dict tree is never held in memory
+
+Optional columnar sidecar:
+    Positions, markings and arc endpoint indices can be written as NumPy
+    arrays next to the .shy file (hidden directory '.<name>.shy.cols').
+    load_columns() opens them with np.load(mmap_mode='r') for consumers
+    that only need numbers (previews, analyses) without building objects.
+    The sidecar is tied to the size and mtime of its .shy file and is
+    ignored once the .shy file changes.
+"""
+
+import gzip
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+
+# Try to import zstandard (optional zstd compression)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+COMPRESSIONS = (None, 'gzip', 'zstd')
+
+# Top-level arrays decoded element by element while loading
+STREAMED_SECTIONS = ('places', 'transitions', 'arcs')
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+COLUMNS_FORMAT = 1
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+# ============================================================================
+# Writing
+# ============================================================================
+
+def write_document(data: dict, filepath: str, compact: bool = True,
+                   compression: Optional[str] = None) -> None:
+    """Write a serialized document to a .shy file.
+
+    Args:
+        data: Document dictionary (DocumentModel.to_dict())
+        filepath: Destination path
+        compact: If True, no indentation or spaces after separators
+        compression: None, 'gzip' or 'zstd'
+
+    Raises:
+        ValueError: If compression is unknown or zstandard is not installed
+        IOError: If file cannot be written
+    """
+    _check_compression(compression)
+
+    if compact:
+        text = json.dumps(data, separators=(',', ':'))
+    else:
+        text = json.dumps(data, indent=2)
+    payload = text.encode('utf-8')
+
+    if compression == 'gzip':
+        payload = gzip.compress(payload, compresslevel=6)
+    elif compression == 'zstd':
+        payload = zstandard.ZstdCompressor(level=3).compress(payload)
+
+    with open(filepath, 'wb') as f:
+        f.write(payload)
+
+
+def _check_compression(compression: Optional[str]) -> None:
+    """Validate a compression name."""
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unknown compression '{compression}' (expected one of {COMPRESSIONS})"
+        )
+    if compression == 'zstd' and not ZSTD_AVAILABLE:
+        raise ValueError("zstd compression requires 'zstandard' (pip install zstandard)")
+
+
+# ============================================================================
+# Reading
+# ============================================================================
+
+def detect_compression(filepath: str) -> Optional[str]:
+    """Detect the compression of a .shy file from its magic bytes.
+
+    Returns:
+        None (plain JSON), 'gzip' or 'zstd'
+    """
+    with open(filepath, 'rb') as f:
+        magic = f.read(4)
+    if magic[:2] == GZIP_MAGIC:
+        return 'gzip'
+    if magic == ZSTD_MAGIC:
+        return 'zstd'
+    return None
+
+
+def open_document(filepath: str) -> TextIO:
+    """Open a .shy file for reading as text, decompressing transparently.
+
+    Raises:
+        ValueError: If the file is zstd-compressed and zstandard is missing
+        IOError: If file cannot be read
+    """
+    compression = detect_compression(filepath)
+    if compression == 'gzip':
+        return gzip.open(filepath, 'rt', encoding='utf-8')
+    if compression == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ValueError(
+                f"{filepath} is zstd-compressed; install 'zstandard' to open it"
+            )
+        return zstandard.open(filepath, 'rt', encoding='utf-8')
+    return open(filepath, 'r', encoding='utf-8')
+
+
+def iter_members(fp: TextIO,
+                 streamed: Sequence[str] = STREAMED_SECTIONS,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """Iterate over the members of a top-level JSON object.
+
+    Members named in `streamed` whose value is an array are yielded as a
+    lazy iterator over the array elements; it must be consumed before
+    advancing (unconsumed elements are skipped). All other members are
+    yielded fully decoded.
+
+    Args:
+        fp: Text stream positioned at the start of the document
+        streamed: Member names to stream element by element
+        chunk_size: Number of characters read at a time
+
+    Yields:
+        (key, value) pairs in file order
+
+    Raises:
+        ValueError: If the document is not a JSON object
+    """
+    reader = _JsonStreamReader(fp, chunk_size)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+
+    while True:
+        key = reader.value()
+        reader.expect(':')
+        if key in streamed and reader.peek() == '[':
+            items = reader.iter_array()
+            yield key, items
+            for _ in items:
+                pass  # Skip whatever the consumer left unread
+        else:
+            yield key, reader.value()
+
+        if reader.peek() == ',':
+            reader.expect(',')
+            continue
+        reader.expect('}')
+        return
+
+
+class _JsonStreamReader:
+    """Incremental JSON reader over a text stream.
+
+    Decodes one value at a time with json.JSONDecoder.raw_decode (C
+    scanner) on a buffer that is refilled in chunks as needed.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping consumed text. False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at EOF)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        """Consume `char` (after whitespace) or raise ValueError."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Invalid .shy document: expected '{char}', found '{found or 'end of file'}'"
+            )
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Value continues past the buffer: read more and retry
+                if self._fill():
+                    continue
+                raise
+            # A number ending at the buffer end may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def iter_array(self) -> Iterator[Any]:
+        """Decode the elements of the next JSON array one at a time."""
+        self.expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self._pos += 1
+                continue
+            self.expect(']')
+            return
+
+
+# ============================================================================
+# Columnar sidecar
+# ============================================================================
+
+@dataclass
+class ShyColumns:
+    """Numeric columns of a document, memory-mapped from the sidecar.
+
+    Node indices in arc_source/arc_target number places first
+    (0..num_places-1), then transitions.
+
+    Attributes:
+        place_ids: Place IDs
+        place_xy: (num_places, 2) float64 positions
+        place_marking: Current marking per place
+        place_initial_marking: Initial marking per place
+        transition_ids: Transition IDs
+        transition_xy: (num_transitions, 2) float64 positions
+        arc_ids: Arc IDs
+        arc_source: int32 source node index per arc
+        arc_target: int32 target node index per arc
+        arc_weight: float64 weight per arc
+    """
+    place_ids: np.ndarray
+    place_xy: np.ndarray
+    place_marking: np.ndarray
+    place_initial_marking: np.ndarray
+    transition_ids: np.ndarray
+    transition_xy: np.ndarray
+    arc_ids: np.ndarray
+    arc_source: np.ndarray
+    arc_target: np.ndarray
+    arc_weight: np.ndarray
+
+
+def columns_path(filepath: str) -> str:
+    """Sidecar directory for a .shy file (hidden, next to the file)."""
+    directory, name = os.path.split(os.path.abspath(filepath))
+    return os.path.join(directory, f'.{name}.cols')
+
+
+def write_columns(document, filepath: str) -> str:
+    """Write the columnar sidecar for a saved document.
+
+    Must be called after the .shy file is written: the sidecar records
+    the file's size and mtime to detect staleness.
+
+    Args:
+        document: DocumentModel that was saved to filepath
+        filepath: Path of the saved .shy file
+
+    Returns:
+        Path of the sidecar directory
+    """
+    places = document.places
+    transitions = document.transitions
+    arcs = document.arcs
+
+    node_index = {id(place): i for i, place in enumerate(places)}
+    offset = len(places)
+    node_index.update((id(transition), offset + i) for i, transition in enumerate(transitions))
+
+    columns = {
+        'place_ids': np.array([str(place.id) for place in places], dtype=str),
+        'place_xy': np.array([(place.x, place.y) for place in places], dtype=np.float64).reshape(-1, 2),
+        'place_marking': np.array([_as_float(place.tokens) for place in places], dtype=np.float64),
+        'place_initial_marking': np.array(
+            [_as_float(getattr(place, 'initial_marking', 0)) for place in places], dtype=np.float64
+        ),
+        'transition_ids': np.array([str(transition.id) for transition in transitions], dtype=str),
+        'transition_xy': np.array(
+            [(transition.x, transition.y) for transition in transitions], dtype=np.float64
+        ).reshape(-1, 2),
+        'arc_ids': np.array([str(arc.id) for arc in arcs], dtype=str),
+        'arc_source': np.array([node_index.get(id(arc.source), -1) for arc in arcs], dtype=np.int32),
+        'arc_target': np.array([node_index.get(id(arc.target), -1) for arc in arcs], dtype=np.int32),
+        'arc_weight': np.array([_as_float(arc.weight) for arc in arcs], dtype=np.float64),
+    }
+
+    directory = columns_path(filepath)
+    os.makedirs(directory, exist_ok=True)
+    for name, array in columns.items():
+        np.save(os.path.join(directory, f'{name}.npy'), array, allow_pickle=False)
+
+    stat = os.stat(filepath)
+    manifest = {
+        'format': COLUMNS_FORMAT,
+        'source_size': stat.st_size,
+        'source_mtime_ns': stat.st_mtime_ns,
+        'counts': {'places': len(places), 'transitions': len(transitions), 'arcs': len(arcs)},
+    }
+    with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+
+    return directory
+
+
+def load_columns(filepath: str) -> Optional[ShyColumns]:
+    """Memory-map the columnar sidecar of a .shy file.
+
+    Returns:
+        ShyColumns, or None if there is no sidecar or it is out of date
+    """
+    directory = columns_path(filepath)
+    try:
+        with open(os.path.join(directory, 'manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        stat = os.stat(filepath)
+    except (OSError, ValueError):
+        return None
+
+    if (manifest.get('format') != COLUMNS_FORMAT
+            or manifest.get('source_size') != stat.st_size
+            or manifest.get('source_mtime_ns') != stat.st_mtime_ns):
+        return None
+
+    try:
+        arrays = {
+            name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r', allow_pickle=False)
+            for name in ShyColumns.__dataclass_fields__
+        }
+    except (OSError, ValueError):
+        return None
+    return ShyColumns(**arrays)
+
+
+def remove_columns(filepath: str) -> None:
+    """Delete the sidecar of a .shy file, if any."""
+    directory = columns_path(filepath)
+    if not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+    os.rmdir(directory)
+
+
+def _as_float(value) -> float:
+    """Convert a marking or weight to float (NaN if not numeric)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
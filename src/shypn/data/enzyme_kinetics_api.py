@@ -31,7 +31,6 @@ Example:
     >>> enzyme = api_offline.lookup("2.7.1.1")  # From fallback
 """
 
-import requests
 import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
@@ -40,6 +39,9 @@ import json
 from pathlib import Path
 import time
 
+from shypn.utils.http_cache import get_http_cache
+from shypn.utils.sqlite_pool import get_pool
+
 
 class EnzymeKineticsAPI:
     """
@@ -95,6 +97,8 @@ class EnzymeKineticsAPI:
         cache_dir.mkdir(parents=True, exist_ok=True)
         
         self.cache_db = cache_dir / "enzyme_kinetics.db"
+        self._pool = get_pool(self.cache_db)
+        self._closed = False
         self.cache_ttl = timedelta(days=cache_ttl_days)
         self.offline_mode = offline_mode
         self.api_timeout = api_timeout
@@ -117,27 +121,23 @@ class EnzymeKineticsAPI:
     
     def _init_cache(self):
         """Initialize SQLite cache database with schema."""
-        conn = sqlite3.connect(self.cache_db)
-        
-        # Create cache table
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS enzyme_cache (
-                ec_number TEXT PRIMARY KEY,
-                data TEXT NOT NULL,
-                fetched_at TIMESTAMP NOT NULL,
-                source TEXT NOT NULL,
-                fetch_duration_ms INTEGER
-            )
-        """)
-        
-        # Create index for efficient queries
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_fetched_at 
-            ON enzyme_cache(fetched_at)
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self._pool.transaction() as conn:
+            # Create cache table
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS enzyme_cache (
+                    ec_number TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    fetched_at TIMESTAMP NOT NULL,
+                    source TEXT NOT NULL,
+                    fetch_duration_ms INTEGER
+                )
+            """)
+            
+            # Create index for efficient queries
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_fetched_at 
+                ON enzyme_cache(fetched_at)
+            """)
         
         self.logger.debug(f"Cache initialized at {self.cache_db}")
     
@@ -203,8 +203,8 @@ class EnzymeKineticsAPI:
                 cached['_lookup_source'] = 'cache'
                 return cached
         
-        # TIER 2: External API
-        if not self.offline_mode:
+        # TIER 2: External API (skipped when the shared HTTP cache is offline)
+        if not self.offline_mode and not get_http_cache().offline:
             api_result = self._fetch_from_api(ec_number)
             if api_result:
                 # Cache the result
@@ -248,8 +248,7 @@ class EnzymeKineticsAPI:
             Cached enzyme data or None if not in cache or expired
         """
         try:
-            conn = sqlite3.connect(self.cache_db)
-            cursor = conn.execute(
+            cursor = self._pool.execute(
                 """
                 SELECT data, fetched_at, source 
                 FROM enzyme_cache 
@@ -258,7 +257,6 @@ class EnzymeKineticsAPI:
                 (ec_number,)
             )
             row = cursor.fetchone()
-            conn.close()
             
             if not row:
                 return None
@@ -288,13 +286,11 @@ class EnzymeKineticsAPI:
     def _get_cache_age(self, ec_number: str) -> str:
         """Get human-readable cache age."""
         try:
-            conn = sqlite3.connect(self.cache_db)
-            cursor = conn.execute(
+            cursor = self._pool.execute(
                 "SELECT fetched_at FROM enzyme_cache WHERE ec_number = ?",
                 (ec_number,)
             )
             row = cursor.fetchone()
-            conn.close()
             
             if row:
                 fetched_time = datetime.fromisoformat(row[0])
@@ -330,8 +326,7 @@ class EnzymeKineticsAPI:
             cache_data = {k: v for k, v in data.items() 
                          if not k.startswith('_')}
             
-            conn = sqlite3.connect(self.cache_db)
-            conn.execute(
+            self._pool.execute(
                 """
                 INSERT OR REPLACE INTO enzyme_cache 
                 (ec_number, data, fetched_at, source, fetch_duration_ms)
@@ -345,8 +340,6 @@ class EnzymeKineticsAPI:
                     fetch_duration_ms
                 )
             )
-            conn.commit()
-            conn.close()
             
             self.logger.debug(f"Cached EC {ec_number} from {source}")
             
@@ -393,14 +386,12 @@ class EnzymeKineticsAPI:
             >>> api.clear_cache()  # Clear everything
         """
         try:
-            conn = sqlite3.connect(self.cache_db)
-            
             if older_than_days is None:
-                conn.execute("DELETE FROM enzyme_cache")
+                self._pool.execute("DELETE FROM enzyme_cache")
                 self.logger.info("Cleared all cache entries")
             else:
                 cutoff = datetime.now() - timedelta(days=older_than_days)
-                cursor = conn.execute(
+                cursor = self._pool.execute(
                     "DELETE FROM enzyme_cache WHERE fetched_at < ?",
                     (cutoff.isoformat(),)
                 )
@@ -409,9 +400,6 @@ class EnzymeKineticsAPI:
                     f"Cleared {deleted} cache entries older than {older_than_days} days"
                 )
             
-            conn.commit()
-            conn.close()
-            
         except Exception as e:
             self.logger.error(f"Error clearing cache: {e}")
     
@@ -436,7 +424,7 @@ class EnzymeKineticsAPI:
             >>> print(f"Cache has {stats['valid_entries']} valid entries")
         """
         try:
-            conn = sqlite3.connect(self.cache_db)
+            conn = self._pool.connection()
             
             # Total entries
             cursor = conn.execute("SELECT COUNT(*) FROM enzyme_cache")
@@ -459,8 +447,6 @@ class EnzymeKineticsAPI:
             )
             avg_fetch_ms = cursor.fetchone()[0] or 0
             
-            conn.close()
-            
             # Cache file size
             cache_size_kb = self.cache_db.stat().st_size / 1024 if self.cache_db.exists() else 0
             
@@ -512,6 +498,17 @@ class EnzymeKineticsAPI:
         self.logger.info(
             f"Cache warming complete: {cached_count} cached, {failed_count} failed"
         )
+    
+    def close(self):
+        """
+        Release the pooled connections to the cache database.
+        
+        The shared pool is closed once its last holder released it.
+        Idempotent; the API must not be used afterwards.
+        """
+        if not self._closed:
+            self._closed = True
+            self._pool.release()
 
 
 # ============================================================================
@@ -538,6 +535,8 @@ def get_api(offline_mode: bool = False) -> EnzymeKineticsAPI:
     """
     global _global_api
     if _global_api is None or _global_api.offline_mode != offline_mode:
+        if _global_api is not None:
+            _global_api.close()
         _global_api = EnzymeKineticsAPI(offline_mode=offline_mode)
     return _global_api
 
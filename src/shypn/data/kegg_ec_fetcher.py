@@ -14,16 +14,33 @@ Example:
     ['2.7.1.1']  # hexokinase
 """
 
+import atexit
 import logging
-import requests
 import json
-import concurrent.futures
+import threading
+import weakref
+from contextlib import contextmanager, nullcontext
 from typing import List, Optional, Dict, Callable
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from shypn.utils.http_cache import (
+    HTTPCache, HTTPCacheError, HTTPStatusError, HTTPTimeoutError, get_http_cache
+)
+from shypn.utils.sqlite_pool import get_pool
+
 logger = logging.getLogger(__name__)
 
+# Open PersistentECCache instances, possibly with unsaved entries (closed at exit)
+_open_caches: "weakref.WeakSet[PersistentECCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches():
+    """Write pending EC cache entries before the interpreter exits."""
+    for cache in list(_open_caches):
+        cache.close()
+
 
 class KEGGECFetcher:
     """
@@ -44,18 +61,22 @@ class KEGGECFetcher:
         base_url: KEGG REST API base URL
         timeout: Request timeout in seconds
         cache: In-memory cache for fetched EC numbers
+        http_cache: Shared HTTP response cache (raw KEGG responses)
     """
     
-    def __init__(self, timeout: int = 5, use_persistent_cache: bool = True):
+    def __init__(self, timeout: int = 5, use_persistent_cache: bool = True,
+                 http_cache: Optional[HTTPCache] = None):
         """
         Initialize KEGG EC fetcher.
         
         Args:
             timeout: HTTP request timeout in seconds (default: 5)
             use_persistent_cache: Use persistent file cache (default: True)
+            http_cache: HTTP response cache (default: shared cache under ~/.shypn/cache)
         """
         self.base_url = "https://rest.kegg.jp"
         self.timeout = timeout
+        self.http_cache = http_cache if http_cache is not None else get_http_cache()
         self.cache: Dict[str, List[str]] = {}  # In-memory cache
         
         # Persistent cache (survives app restarts)
@@ -110,7 +131,7 @@ class KEGGECFetcher:
             url = f"{self.base_url}/get/{normalized_id}"
             logger.debug(f"Fetching EC numbers from KEGG: {url}")
             
-            response = requests.get(url, timeout=self.timeout)
+            response = self.http_cache.get(url, timeout=self.timeout)
             response.raise_for_status()
             
             # Parse response
@@ -122,7 +143,7 @@ class KEGGECFetcher:
             # Cache result persistently
             if self.persistent_cache:
                 self.persistent_cache.set(reaction_id, ec_numbers)
-                # Save immediately to ensure data persists
+                # Flush now, or once at the end of a batch (parallel prefetch)
                 self.persistent_cache.save()
             
             if ec_numbers:
@@ -132,17 +153,17 @@ class KEGGECFetcher:
             
             return ec_numbers
             
-        except requests.exceptions.Timeout:
+        except HTTPTimeoutError:
             logger.warning(f"KEGG API timeout for {reaction_id}")
             return []
-        except requests.exceptions.HTTPError as e:
+        except HTTPStatusError as e:
             # 400 Bad Request is expected for invalid reaction IDs (e.g., entry IDs)
             if e.response.status_code == 400:
                 logger.debug(f"Invalid KEGG reaction ID: {reaction_id}")
             else:
                 logger.warning(f"KEGG API HTTP error for {reaction_id}: {e}")
             return []
-        except requests.exceptions.RequestException as e:
+        except HTTPCacheError as e:
             logger.warning(f"KEGG API error for {reaction_id}: {e}")
             return []
         except Exception as e:
@@ -215,7 +236,7 @@ class KEGGECFetcher:
             url = f"{self.base_url}/get/{normalized_id}"
             logger.debug(f"Fetching reaction name from KEGG: {url}")
             
-            response = requests.get(url, timeout=self.timeout)
+            response = self.http_cache.get(url, timeout=self.timeout)
             response.raise_for_status()
             
             # Parse response for NAME field
@@ -228,7 +249,7 @@ class KEGGECFetcher:
             
             return name
             
-        except requests.exceptions.RequestException as e:
+        except HTTPCacheError as e:
             logger.warning(f"KEGG API error fetching name for {reaction_id}: {e}")
             return None
         except Exception as e:
@@ -336,6 +357,61 @@ class KEGGECFetcher:
             "size": len(self.cache)
         }
     
+    def close(self):
+        """Save and release the persistent cache (no-op without one)."""
+        if self.persistent_cache is not None:
+            self.persistent_cache.close()
+    
+    def _fetch_entries(
+        self,
+        reaction_ids: List[str],
+        max_workers: int = 5,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, str]:
+        """
+        Fetch KEGG flat-file entries in bulk.
+        
+        Args:
+            reaction_ids: Reaction IDs (with or without "rn:" prefix)
+            max_workers: Maximum number of parallel requests
+            progress_callback: Optional callback function(completed, total)
+            
+        Returns:
+            Dictionary mapping reaction_id → entry text (missing ids absent)
+        """
+        # Imported here: the KEGG importer package imports this module
+        from shypn.importer.kegg.api_client import KEGGAPIClient
+        
+        client = KEGGAPIClient(timeout=self.timeout, cache=self.http_cache, max_workers=max_workers)
+        client.BASE_URL = self.base_url
+        try:
+            return client.get_entries(reaction_ids, progress_callback=progress_callback)
+        finally:
+            client.close()
+    
+    def fetch_reaction_names(self, reaction_ids: List[str], max_workers: int = 5) -> Dict[str, Optional[str]]:
+        """
+        Fetch reaction names for several KEGG reaction IDs in bulk.
+        
+        Args:
+            reaction_ids: KEGG reaction IDs (e.g., ["R00710", "rn:R00299"])
+            max_workers: Maximum number of parallel requests
+            
+        Returns:
+            Dictionary mapping reaction_id → name (None if not found)
+        """
+        entries = self._fetch_entries(reaction_ids, max_workers)
+        return {
+            rid: self._parse_kegg_name(entries[rid]) if rid in entries else None
+            for rid in reaction_ids
+        }
+    
+    def _persistent_batch(self):
+        """Batch context of the persistent cache (no-op without one)."""
+        if self.persistent_cache:
+            return self.persistent_cache.batch()
+        return nullcontext()
+    
     def fetch_ec_numbers_parallel(
         self, 
         reaction_ids: List[str], 
@@ -345,15 +421,16 @@ class KEGGECFetcher:
         """
         Fetch EC numbers for multiple reactions in parallel.
         
-        This method uses ThreadPoolExecutor to fetch EC numbers concurrently,
+        Uncached reactions are fetched with KEGG's multi-entry `get`
+        (10 reactions per request), with requests running concurrently,
         significantly improving performance for pathways with many reactions.
         
         Args:
             reaction_ids: List of KEGG reaction IDs to fetch
             max_workers: Maximum number of parallel requests (default: 5)
-                        Limited to 5 to be polite to KEGG API
+                        Requests are also paced by the shared KEGG rate limiter
             progress_callback: Optional callback function(completed, total)
-                             Called after each fetch completes
+                             Called after each request completes
         
         Returns:
             Dictionary mapping reaction_id → EC numbers list
@@ -369,11 +446,16 @@ class KEGGECFetcher:
         completed = 0
         total = len(reaction_ids)
         
-        # Check which ones are already cached
+        # Check which ones are already cached (memory, then disk)
         uncached_ids = []
         for rid in reaction_ids:
-            if rid in self.cache:
-                results[rid] = self.cache[rid]
+            cached = self.cache.get(rid)
+            if cached is None and self.persistent_cache:
+                cached = self.persistent_cache.get(rid)
+                if cached is not None:
+                    self.cache[rid] = cached
+            if cached is not None:
+                results[rid] = cached
                 completed += 1
             else:
                 uncached_ids.append(rid)
@@ -382,34 +464,29 @@ class KEGGECFetcher:
         if progress_callback and completed > 0:
             progress_callback(completed, total)
         
-        # Fetch uncached items in parallel
+        # Fetch uncached items in bulk (10 ids per request, requests run
+        # concurrently); persistent writes are flushed once at the end
         if uncached_ids:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all fetches
-                future_to_reaction = {
-                    executor.submit(self.fetch_ec_numbers, rid): rid 
-                    for rid in uncached_ids
-                }
-                
-                # Collect results as they complete
-                for future in concurrent.futures.as_completed(future_to_reaction):
-                    reaction_id = future_to_reaction[future]
-                    try:
-                        ec_numbers = future.result()
-                        results[reaction_id] = ec_numbers
-                        completed += 1
-                        
-                        # Report progress
-                        if progress_callback:
-                            progress_callback(completed, total)
-                            
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch EC for {reaction_id}: {e}")
-                        results[reaction_id] = []
-                        completed += 1
-                        
-                        if progress_callback:
-                            progress_callback(completed, total)
+            cached_count = completed
+            
+            def report(done, _):
+                if progress_callback:
+                    progress_callback(cached_count + done, total)
+            
+            with self._persistent_batch():
+                entries = self._fetch_entries(uncached_ids, max_workers, report)
+                for rid in uncached_ids:
+                    entry = entries.get(rid)
+                    if entry is None:
+                        # Unknown id or failed request: not cached, retried next time
+                        results[rid] = []
+                        continue
+                    ec_numbers = self._parse_kegg_response(entry)
+                    results[rid] = ec_numbers
+                    self.cache[rid] = ec_numbers
+                    if self.persistent_cache:
+                        self.persistent_cache.set(rid, ec_numbers)
+                        self.persistent_cache.save()
         
         logger.info(f"Parallel fetch completed: {len(results)} reactions, "
                    f"{len(uncached_ids)} fetched, {total - len(uncached_ids)} cached")
@@ -419,14 +496,20 @@ class KEGGECFetcher:
 
 class PersistentECCache:
     """
-    Persistent cache for KEGG EC numbers stored in JSON file.
+    Persistent cache for KEGG EC numbers stored in SQLite.
     
     This cache survives application restarts, making subsequent imports
     much faster. Cache entries have a TTL (time-to-live) to ensure
     data freshness.
     
+    Reads are served from memory. Writes are buffered and flushed in one
+    transaction by save(); inside a batch() block, save() is deferred to
+    the end of the block, so a parallel prefetch of hundreds of reactions
+    costs one flush. Pending writes are also flushed at interpreter exit.
+    All methods are thread-safe.
+    
     Attributes:
-        cache_file: Path to JSON cache file
+        cache_file: Path to SQLite cache database
         cache: In-memory cache dictionary
         ttl_days: Number of days before cache entry expires
     """
@@ -440,48 +523,132 @@ class PersistentECCache:
         Initialize persistent cache.
         
         Args:
-            cache_file: Path to cache file (default: ~/.shypn/kegg_ec_cache.json)
+            cache_file: Path to cache database (default: ~/.shypn/kegg_ec_cache.db).
+                        A legacy .json path is mapped to a .db file next to it.
+                        The JSON entries (for the default, those of the former
+                        default ~/.shypn/kegg_ec_cache.json) are imported into
+                        an empty database, and the JSON file is renamed to
+                        *.json.migrated.
             ttl_days: Cache entry time-to-live in days (default: 90)
                      EC numbers are stable, so long TTL is acceptable
         """
+        cache_file = Path(cache_file) if cache_file is not None else None
+        legacy_file = None
         if cache_file is None:
-            # Default cache location
+            # Default cache location (earlier versions wrote a JSON file there)
             cache_dir = Path.home() / ".shypn"
             cache_dir.mkdir(exist_ok=True)
-            cache_file = cache_dir / "kegg_ec_cache.json"
+            cache_file = cache_dir / "kegg_ec_cache.db"
+            legacy_file = cache_dir / "kegg_ec_cache.json"
+        elif cache_file.suffix == '.json':
+            legacy_file = cache_file
+            cache_file = cache_file.with_suffix('.db')
         
-        self.cache_file = Path(cache_file)
+        self.cache_file = cache_file
         self.ttl_days = ttl_days
         self.cache: Dict[str, dict] = {}
+        
+        self._lock = threading.RLock()
+        self._pending: Dict[str, dict] = {}
+        self._batch_depth = 0
+        
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(self.cache_file)
+        self._closed = False
+        self._init_schema()
         self._load_cache()
+        if legacy_file is not None and not self.cache:
+            self._import_legacy(legacy_file)
+        
+        _open_caches.add(self)
+    
+    def _init_schema(self):
+        """Create the cache table."""
+        with self._pool.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ec_cache (
+                    reaction_id TEXT PRIMARY KEY,
+                    ec_numbers TEXT NOT NULL,
+                    timestamp TEXT NOT NULL
+                )
+            """)
     
     def _load_cache(self):
-        """Load cache from JSON file."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'r') as f:
-                    self.cache = json.load(f)
-                logger.debug(f"Loaded EC cache from {self.cache_file} "
-                           f"({len(self.cache)} entries)")
-            except Exception as e:
-                logger.warning(f"Failed to load EC cache: {e}")
-                self.cache = {}
-        else:
-            logger.debug(f"No existing EC cache at {self.cache_file}")
+        """Load all entries into memory."""
+        try:
+            rows = self._pool.execute(
+                "SELECT reaction_id, ec_numbers, timestamp FROM ec_cache"
+            ).fetchall()
+            self.cache = {
+                rid: {'ec_numbers': json.loads(ec_numbers), 'timestamp': timestamp}
+                for rid, ec_numbers, timestamp in rows
+            }
+            logger.debug(f"Loaded EC cache from {self.cache_file} "
+                       f"({len(self.cache)} entries)")
+        except Exception as e:
+            logger.warning(f"Failed to load EC cache: {e}")
             self.cache = {}
     
+    def _import_legacy(self, legacy_file: Path):
+        """Import entries from a JSON cache written by earlier versions."""
+        if not legacy_file.exists():
+            return
+        try:
+            with open(legacy_file, 'r') as f:
+                entries = json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to read legacy EC cache {legacy_file}: {e}")
+            return
+        
+        with self._lock:
+            for rid, entry in entries.items():
+                if isinstance(entry, dict) and 'ec_numbers' in entry and 'timestamp' in entry:
+                    self.cache[rid] = entry
+                    self._pending[rid] = entry
+        self.save()
+        if self._pending:
+            return  # Not written; retry the import on the next open
+        logger.info(f"Imported {len(self.cache)} EC cache entries from {legacy_file}")
+        try:
+            # Imported once: a later clear() must not bring the entries back
+            legacy_file.replace(legacy_file.with_name(legacy_file.name + '.migrated'))
+        except OSError as e:
+            logger.warning(f"Could not rename migrated EC cache {legacy_file}: {e}")
+    
     def _save_cache(self):
-        """Save cache to JSON file."""
+        """Write pending entries to the database in one transaction."""
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+        
         try:
-            # Ensure directory exists
-            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
-            logger.debug(f"Saved EC cache to {self.cache_file} "
-                        f"({len(self.cache)} entries)")
+            self._pool.executemany(
+                "INSERT OR REPLACE INTO ec_cache (reaction_id, ec_numbers, timestamp) "
+                "VALUES (?, ?, ?)",
+                [(rid, json.dumps(entry['ec_numbers']), entry['timestamp'])
+                 for rid, entry in pending.items()]
+            )
+            logger.debug(f"Saved {len(pending)} EC cache entries to {self.cache_file}")
         except Exception as e:
             logger.warning(f"Failed to save EC cache: {e}")
+            # Keep the entries for the next flush (newer writes win)
+            with self._lock:
+                for rid, entry in pending.items():
+                    self._pending.setdefault(rid, entry)
+    
+    def _delete(self, reaction_ids: List[str]):
+        """Delete entries from the database in one transaction."""
+        with self._lock:
+            for rid in reaction_ids:
+                self._pending.pop(rid, None)
+        try:
+            self._pool.executemany(
+                "DELETE FROM ec_cache WHERE reaction_id = ?",
+                [(rid,) for rid in reaction_ids]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to delete EC cache entries: {e}")
     
     def _is_expired(self, entry: dict) -> bool:
         """
@@ -511,41 +678,93 @@ class PersistentECCache:
         Returns:
             List of EC numbers if cached and not expired, None otherwise
         """
-        entry = self.cache.get(reaction_id)
-        
-        if entry is None:
-            return None
-        
-        if self._is_expired(entry):
-            logger.debug(f"Cache entry expired for {reaction_id}")
-            del self.cache[reaction_id]
-            return None
+        with self._lock:
+            entry = self.cache.get(reaction_id)
+            
+            if entry is None:
+                return None
+            
+            if self._is_expired(entry):
+                logger.debug(f"Cache entry expired for {reaction_id}")
+                del self.cache[reaction_id]
+                return None
         
         logger.debug(f"Cache hit for {reaction_id}: {entry['ec_numbers']}")
         return entry['ec_numbers']
     
     def set(self, reaction_id: str, ec_numbers: List[str]):
         """
-        Store EC numbers in cache.
+        Store EC numbers in cache (written to disk by the next save()).
         
         Args:
             reaction_id: KEGG reaction ID
             ec_numbers: List of EC numbers to cache
         """
-        self.cache[reaction_id] = {
+        entry = {
             'ec_numbers': ec_numbers,
             'timestamp': datetime.now().isoformat()
         }
+        with self._lock:
+            self.cache[reaction_id] = entry
+            self._pending[reaction_id] = entry
         logger.debug(f"Cached EC numbers for {reaction_id}: {ec_numbers}")
     
     def save(self):
-        """Persist cache to disk."""
+        """Persist pending entries to disk (deferred inside batch())."""
+        with self._lock:
+            if self._batch_depth > 0:
+                return
         self._save_cache()
     
+    @contextmanager
+    def batch(self):
+        """
+        Defer save() until the end of the block, then flush once.
+        
+        Example:
+            >>> with cache.batch():
+            ...     for rid, ecs in results.items():
+            ...         cache.set(rid, ecs)
+            ...         cache.save()  # deferred
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+            self.save()
+    
+    def pending_count(self) -> int:
+        """Number of entries not yet written to disk."""
+        with self._lock:
+            return len(self._pending)
+    
+    def close(self):
+        """
+        Save pending entries and release the pooled database connections.
+        
+        The shared pool is closed once its last holder released it.
+        Idempotent; the cache must not be used afterwards.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._save_cache()
+        _open_caches.discard(self)
+        self._pool.release()
+    
     def clear(self):
         """Clear all cache entries."""
-        self.cache.clear()
-        self._save_cache()
+        with self._lock:
+            self.cache.clear()
+            self._pending.clear()
+        try:
+            self._pool.execute("DELETE FROM ec_cache")
+        except Exception as e:
+            logger.warning(f"Failed to clear EC cache: {e}")
         logger.info("EC cache cleared")
     
     def get_stats(self) -> Dict[str, int]:
@@ -558,8 +777,10 @@ class PersistentECCache:
                 - expired: Number of expired entries
                 - valid: Number of valid entries
         """
-        total = len(self.cache)
-        expired = sum(1 for entry in self.cache.values() if self._is_expired(entry))
+        with self._lock:
+            entries = list(self.cache.values())
+        total = len(entries)
+        expired = sum(1 for entry in entries if self._is_expired(entry))
         valid = total - expired
         
         return {
@@ -570,16 +791,17 @@ class PersistentECCache:
     
     def cleanup_expired(self):
         """Remove expired entries from cache."""
-        expired_keys = [
-            rid for rid, entry in self.cache.items() 
-            if self._is_expired(entry)
-        ]
-        
-        for key in expired_keys:
-            del self.cache[key]
+        with self._lock:
+            expired_keys = [
+                rid for rid, entry in self.cache.items() 
+                if self._is_expired(entry)
+            ]
+            
+            for key in expired_keys:
+                del self.cache[key]
         
         if expired_keys:
-            self._save_cache()
+            self._delete(expired_keys)
             logger.info(f"Removed {len(expired_keys)} expired cache entries")
 
 
@@ -603,7 +825,10 @@ def fetch_ec_for_reaction(reaction_id: str, timeout: int = 5) -> List[str]:
         ['2.7.1.1']
     """
     fetcher = KEGGECFetcher(timeout=timeout)
-    return fetcher.fetch_ec_numbers(reaction_id)
+    try:
+        return fetcher.fetch_ec_numbers(reaction_id)
+    finally:
+        fetcher.close()
 
 
 def fetch_ec_numbers_parallel(
@@ -14,11 +14,12 @@ Two layout modes:
 - FIXED: Equal spacing within layers (current default)
 - TREE: Aperture angle-based spacing (adaptive to branching)
 
-Algorithm:
-1. Build dependency graph (which reactions depend on which species)
-2. Calculate "layer" for each species (topological sort)
-3. Position layers vertically (top = inputs, bottom = outputs)
-4. Position species horizontally (fixed spacing or tree-based angles)
+Algorithm (shared Sugiyama pipeline, see shypn.layout.sugiyama):
+1. Build bipartite graph: reactant → reaction → product
+2. Assign layers with network simplex (species and reactions alternate,
+   so reactions sit halfway between their reactant and product layers)
+3. Order layers by median/barycenter sweeps until crossings stop improving
+4. Assign x-coordinates with Brandes-Köpf (straight, balanced edges)
 
 Coordinate System:
 - Conceptually: Cartesian coordinates (origin lower-left, Y grows up)
@@ -32,9 +33,10 @@ Date: October 2025
 
 import logging
 from typing import Dict, List, Set, Tuple, Optional
-from collections import defaultdict, deque
+from collections import defaultdict
 
 from .pathway_data import PathwayData, ProcessedPathwayData, Species, Reaction
+from shypn.layout.sugiyama import SugiyamaLayout, group_by_layer
 
 
 class HierarchicalLayoutProcessor:
@@ -45,6 +47,10 @@ class HierarchicalLayoutProcessor:
     creating a clear flow from substrates to products.
     """
     
+    # Top margin and horizontal center of the drawing
+    START_Y = 100.0
+    CENTER_X = 600.0
+    
     def __init__(self, pathway: PathwayData, vertical_spacing: float = 150.0, 
                  horizontal_spacing: float = 100.0):
         """Initialize hierarchical layout processor.
@@ -67,18 +73,21 @@ class HierarchicalLayoutProcessor:
         """
         self.logger.info("Calculating hierarchical layout...")
         
-        # Step 1: Build dependency graph (excludes isolated enzyme places)
-        graph, in_degree = self._build_dependency_graph()
-        
-        # Step 2: Assign layers using topological sort (Kahn's algorithm)
-        layers = self._assign_layers(graph, in_degree)
+        # Step 1: Build reaction graph (excludes isolated enzyme places)
+        nodes, edges = self._build_reaction_graph()
         
-        # Step 3: Position species in layers
-        positions = self._position_layers(layers)
-        
-        # Step 4: Position reactions between layers
-        reaction_positions = self._position_reactions(positions)
-        positions.update(reaction_positions)
+        # Steps 2-4: Layers, crossing reduction, coordinates.
+        # Species and reactions alternate, so half the vertical spacing per
+        # layer keeps species layers vertical_spacing apart.
+        sugiyama = SugiyamaLayout(
+            layer_spacing=self.vertical_spacing / 2.0,
+            node_spacing=self.horizontal_spacing
+        )
+        positions = {
+            node_id: (x + self.CENTER_X, y + self.START_Y)
+            for node_id, (x, y) in sugiyama.compute(nodes, edges).items()
+        }
+        num_layers = len({y for _, y in positions.values()})
         
         # Step 5: Position isolated enzyme places (catalysts with only test arcs)
         # These were excluded from the dependency graph to prevent layout flattening
@@ -96,7 +105,10 @@ class HierarchicalLayoutProcessor:
         # Step 6: Validate and normalize coordinates (ensure all positive)
         positions = self._normalize_coordinates(positions)
         
-        self.logger.info(f"Hierarchical layout complete: {len(layers)} layers, {len(positions)} positioned")
+        self.logger.info(
+            f"Hierarchical layout complete: {num_layers} layers, {len(positions)} positioned, "
+            f"{sugiyama.crossings:.0f} crossings"
+        )
         return positions
     
     def _normalize_coordinates(self, positions: Dict[str, Tuple[float, float]]) -> Dict[str, Tuple[float, float]]:
@@ -117,16 +129,16 @@ class HierarchicalLayoutProcessor:
         max_x = max(x for x, y in positions.values())
         max_y = max(y for x, y in positions.values())
         
-        self.logger.warning(f"🔍 HIERARCHICAL LAYOUT COORDINATES BEFORE NORMALIZATION:")
-        self.logger.warning(f"   X range: {min_x:.1f} to {max_x:.1f} (width: {max_x - min_x:.1f}px)")
-        self.logger.warning(f"   Y range: {min_y:.1f} to {max_y:.1f} (height: {max_y - min_y:.1f}px)")
+        self.logger.debug("Hierarchical layout coordinates before normalization:")
+        self.logger.debug(f"   X range: {min_x:.1f} to {max_x:.1f} (width: {max_x - min_x:.1f}px)")
+        self.logger.debug(f"   Y range: {min_y:.1f} to {max_y:.1f} (height: {max_y - min_y:.1f}px)")
         
         # If any coordinate is negative, shift everything
         offset_x = max(0, 50 - min_x)  # At least 50px margin
         offset_y = max(0, 50 - min_y)
         
         if offset_x > 0 or offset_y > 0:
-            self.logger.warning(f"⚠️  NORMALIZING: offset=({offset_x:.1f}, {offset_y:.1f})")
+            self.logger.debug(f"Normalizing: offset=({offset_x:.1f}, {offset_y:.1f})")
             positions = {
                 element_id: (x + offset_x, y + offset_y)
                 for element_id, (x, y) in positions.items()
@@ -135,12 +147,41 @@ class HierarchicalLayoutProcessor:
             # Verify after normalization
             new_min_x = min(x for x, y in positions.values())
             new_min_y = min(y for x, y in positions.values())
-            self.logger.warning(f"✓ AFTER NORMALIZATION: min=({new_min_x:.1f}, {new_min_y:.1f})")
+            self.logger.debug(f"After normalization: min=({new_min_x:.1f}, {new_min_y:.1f})")
         else:
-            self.logger.warning(f"✓ No normalization needed (all coordinates positive)")
+            self.logger.debug("No normalization needed (all coordinates positive)")
         
         return positions
     
+    def _build_reaction_graph(self) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """Build the bipartite species/reaction graph used for layout.
+        
+        Edges run reactant → reaction → product. Species connected ONLY
+        as modifiers (catalysts/enzymes) are left out and positioned next
+        to their reaction afterwards, so they cannot flatten the hierarchy.
+        
+        Returns:
+            (nodes, edges) with species and reaction IDs
+        """
+        nodes = []
+        edges = []
+        seen = set()
+        
+        for reaction in self.pathway.reactions:
+            reactants = [species_id for species_id, _ in reaction.reactants]
+            products = [species_id for species_id, _ in reaction.products]
+            if not reactants and not products:
+                continue
+            
+            for node_id in reactants + [reaction.id] + products:
+                if node_id not in seen:
+                    seen.add(node_id)
+                    nodes.append(node_id)
+            edges.extend((species_id, reaction.id) for species_id in reactants)
+            edges.extend((reaction.id, species_id) for species_id in products)
+        
+        return nodes, edges
+    
     def _build_dependency_graph(self) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
         """Build directed graph of species dependencies.
         
@@ -197,12 +238,12 @@ class HierarchicalLayoutProcessor:
     
     def _assign_layers(self, graph: Dict[str, List[str]], 
                       in_degree: Dict[str, int]) -> List[List[str]]:
-        """Assign species to layers using topological sort.
+        """Assign species to layers of the species-only dependency graph.
         
         Layer 0: Initial substrates (no predecessors)
         Layer 1: Products of layer 0
-        Layer 2: Products of layer 1
-        ... and so on
+        ... and so on, using network simplex (cycles are broken by the
+        shared pipeline rather than dumped into the last layer).
         
         Args:
             graph: Dependency graph
@@ -211,176 +252,10 @@ class HierarchicalLayoutProcessor:
         Returns:
             List of layers, each layer is a list of species IDs
         """
-        layers = []
-        current_layer = []
-        
-        # Start with species that have no incoming edges (initial substrates)
-        queue = deque()
-        for species_id, degree in in_degree.items():
-            if degree == 0:
-                queue.append(species_id)
-                current_layer.append(species_id)
-        
-        if not current_layer:
-            # Cyclic graph or isolated species - add all to layer 0
-            self.logger.warning("No initial substrates found, using all species in layer 0")
-            return [[species.id for species in self.pathway.species]]
-        
-        layers.append(current_layer)
-        
-        # Process remaining species layer by layer
-        while queue:
-            next_layer = []
-            layer_size = len(queue)
-            
-            for _ in range(layer_size):
-                current_id = queue.popleft()
-                
-                # Process dependents
-                for dependent_id in graph.get(current_id, []):
-                    in_degree[dependent_id] -= 1
-                    
-                    if in_degree[dependent_id] == 0:
-                        queue.append(dependent_id)
-                        next_layer.append(dependent_id)
-            
-            if next_layer:
-                layers.append(next_layer)
-        
-        # Check for unprocessed species (cycles)
-        unprocessed = [sid for sid, deg in in_degree.items() if deg > 0]
-        if unprocessed:
-            self.logger.warning(f"Cyclic dependencies found: {len(unprocessed)} species")
-            # Add to last layer
-            if layers:
-                layers[-1].extend(unprocessed)
-            else:
-                layers.append(unprocessed)
-        
-        return layers
-    
-    def _position_layers(self, layers: List[List[str]]) -> Dict[str, Tuple[float, float]]:
-        """Position species within their assigned layers - SIMPLE FIXED SPACING.
-        
-        Uses clean, predictable layout:
-        - Vertical: Fixed spacing between layers (150px)
-        - Horizontal: Even distribution within each layer
-        - Canvas: Centered, max width 1200px
-        
-        Args:
-            layers: List of layers with species IDs
-            
-        Returns:
-            Dictionary {species_id: (x, y)}
-        """
-        positions = {}
-        
-        # Layout parameters
-        start_y = 100.0  # Top margin
-        canvas_center_x = 600.0  # Canvas center
-        max_canvas_width = 1200.0  # Maximum width
-        min_spacing = 80.0  # Minimum spacing between nodes
-        
-        self.logger.warning(f"🔍 POSITIONING {len(layers)} LAYERS:")
-        
-        for layer_index, layer_species in enumerate(layers):
-            # Y position for this layer
-            y = start_y + layer_index * self.vertical_spacing
-            
-            num_species = len(layer_species)
-            self.logger.warning(f"   Layer {layer_index}: {num_species} species at Y={y:.1f}")
-            
-            if num_species == 1:
-                # Single element: center it
-                x = canvas_center_x
-                positions[layer_species[0]] = (x, y)
-                self.logger.debug(f"      {layer_species[0]}: ({x:.1f}, {y:.1f})")
-            else:
-                # Multiple elements: distribute evenly
-                # Calculate spacing (but don't exceed max width)
-                ideal_width = (num_species - 1) * self.horizontal_spacing
-                
-                if ideal_width > max_canvas_width:
-                    # Too wide - use max width with tighter spacing
-                    actual_width = max_canvas_width
-                    actual_spacing = max_canvas_width / (num_species - 1)
-                    self.logger.debug(f"      Layer too wide, reducing spacing to {actual_spacing:.1f}px")
-                else:
-                    actual_width = ideal_width
-                    actual_spacing = self.horizontal_spacing
-                
-                # Center the layer horizontally
-                start_x = canvas_center_x - actual_width / 2
-                
-                for i, species_id in enumerate(layer_species):
-                    x = start_x + i * actual_spacing
-                    positions[species_id] = (x, y)
-                    if i < 3 or i >= num_species - 1:  # Log first 3 and last
-                        self.logger.debug(f"      {species_id}: ({x:.1f}, {y:.1f})")
-        
-        self.logger.warning(f"✓ POSITIONED {len(positions)} species")
-        return positions
-    
-    def _position_reactions(self, species_positions: Dict[str, Tuple[float, float]]) -> Dict[str, Tuple[float, float]]:
-        """Position reactions BETWEEN layers (not on same layer as species).
-        
-        Places reactions vertically between their reactants and products layers,
-        and horizontally offset to avoid overlapping with species.
-        
-        Args:
-            species_positions: Positions of species
-            
-        Returns:
-            Dictionary {reaction_id: (x, y)}
-        """
-        reaction_positions = {}
-        
-        for reaction in self.pathway.reactions:
-            reactant_coords = []
-            product_coords = []
-            
-            # Separate reactants and products
-            for species_id, _ in reaction.reactants:
-                if species_id in species_positions:
-                    reactant_coords.append(species_positions[species_id])
-            
-            for species_id, _ in reaction.products:
-                if species_id in species_positions:
-                    product_coords.append(species_positions[species_id])
-            
-            # Position reaction between layers
-            if reactant_coords and product_coords:
-                # Average position of reactants
-                reactant_x = sum(x for x, y in reactant_coords) / len(reactant_coords)
-                reactant_y = sum(y for x, y in reactant_coords) / len(reactant_coords)
-                
-                # Average position of products
-                product_x = sum(x for x, y in product_coords) / len(product_coords)
-                product_y = sum(y for x, y in product_coords) / len(product_coords)
-                
-                # Position reaction BETWEEN layers (halfway in Y)
-                avg_x = (reactant_x + product_x) / 2
-                avg_y = (reactant_y + product_y) / 2
-                
-                reaction_positions[reaction.id] = (avg_x, avg_y)
-                
-            elif reactant_coords:
-                # Only reactants (sink reaction)
-                avg_x = sum(x for x, y in reactant_coords) / len(reactant_coords)
-                avg_y = sum(y for x, y in reactant_coords) / len(reactant_coords)
-                reaction_positions[reaction.id] = (avg_x, avg_y + self.vertical_spacing / 2)
-                
-            elif product_coords:
-                # Only products (source reaction)
-                avg_x = sum(x for x, y in product_coords) / len(product_coords)
-                avg_y = sum(y for x, y in product_coords) / len(product_coords)
-                reaction_positions[reaction.id] = (avg_x, avg_y - self.vertical_spacing / 2)
-                
-            else:
-                # Fallback: position at center
-                reaction_positions[reaction.id] = (400.0, 300.0)
-        
-        return reaction_positions
+        species_ids = list(in_degree.keys())
+        edges = [(source, target) for source, targets in graph.items() for target in targets]
+        layers = SugiyamaLayout().assign_layers(species_ids, edges)
+        return group_by_layer(species_ids, layers)
     
     def _position_enzyme_places(self, enzyme_species_ids: Set[str], 
                                 existing_positions: Dict[str, Tuple[float, float]]) -> Dict[str, Tuple[float, float]]:
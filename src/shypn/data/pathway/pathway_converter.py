@@ -866,13 +866,11 @@ class PathwayConverter:
             reaction_to_transition: Mapping from reaction.id to Transition object
         """
         # Build transition→reaction map (using object references)
+        reaction_by_id = {r.id: r for r in reversed(pathway.reactions)}
         transition_reaction_map = {}
         for reaction_id, transition in reaction_to_transition.items():
             # Find corresponding reaction object
-            reaction = next(
-                (r for r in pathway.reactions if r.id == reaction_id),
-                None
-            )
+            reaction = reaction_by_id.get(reaction_id)
             if reaction is not None:
                 # Store object reference (not ID)
                 transition_reaction_map[transition] = reaction
@@ -2,12 +2,14 @@
 Pathway Post-Processor (Simplified v2.0)
 
 Minimal post-processing for SBML pathways:
-- Arbitrary position assignment (force-directed layout will recalculate via Swiss Palette)
+- Hierarchical layout (shared Sugiyama pipeline, same as Swiss Palette → Hierarchical)
+- Arbitrary position fallback when layout is disabled or fails
 - Color assignment by compartment
 - Unit normalization (concentrations → token counts)
 - Name resolution (IDs → readable names)
 
-NO LAYOUT ALGORITHMS - Layout is now user-initiated via Swiss Palette → Force-Directed
+Imported pathways come out readable without a second layout pass; the
+Swiss Palette layouts remain available to re-layout interactively.
 
 Architecture:
 - BaseProcessor: Abstract base for all processors
@@ -32,6 +34,7 @@ from .pathway_data import (
     Species,
     Reaction,
 )
+from .hierarchical_layout import HierarchicalLayoutProcessor
 
 
 # Color palette for compartments
@@ -221,10 +224,8 @@ class PathwayPostProcessor:
     """
     Minimal post-processor coordinator (v2.0 Simplified).
     
-    NO LAYOUT CALCULATION - Layout is now user-initiated via Swiss Palette → Force-Directed.
-    
     This processor only:
-    - Assigns ARBITRARY positions (force-directed will recalculate everything)
+    - Assigns hierarchical positions (arbitrary ones if apply_layout is False)
     - Assigns colors by compartment
     - Normalizes concentrations to tokens
     - Resolves display names
@@ -237,14 +238,25 @@ class PathwayPostProcessor:
     - CompartmentGrouper: Groups by compartment
     """
     
-    def __init__(self, scale_factor: float = 1.0):
+    # Species + reactions above which imports skip the hierarchical layout
+    # (seconds to minutes on genome-scale models); Swiss Palette layouts
+    # can still be applied afterwards
+    MAX_LAYOUT_ELEMENTS = 2000
+    
+    def __init__(self, scale_factor: float = 1.0, spacing: float = 150.0,
+                 apply_layout: bool = True):
         """
         Initialize post-processor.
         
         Args:
             scale_factor: Multiplier for concentration → tokens conversion
+            spacing: Vertical distance between species layers
+            apply_layout: If False, only assign arbitrary placeholder positions
+                (also done for pathways larger than MAX_LAYOUT_ELEMENTS)
         """
         self.scale_factor = scale_factor
+        self.spacing = spacing
+        self.apply_layout = apply_layout
         self.logger = logging.getLogger(self.__class__.__name__)
     
     def process(self, pathway: PathwayData) -> ProcessedPathwayData:
@@ -255,7 +267,7 @@ class PathwayPostProcessor:
             pathway: The validated pathway data
         
         Returns:
-            ProcessedPathwayData with colors, normalized units, and ARBITRARY positions
+            ProcessedPathwayData with colors, normalized units, and positions
         """
         self.logger.info(f"Post-processing pathway: {pathway.metadata.get('name', 'Unknown')}")
         
@@ -271,8 +283,71 @@ class PathwayPostProcessor:
             compartment_groups={}
         )
         
-        # Assign ARBITRARY positions (force-directed will recalculate everything)
-        # These positions are just placeholders so the converter doesn't complain
+        apply_layout = self.apply_layout
+        size = len(processed.species) + len(processed.reactions)
+        if apply_layout and size > self.MAX_LAYOUT_ELEMENTS:
+            self.logger.info(
+                f"Skipping hierarchical layout: {size} species and reactions "
+                f"(limit {self.MAX_LAYOUT_ELEMENTS})"
+            )
+            apply_layout = False
+        
+        if not (apply_layout and self._apply_hierarchical_layout(pathway, processed)):
+            self._assign_arbitrary_positions(processed)
+        
+        # Create processors
+        processors = [
+            ColorProcessor(pathway),
+            UnitNormalizer(pathway, self.scale_factor),
+            NameResolver(pathway),
+            CompartmentGrouper(pathway),
+        ]
+        
+        # Run all processors
+        for processor in processors:
+            try:
+                processor.process(processed)
+            except Exception as e:
+                self.logger.error(
+                    f"{processor.__class__.__name__} failed: {e}",
+                    exc_info=True
+                )
+                # Continue with other processors
+        
+        self.logger.info(
+            f"Post-processing complete (layout: {processed.metadata['layout_type']})"
+        )
+        return processed
+    
+    def _apply_hierarchical_layout(self, pathway: PathwayData,
+                                   processed: ProcessedPathwayData) -> bool:
+        """Lay out species and reactions with the shared hierarchical pipeline.
+        
+        Returns:
+            True if positions were assigned, False if the layout failed
+        """
+        try:
+            processor = HierarchicalLayoutProcessor(
+                pathway,
+                vertical_spacing=self.spacing,
+                horizontal_spacing=self.spacing * 0.7
+            )
+            processed.positions = processor.calculate_hierarchical_layout()
+        except Exception as e:
+            self.logger.error(f"Hierarchical layout failed: {e}", exc_info=True)
+            processed.positions = {}
+            return False
+        
+        # Reactions without reactants or products are not part of the hierarchy
+        for reaction in processed.reactions:
+            processed.positions.setdefault(reaction.id, (100.0, 100.0))
+        
+        processed.metadata['layout_type'] = 'hierarchical'
+        processed.metadata['layout_note'] = 'Use Swiss Palette to re-layout interactively'
+        return True
+    
+    def _assign_arbitrary_positions(self, processed: ProcessedPathwayData) -> None:
+        """Assign placeholder positions (force-directed will recalculate everything)."""
         self.logger.info("Assigning arbitrary positions (force-directed will recalculate)")
         
         base_x, base_y = 100.0, 100.0
@@ -297,28 +372,6 @@ class PathwayPostProcessor:
         # Mark as arbitrary (no real layout applied)
         processed.metadata['layout_type'] = 'arbitrary'
         processed.metadata['layout_note'] = 'Use Swiss Palette → Force-Directed to apply physics-based layout'
-        
-        # Create processors (NO LAYOUT PROCESSOR - that's gone!)
-        processors = [
-            ColorProcessor(pathway),
-            UnitNormalizer(pathway, self.scale_factor),
-            NameResolver(pathway),
-            CompartmentGrouper(pathway),
-        ]
-        
-        # Run all processors
-        for processor in processors:
-            try:
-                processor.process(processed)
-            except Exception as e:
-                self.logger.error(
-                    f"{processor.__class__.__name__} failed: {e}",
-                    exc_info=True
-                )
-                # Continue with other processors
-        
-        self.logger.info("Post-processing complete (positions are arbitrary)")
-        return processed
 
 
 # Example usage
@@ -22,8 +22,8 @@ Date: October 2025
 
 import logging
 from typing import Dict, Tuple, Optional, List
-import urllib.request
-import urllib.parse
+
+from shypn.utils.http_cache import get_http_cache
 
 from .pathway_data import PathwayData
 
@@ -270,8 +270,9 @@ class SBMLLayoutResolver:
         """
         try:
             url = f"https://rest.kegg.jp/link/pathway/{kegg_id}"
-            with urllib.request.urlopen(url, timeout=5) as response:
-                data = response.read().decode('utf-8')
+            response = get_http_cache().get(url, timeout=5)
+            response.raise_for_status()
+            data = response.text
             
             # Parse response: "cpd:C00031\tpath:hsa00010"
             pathways = []
@@ -170,6 +170,11 @@ class Project:
             return os.path.join(self.base_path, 'simulations')
         return None
     
+    def list_simulations(self) -> List[str]:
+        """Get the trajectory directories of streamed runs, oldest first."""
+        from shypn.engine.simulation.trajectory_store import list_trajectories
+        return list_trajectories(self.get_simulations_dir())
+    
     def get_enrichments_dir(self) -> Optional[str]:
         """Get the enrichments directory path.
         
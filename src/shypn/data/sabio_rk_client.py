@@ -19,17 +19,12 @@ Performance Notes:
 - Count endpoint works well - use it to check result size before fetching
 """
 
-import sys
 import logging
 import xml.etree.ElementTree as ET
 from typing import Optional, Dict, List, Any
 from urllib.parse import quote
 
-try:
-    import requests
-except ImportError:
-    print("Warning: requests library not available. Install with: pip install requests", file=sys.stderr)
-    requests = None
+from shypn.utils.http_cache import HTTPTimeoutError, get_http_cache
 
 
 class SabioRKClient:
@@ -56,9 +51,6 @@ class SabioRKClient:
         self.base_url = "https://sabiork.h-its.org/sabioRestWebServices"
         self.logger = logging.getLogger(self.__class__.__name__)
         self.timeout = timeout
-        
-        if not requests:
-            self.logger.warning("requests library not available - API calls will fail")
     
     def query_by_ec_number(self, ec_number: str, organism: str = None) -> Optional[Dict[str, Any]]:
         """Query SABIO-RK by EC number with organism filter.
@@ -73,10 +65,6 @@ class SabioRKClient:
         Returns:
             Dict with kinetic parameters or None if query fails
         """
-        if not requests:
-            self.logger.error("[SABIO-RK] requests library not available")
-            return None
-        
         if not organism:
             self.logger.warning("[SABIO-RK] No organism specified - query may timeout!")
             self.logger.warning("[SABIO-RK] Recommend specifying organism (e.g., 'Homo sapiens')")
@@ -144,7 +132,7 @@ class SabioRKClient:
             url = f"{self.base_url}/searchKineticLaws/count?q={encoded_query}&format=txt"
             
             self.logger.debug(f"[SABIO-RK] Counting results...")
-            response = requests.get(url, timeout=30)
+            response = get_http_cache().get(url, timeout=30)
             response.raise_for_status()
             
             # Response is plain text number
@@ -159,7 +147,7 @@ class SabioRKClient:
                 self.logger.error(f"[SABIO-RK] Invalid count response: {count_text}")
                 return None
                 
-        except requests.exceptions.Timeout:
+        except HTTPTimeoutError:
             self.logger.error("[SABIO-RK] Timeout getting result count")
             return None
         except Exception as e:
@@ -182,14 +170,14 @@ class SabioRKClient:
             url = f"{self.base_url}/searchKineticLaws/sbml?q={encoded_query}"
             
             self.logger.debug(f"[SABIO-RK] Fetching SBML data (timeout={timeout}s)...")
-            response = requests.get(url, timeout=timeout)
+            response = get_http_cache().get(url, timeout=timeout)
             response.raise_for_status()
             
             # Parse SBML response
             result = self._parse_sbml_response(response.text, identifier)
             return result
             
-        except requests.exceptions.Timeout:
+        except HTTPTimeoutError:
             self.logger.error(f"[SABIO-RK] Timeout fetching data (waited {timeout}s)")
             return None
         except Exception as e:
@@ -205,10 +193,6 @@ class SabioRKClient:
         Returns:
             Dict with kinetic parameters or None if query fails
         """
-        if not requests:
-            self.logger.error("[SABIO-RK] requests library not available")
-            return None
-        
         try:
             # Normalize reaction ID
             if kegg_reaction_id.isdigit():
@@ -463,14 +447,11 @@ class SabioRKClient:
         Returns:
             True if API is reachable, False otherwise
         """
-        if not requests:
-            return False
-        
         try:
-            # Test with status endpoint
+            # Test with status endpoint (ttl=0: always asks the server)
             url = f"{self.base_url}/status"
-            response = requests.get(url, timeout=10)
-            return response.status_code == 200 and "UP" in response.text
+            response = get_http_cache().get(url, timeout=10, ttl=0)
+            return response.status_code == 200 and not response.stale and "UP" in response.text
         except Exception:
             return False
 
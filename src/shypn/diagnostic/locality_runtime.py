@@ -219,6 +219,16 @@ class LocalityRuntimeAnalyzer:
         logical_time = self._get_logical_time()
         
         try:
+            window_start = max(0.0, logical_time - window)
+            actual_window = logical_time - window_start
+            
+            # Incrementally maintained window: no scan of the firing history
+            get_firing_window = getattr(self.data_collector, 'get_firing_window', None)
+            if get_firing_window is not None:
+                firing_window = get_firing_window(transition_id, window)
+                firing_window.evict(logical_time)
+                return firing_window.count / actual_window if actual_window > 0 else 0.0
+            
             # Get all transition data
             transition_data = self.data_collector.get_transition_data(transition_id)
             
@@ -226,7 +236,6 @@ class LocalityRuntimeAnalyzer:
                 return 0.0
             
             # Count events within time window
-            window_start = max(0.0, logical_time - window)
             fire_count = 0
             
             for entry in transition_data:
@@ -237,7 +246,6 @@ class LocalityRuntimeAnalyzer:
                         fire_count += 1
             
             # Calculate rate
-            actual_window = logical_time - window_start
             if actual_window > 0:
                 return fire_count / actual_window
             else:
@@ -21,7 +21,6 @@ from shypn.edit.editing_operations_palette import EditingOperationsPalette
 from shypn.edit.editing_operations_palette_loader import EditingOperationsPaletteLoader
 from shypn.edit.edit_operations import EditOperations
 from shypn.edit.lasso_selector import LassoSelector
-from shypn.edit.graph_layout import LayoutEngine, LayoutAlgorithm
 
 __all__ = [
     'TransientArc',
@@ -38,3 +37,14 @@ __all__ = [
     'LayoutEngine',
     'LayoutAlgorithm'
 ]
+
+
+def __getattr__(name):
+    # Graph layout pulls in networkx; import it only when first used
+    if name == 'LayoutEngine':
+        from shypn.edit.graph_layout import LayoutEngine
+        return LayoutEngine
+    elif name == 'LayoutAlgorithm':
+        from shypn.edit.graph_layout import LayoutAlgorithm
+        return LayoutAlgorithm
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,14 +10,17 @@ Architecture:
     - ForceDirectedLayout: Fruchterman-Reingold (physics-based)
     - CircularLayout: For cyclic pathways (TCA, Calvin)
     - OrthogonalLayout: Manhattan routing (circuit-like)
+    - MultilevelLayout: Coarsen-layout-refine for very large graphs
     - LayoutSelector: Auto-detect best algorithm for topology
     - LayoutEngine: Main API orchestrator
+    - BackgroundLayoutJob: Cancellable worker-process layout with preview
 
 Scientific Basis:
     - Sugiyama et al. (1981) - Hierarchical layout
     - Fruchterman & Reingold (1991) - Force-directed
     - Di Battista et al. (1998) - Graph drawing algorithms
     - Dogrusoz et al. (2009) - Biological pathway layout
+    - Walshaw (2003) - Multilevel force-directed layout
 
 Usage:
     >>> from shypn.edit.graph_layout import LayoutEngine
@@ -32,8 +35,10 @@ from .hierarchical import HierarchicalLayout
 from .force_directed import ForceDirectedLayout
 from .circular import CircularLayout
 from .orthogonal import OrthogonalLayout
+from .multilevel import MultilevelLayout
 from .selector import LayoutSelector
 from .engine import LayoutEngine
+from .background import BackgroundLayoutJob, LayoutSnapshot, compute_snapshot_layout
 
 __all__ = [
     'LayoutAlgorithm',
@@ -41,6 +46,10 @@ __all__ = [
     'ForceDirectedLayout',
     'CircularLayout',
     'OrthogonalLayout',
+    'MultilevelLayout',
     'LayoutSelector',
-    'LayoutEngine'
+    'LayoutEngine',
+    'BackgroundLayoutJob',
+    'LayoutSnapshot',
+    'compute_snapshot_layout'
 ]
@@ -0,0 +1,564 @@
+"""
+Background Layout - Cancellable layout computation in a worker process
+
+Layout algorithms (networkx spring_layout, the Solar System physics
+simulation) can take seconds on large pathways. Running them on the GTK
+main thread freezes the window, so this module runs them in a separate
+process on a picklable snapshot of the model geometry.
+
+Architecture:
+    - LayoutSnapshot: Plain-data copy of places/transitions/arcs
+    - compute_snapshot_layout(): Runs one layout on a snapshot (worker side,
+      also usable synchronously)
+    - BackgroundLayoutJob: Main-thread handle that starts the worker,
+      streams preview positions, supports cancel, and applies the final
+      positions atomically through LayoutEngine._apply_positions
+
+The job never touches GTK itself. The UI drives it by polling:
+
+Usage:
+    >>> job = engine.apply_layout_async(
+    ...     'force_directed',
+    ...     on_preview=lambda job, it, total: drawing_area.queue_draw(),
+    ...     on_complete=lambda job, result: drawing_area.queue_draw())
+    >>> GLib.timeout_add(50, job.poll)   # poll() returns False when finished
+    >>> job.cancel()                     # restores the original positions
+    >>> job.discard()                    # same, at once, without waiting for the worker
+"""
+
+import multiprocessing
+import queue
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Algorithm handled outside LayoutEngine.algorithms
+SOLAR_SYSTEM = 'solar_system'
+
+# Job states
+STATE_PENDING = 'pending'
+STATE_RUNNING = 'running'
+STATE_DONE = 'done'
+STATE_CANCELLED = 'cancelled'
+STATE_FAILED = 'failed'
+
+
+class LayoutCancelled(Exception):
+    """Raised inside the worker when the job has been cancelled."""
+    pass
+
+
+class LayoutSnapshot:
+    """
+    Picklable snapshot of the model geometry needed for layout.
+
+    Nodes are keyed by (kind, id) with kind 'place' or 'transition', so
+    positions computed in the worker can be mapped back to the live objects.
+
+    Attributes:
+        places: List of (id, name, x, y, is_catalyst) tuples
+        transitions: List of (id, name, x, y) tuples
+        arcs: List of (id, source_key, target_key, weight) tuples
+    """
+
+    def __init__(self, places, transitions, arcs):
+        self.places = places
+        self.transitions = transitions
+        self.arcs = arcs
+
+    @classmethod
+    def from_document(cls, doc) -> Tuple['LayoutSnapshot', Dict[Tuple[str, object], object]]:
+        """
+        Capture geometry from a document (ModelCanvasManager or DocumentModel).
+
+        Args:
+            doc: Object with places, transitions and arcs lists
+
+        Returns:
+            Tuple of (snapshot, key_to_object) where key_to_object maps
+            (kind, id) keys to the live Place/Transition objects
+        """
+        key_to_object = {}
+        places = []
+        for place in doc.places:
+            key = ('place', place.id)
+            key_to_object[key] = place
+            is_catalyst = getattr(place, 'is_catalyst', False)
+            if not is_catalyst:
+                metadata = getattr(place, 'metadata', None) or {}
+                is_catalyst = bool(metadata.get('is_enzyme', False))
+            places.append((place.id, place.name, float(place.x), float(place.y), bool(is_catalyst)))
+
+        transitions = []
+        for transition in doc.transitions:
+            key_to_object[('transition', transition.id)] = transition
+            transitions.append((transition.id, transition.name, float(transition.x), float(transition.y)))
+
+        place_ids = {id(p) for p in doc.places}
+        arcs = []
+        for arc in doc.arcs:
+            if arc.source is None or arc.target is None:
+                continue
+            source_kind = 'place' if id(arc.source) in place_ids else 'transition'
+            target_kind = 'place' if id(arc.target) in place_ids else 'transition'
+            source_key = (source_kind, arc.source.id)
+            target_key = (target_kind, arc.target.id)
+            if source_key in key_to_object and target_key in key_to_object:
+                arcs.append((arc.id, source_key, target_key, getattr(arc, 'weight', 1)))
+
+        return cls(places, transitions, arcs), key_to_object
+
+    @property
+    def node_count(self) -> int:
+        """Number of places plus transitions."""
+        return len(self.places) + len(self.transitions)
+
+    def original_positions(self) -> Dict[Tuple[str, object], Tuple[float, float]]:
+        """Positions at snapshot time, keyed by (kind, id)."""
+        positions = {('place', p[0]): (p[2], p[3]) for p in self.places}
+        positions.update({('transition', t[0]): (t[2], t[3]) for t in self.transitions})
+        return positions
+
+    def center(self) -> Tuple[float, float]:
+        """Centroid of all node positions at snapshot time."""
+        positions = list(self.original_positions().values())
+        if not positions:
+            return (0.0, 0.0)
+        return (sum(x for x, _ in positions) / len(positions),
+                sum(y for _, y in positions) / len(positions))
+
+    def rebuild(self):
+        """
+        Recreate detached Place/Transition/Arc objects from the snapshot.
+
+        Returns:
+            Tuple of (places, transitions, arcs, object_to_key)
+        """
+        from shypn.netobjs import Place, Transition, Arc
+
+        objects = {}
+        places = []
+        for obj_id, name, x, y, is_catalyst in self.places:
+            place = Place(x, y, obj_id, name)
+            place.is_catalyst = is_catalyst
+            objects[('place', obj_id)] = place
+            places.append(place)
+
+        transitions = []
+        for obj_id, name, x, y in self.transitions:
+            transition = Transition(x, y, obj_id, name)
+            objects[('transition', obj_id)] = transition
+            transitions.append(transition)
+
+        arcs = []
+        for arc_id, source_key, target_key, weight in self.arcs:
+            arcs.append(Arc(objects[source_key], objects[target_key], arc_id, str(arc_id), weight))
+
+        object_to_key = {obj: key for key, obj in objects.items()}
+        return places, transitions, arcs, object_to_key
+
+
+class _SnapshotDocument:
+    """Minimal document facade so LayoutEngine can build graphs in the worker."""
+
+    def __init__(self, places, transitions, arcs):
+        self.places = places
+        self.transitions = transitions
+        self.arcs = arcs
+
+    def mark_dirty(self):
+        pass
+
+
+def _recenter(positions: Dict, center: Optional[Tuple[float, float]]) -> Dict:
+    """Translate positions so their centroid lands on center (if given)."""
+    if center is None or not positions:
+        return positions
+    cx = sum(x for x, _ in positions.values()) / len(positions)
+    cy = sum(y for _, y in positions.values()) / len(positions)
+    dx = center[0] - cx
+    dy = center[1] - cy
+    return {key: (x + dx, y + dy) for key, (x, y) in positions.items()}
+
+
+def compute_snapshot_layout(
+    snapshot: LayoutSnapshot,
+    algorithm: str = 'auto',
+    params: Optional[Dict] = None,
+    preview_interval: int = 50,
+    preview_callback: Optional[Callable[[int, int, Dict], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    preserve_center: bool = True
+) -> Dict:
+    """
+    Compute a layout for a geometry snapshot.
+
+    This is the worker-side entry point; it has no GTK or live-model
+    dependencies and can also be called synchronously (e.g. headless tools).
+
+    Args:
+        snapshot: LayoutSnapshot to lay out
+        algorithm: 'auto', 'solar_system' or any LayoutEngine algorithm name
+        params: Algorithm parameters (None = selector recommendations)
+        preview_interval: Iterations between preview callbacks
+        preview_callback: Optional callback(iteration, total, positions)
+            with positions keyed by (kind, id)
+        is_cancelled: Optional predicate polled at every preview point;
+            when it returns True, LayoutCancelled is raised
+        preserve_center: Keep the centroid of the snapshot (the layout
+            algorithms center their output at the origin)
+
+    Returns:
+        Dictionary with algorithm, reason, parameters, positions (keyed by
+        (kind, id)) and statistics
+
+    Raises:
+        LayoutCancelled: If is_cancelled() returned True
+        ValueError: If the algorithm is unknown
+    """
+    from .engine import LayoutEngine
+
+    params = dict(params or {})
+    places, transitions, arcs, object_to_key = snapshot.rebuild()
+    center = snapshot.center() if preserve_center and algorithm != SOLAR_SYSTEM else None
+
+    def to_keys(positions):
+        return {object_to_key[obj]: (float(x), float(y))
+                for obj, (x, y) in positions.items() if obj in object_to_key}
+
+    def check_cancelled():
+        if is_cancelled is not None and is_cancelled():
+            raise LayoutCancelled()
+
+    if algorithm == SOLAR_SYSTEM:
+        from shypn.layout.sscc import SolarSystemLayoutEngine
+
+        id_to_key = {key[1]: key for key in object_to_key.values()}
+
+        def on_physics_preview(iteration, total, positions):
+            check_cancelled()
+            if preview_callback:
+                preview_callback(iteration, total, {
+                    id_to_key[obj_id]: (float(x), float(y))
+                    for obj_id, (x, y) in positions.items() if obj_id in id_to_key
+                })
+
+        sscc_engine = SolarSystemLayoutEngine(
+            preview_callback=on_physics_preview,
+            preview_interval=preview_interval,
+            **params
+        )
+        positions = sscc_engine.apply_layout(places, transitions, arcs)
+        check_cancelled()
+        return {
+            'algorithm': SOLAR_SYSTEM,
+            'reason': f"User selected {SOLAR_SYSTEM}",
+            'parameters': params,
+            'positions': {id_to_key[obj_id]: (float(x), float(y))
+                          for obj_id, (x, y) in positions.items() if obj_id in id_to_key},
+            'statistics': sscc_engine.get_statistics()
+        }
+
+    engine = LayoutEngine(_SnapshotDocument(places, transitions, arcs))
+    graph = engine.build_graph()
+    if graph.number_of_nodes() == 0:
+        return {
+            'algorithm': algorithm,
+            'reason': 'Empty graph',
+            'parameters': params,
+            'positions': {},
+            'statistics': {}
+        }
+
+    if algorithm == 'auto':
+        selection = engine.selector.select_with_explanation(graph)
+        algorithm = selection['algorithm']
+        reason = selection['reason']
+    else:
+        reason = f"User selected {algorithm}"
+
+    if algorithm not in engine.algorithms:
+        raise ValueError(f"Unknown algorithm: {algorithm}. Must be one of: "
+                         f"{list(engine.algorithms.keys()) + [SOLAR_SYSTEM]}")
+
+    if not params:
+        params = engine.selector.recommend_parameters(graph, algorithm)
+
+    def on_layout_preview(iteration, total, positions):
+        check_cancelled()
+        if preview_callback:
+            preview_callback(iteration, total, _recenter(to_keys(positions), center))
+
+    check_cancelled()
+    positions = engine.algorithms[algorithm].compute(
+        graph,
+        preview_callback=on_layout_preview,
+        preview_interval=preview_interval,
+        **params
+    )
+    check_cancelled()
+
+    return {
+        'algorithm': algorithm,
+        'reason': reason,
+        'parameters': params,
+        'positions': _recenter(to_keys(positions), center),
+        'statistics': {}
+    }
+
+
+def _layout_worker(snapshot, algorithm, params, preview_interval, preserve_center,
+                   messages, cancel_event):
+    """
+    Worker process entry point.
+
+    Sends ('preview', iteration, total, positions), then exactly one of
+    ('done', result), ('cancelled',) or ('error', message) through messages.
+    """
+    def send_preview(iteration, total, positions):
+        messages.put(('preview', iteration, total, positions))
+
+    try:
+        result = compute_snapshot_layout(
+            snapshot,
+            algorithm=algorithm,
+            params=params,
+            preview_interval=preview_interval,
+            preview_callback=send_preview,
+            is_cancelled=cancel_event.is_set,
+            preserve_center=preserve_center
+        )
+        messages.put(('done', result))
+    except LayoutCancelled:
+        messages.put(('cancelled',))
+    except Exception as e:
+        messages.put(('error', f"{type(e).__name__}: {e}"))
+
+
+class BackgroundLayoutJob:
+    """
+    Main-thread handle for a layout computed in a worker process.
+
+    The job is driven by poll(), which must be called from the thread that
+    owns the model (normally via GLib.timeout_add). Preview positions are
+    written straight onto the objects so the canvas animates; cancel or
+    failure restores the positions captured in the snapshot. The final
+    positions are applied in a single call to LayoutEngine._apply_positions.
+
+    Callbacks (all invoked from poll() on the caller's thread):
+        on_preview(job, iteration, total): after preview positions were set
+        on_complete(job, result): after the final positions were applied
+        on_cancelled(job): after original positions were restored
+        on_error(job, message): after original positions were restored
+    """
+
+    # Seconds to wait for a cancelled worker before terminating it
+    CANCEL_GRACE_PERIOD = 2.0
+
+    def __init__(self,
+                 engine,
+                 algorithm: str = 'auto',
+                 params: Optional[Dict] = None,
+                 preview_interval: int = 50,
+                 preserve_center: bool = True,
+                 on_preview: Optional[Callable] = None,
+                 on_complete: Optional[Callable] = None,
+                 on_cancelled: Optional[Callable] = None,
+                 on_error: Optional[Callable] = None,
+                 mp_context: str = 'spawn'):
+        """
+        Initialize a background layout job (does not start it).
+
+        Args:
+            engine: LayoutEngine whose document is laid out
+            algorithm: Algorithm name ('auto', 'solar_system', ...)
+            params: Algorithm parameters (None = recommended)
+            preview_interval: Iterations between preview updates (0 = none)
+            preserve_center: Keep the current centroid of the model
+            on_preview, on_complete, on_cancelled, on_error: Callbacks
+            mp_context: multiprocessing start method ('spawn' is safe with GTK)
+        """
+        self.engine = engine
+        self.algorithm = algorithm
+        self.params = params
+        self.preview_interval = preview_interval
+        self.preserve_center = preserve_center
+        self.on_preview = on_preview
+        self.on_complete = on_complete
+        self.on_cancelled = on_cancelled
+        self.on_error = on_error
+
+        self.state = STATE_PENDING
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+        self.preview_count = 0
+
+        self._context = multiprocessing.get_context(mp_context)
+        self._process = None
+        self._messages = None
+        self._cancel_event = None
+        self._cancel_requested_at = None
+
+        doc = engine._get_document()
+        self.snapshot, self._key_to_object = LayoutSnapshot.from_document(doc)
+
+    @property
+    def running(self) -> bool:
+        """True while the worker is computing."""
+        return self.state == STATE_RUNNING
+
+    def start(self) -> 'BackgroundLayoutJob':
+        """Start the worker process. Returns self for chaining."""
+        if self.state != STATE_PENDING:
+            raise RuntimeError(f"Layout job already {self.state}")
+
+        self._messages = self._context.Queue()
+        self._cancel_event = self._context.Event()
+        self._process = self._context.Process(
+            target=_layout_worker,
+            args=(self.snapshot, self.algorithm, self.params, self.preview_interval,
+                  self.preserve_center, self._messages, self._cancel_event),
+            daemon=True
+        )
+        self._process.start()
+        self.state = STATE_RUNNING
+        return self
+
+    def cancel(self):
+        """
+        Request cancellation.
+
+        The worker stops at its next preview point; poll() then restores the
+        original positions. A worker stuck in a non-interruptible phase is
+        terminated after CANCEL_GRACE_PERIOD seconds.
+        """
+        if self.state != STATE_RUNNING:
+            return
+        self._cancel_event.set()
+        if self._cancel_requested_at is None:
+            self._cancel_requested_at = time.monotonic()
+
+    def discard(self):
+        """
+        Cancel without waiting for the worker (e.g. before a new layout of
+        the same model).
+
+        The original positions are restored and on_cancelled is called
+        right away; the worker is terminated and whatever it still sends,
+        including a final result, is ignored. Never blocks.
+        """
+        if self.state != STATE_RUNNING:
+            return
+        self._cancel_event.set()
+        self._process.terminate()
+        self._finish(('cancelled',), join=False)
+
+    def poll(self) -> bool:
+        """
+        Process pending worker messages.
+
+        Only the most recent preview is applied, so a slow UI never falls
+        behind the worker.
+
+        Returns:
+            True while the job is still running (GLib.timeout_add contract)
+        """
+        if self.state != STATE_RUNNING:
+            return False
+
+        latest_preview = None
+        final_message = None
+        while final_message is None:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == 'preview':
+                latest_preview = message
+            else:
+                final_message = message
+
+        if final_message is not None:
+            self._finish(final_message)
+            return False
+
+        if self._cancel_requested_at is not None:
+            if time.monotonic() - self._cancel_requested_at > self.CANCEL_GRACE_PERIOD:
+                self._process.terminate()
+                self._finish(('cancelled',))
+                return False
+        elif latest_preview is not None:
+            _, iteration, total, positions = latest_preview
+            self._set_positions(positions)
+            self.preview_count += 1
+            if self.on_preview:
+                self.on_preview(self, iteration, total)
+
+        if not self._process.is_alive() and self._messages.empty():
+            self._finish(('error', f"Layout worker exited with code {self._process.exitcode}"))
+            return False
+
+        return True
+
+    def wait(self, timeout: Optional[float] = None, interval: float = 0.02) -> bool:
+        """
+        Block until the job finishes (for scripts and tests).
+
+        Args:
+            timeout: Maximum seconds to wait (None = forever)
+            interval: Polling interval in seconds
+
+        Returns:
+            True if the job finished, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.poll():
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(interval)
+        return True
+
+    def _finish(self, message, join: bool = True):
+        """Handle the worker's final message and release resources."""
+        kind = message[0]
+        if kind == 'done' and self._cancel_requested_at is None:
+            self.result = message[1]
+            self.state = STATE_DONE
+            self._apply_final(self.result)
+        elif kind == 'error':
+            self.error = message[1]
+            self.state = STATE_FAILED
+            self._set_positions(self.snapshot.original_positions())
+            if self.on_error:
+                self.on_error(self, self.error)
+        else:
+            self.state = STATE_CANCELLED
+            self._set_positions(self.snapshot.original_positions())
+            if self.on_cancelled:
+                self.on_cancelled(self)
+
+        if self._process is not None and join:
+            self._process.join(timeout=1.0)
+        self._messages.close()
+
+    def _apply_final(self, result: Dict):
+        """Apply final positions atomically via the engine."""
+        positions = {
+            self._key_to_object[key]: position
+            for key, position in result['positions'].items()
+            if key in self._key_to_object
+        }
+        result['nodes_moved'] = self.engine._apply_positions(positions)
+        result['success'] = True
+        if result['nodes_moved']:
+            self.engine.document_manager.mark_dirty()
+        if self.on_complete:
+            self.on_complete(self, result)
+
+    def _set_positions(self, positions: Dict):
+        """Write (kind, id)-keyed positions onto the live objects (preview/restore)."""
+        for key, (x, y) in positions.items():
+            obj = self._key_to_object.get(key)
+            if obj is not None:
+                obj.x = x
+                obj.y = y
@@ -16,11 +16,16 @@ Usage:
     >>> engine.apply_layout('force_directed')
     >>> engine.apply_layout('circular')
     >>> engine.apply_layout('orthogonal')
+    >>> engine.apply_layout('multilevel')  # very large graphs
     >>> 
     >>> # Preview without applying
     >>> result = engine.preview_layout('auto')
     >>> print(result['algorithm'])  # Shows selected algorithm
     >>> print(result['reason'])     # Explains why
+    >>> 
+    >>> # Compute in a worker process with animated preview (GTK main loop)
+    >>> job = engine.apply_layout_async('force_directed', on_complete=...)
+    >>> GLib.timeout_add(50, job.poll)
 """
 
 from typing import Dict, Tuple, List, Optional
@@ -30,7 +35,10 @@ from .hierarchical import HierarchicalLayout
 from .force_directed import ForceDirectedLayout
 from .circular import CircularLayout
 from .orthogonal import OrthogonalLayout
+from .multilevel import MultilevelLayout
 from .selector import LayoutSelector
+from shypn.layout.sscc.csr_graph import CSRGraph, KIND_PLACE
+from .background import BackgroundLayoutJob
 
 
 class LayoutEngine:
@@ -54,7 +62,8 @@ class LayoutEngine:
             'hierarchical': HierarchicalLayout(),
             'force_directed': ForceDirectedLayout(),
             'circular': CircularLayout(),
-            'orthogonal': OrthogonalLayout()
+            'orthogonal': OrthogonalLayout(),
+            'multilevel': MultilevelLayout()
         }
         
         # Initialize selector
@@ -64,6 +73,17 @@ class LayoutEngine:
         """Set the document manager."""
         self.document_manager = document_manager
     
+    def _get_document(self):
+        """
+        Get the object holding places/transitions/arcs.
+        
+        Supports both ModelCanvasManager (has places/transitions directly)
+        and DocumentManager (has .document property).
+        """
+        if hasattr(self.document_manager, 'document'):
+            return self.document_manager.document
+        return self.document_manager  # ModelCanvasManager IS the document
+    
     def build_graph(self) -> nx.DiGraph:
         """
         Build NetworkX graph from current DocumentModel.
@@ -98,74 +118,41 @@ class LayoutEngine:
         if self.document_manager is None:
             raise ValueError("Document manager not set")
         
-        # Support both ModelCanvasManager (has places/transitions directly)
-        # and DocumentManager (has .document property)
-        if hasattr(self.document_manager, 'document'):
-            doc = self.document_manager.document
-        else:
-            doc = self.document_manager  # ModelCanvasManager IS the document
+        doc = self._get_document()
         
         graph = nx.DiGraph()
         
-        # DIAGNOSTIC: Count and log what we're loading
-        
-        # Add mass nodes (places and transitions)
-        # Use the actual objects as node IDs - NetworkX handles this perfectly
-        # This automatically avoids ID collisions since Python objects are unique by identity
-        place_count = 0
-        for i, place in enumerate(doc.places):
-            # Check if this place is an enzyme/catalyst place
-            # Enzyme places have metadata['is_enzyme'] = True
-            # Use getattr() to safely access metadata attribute
-            # Check for catalyst flag (enzyme place)
-            # Priority: Use existing is_catalyst attribute if set (from loaded file),
-            # fallback to metadata['is_enzyme'] for KEGG imports
+        # Catalyst flag (enzyme place) drives layering in hierarchical layout
+        # Priority: Use existing is_catalyst attribute if set (from loaded file),
+        # fallback to metadata['is_enzyme'] for KEGG imports
+        for place in doc.places:
             if hasattr(place, 'is_catalyst') and place.is_catalyst:
                 # Already set (from file load or KEGG import) - preserve it!
-                pass
-            else:
-                # Not set yet - check metadata
-                metadata = getattr(place, 'metadata', {})
-                is_enzyme = metadata.get('is_enzyme', False) if metadata else False
-                place.is_catalyst = is_enzyme
-            
-            graph.add_node(place, type='place')  # Use object itself as node ID
-            place_count += 1
-            if i < 5:  # Show first 5
-                place_name = getattr(place, 'name', 'unnamed')
+                continue
+            metadata = getattr(place, 'metadata', {})
+            place.is_catalyst = metadata.get('is_enzyme', False) if metadata else False
         
-        if len(doc.places) > 5:
-            pass  # More places exist
-        
-        transition_count = 0
-        for transition in doc.transitions:
-            graph.add_node(transition, type='transition')  # Use object itself as node ID
-            transition_count += 1
+        # Shared array-backed adjacency (one pass over arcs)
+        csr = CSRGraph.from_petri_net(doc.places, doc.transitions, doc.arcs)
+        objects = csr.objects
         
+        # Add mass nodes (places and transitions)
+        # Use the actual objects as node IDs - NetworkX handles this perfectly
+        # This automatically avoids ID collisions since Python objects are unique by identity
+        graph.add_nodes_from(
+            (obj, {'type': 'place' if kind == KIND_PLACE else 'transition'})
+            for obj, kind in zip(objects, csr.kinds.tolist())
+        )
         
         # Add springs (arcs) with weight as spring strength
-        # Arcs have .source and .target which are OBJECT REFERENCES, not IDs!
-        arcs_added = 0
-        for arc in doc.arcs:
-            # Arc weight = stoichiometry = spring strength
-            # Higher weight = stronger spring = pulls mass nodes closer
-            weight = getattr(arc, 'weight', 1.0)  # Default weight = 1.0
-            
-            # arc.source and arc.target are the actual Place/Transition objects
-            # These are already in the graph as node IDs
-            source_obj = arc.source
-            target_obj = arc.target
-            
-            if source_obj in graph and target_obj in graph:
-                # Don't store arc object - it contains GObject references that can't be deepcopied
-                # Just store the weight (stoichiometry) which is all we need for layout
-                graph.add_edge(source_obj, target_obj, weight=weight)
-                arcs_added += 1
-            else:
-                # This shouldn't happen if everything is wired correctly
-                source_name = getattr(source_obj, 'name', 'unknown')
-                target_name = getattr(target_obj, 'name', 'unknown')
-        
+        # Arc weight = stoichiometry = spring strength
+        # Higher weight = stronger spring = pulls mass nodes closer
+        # Don't store arc object - it contains GObject references that can't be deepcopied
+        # Just store the weight (stoichiometry) which is all we need for layout
+        graph.add_edges_from(
+            (objects[source], objects[target], {'weight': weight})
+            for source, target, weight, _ in csr.iter_edges()
+        )
         
         return graph
     
@@ -241,6 +228,59 @@ class LayoutEngine:
             'parameters': kwargs
         }
     
+    def apply_layout_async(
+        self,
+        algorithm: str = 'auto',
+        on_preview=None,
+        on_complete=None,
+        on_cancelled=None,
+        on_error=None,
+        preview_interval: int = 50,
+        preserve_center: bool = True,
+        **kwargs
+    ) -> BackgroundLayoutJob:
+        """
+        Compute a layout in a worker process without blocking the caller.
+        
+        The model geometry is snapshotted now; the returned job must be
+        polled from the main thread (e.g. GLib.timeout_add(50, job.poll)).
+        Intermediate positions are shown every preview_interval iterations,
+        and the final positions are applied through _apply_positions in a
+        single step. See shypn.edit.graph_layout.background for details.
+        
+        Args:
+            algorithm: Algorithm name ('auto', 'solar_system', 'hierarchical',
+                      'force_directed', 'circular', 'orthogonal')
+            on_preview: Callback(job, iteration, total) after preview update
+            on_complete: Callback(job, result) after final positions applied
+            on_cancelled: Callback(job) after original positions restored
+            on_error: Callback(job, message) after original positions restored
+            preview_interval: Iterations between preview updates (0 = none)
+            preserve_center: Keep the current centroid of the model
+            **kwargs: Algorithm-specific parameters
+            
+        Returns:
+            Started BackgroundLayoutJob
+            
+        Raises:
+            ValueError: If document_manager is not set
+        """
+        if self.document_manager is None:
+            raise ValueError("Document manager not set")
+        
+        job = BackgroundLayoutJob(
+            self,
+            algorithm=algorithm,
+            params=kwargs or None,
+            preview_interval=preview_interval,
+            preserve_center=preserve_center,
+            on_preview=on_preview,
+            on_complete=on_complete,
+            on_cancelled=on_cancelled,
+            on_error=on_error
+        )
+        return job.start()
+    
     def preview_layout(
         self,
         algorithm: str = 'auto',
@@ -323,12 +363,7 @@ class LayoutEngine:
         Returns:
             Number of nodes moved
         """
-        # Support both ModelCanvasManager (has places/transitions directly)
-        # and DocumentManager (has .document property)
-        if hasattr(self.document_manager, 'document'):
-            doc = self.document_manager.document
-        else:
-            doc = self.document_manager  # ModelCanvasManager IS the document
+        doc = self._get_document()
         
         nodes_moved = 0
         
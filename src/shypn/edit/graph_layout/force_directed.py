@@ -43,6 +43,8 @@ class ForceDirectedLayout(LayoutAlgorithm):
         k_multiplier: float = 1.5,  # Multiplier for auto-calculated k
         scale: float = 2000.0,  # Increased from 1000.0 → more canvas space
         seed: int = 42,
+        preview_callback=None,
+        preview_interval: int = 50,
         **kwargs
     ) -> Dict[str, Tuple[float, float]]:
         """
@@ -75,6 +77,9 @@ class ForceDirectedLayout(LayoutAlgorithm):
             k_multiplier: Multiplier for auto-calculated k (ignored if k is provided)
             scale: Scale factor for final positions (canvas size)
             seed: Random seed for reproducible layouts
+            preview_callback: Optional callback(iteration, total, positions)
+                receiving intermediate scaled positions (animated preview)
+            preview_interval: Iterations between preview callbacks
             
         Returns:
             Dictionary mapping node IDs to (x, y) positions
@@ -152,7 +157,12 @@ class ForceDirectedLayout(LayoutAlgorithm):
             layout_params['weight'] = 'weight'
         
         
-        positions = nx.spring_layout(undirected_graph, **layout_params)
+        if preview_callback and 0 < preview_interval < iterations:
+            positions = self._spring_layout_with_preview(
+                undirected_graph, layout_params, preview_callback, preview_interval
+            )
+        else:
+            positions = nx.spring_layout(undirected_graph, **layout_params)
         
         # Convert positions to our format
         result = {}
@@ -161,6 +171,45 @@ class ForceDirectedLayout(LayoutAlgorithm):
         
         return result
     
+    def _spring_layout_with_preview(self, graph, layout_params, preview_callback, preview_interval):
+        """
+        Run spring_layout in chunks of preview_interval iterations.
+        
+        Each chunk continues from the previous (unscaled) positions, and the
+        rescaled intermediate positions are handed to preview_callback.
+        NetworkX restarts its cooling schedule per call, so the result is
+        close to, but not bit-identical with, a single uninterrupted run.
+        
+        Args:
+            graph: Undirected NetworkX graph
+            layout_params: Parameters as passed to nx.spring_layout
+            preview_callback: Callback(iteration, total, positions)
+            preview_interval: Iterations per chunk
+            
+        Returns:
+            Dictionary mapping nodes to numpy (x, y) positions
+        """
+        params = dict(layout_params)
+        total = params.pop('iterations')
+        scale = params.pop('scale')
+        params.pop('center', None)
+        
+        positions = None
+        done = 0
+        while done < total:
+            chunk = min(preview_interval, total - done)
+            positions = nx.spring_layout(
+                graph, pos=positions, iterations=chunk, scale=None, **params
+            )
+            done += chunk
+            if done < total:
+                scaled = nx.rescale_layout_dict(positions, scale=scale)
+                preview_callback(done, total, {
+                    node: (float(x), float(y)) for node, (x, y) in scaled.items()
+                })
+        
+        return nx.rescale_layout_dict(positions, scale=scale)
+    
     def compute_with_weights(
         self,
         graph: nx.DiGraph,
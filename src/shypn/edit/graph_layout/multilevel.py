@@ -0,0 +1,481 @@
+"""
+Multilevel Layout Algorithm (coarsen - layout - refine)
+
+Implements near-linear force-directed layout for very large pathways
+(whole-genome KEGG/Reactome imports with thousands of nodes), where a
+single-level spring_layout is O(n²) per iteration.
+
+Based on:
+    Walshaw (2003) - "A multilevel algorithm for force-directed
+    graph-drawing" Journal of Graph Algorithms and Applications
+    Hachul & Jünger (2004) - "Drawing large graphs with a
+    potential-field-based multilevel algorithm" (FM³)
+
+Algorithm:
+    1. Coarsening: Repeatedly contract the graph by heavy-edge matching
+       (plus absorbing dangling leaves into their neighbour) until it has
+       at most `coarsest_size` nodes or stops shrinking
+    2. Initial layout: Exact Fruchterman-Reingold on the coarsest graph
+    3. Refinement: Walk back up the hierarchy; the children of each node
+       are spread over a disc around its position (about k² of room per
+       child) and a fast force model refines them:
+       - Springs along edges (weighted by summed arc weights)
+       - Repulsion only between nodes in neighbouring grid cells
+         (cell size = 2 × ideal edge length). Springs of non-planar graphs
+         (random or expander-like networks) pull the layout denser than
+         one node per k², so pairs between crowded cells are sampled
+         (at most CELL_PAIR_LIMIT per cell pair, scaled to the full
+         count); each iteration stays O(n + m)
+
+    Weak gravity is applied on the coarsest level only (where repulsion is
+    exact) to keep disconnected components together; with cut-off
+    repulsion it would compress the finer levels.
+"""
+
+from typing import Dict, List, Tuple
+import math
+import networkx as nx
+import numpy as np
+from .base import LayoutAlgorithm
+
+
+class MultilevelLayout(LayoutAlgorithm):
+    """
+    Multilevel force-directed layout for very large graphs.
+
+    Coarsens the graph by heavy-edge matching, lays out the coarsest
+    graph exactly, then refines level by level with a grid-accelerated
+    force model.
+    """
+
+    # Repulsion cutoff as a multiple of the ideal edge length
+    REPULSION_RADIUS = 2.0
+
+    # Stop coarsening when a level shrinks by less than this fraction
+    MIN_COARSENING_RATIO = 0.95
+
+    # Largest level laid out with all-pairs repulsion
+    EXACT_LIMIT = 300
+
+    # Repulsion pairs evaluated per pair of grid cells (sampled beyond it)
+    CELL_PAIR_LIMIT = 256
+
+    def __init__(self):
+        super().__init__()
+        self.name = "Multilevel Layout"
+        self.description = "Coarsen-layout-refine force-directed layout (near-linear)"
+        self.best_for = "Very large pathways (whole-genome KEGG/Reactome imports)"
+
+    def compute(
+        self,
+        graph: nx.DiGraph,
+        spacing: float = 100.0,
+        coarsest_size: int = 50,
+        coarsest_iterations: int = 300,
+        refine_iterations: int = 50,
+        gravity: float = 0.05,
+        seed: int = 42,
+        preview_callback=None,
+        **kwargs
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        Compute multilevel layout positions.
+
+        Args:
+            graph: NetworkX directed graph
+            spacing: Ideal edge length in pixels on the finest level
+            coarsest_size: Stop coarsening at this many nodes
+            coarsest_iterations: Force iterations for the coarsest graph
+            refine_iterations: Force iterations per refinement level
+            gravity: Pull toward the centroid on the coarsest level
+                (keeps disconnected components together)
+            seed: Random seed for reproducible layouts
+            preview_callback: Optional callback(level, total_levels, positions)
+                called after each refined level with positions for all
+                original nodes (nodes inherit their coarse ancestor's position)
+
+        Returns:
+            Dictionary mapping node IDs to (x, y) positions centered at (0, 0)
+        """
+        n = graph.number_of_nodes()
+        if n == 0:
+            return {}
+
+        nodes = list(graph.nodes())
+        if n == 1:
+            return {nodes[0]: (0.0, 0.0)}
+
+        rng = np.random.default_rng(seed)
+        edges, weights = self._undirected_edges(graph, nodes)
+
+        # Phase 1: Coarsening
+        levels = self._coarsen(n, edges, weights, coarsest_size, rng)
+
+        # Phase 2: Layout of coarsest graph
+        coarse_n, coarse_edges, coarse_weights, coarse_mass = levels[-1][:4]
+        k = spacing * math.sqrt(n / coarse_n)
+        positions = rng.uniform(-0.5, 0.5, size=(coarse_n, 2)) * k * math.sqrt(coarse_n)
+        positions = self._force_iterations(
+            positions, coarse_edges, coarse_weights, coarse_mass, k,
+            iterations=coarsest_iterations,
+            temperature=k * math.sqrt(coarse_n) * 0.1,
+            gravity=gravity,
+            exact=coarse_n <= max(coarsest_size, self.EXACT_LIMIT)
+        )
+
+        # Phase 3: Refinement (coarse → fine)
+        total_levels = len(levels)
+        for level in range(total_levels - 2, -1, -1):
+            level_n, level_edges, level_weights, level_mass, _ = levels[level]
+            parent = levels[level + 1][4]
+            k = spacing * math.sqrt(n / level_n)
+
+            positions = self._prolong(positions, parent, k, rng)
+            positions = self._force_iterations(
+                positions, level_edges, level_weights, level_mass, k,
+                iterations=refine_iterations,
+                temperature=k,
+                gravity=0.0,
+                exact=False,
+                rng=rng
+            )
+
+            if preview_callback and level > 0:
+                projected = positions[self._project_to_level(levels, level)]
+                projected = projected - projected.mean(axis=0)
+                preview_callback(total_levels - 1 - level, total_levels - 1, {
+                    node: (float(x), float(y)) for node, (x, y) in zip(nodes, projected.tolist())
+                })
+
+        positions = positions - positions.mean(axis=0)
+        return {node: (float(x), float(y)) for node, (x, y) in zip(nodes, positions.tolist())}
+
+    def _undirected_edges(self, graph: nx.DiGraph, nodes: List) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Collapse directed (possibly reciprocal) edges into undirected pairs.
+
+        Returns:
+            Tuple of (edges as int64 array of shape (m, 2) with u < v,
+            summed weights as float64 array of length m)
+        """
+        index = {node: i for i, node in enumerate(nodes)}
+        pairs = []
+        pair_weights = []
+        for u, v, data in graph.edges(data=True):
+            i, j = index[u], index[v]
+            if i == j:
+                continue
+            pairs.append((i, j) if i < j else (j, i))
+            pair_weights.append(float(data.get('weight', 1.0) or 1.0))
+
+        if not pairs:
+            return np.zeros((0, 2), dtype=np.int64), np.zeros(0)
+        return self._merge_edges(np.asarray(pairs, dtype=np.int64), np.asarray(pair_weights), len(nodes))
+
+    def _merge_edges(self, edges: np.ndarray, weights: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Sum weights of duplicate (u, v) pairs (u < v required)."""
+        keys = edges[:, 0] * n + edges[:, 1]
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        merged_weights = np.bincount(inverse, weights=weights)
+        merged = np.stack([unique_keys // n, unique_keys % n], axis=1)
+        return merged, merged_weights
+
+    def _coarsen(self, n: int, edges: np.ndarray, weights: np.ndarray,
+                 coarsest_size: int, rng) -> List[Tuple]:
+        """
+        Build the coarsening hierarchy.
+
+        Returns:
+            List of levels (finest first). Each level is a tuple
+            (node_count, edges, weights, masses, parent) where parent maps
+            the previous (finer) level's nodes to this level's nodes
+            (None for the finest level).
+        """
+        masses = np.ones(n)
+        levels = [(n, edges, weights, masses, None)]
+
+        while n > coarsest_size:
+            parent, coarse_n = self._match(n, edges, weights, masses, rng)
+            if coarse_n > n * self.MIN_COARSENING_RATIO:
+                break
+
+            coarse_masses = np.bincount(parent, weights=masses, minlength=coarse_n)
+            if len(edges):
+                mapped = parent[edges]
+                keep = mapped[:, 0] != mapped[:, 1]
+                mapped = np.sort(mapped[keep], axis=1)
+                coarse_edges, coarse_weights = self._merge_edges(mapped, weights[keep], coarse_n)
+            else:
+                coarse_edges, coarse_weights = edges, weights
+
+            levels.append((coarse_n, coarse_edges, coarse_weights, coarse_masses, parent))
+            n, edges, weights, masses = coarse_n, coarse_edges, coarse_weights, coarse_masses
+
+        return levels
+
+    def _match(self, n: int, edges: np.ndarray, weights: np.ndarray,
+               masses: np.ndarray, rng) -> Tuple[np.ndarray, int]:
+        """
+        Heavy-edge matching with leaf absorption.
+
+        Nodes are visited in random order; each unmatched node is paired
+        with the unmatched neighbour maximising weight / (mass_u * mass_v)
+        (mass normalisation keeps clusters balanced). Isolated nodes are
+        paired with each other. Unmatched nodes with a single neighbour
+        are then absorbed into that neighbour's group, so star-shaped hubs
+        collapse in one level.
+
+        Returns:
+            Tuple of (parent array mapping node → coarse node, coarse count)
+        """
+        neighbors = [[] for _ in range(n)]
+        if len(edges):
+            mass_list = masses.tolist()
+            for (u, v), w in zip(edges.tolist(), weights.tolist()):
+                score = w / (mass_list[u] * mass_list[v])
+                neighbors[u].append((score, v))
+                neighbors[v].append((score, u))
+
+        parent = [-1] * n
+        coarse_n = 0
+        pending_isolated = -1
+        for u in rng.permutation(n).tolist():
+            if parent[u] != -1:
+                continue
+            if not neighbors[u]:
+                if pending_isolated == -1:
+                    pending_isolated = u
+                else:
+                    parent[pending_isolated] = parent[u] = coarse_n
+                    coarse_n += 1
+                    pending_isolated = -1
+                continue
+            best = -1
+            best_score = -1.0
+            for score, v in neighbors[u]:
+                if parent[v] == -1 and v != u and score > best_score:
+                    best, best_score = v, score
+            parent[u] = coarse_n
+            if best != -1:
+                parent[best] = coarse_n
+            coarse_n += 1
+        if pending_isolated != -1:
+            parent[pending_isolated] = coarse_n
+            coarse_n += 1
+
+        # Leaf absorption: singleton groups with exactly one neighbour
+        group_size = [0] * coarse_n
+        for p in parent:
+            group_size[p] += 1
+        for u in range(n):
+            if group_size[parent[u]] == 1 and len(neighbors[u]) == 1:
+                v = neighbors[u][0][1]
+                if group_size[parent[v]] > 1 or (parent[v] < parent[u]):
+                    group_size[parent[u]] = 0
+                    parent[u] = parent[v]
+                    group_size[parent[v]] += 1
+
+        # Renumber groups densely
+        used = sorted(set(parent))
+        if len(used) != coarse_n:
+            renumber = {old: new for new, old in enumerate(used)}
+            parent = [renumber[p] for p in parent]
+            coarse_n = len(used)
+
+        return np.asarray(parent, dtype=np.int64), coarse_n
+
+    def _prolong(self, positions: np.ndarray, parent: np.ndarray, k: float, rng) -> np.ndarray:
+        """
+        Place each node around its parent's position.
+
+        The children of a parent are spread uniformly over a disc of area
+        about children × k², the room they take at the finer level's ideal
+        edge length. Starting them on the parent's point would crowd whole
+        groups (e.g. the absorbed leaves of a hub) into one grid cell.
+        """
+        children = np.bincount(parent, minlength=len(positions))
+        radius = 0.6 * k * np.sqrt(children[parent])
+        angle = rng.uniform(0.0, 2.0 * math.pi, size=len(parent))
+        distance = radius * np.sqrt(rng.uniform(0.0, 1.0, size=len(parent)))
+        return positions[parent] + np.stack([np.cos(angle), np.sin(angle)], axis=1) * distance[:, None]
+
+    def _project_to_level(self, levels: List[Tuple], level: int) -> np.ndarray:
+        """Map each finest-level node to its ancestor on the given level."""
+        mapping = np.arange(levels[0][0])
+        for parent_level in range(1, level + 1):
+            mapping = levels[parent_level][4][mapping]
+        return mapping
+
+    def _force_iterations(
+        self,
+        positions: np.ndarray,
+        edges: np.ndarray,
+        weights: np.ndarray,
+        masses: np.ndarray,
+        k: float,
+        iterations: int,
+        temperature: float,
+        gravity: float,
+        exact: bool,
+        rng=None
+    ) -> np.ndarray:
+        """
+        Run Fruchterman-Reingold style iterations.
+
+        Args:
+            positions: (n, 2) array of starting positions (modified copy returned)
+            edges: (m, 2) undirected edge array
+            weights: Edge weights (spring strength)
+            masses: Node masses (number of original nodes represented)
+            k: Ideal edge length
+            iterations: Number of iterations
+            temperature: Initial maximum displacement (cools linearly)
+            gravity: Pull toward the centroid
+            exact: Use all-pairs repulsion (small graphs) instead of the grid
+            rng: Random generator for sampling crowded cells (grid only)
+
+        Returns:
+            (n, 2) array of refined positions
+        """
+        positions = positions.astype(np.float64, copy=True)
+        n = len(positions)
+        if n < 2 or iterations <= 0:
+            return positions
+
+        # Normalise weights so the typical spring has strength 1
+        spring = weights / weights.mean() if len(weights) else weights
+        mass_scale = masses / masses.mean()
+        cooling = temperature / (iterations + 1)
+
+        for _ in range(iterations):
+            if exact:
+                displacement = self._exact_repulsion(positions, mass_scale, k)
+            else:
+                displacement = self._grid_repulsion(positions, mass_scale, k, rng)
+
+            if len(edges):
+                u = edges[:, 0]
+                v = edges[:, 1]
+                delta = positions[v] - positions[u]
+                distance = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 0.01)
+                attraction = (delta * (distance * spring / k)[:, None])
+                displacement += self._accumulate(u, attraction, n)
+                displacement -= self._accumulate(v, attraction, n)
+
+            if gravity:
+                displacement -= gravity * (positions - positions.mean(axis=0)) * mass_scale[:, None]
+
+            # Limit displacement by temperature
+            length = np.maximum(np.hypot(displacement[:, 0], displacement[:, 1]), 0.01)
+            positions += displacement * (np.minimum(length, temperature) / length)[:, None]
+            temperature = max(temperature - cooling, k * 0.01)
+
+        return positions
+
+    def _exact_repulsion(self, positions: np.ndarray, mass_scale: np.ndarray, k: float) -> np.ndarray:
+        """All-pairs repulsion k² · m_j / d (O(n²), coarsest level only)."""
+        delta = positions[:, None, :] - positions[None, :, :]
+        distance_sq = np.maximum((delta ** 2).sum(axis=2), 0.01)
+        np.fill_diagonal(distance_sq, np.inf)
+        factor = (k * k) * mass_scale[None, :] / distance_sq
+        return (delta * factor[:, :, None]).sum(axis=1)
+
+    def _grid_repulsion(self, positions: np.ndarray, mass_scale: np.ndarray, k: float,
+                        rng=None) -> np.ndarray:
+        """
+        Repulsion between nodes closer than REPULSION_RADIUS × k.
+
+        Nodes are binned into square cells of that size; only pairs in the
+        same or adjacent cells are considered. Cell pairs with more than
+        CELL_PAIR_LIMIT node pairs contribute a uniform sample of that
+        many, weighted by the sampling ratio (an unbiased estimate of the
+        full sum), so the cost stays linear in n however crowded the
+        cells get.
+        """
+        if rng is None:
+            rng = np.random.default_rng(0)
+        n = len(positions)
+        displacement = np.zeros_like(positions)
+        radius = self.REPULSION_RADIUS * k
+
+        cells = np.floor(positions / radius).astype(np.int64)
+        cells -= cells.min(axis=0)
+        width = int(cells[:, 1].max()) + 3
+        keys = (cells[:, 0] + 1) * width + (cells[:, 1] + 1)
+
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        unique_keys, starts, counts = np.unique(sorted_keys, return_index=True, return_counts=True)
+
+        # Half neighbourhood: each unordered cell pair is visited once
+        for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+            neighbor_keys = unique_keys + dx * width + dy
+            found = np.searchsorted(unique_keys, neighbor_keys)
+            found = np.minimum(found, len(unique_keys) - 1)
+            valid = unique_keys[found] == neighbor_keys
+            if not valid.any():
+                continue
+
+            a_start = starts[valid]
+            a_count = counts[valid]
+            b_start = starts[found[valid]]
+            b_count = counts[found[valid]]
+
+            i, j, scale = self._cell_pairs(a_start, a_count, b_start, b_count, rng)
+            if dx == 0 and dy == 0:
+                keep = i < j
+                i, j, scale = i[keep], j[keep], scale[keep]
+            if len(i) == 0:
+                continue
+
+            i = order[i]
+            j = order[j]
+            delta = positions[i] - positions[j]
+            distance_sq = np.maximum((delta ** 2).sum(axis=1), 0.01)
+            within = distance_sq < radius * radius
+            if not within.any():
+                continue
+            i, j, delta, distance_sq = i[within], j[within], delta[within], distance_sq[within]
+
+            factor = (k * k) * scale[within] / distance_sq
+            displacement += self._accumulate(i, delta * (factor * mass_scale[j])[:, None], n)
+            displacement -= self._accumulate(j, delta * (factor * mass_scale[i])[:, None], n)
+
+        return displacement
+
+    def _accumulate(self, index: np.ndarray, vectors: np.ndarray, n: int) -> np.ndarray:
+        """Sum 2D vectors per node index (bincount is much faster than add.at)."""
+        return np.stack([
+            np.bincount(index, weights=vectors[:, 0], minlength=n),
+            np.bincount(index, weights=vectors[:, 1], minlength=n)
+        ], axis=1)
+
+    def _cell_pairs(self, a_start, a_count, b_start, b_count,
+                    rng) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Enumerate (i, j) sorted-order index pairs between matched cells.
+
+        Cell pairs with more than CELL_PAIR_LIMIT node pairs yield that
+        many pairs drawn uniformly (with replacement) instead.
+
+        Returns:
+            Tuple of (i, j, scale), where scale is the weight of each pair
+            (1 when enumerated, full count / sample size when sampled)
+        """
+        pair_counts = a_count * b_count
+        sample_counts = np.minimum(pair_counts, self.CELL_PAIR_LIMIT)
+        total = int(sample_counts.sum())
+        if total == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0)
+
+        cell = np.repeat(np.arange(len(sample_counts)), sample_counts)
+        offset = np.arange(total) - np.repeat(np.cumsum(sample_counts) - sample_counts, sample_counts)
+        sampled = pair_counts[cell] > sample_counts[cell]
+        if sampled.any():
+            offset[sampled] = (rng.random(int(sampled.sum())) * pair_counts[cell[sampled]]).astype(np.int64)
+        b_len = b_count[cell]
+        i = a_start[cell] + offset // b_len
+        j = b_start[cell] + offset % b_len
+        scale = (pair_counts / sample_counts)[cell]
+        return i, j, scale
@@ -4,6 +4,7 @@ Layout Selector - Automatic Algorithm Selection
 Analyzes graph topology and selects the most appropriate layout algorithm.
 
 Decision Tree:
+    0. Very large graph (>= MULTILEVEL_THRESHOLD nodes)? → Multilevel
     1. Is graph a DAG (directed acyclic)? → Hierarchical
     2. Does graph have large cycle (>50% nodes)? → Circular
     3. Is graph highly connected (avg degree > 4)? → Force-Directed
@@ -17,6 +18,7 @@ from .hierarchical import HierarchicalLayout
 from .force_directed import ForceDirectedLayout
 from .circular import CircularLayout
 from .orthogonal import OrthogonalLayout
+from .multilevel import MultilevelLayout
 
 
 class LayoutSelector:
@@ -26,12 +28,17 @@ class LayoutSelector:
     Analyzes graph characteristics and recommends the best algorithm.
     """
     
+    # Graphs at least this large get the multilevel layout; the other
+    # algorithms (and full topology analysis) are too slow beyond this
+    MULTILEVEL_THRESHOLD = 500
+    
     def __init__(self):
         self.algorithms = {
             'hierarchical': HierarchicalLayout(),
             'force_directed': ForceDirectedLayout(),
             'circular': CircularLayout(),
-            'orthogonal': OrthogonalLayout()
+            'orthogonal': OrthogonalLayout(),
+            'multilevel': MultilevelLayout()
         }
     
     def select(
@@ -47,7 +54,8 @@ class LayoutSelector:
             prefer_orthogonal: If True, prefer orthogonal over hierarchical
             
         Returns:
-            Algorithm name: 'hierarchical', 'force_directed', 'circular', or 'orthogonal'
+            Algorithm name: 'hierarchical', 'force_directed', 'circular',
+            'orthogonal', or 'multilevel'
         """
         if graph.number_of_nodes() == 0:
             return 'hierarchical'  # Default
@@ -55,6 +63,10 @@ class LayoutSelector:
         if graph.number_of_nodes() == 1:
             return 'hierarchical'  # Doesn't matter for single node
         
+        # Very large graph: skip the (cycle enumerating) topology analysis
+        if graph.number_of_nodes() >= self.MULTILEVEL_THRESHOLD:
+            return 'multilevel'
+        
         # Analyze topology
         metrics = self._analyze_graph(graph)
         
@@ -86,6 +98,18 @@ class LayoutSelector:
                 'alternatives': []
             }
         
+        if graph.number_of_nodes() >= self.MULTILEVEL_THRESHOLD:
+            metrics = self._basic_metrics(graph)
+            return {
+                'algorithm': 'multilevel',
+                'reason': self._explain_multilevel(metrics),
+                'metrics': metrics,
+                'alternatives': [(
+                    'force_directed',
+                    'Single-level physics layout (slow for graphs this large)'
+                )]
+            }
+        
         # Analyze
         metrics = self._analyze_graph(graph)
         algorithm = self._apply_decision_tree(metrics, prefer_orthogonal)
@@ -112,6 +136,19 @@ class LayoutSelector:
         hierarchical = self.algorithms['hierarchical']
         return hierarchical.analyze_topology(graph)
     
+    def _basic_metrics(self, graph: nx.DiGraph) -> Dict:
+        """
+        Cheap O(V + E) metrics for graphs too large for analyze_topology.
+        """
+        n = graph.number_of_nodes()
+        m = graph.number_of_edges()
+        return {
+            'node_count': n,
+            'edge_count': m,
+            'avg_degree': (2 * m / n) if n > 0 else 0,
+            'density': nx.density(graph) if n > 1 else 0
+        }
+    
     def _apply_decision_tree(
         self,
         metrics: Dict,
@@ -156,6 +193,9 @@ class LayoutSelector:
         """
         Generate human-readable explanation for algorithm selection.
         """
+        if algorithm == 'multilevel':
+            return self._explain_multilevel(metrics)
+        
         reasons = {
             'hierarchical': self._explain_hierarchical(metrics),
             'force_directed': self._explain_force_directed(metrics),
@@ -193,6 +233,10 @@ class LayoutSelector:
         else:
             return "Structured layout requested. Using grid-aligned orthogonal layout for clarity."
     
+    def _explain_multilevel(self, metrics: Dict) -> str:
+        """Explain multilevel selection."""
+        return f"Very large graph ({metrics['node_count']} nodes, {metrics['edge_count']} edges). Multilevel layout coarsens the graph and refines it level by level in near-linear time."
+    
     def _find_alternatives(self, selected: str, metrics: Dict) -> list:
         """
         Find alternative algorithms that could work.
@@ -238,6 +282,12 @@ class LayoutSelector:
         Returns:
             Dictionary mapping algorithm names to suitability descriptions
         """
+        if graph.number_of_nodes() >= self.MULTILEVEL_THRESHOLD:
+            return {
+                'multilevel': "Near-linear coarsen-layout-refine layout",
+                'force_directed': "Universal physics-based layout (slow at this size)"
+            }
+        
         metrics = self._analyze_graph(graph)
         suitable = {}
         
@@ -247,6 +297,9 @@ class LayoutSelector:
         # Force-directed: Always works
         suitable['force_directed'] = "Universal physics-based layout"
         
+        # Multilevel: Works for any size, pays off on large graphs
+        suitable['multilevel'] = "Coarsen-layout-refine physics layout"
+        
         # Orthogonal: Works well for DAGs and structured graphs
         if metrics['is_dag'] or metrics['avg_degree'] < 3:
             suitable['orthogonal'] = "Grid-aligned structured layout"
@@ -269,7 +322,10 @@ class LayoutSelector:
         Returns:
             Dictionary of recommended parameter values
         """
-        metrics = self._analyze_graph(graph)
+        if algorithm == 'multilevel' or graph.number_of_nodes() >= self.MULTILEVEL_THRESHOLD:
+            metrics = self._basic_metrics(graph)
+        else:
+            metrics = self._analyze_graph(graph)
         n = metrics['node_count']
         
         # Base spacing on graph size
@@ -308,6 +364,11 @@ class LayoutSelector:
             params['iterations'] = min(500, 100 + n * 5)
             params['scale'] = 1000.0
         
+        elif algorithm == 'multilevel':
+            params['spacing'] = base_spacing
+            # Fewer refinement iterations per level as levels multiply
+            params['refine_iterations'] = 50 if n < 5000 else 30
+        
         elif algorithm == 'circular':
             # Radius based on number of cycle nodes
             cycle_nodes = metrics.get('longest_cycle', n)
@@ -18,6 +18,7 @@ import math
 import numpy as np
 from .transition_behavior import TransitionBehavior
 from .function_catalog import FUNCTION_CATALOG
+from .expression_compiler import compile_expression
 
 
 class ContinuousBehavior(TransitionBehavior):
@@ -125,6 +126,12 @@ class ContinuousBehavior(TransitionBehavior):
         except ValueError:
             pass
         
+        # Compile once; a syntax error is reported on evaluation (below)
+        try:
+            code = compile_expression(expr)
+        except SyntaxError:
+            code = expr
+        
         # Parse expression with place references (simple parser)
         # Format: "a * P1 + b * P2" or "min(c, P1)" or "sigmoid(time, 10, 0.5)" etc.
         def evaluate_rate(places: Dict[int, Any], time: float) -> float:
@@ -177,7 +184,7 @@ class ContinuousBehavior(TransitionBehavior):
                         context[place.name] = place.tokens
                 
                 # Evaluate expression safely
-                result = eval(expr, {"__builtins__": {}}, context)
+                result = eval(code, {"__builtins__": {}}, context)
                 return float(result)
             except Exception as e:
                 # FAIL LOUDLY - do not use silent fallbacks in development
@@ -5,5 +5,10 @@ Contains the simulation controller and related utilities.
 """
 
 from shypn.engine.simulation.controller import SimulationController
+from shypn.engine.simulation.events import FiringBatch, SimulationEvent
+from shypn.engine.simulation.steady_state import SteadyStateAction, SteadyStateDetector
+from shypn.engine.simulation.trajectory_store import TrajectoryStore, TrajectoryWriter
 
-__all__ = ['SimulationController']
+__all__ = ['SimulationController', 'SimulationEvent', 'FiringBatch',
+           'SteadyStateAction', 'SteadyStateDetector',
+           'TrajectoryStore', 'TrajectoryWriter']
@@ -33,15 +33,24 @@ class ReactionMetrics:
 class ReactionAnalyzer:
     """Analyze transition (reaction) data from simulation."""
     
-    def __init__(self, data_collector):
+    def __init__(self, data_collector, firing_log=None):
         """Initialize analyzer.
         
         Args:
             data_collector: DataCollector instance with recorded data
+            firing_log: Optional FiringLog (shypn.analyses.firing_log); when it
+                holds events, firing counts and flux are read from it
         """
         self.data_collector = data_collector
         # Store model reference for accessing arcs
         self.model = data_collector.model if hasattr(data_collector, 'model') else None
+        if firing_log is None:
+            firing_log = getattr(data_collector, 'firing_log', None)
+        self.firing_log = firing_log
+        self._log_counts = None
+        self._log_flows = None
+        self._log_index = {}
+        self._tokens_per_firing = None
         
     def analyze_all_reactions(self, duration: float) -> List[ReactionMetrics]:
         """Analyze all transitions and return metrics.
@@ -54,6 +63,7 @@ class ReactionAnalyzer:
         """
         results = []
         total_flux = 0
+        self._load_firing_log()
         
         # First pass: calculate individual metrics and total flux
         for transition in self.data_collector.model.transitions:
@@ -84,31 +94,56 @@ class ReactionAnalyzer:
             transition_type=self._get_transition_type(transition)
         )
         
-        time_points, firing_series = self.data_collector.get_transition_series(transition.id)
-        
-        if not firing_series:
-            # No data collected - use current firing_count if available
-            metrics.firing_count = getattr(transition, 'firing_count', 0)
+        index = self._log_index.get(transition.id)
+        if index is not None:
+            # Firing log: event count and the tokens actually produced
+            metrics.firing_count = int(self._log_counts[index])
+            metrics.total_flux = int(round(self._log_flows[index]))
         else:
-            metrics.firing_count = firing_series[-1]  # Final cumulative count
+            firing_series = []
+            if hasattr(self.data_collector, 'get_transition_series'):
+                time_points, firing_series = self.data_collector.get_transition_series(transition.id)
+            
+            if len(firing_series) == 0:
+                # No data collected - use current firing_count if available
+                metrics.firing_count = getattr(transition, 'firing_count', 0)
+            else:
+                metrics.firing_count = firing_series[-1]  # Final cumulative count
+            
+            # Calculate total flux (tokens processed)
+            # For simplicity: flux = firing_count * output_tokens_per_firing
+            metrics.total_flux = metrics.firing_count * self._get_tokens_per_firing(transition)
             
         # Calculate average rate
         if duration > 0:
             metrics.average_rate = metrics.firing_count / duration
-            
-        # Calculate total flux (tokens processed)
-        # For simplicity: flux = firing_count * output_tokens_per_firing
-        # Get output arcs from model (transition → place)
-        output_arcs = [arc for arc in self.model.arcs 
-                      if hasattr(arc, 'source') and arc.source == transition]
-        tokens_per_firing = sum(arc.weight for arc in output_arcs) if output_arcs else 1
-        metrics.total_flux = metrics.firing_count * tokens_per_firing
         
         # Classify activity status
         metrics.status = self._classify_activity(metrics.firing_count)
             
         return metrics
         
+    def _load_firing_log(self):
+        """Aggregate per-transition counts and flux from the firing log."""
+        self._log_index = {}
+        if self.firing_log is None or len(self.firing_log) == 0:
+            return
+        self._log_counts = self.firing_log.counts()
+        self._log_flows = self.firing_log.total_flows()
+        self._log_index = {tid: i for i, tid in enumerate(self.firing_log.transition_ids)}
+        
+    def _get_tokens_per_firing(self, transition) -> float:
+        """Sum of output arc weights of a transition (1 if it has none)."""
+        if self._tokens_per_firing is None:
+            # One pass over the arcs instead of one per transition
+            self._tokens_per_firing = {}
+            for arc in self.model.arcs:
+                source = getattr(arc, 'source', None)
+                if source is not None:
+                    key = id(source)
+                    self._tokens_per_firing[key] = self._tokens_per_firing.get(key, 0) + arc.weight
+        return self._tokens_per_firing.get(id(transition), 1)
+        
     def _get_transition_type(self, transition) -> str:
         """Get transition type.
         
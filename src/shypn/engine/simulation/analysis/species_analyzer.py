@@ -4,9 +4,10 @@
 Calculates metrics for each place based on collected time-series data.
 """
 from typing import List, Optional
-import statistics
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class SpeciesMetrics:
@@ -70,7 +71,7 @@ class SpeciesAnalyzer:
         
         time_points, token_series = self.data_collector.get_place_series(place.id)
         
-        if not token_series:
+        if len(token_series) == 0:
             # No data collected - use current state
             metrics.initial_tokens = place.tokens
             metrics.final_tokens = place.tokens
@@ -82,9 +83,18 @@ class SpeciesAnalyzer:
         # Calculate metrics from time-series
         metrics.initial_tokens = token_series[0]
         metrics.final_tokens = token_series[-1]
-        metrics.min_tokens = min(token_series)
-        metrics.max_tokens = max(token_series)
-        metrics.avg_tokens = statistics.mean(token_series)
+        stats = self._get_running_stats(place.id, len(token_series))
+        if stats is not None:
+            # Collector keeps running statistics: O(1)
+            metrics.min_tokens = stats.min
+            metrics.max_tokens = stats.max
+            metrics.avg_tokens = stats.mean
+        else:
+            # One vectorized pass over the series
+            tokens = np.asarray(token_series)
+            metrics.min_tokens = tokens.min().item()
+            metrics.max_tokens = tokens.max().item()
+            metrics.avg_tokens = float(tokens.mean())
         metrics.total_change = metrics.final_tokens - metrics.initial_tokens
         
         if duration > 0:
@@ -92,6 +102,16 @@ class SpeciesAnalyzer:
             
         return metrics
         
+    def _get_running_stats(self, place_id, series_length: int):
+        """Running statistics of a place if the collector keeps them for the whole series."""
+        get_place_stats = getattr(self.data_collector, 'get_place_stats', None)
+        if get_place_stats is None:
+            return None
+        stats = get_place_stats(place_id)
+        if stats is None or stats.count != series_length:
+            return None
+        return stats
+        
     def _get_place_color(self, place) -> str:
         """Get place color for display.
         
@@ -21,6 +21,9 @@ except ImportError:
     GLib = None
 from shypn.engine import behavior_factory
 from shypn.engine.simulation.conflict_policy import ConflictResolutionPolicy, DEFAULT_POLICY, TYPE_PRIORITIES
+from shypn.engine.simulation.events import EventDispatcher, FiringBatch, SimulationEvent
+from shypn.engine.simulation.profiling import StepProfiler
+from shypn.engine.simulation.steady_state import SteadyStateAction, SteadyStateDetector
 
 class TransitionState:
     """Per-transition state tracking for time-aware behaviors.
@@ -119,7 +122,10 @@ class SimulationController:
         model: ModelCanvasManager instance (has places, transitions, arcs lists)
         time: Current simulation time
         settings: SimulationSettings instance for timing configuration
-        step_listeners: List of callbacks to notify on each step
+        events: EventDispatcher with the STEP, FIRING and COMPLETION subscribers
+        step_listeners: STEP subscribers (live list of events)
+        profiler: StepProfiler with per-phase step timings and counters
+        steady_state: SteadyStateDetector that can end runs at steady state
         state_detector: SimulationStateDetector for context-aware state queries
         buffered_settings: BufferedSimulationSettings for atomic parameter updates
         interaction_guard: InteractionGuard for permission-based UI control
@@ -134,7 +140,9 @@ class SimulationController:
         self.model = model
         self.time = 0.0
         self.model_adapter = ModelAdapter(model, controller=self)
-        self.step_listeners = []
+        self.events = EventDispatcher()
+        self.step_listeners = self.events.subscribers(SimulationEvent.STEP)
+        self._firing_batch = None  # FiringBatch of the step being executed
         self._running = False
         self._stop_requested = False
         self._timeout_id = None
@@ -147,6 +155,12 @@ class SimulationController:
         from shypn.engine.simulation.data_collector import DataCollector
         self.data_collector = DataCollector(model)
         
+        # Per-phase step timers and counters (collected once enabled)
+        self.profiler = StepProfiler()
+        
+        # Online steady-state detection (fed once enabled)
+        self.steady_state = SteadyStateDetector()
+        
         # Callback for simulation complete event
         # Use private attribute with property to trace all assignments
         self._on_simulation_complete = None
@@ -217,7 +231,7 @@ class SimulationController:
         
         # Reinitialize data collector with current model
         from shypn.engine.simulation.data_collector import DataCollector
-        self.data_collector = DataCollector(self.model)
+        self.data_collector = DataCollector(self.model, **self.data_collector.streaming_options())
         
         # Reset buffered settings (discard any uncommitted changes from previous model)
         if hasattr(self, 'buffered_settings'):
@@ -457,6 +471,7 @@ class SimulationController:
             for t in source_transitions:
                 logger.info(f"  - {t.id}: type={t.transition_type}, is_source={getattr(t, 'is_source', False)}")
         
+        self.profiler.count('enablement_checks', len(self.model.transitions))
         for transition in self.model.transitions:
             behavior = self._get_behavior(transition)
             
@@ -558,42 +573,121 @@ class SimulationController:
             if transition_id in self.transition_states:
                 del self.transition_states[transition_id]
 
+    def subscribe(self, kind, callback: Callable) -> Callable:
+        """Subscribe to one kind of simulation event.
+        
+        Args:
+            kind: SimulationEvent (or its value: 'step', 'firing', 'completion')
+            callback: STEP: callback(controller, time); FIRING:
+                callback(controller, batch) with a FiringBatch of the step's
+                firings; COMPLETION: callback(controller)
+        
+        Returns:
+            The callback
+        """
+        return self.events.subscribe(kind, callback)
+
+    def unsubscribe(self, kind, callback: Callable) -> bool:
+        """Remove a subscription made with subscribe()."""
+        return self.events.unsubscribe(kind, callback)
+
+    def clear_listeners(self):
+        """Remove all subscribers of all event kinds."""
+        self.events.clear()
+
     def add_step_listener(self, callback: Callable):
         """Register a callback to be notified on each simulation step.
         
+        If the callback is a bound method of an object with an
+        ``on_firings(controller, batch)`` method (SimulationDataCollector),
+        that object is also subscribed to FIRING events. This is resolved
+        here, once, not on every firing.
+        
         Args:
             callback: Function to call after each step. Should accept
                      (controller, time) as arguments.
         """
-        if callback not in self.step_listeners:
-            self.step_listeners.append(callback)
+        self.events.subscribe(SimulationEvent.STEP, callback)
+        on_firings = getattr(getattr(callback, '__self__', None), 'on_firings', None)
+        if on_firings is not None:
+            self.events.subscribe(SimulationEvent.FIRING, on_firings)
 
     def remove_step_listener(self, callback: Callable):
-        """Unregister a step listener callback.
+        """Unregister a step listener callback (and its FIRING subscription).
         
         Args:
             callback: The callback function to remove
         """
-        if callback in self.step_listeners:
-            self.step_listeners.remove(callback)
+        self.events.unsubscribe(SimulationEvent.STEP, callback)
+        on_firings = getattr(getattr(callback, '__self__', None), 'on_firings', None)
+        if on_firings is not None:
+            self.events.unsubscribe(SimulationEvent.FIRING, on_firings)
 
     def _notify_step_listeners(self):
-        """Notify all registered step listeners."""
-        # Debug: Log listener count once
-        if not hasattr(self, '_logged_listeners'):
-            self._logged_listeners = True
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"[STEP_LISTENERS] Controller has {len(self.step_listeners)} step listeners registered")
-            for i, callback in enumerate(self.step_listeners):
-                logger.info(f"  [{i}] {callback}")
-        
-        for callback in self.step_listeners:
-            try:
-                callback(self, self.time)
-            except Exception as e:
+        """Notify all STEP subscribers."""
+        calls = self.events.dispatch(SimulationEvent.STEP, self, self.time)
+        self.profiler.count('listener_calls', calls)
 
-                pass
+    def _notify_firing(self, transition, details):
+        """Pass a firing to the data collector and queue it for FIRING subscribers.
+        
+        During step() firings are collected into one FiringBatch, dispatched
+        before the STEP notification; firings outside step() are dispatched
+        at once.
+        """
+        on_transition_fired = getattr(self.data_collector, 'on_transition_fired', None)
+        if on_transition_fired is not None:
+            on_transition_fired(transition, self.time, details)
+        batch = self._firing_batch
+        if batch is not None:
+            batch.append(transition, self.time, details)
+        elif self.events.has_subscribers(SimulationEvent.FIRING):
+            batch = FiringBatch()
+            batch.append(transition, self.time, details)
+            self.events.dispatch(SimulationEvent.FIRING, self, batch)
+
+    def _check_steady_state(self, batch, time_step) -> bool:
+        """Feed the steady-state detector; fast-forward if configured.
+        
+        Returns:
+            True if steady state was reached in this step
+        """
+        detector = self.steady_state
+        if not detector.update(self.time, self.model.places, self.model.transitions, batch, time_step):
+            return False
+        import logging
+        logging.getLogger(__name__).info(f"[SIMULATION] Steady state reached: time={self.time}")
+        duration = self.settings.get_duration_seconds()
+        if detector.action is SteadyStateAction.FAST_FORWARD and duration is not None and self.time < duration:
+            self.time = duration
+            if self.data_collector:
+                self.data_collector.record_state(self.time)
+        return True
+
+    def _notify_completion(self):
+        """Call on_simulation_complete and the COMPLETION subscribers.
+        
+        Deferred to the GLib main loop when available, to avoid blocking the
+        step that ended the run.
+        """
+        callback = self.on_simulation_complete
+        if not callback and not self.events.has_subscribers(SimulationEvent.COMPLETION):
+            return
+        
+        def deferred_callback():
+            if callback:
+                try:
+                    callback()
+                except Exception as e:
+                    import logging
+                    logging.getLogger(__name__).exception(f"[ERROR] Exception in on_simulation_complete callback: {e}")
+            self.events.dispatch(SimulationEvent.COMPLETION, self)
+            return False  # Don't repeat
+        
+        if GLIB_AVAILABLE:
+            GLib.idle_add(deferred_callback)
+        else:
+            deferred_callback()
 
     def step(self, time_step: float = None) -> bool:
         """Execute a single simulation step with hybrid (discrete + continuous) execution.
@@ -619,6 +713,18 @@ class SimulationController:
         Returns:
             bool: True if any transition fired/integrated, False if deadlocked/complete
         """
+        profiler = self.profiler
+        started = profiler.start_step()
+        if self.steady_state.enabled or self.events.has_subscribers(SimulationEvent.FIRING):
+            self._firing_batch = FiringBatch()
+        try:
+            return self._step(time_step, profiler, started)
+        finally:
+            self._firing_batch = None
+            profiler.end_step(started)
+
+    def _step(self, time_step, profiler, mark) -> bool:
+        """Body of step(); phase timings are charged to profiler from mark."""
         # Use effective dt if not specified
         if time_step is None:
             time_step = self.get_effective_dt()
@@ -650,6 +756,7 @@ class SimulationController:
                 logger.info(f"  - {source_count} source transition(s)")
         
         self._update_enablement_states()
+        mark = profiler.lap('enablement', mark)
         
         immediate_fired_total = 0
         max_immediate_iterations = 100  # Reduced from 1000 to prevent UI freeze
@@ -691,6 +798,7 @@ class SimulationController:
                 f"Fired sequence: {' → '.join(fired_sequence[-20:])}... "
                 f"This may indicate a livelock. Consider using continuous transitions instead."
             )
+        mark = profiler.lap('immediate', mark)
         
         # === PHASE: Handle Timed Window Crossings ===
         # Check for timed transitions whose firing windows will be crossed during this step
@@ -762,34 +870,16 @@ class SimulationController:
                         state.enablement_time = None
                         state.scheduled_time = None
                         
-                        # Notify data collector (if it has this method - old SimulationDataCollector)
-                        if self.data_collector is not None and hasattr(self.data_collector, 'on_transition_fired'):
-                            details = {
-                                'consumed': consumed_map,
-                                'produced': produced_map,
-                                'window_crossing': True,
-                                'timing_window': [behavior.earliest, behavior.latest]
-                            }
-                            self.data_collector.on_transition_fired(transition, self.time, details)
-                        
-                        # PHASE 1-2 FIX: Also notify step listeners if they have on_transition_fired
-                        # print(f"[FIRE_NOTIFY] Window crossing: {transition.id}, notifying {len(self.step_listeners)} listeners")
-                        for listener in self.step_listeners:
-                            pass
-                            # Check if listener is a bound method with __self__
-                            listener_obj = listener.__self__ if hasattr(listener, '__self__') else listener
-                            if hasattr(listener_obj, 'on_transition_fired'):
-                                pass
-                                # print(f"[FIRE_NOTIFY]   Notifying {type(listener_obj).__name__}")
-                                details = {
-                                    'consumed': consumed_map,
-                                    'produced': produced_map,
-                                    'window_crossing': True,
-                                    'timing_window': [behavior.earliest, behavior.latest]
-                                }
-                                listener_obj.on_transition_fired(transition, self.time, details)
+                        self._notify_firing(transition, {
+                            'consumed': consumed_map,
+                            'produced': produced_map,
+                            'window_crossing': True,
+                            'timing_window': [behavior.earliest, behavior.latest]
+                        })
                         
                         window_crossing_fired += 1
+                        profiler.count('firings')
+        mark = profiler.lap('window_crossing', mark)
         
         continuous_transitions = [t for t in self.model.transitions if t.transition_type == 'continuous']
         continuous_to_integrate = []
@@ -802,6 +892,7 @@ class SimulationController:
                 continuous_to_integrate.append((transition, behavior, input_arcs, output_arcs))
         
         continuous_active = 0
+        profiler.count('rate_evaluations', len(continuous_to_integrate))
         for transition, behavior, input_arcs, output_arcs in continuous_to_integrate:
             success, details = behavior.integrate_step(dt=time_step, input_arcs=input_arcs, output_arcs=output_arcs)
             if success:
@@ -810,23 +901,9 @@ class SimulationController:
                 # Increment firing count for continuous transitions (for statistics/tables)
                 transition.firing_count += 1
                 
-                if self.data_collector is not None and hasattr(self.data_collector, 'on_transition_fired'):
-                    self.data_collector.on_transition_fired(transition, self.time, details)
-                
-                # PHASE 1-2 FIX: Also notify step listeners if they have on_transition_fired
-                if not hasattr(self, '_debug_continuous_printed'):
-                    self._debug_continuous_printed = True
-                    # print(f"[FIRE_NOTIFY] Continuous: {transition.id}, notifying {len(self.step_listeners)} listeners")
-                    for i, listener in enumerate(self.step_listeners):
-                        # Check if listener is a bound method with __self__
-                        listener_obj = listener.__self__ if hasattr(listener, '__self__') else listener
-                        if hasattr(listener_obj, 'on_transition_fired'):
-                            listener_obj.on_transition_fired(transition, self.time, details)
-                else:
-                    for listener in self.step_listeners:
-                        listener_obj = listener.__self__ if hasattr(listener, '__self__') else listener
-                        if hasattr(listener_obj, 'on_transition_fired'):
-                            listener_obj.on_transition_fired(transition, self.time, details)
+                self._notify_firing(transition, details)
+        
+        mark = profiler.lap('continuous', mark)
         
         # Advance time BEFORE checking discrete transitions
         # This ensures timed transitions are evaluated at the correct time
@@ -835,6 +912,7 @@ class SimulationController:
         # Record state after time advancement
         if self.data_collector:
             self.data_collector.record_state(self.time)
+        mark = profiler.lap('recording', mark)
         
         # Now check discrete transitions at the NEW time
         # This allows timed transitions to fire when entering their window mid-step
@@ -868,8 +946,14 @@ class SimulationController:
                 transition = self._select_transition(enabled_stochastic)
                 self._fire_transition(transition)
                 discrete_fired = True
+        mark = profiler.lap('discrete', mark)
         
+        batch = self._firing_batch
+        steady = self.steady_state.enabled and self._check_steady_state(batch, time_step)
+        if batch and self.events.has_subscribers(SimulationEvent.FIRING):
+            self.profiler.count('listener_calls', self.events.dispatch(SimulationEvent.FIRING, self, batch))
         self._notify_step_listeners()
+        profiler.lap('listeners', mark)
         
         # Check if simulation is complete (duration reached)
         if self.is_simulation_complete():
@@ -877,6 +961,9 @@ class SimulationController:
             logging.getLogger(__name__).info(f"[SIMULATION] Duration reached: time={self.time}, duration={self.settings.duration}")
             return False  # Simulation complete
         
+        if steady and self.steady_state.action is SteadyStateAction.STOP:
+            return False  # Steady state reached
+        
         if immediate_fired_total > 0 or window_crossing_fired > 0 or discrete_fired or continuous_active > 0:
             return True
         
@@ -926,6 +1013,7 @@ class SimulationController:
         Returns:
             bool: True if transition can fire, False otherwise
         """
+        self.profiler.count('enablement_checks')
         behavior = self._get_behavior(transition)
         can_fire, reason = behavior.can_fire()
         return can_fire
@@ -947,27 +1035,12 @@ class SimulationController:
             pass
             # Increment firing count for statistics
             transition.firing_count += 1
+            self.profiler.count('firings')
             
             state = self._get_or_create_state(transition)
             state.enablement_time = None
             state.scheduled_time = None
-        if self.data_collector is not None and hasattr(self.data_collector, 'on_transition_fired'):
-            self.data_collector.on_transition_fired(transition, self.time, details)
-        
-        # PHASE 1-2 FIX: Also notify step listeners if they have on_transition_fired
-        if not hasattr(self, '_debug_listeners_printed'):
-            self._debug_listeners_printed = True
-            # print(f"[FIRE_NOTIFY] Discrete: {transition.id}, notifying {len(self.step_listeners)} listeners")
-            for i, listener in enumerate(self.step_listeners):
-                # Check if listener is a bound method with __self__
-                listener_obj = listener.__self__ if hasattr(listener, '__self__') else listener
-                if hasattr(listener_obj, 'on_transition_fired'):
-                    listener_obj.on_transition_fired(transition, self.time, details)
-        else:
-            for listener in self.step_listeners:
-                listener_obj = listener.__self__ if hasattr(listener, '__self__') else listener
-                if hasattr(listener_obj, 'on_transition_fired'):
-                    listener_obj.on_transition_fired(transition, self.time, details)
+        self._notify_firing(transition, details)
 
     # ============================================================================
     # Phase 1: Locality Independence Detection (Place-Sharing Analysis)
@@ -1906,17 +1979,7 @@ class SimulationController:
                     self.data_collector.stop_collection()
                 
                 # Notify completion callback (deferred to avoid blocking UI)
-                if self.on_simulation_complete:
-                    def deferred_callback():
-                        try:
-                            self.on_simulation_complete()
-                        except Exception as e:
-                            import logging
-                            logging.getLogger(__name__).exception(f"[ERROR] Exception in on_simulation_complete callback: {e}")
-                            import traceback
-                            traceback.print_exc()
-                        return False  # Don't repeat
-                    GLib.idle_add(deferred_callback)
+                self._notify_completion()
                 
                 return False
             self._steps_executed += 1
@@ -1945,17 +2008,7 @@ class SimulationController:
             self.data_collector.stop_collection()
         
         # Notify completion callback (deferred to avoid blocking)
-        if self.on_simulation_complete and GLIB_AVAILABLE:
-            def deferred_callback():
-                try:
-                    self.on_simulation_complete()
-                except Exception as e:
-                    import logging
-                    logging.getLogger(__name__).exception(f"[ERROR] Exception in on_simulation_complete callback: {e}")
-                    import traceback
-                    traceback.print_exc()
-                return False  # Don't repeat
-            GLib.idle_add(deferred_callback)
+        self._notify_completion()
         
         for state in self.transition_states.values():
             state.enablement_time = None
@@ -1980,6 +2033,8 @@ class SimulationController:
         self.time = 0.0
         if self.data_collector is not None:
             self.data_collector.clear()
+        self.profiler.reset()
+        self.steady_state.reset()
         self.transition_states.clear()
         
         # Reset firing counts for all transitions
@@ -2044,6 +2099,7 @@ class SimulationController:
         self.behavior_cache.clear()
         self.transition_states.clear()
         self._round_robin_index = 0
+        self.steady_state.reset()
         
         # PHASE 1-2 FIX: Preserve callback before recreating data collector
         # The Report Panel's on_simulation_complete callback must survive controller reset
@@ -2051,7 +2107,7 @@ class SimulationController:
         
         # Recreate data collector with new model
         from shypn.engine.simulation.data_collector import DataCollector
-        self.data_collector = DataCollector(new_model)
+        self.data_collector = DataCollector(new_model, **self.data_collector.streaming_options())
         
         # PHASE 1-2 FIX: Restore callback after recreating data collector
         self.on_simulation_complete = saved_callback
@@ -2,8 +2,15 @@
 """Data Collector for simulation time-series recording.
 
 Collects place tokens and transition firing counts at each simulation step.
+Optionally streams every step to an on-disk trajectory (see
+trajectory_store.py) and keeps only the most recent steps in memory.
 """
-from typing import Dict, List, Tuple, Optional
+import os
+from typing import Any, Dict, List, Tuple, Optional
+
+from shypn.engine.simulation.trajectory_store import (
+    TrajectoryWriter, new_trajectory_path, prune_trajectories
+)
 
 
 class DataCollector:
@@ -14,23 +21,78 @@ class DataCollector:
     - Place tokens at each time point (dict: place_id -> list of token counts)
     - Transition firings at each time point (dict: transition_id -> cumulative count)
     
+    When streaming (stream_to), each run is written to its own trajectory
+    directory; with memory_rows set, the lists above keep only the last
+    memory_rows steps and the series getters read the full run from disk.
+    Runs are kept until deleted; with max_trajectories set, only the
+    newest ones (and those a report still refers to) are kept.
+    
     Thread-safe for single-threaded GTK event loop.
     """
     
-    def __init__(self, model):
+    # Steps kept in memory when the application streams runs to a project
+    DEFAULT_MEMORY_ROWS = 100_000
+    
+    def __init__(self, model, trajectory_dir: Optional[str] = None,
+                 chunk_rows: Optional[int] = None, memory_rows: Optional[int] = None,
+                 max_trajectories: Optional[int] = None):
         """Initialize data collector.
         
         Args:
             model: DocumentModel instance with places and transitions
+            trajectory_dir: Directory to stream runs to (e.g.
+                Project.get_simulations_dir()), or None to keep runs in memory
+            chunk_rows: Rows per trajectory chunk (default: store default)
+            memory_rows: Steps kept in memory while streaming (None: all)
+            max_trajectories: Runs kept in trajectory_dir, including the
+                current one; older unpinned runs are deleted when a run
+                starts (None: keep all)
         """
         self.model = model
         self.time_points: List[float] = []
         self.place_data: Dict[str, List[int]] = {}
         self.transition_data: Dict[str, List[int]] = {}
         self.is_collecting: bool = False
+        self.trajectory: Optional[TrajectoryWriter] = None
+        self._trimmed = False
+        self.stream_to(trajectory_dir, chunk_rows, memory_rows, max_trajectories)
+    
+    def stream_to(self, trajectory_dir: Optional[str], chunk_rows: Optional[int] = None,
+                  memory_rows: Optional[int] = None,
+                  max_trajectories: Optional[int] = None):
+        """Stream the next runs to trajectory_dir (None: stop streaming).
+        
+        Raises:
+            ValueError: If memory_rows or max_trajectories is not positive
+        """
+        if memory_rows is not None and memory_rows < 1:
+            raise ValueError(f"memory_rows must be positive, got {memory_rows}")
+        if max_trajectories is not None and max_trajectories < 1:
+            raise ValueError(f"max_trajectories must be positive, got {max_trajectories}")
+        self.trajectory_dir = trajectory_dir
+        self.chunk_rows = chunk_rows
+        self.memory_rows = memory_rows
+        self.max_trajectories = max_trajectories
+    
+    def streaming_options(self) -> Dict[str, Any]:
+        """Streaming settings, as keyword arguments for a new collector."""
+        return {'trajectory_dir': self.trajectory_dir, 'chunk_rows': self.chunk_rows,
+                'memory_rows': self.memory_rows, 'max_trajectories': self.max_trajectories}
         
     def start_collection(self):
         """Initialize data structures and start collecting."""
+        self._close_trajectory()
+        self.trajectory = None
+        self._trimmed = False
+        if self.trajectory_dir:
+            os.makedirs(self.trajectory_dir, exist_ok=True)
+            if self.max_trajectories is not None:
+                prune_trajectories(self.trajectory_dir, self.max_trajectories - 1)
+            self.trajectory = TrajectoryWriter(
+                new_trajectory_path(self.trajectory_dir),
+                [p.id for p in self.model.places],
+                [t.id for t in self.model.transitions],
+                chunk_rows=self.chunk_rows)
         self.time_points = []
         
         # Initialize place data with empty lists
@@ -61,13 +123,41 @@ class DataCollector:
         for transition in self.model.transitions:
             count = getattr(transition, 'firing_count', 0)
             self.transition_data[transition.id].append(count)
+        
+        if self.trajectory is not None:
+            self.trajectory.append_state(current_time, self.model.places, self.model.transitions)
+            if self.memory_rows and len(self.time_points) >= 2 * self.memory_rows:
+                self._trim()
+    
+    def _trim(self):
+        """Drop all but the last memory_rows steps (amortized over memory_rows steps)."""
+        cut = len(self.time_points) - self.memory_rows
+        del self.time_points[:cut]
+        for series in self.place_data.values():
+            del series[:cut]
+        for series in self.transition_data.values():
+            del series[:cut]
+        self._trimmed = True
+    
+    def _close_trajectory(self):
+        if self.trajectory is not None:
+            self.trajectory.close()
+    
+    @property
+    def trajectory_path(self) -> Optional[str]:
+        """Directory of the current or last streamed run, or None."""
+        return self.trajectory.path if self.trajectory is not None else None
     
     def stop_collection(self):
-        """Stop collecting data."""
+        """Stop collecting data (completes the streamed trajectory)."""
         self.is_collecting = False
+        self._close_trajectory()
         
     def clear(self):
-        """Clear all collected data."""
+        """Clear all collected data (a streamed trajectory stays on disk)."""
+        self._close_trajectory()
+        self.trajectory = None
+        self._trimmed = False
         self.time_points.clear()
         self.place_data.clear()
         self.transition_data.clear()
@@ -92,8 +182,11 @@ class DataCollector:
             place_id: Place identifier
             
         Returns:
-            Tuple of (time_points, token_counts)
+            Tuple of (time_points, token_counts); NumPy arrays read from the
+            trajectory once older steps were dropped from memory
         """
+        if self._trimmed and place_id in self.place_data:
+            return self.trajectory.place_series(place_id)
         return self.time_points.copy(), self.place_data.get(place_id, []).copy()
         
     def get_transition_series(self, transition_id: str) -> Tuple[List[float], List[int]]:
@@ -103,10 +196,19 @@ class DataCollector:
             transition_id: Transition identifier
             
         Returns:
-            Tuple of (time_points, firing_counts)
+            Tuple of (time_points, firing_counts); NumPy arrays read from the
+            trajectory once older steps were dropped from memory
         """
+        if self._trimmed and transition_id in self.transition_data:
+            return self.trajectory.transition_series(transition_id)
         return self.time_points.copy(), self.transition_data.get(transition_id, []).copy()
         
+    def get_point_count(self) -> int:
+        """Number of recorded time points, including steps dropped from memory."""
+        if self._trimmed:
+            return len(self.trajectory)
+        return len(self.time_points)
+        
     def has_data(self) -> bool:
         """Check if any data has been collected.
         
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Typed event subscriptions for the simulation controller.
+
+Listeners subscribe once per event kind and are only called for the kinds
+they asked for:
+
+- STEP: ``callback(controller, time)`` after every step
+- FIRING: ``callback(controller, batch)`` once per step with a FiringBatch
+  holding every firing of that step (nothing is dispatched for steps
+  without firings)
+- COMPLETION: ``callback(controller)`` when a run ends or is stopped
+
+Example:
+    controller.subscribe(SimulationEvent.STEP, panel.on_step)
+    controller.subscribe('firing', lambda controller, batch: print(len(batch)))
+"""
+
+import logging
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+class SimulationEvent(Enum):
+    """Event kinds a listener can subscribe to."""
+
+    STEP = "step"
+    """After every step: callback(controller, time)."""
+
+    FIRING = "firing"
+    """Firings of a step, batched: callback(controller, batch)."""
+
+    COMPLETION = "completion"
+    """Run finished or stopped: callback(controller)."""
+
+
+class FiringBatch:
+    """All firings of one step, in firing order.
+
+    Times and rates are NumPy columns (rate is NaN for discrete firings, as
+    in FiringLog); transitions and the controller's ``details`` dicts are
+    kept in parallel lists. Iterating yields ``(transition, time, details)``.
+
+    Attributes:
+        transitions: Fired transition objects
+        details: Controller details dict per firing
+    """
+
+    __slots__ = ('transitions', 'details', '_times', '_rates', '_arrays')
+
+    def __init__(self):
+        self.transitions: List[Any] = []
+        self.details: List[Any] = []
+        self._times: List[float] = []
+        self._rates: List[float] = []
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def append(self, transition, time: float, details: Any = None):
+        """Add one firing."""
+        rate = details.get('rate') if isinstance(details, dict) else None
+        self.transitions.append(transition)
+        self.details.append(details)
+        self._times.append(time)
+        self._rates.append(float('nan') if rate is None else float(rate))
+        self._arrays = None
+
+    def _columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            self._arrays = (np.array(self._times, dtype=np.float64),
+                            np.array(self._rates, dtype=np.float64))
+        return self._arrays
+
+    @property
+    def times(self) -> np.ndarray:
+        """Firing times (float64)."""
+        return self._columns()[0]
+
+    @property
+    def rates(self) -> np.ndarray:
+        """Continuous flow rate per firing, NaN for discrete firings."""
+        return self._columns()[1]
+
+    @property
+    def continuous(self) -> np.ndarray:
+        """Boolean mask of continuous flow events."""
+        return ~np.isnan(self.rates)
+
+    def transition_ids(self) -> List[Any]:
+        """IDs of the fired transitions."""
+        return [transition.id for transition in self.transitions]
+
+    def __len__(self) -> int:
+        return len(self.transitions)
+
+    def __bool__(self) -> bool:
+        return bool(self.transitions)
+
+    def __iter__(self) -> Iterator[Tuple[Any, float, Any]]:
+        return zip(self.transitions, self._times, self.details)
+
+    def __repr__(self) -> str:
+        return f"FiringBatch({len(self)} firings)"
+
+
+class EventDispatcher:
+    """Subscriber lists per SimulationEvent.
+
+    Subscribing the same callback twice to one kind has no effect. A
+    callback that raises is logged (once) and the remaining subscribers
+    are still called.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[SimulationEvent, List[Callable]] = {kind: [] for kind in SimulationEvent}
+        self._reported_failures = set()
+
+    @staticmethod
+    def _kind(kind) -> SimulationEvent:
+        """Accept SimulationEvent members or their string values.
+
+        Raises:
+            ValueError: If kind is not a known event kind
+        """
+        return kind if isinstance(kind, SimulationEvent) else SimulationEvent(kind)
+
+    def subscribe(self, kind, callback: Callable) -> Callable:
+        """Add a subscriber; returns the callback (usable as a decorator)."""
+        subscribers = self._subscribers[self._kind(kind)]
+        if callback not in subscribers:
+            subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, kind, callback: Callable) -> bool:
+        """Remove a subscriber; returns False if it was not subscribed."""
+        subscribers = self._subscribers[self._kind(kind)]
+        if callback in subscribers:
+            subscribers.remove(callback)
+            return True
+        return False
+
+    def subscribers(self, kind) -> List[Callable]:
+        """The live subscriber list of an event kind."""
+        return self._subscribers[self._kind(kind)]
+
+    def has_subscribers(self, kind) -> bool:
+        return bool(self._subscribers[self._kind(kind)])
+
+    def clear(self, kind=None):
+        """Remove the subscribers of one kind, or of all kinds."""
+        kinds = SimulationEvent if kind is None else (self._kind(kind),)
+        for each in kinds:
+            self._subscribers[each].clear()
+
+    def dispatch(self, kind: SimulationEvent, *args) -> int:
+        """Call every subscriber of ``kind`` with ``args``.
+
+        Returns:
+            Number of subscribers called
+        """
+        subscribers = self._subscribers[kind]
+        if not subscribers:
+            return 0
+        for callback in tuple(subscribers):  # Callbacks may unsubscribe
+            try:
+                callback(*args)
+            except Exception:
+                key = (kind, id(callback))
+                if key not in self._reported_failures:
+                    self._reported_failures.add(key)
+                    logger.exception(f"Simulation {kind.value} listener {callback!r} failed")
+        return len(subscribers)
@@ -0,0 +1,296 @@
+"""
+Step Profiler for Simulation Performance Diagnostics
+
+Per-phase timers and counters for SimulationController.step():
+
+- Phase timers: enablement, immediate exhaustion, window crossing,
+  continuous integration, data recording, discrete selection/firing and
+  step listener notification
+- Counters: rate evaluations, enablement checks, discrete firings,
+  listener calls and redraw requests
+- Throughput: steps per second of wall time and of time spent in step()
+- Capture: cProfile (or pyinstrument, if installed) over a bounded
+  range of steps
+
+Timers are off by default; while disabled each hook is a single attribute
+check. Enable them with ``controller.profiler.enabled = True``.
+
+Example:
+    profiler = controller.profiler
+    profiler.enabled = True
+    controller.run(max_steps=1000)
+    print(profiler.format_stats())
+
+    profiler.capture(steps=200, skip=50)   # profile steps 51-250
+    controller.run(max_steps=300)
+    print(profiler.capture_report())
+"""
+import cProfile
+import io
+import pstats
+import time
+from typing import Any, Dict, Optional
+
+try:
+    import pyinstrument
+    PYINSTRUMENT_AVAILABLE = True
+except ImportError:
+    pyinstrument = None
+    PYINSTRUMENT_AVAILABLE = False
+
+
+PHASES = (
+    'enablement',
+    'immediate',
+    'window_crossing',
+    'continuous',
+    'recording',
+    'discrete',
+    'listeners',
+)
+
+COUNTERS = (
+    'rate_evaluations',
+    'enablement_checks',
+    'firings',
+    'listener_calls',
+    'redraw_requests',
+)
+
+CAPTURE_ENGINES = ('cprofile', 'pyinstrument')
+
+
+class _Capture:
+    """A pending or running profiler capture over a range of steps."""
+
+    def __init__(self, steps: int, skip: int, engine: str, output: Optional[str]):
+        self.remaining = steps
+        self.skip = skip
+        self.engine = engine
+        self.output = output
+        self.profiler = None
+
+    @property
+    def running(self) -> bool:
+        return self.profiler is not None
+
+    def start(self):
+        if self.engine == 'pyinstrument':
+            self.profiler = pyinstrument.Profiler()
+            self.profiler.start()
+        else:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop(self):
+        if self.engine == 'pyinstrument':
+            self.profiler.stop()
+            if self.output:
+                with open(self.output, 'w') as f:
+                    f.write(self.profiler.output_html())
+        else:
+            self.profiler.disable()
+            if self.output:
+                self.profiler.dump_stats(self.output)
+
+
+class StepProfiler:
+    """Per-phase timers and counters for simulation steps.
+
+    The controller brackets each step with start_step()/end_step() and
+    calls lap() at every phase boundary; count() increments a counter.
+
+    Attributes:
+        enabled: Whether timers and counters are collected
+        steps: Steps timed since the last reset
+        step_time: Seconds spent inside step()
+        phase_times: Seconds per phase (see PHASES)
+        counters: Event counts (see COUNTERS)
+        last_capture: Result of the last finished capture (pstats.Stats or
+            pyinstrument.Profiler), None if none has finished
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._capture: Optional[_Capture] = None
+        self.last_capture = None
+        self.reset()
+
+    def reset(self):
+        """Clear timers and counters (a pending capture is kept)."""
+        self.steps = 0
+        self.step_time = 0.0
+        self.max_step_time = 0.0
+        self.phase_times: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self._first_step_start: Optional[float] = None
+        self._last_step_end: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Hooks called by the controller
+    # ------------------------------------------------------------------
+
+    def start_step(self) -> float:
+        """Mark the start of a step; returns the timestamp to pass to lap()."""
+        capture = self._capture
+        if capture is not None and not capture.running:
+            if capture.skip > 0:
+                capture.skip -= 1
+            else:
+                capture.start()
+        if not self.enabled:
+            return 0.0
+        now = time.perf_counter()
+        if self._first_step_start is None:
+            self._first_step_start = now
+        return now
+
+    def lap(self, phase: str, since: float) -> float:
+        """Charge the time since ``since`` to a phase; returns the new mark."""
+        if not self.enabled:
+            return 0.0
+        now = time.perf_counter()
+        if since:
+            self.phase_times[phase] += now - since
+        return now
+
+    def end_step(self, started: float):
+        """Mark the end of a step started at ``started``."""
+        if self.enabled and started:
+            now = time.perf_counter()
+            elapsed = now - started
+            self.steps += 1
+            self.step_time += elapsed
+            if elapsed > self.max_step_time:
+                self.max_step_time = elapsed
+            self._last_step_end = now
+
+        capture = self._capture
+        if capture is not None and capture.running:
+            capture.remaining -= 1
+            if capture.remaining <= 0:
+                self._finish_capture()
+
+    def count(self, counter: str, n: int = 1):
+        """Increment a counter by n."""
+        if self.enabled:
+            self.counters[counter] += n
+
+    # ------------------------------------------------------------------
+    # Capture
+    # ------------------------------------------------------------------
+
+    def capture(self, steps: int, skip: int = 0, engine: str = 'cprofile',
+                output: Optional[str] = None):
+        """Profile the next ``steps`` steps after skipping ``skip`` steps.
+
+        Args:
+            steps: Number of steps to profile
+            skip: Steps to let pass before profiling starts
+            engine: 'cprofile' or 'pyinstrument' (optional dependency)
+            output: Optional path for the result (.prof stats for cProfile,
+                HTML for pyinstrument)
+
+        Raises:
+            ValueError: If steps < 1 or the engine is unknown
+            ImportError: If engine is 'pyinstrument' and it is not installed
+        """
+        if steps < 1:
+            raise ValueError(f"steps must be at least 1, got {steps}")
+        if engine not in CAPTURE_ENGINES:
+            raise ValueError(f"Unknown capture engine {engine!r} (expected one of {CAPTURE_ENGINES})")
+        if engine == 'pyinstrument' and not PYINSTRUMENT_AVAILABLE:
+            raise ImportError("pyinstrument is not installed (pip install pyinstrument)")
+        self.cancel_capture()
+        self._capture = _Capture(steps, max(0, skip), engine, output)
+
+    def cancel_capture(self):
+        """Abandon a pending or running capture."""
+        capture = self._capture
+        if capture is not None and capture.running:
+            capture.stop()
+        self._capture = None
+
+    @property
+    def capture_pending(self) -> bool:
+        """True while a capture is waiting to start or running."""
+        return self._capture is not None
+
+    def _finish_capture(self):
+        capture = self._capture
+        self._capture = None
+        capture.stop()
+        if capture.engine == 'pyinstrument':
+            self.last_capture = capture.profiler
+        else:
+            self.last_capture = pstats.Stats(capture.profiler, stream=io.StringIO())
+
+    def capture_report(self, limit: int = 25, sort: str = 'cumulative') -> str:
+        """Text report of the last finished capture ('' if there is none)."""
+        result = self.last_capture
+        if result is None:
+            return ''
+        if isinstance(result, pstats.Stats):
+            stream = io.StringIO()
+            result.stream = stream
+            result.sort_stats(sort).print_stats(limit)
+            return stream.getvalue()
+        return result.output_text()
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of throughput, per-phase timings and counters.
+
+        Returns:
+            dict with 'steps', 'step_time', 'wall_time', 'steps_per_second'
+            (wall clock, including time between steps), 'step_rate' (steps
+            per second spent inside step()), 'mean_step_time',
+            'max_step_time', 'phases' ({phase: {'total', 'mean', 'share'}})
+            and 'counters'
+        """
+        steps = self.steps
+        wall_time = 0.0
+        if self._first_step_start is not None and self._last_step_end is not None:
+            wall_time = self._last_step_end - self._first_step_start
+        phases = {}
+        for phase, total in self.phase_times.items():
+            phases[phase] = {
+                'total': total,
+                'mean': total / steps if steps else 0.0,
+                'share': total / self.step_time if self.step_time else 0.0,
+            }
+        return {
+            'steps': steps,
+            'step_time': self.step_time,
+            'wall_time': wall_time,
+            'steps_per_second': steps / wall_time if wall_time > 0 else 0.0,
+            'step_rate': steps / self.step_time if self.step_time > 0 else 0.0,
+            'mean_step_time': self.step_time / steps if steps else 0.0,
+            'max_step_time': self.max_step_time,
+            'phases': phases,
+            'counters': dict(self.counters),
+        }
+
+    def format_stats(self) -> str:
+        """Multi-line text summary of get_stats() for display."""
+        stats = self.get_stats()
+        steps = stats['steps']
+        lines = [
+            f"Steps: {steps}  ({stats['steps_per_second']:.1f}/s wall, "
+            f"{stats['step_rate']:.1f}/s in step)",
+            f"Step time: mean {stats['mean_step_time'] * 1000:.3f} ms, "
+            f"max {stats['max_step_time'] * 1000:.3f} ms",
+            '',
+            f"{'Phase':<16}{'ms/step':>10}{'share':>8}",
+        ]
+        for phase, timing in stats['phases'].items():
+            lines.append(f"{phase:<16}{timing['mean'] * 1000:>10.3f}{timing['share']:>8.1%}")
+        lines.append('')
+        lines.append(f"{'Counter':<18}{'total':>10}{'per step':>10}")
+        for counter, total in stats['counters'].items():
+            per_step = total / steps if steps else 0.0
+            lines.append(f"{counter:<18}{total:>10}{per_step:>10.2f}")
+        return '\n'.join(lines)
@@ -0,0 +1,191 @@
+"""
+Online Steady-State Detection
+
+Watches the marking vector and the transition flux of a running
+simulation over a sliding window of steps:
+
+- Marking change: largest distance between the current marking and any
+  marking in the window, relative to the current marking's norm
+- Flux change: distance between the mean flux of the older and the newer
+  half of the window, relative to the newer half's norm. Flux is the flow
+  rate of continuous transitions plus firings / dt of discrete ones
+
+The run is at steady state once both stay within their tolerances. The
+controller then reports, stops or fast-forwards the run (see
+SteadyStateAction). Detection is off by default; while disabled the
+controller skips it with one attribute check.
+
+Example:
+    detector = controller.steady_state
+    detector.configure(window=100, rtol=1e-4, action=SteadyStateAction.STOP)
+    detector.enabled = True
+    controller.run()
+    ...
+    print(detector.time_to_steady_state)
+"""
+from enum import Enum
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+
+class SteadyStateAction(Enum):
+    """What the controller does once the run reaches steady state."""
+
+    REPORT = "report"
+    """Record the time to steady state and keep running."""
+
+    STOP = "stop"
+    """End the run at the step that reached steady state."""
+
+    FAST_FORWARD = "fast_forward"
+    """Jump to the end of the configured duration with the steady marking.
+
+    The final state is recorded at the duration, so plots show the flat
+    line without simulating it. Firing counts are not extrapolated. Without
+    a duration this behaves like STOP.
+    """
+
+
+class SteadyStateDetector:
+    """Sliding-window steady-state detector fed by SimulationController.step().
+
+    Attributes:
+        enabled: Whether the controller feeds the detector
+        window: Number of steps compared (at least 4)
+        rtol: Tolerance of the relative marking change
+        flux_rtol: Tolerance of the relative flux change
+        atol: Norm floor, so empty markings and zero flux compare as equal
+        min_time: Earliest simulation time at which steady state is declared
+        action: SteadyStateAction taken when steady state is reached
+        reached: Whether the current run reached steady state
+        time_to_steady_state: Simulation time it was reached at, or None
+        marking_change: Last relative marking change (NaN until the window fills)
+        flux_change: Last relative flux change (NaN until the window fills)
+    """
+
+    DEFAULT_WINDOW = 50
+    DEFAULT_RTOL = 1e-4
+    DEFAULT_FLUX_RTOL = 1e-3
+    DEFAULT_ATOL = 1e-9
+
+    def __init__(self, window: int = DEFAULT_WINDOW, rtol: float = DEFAULT_RTOL,
+                 flux_rtol: float = DEFAULT_FLUX_RTOL, atol: float = DEFAULT_ATOL,
+                 min_time: float = 0.0, action: SteadyStateAction = SteadyStateAction.REPORT):
+        self.enabled = False
+        self.configure(window=window, rtol=rtol, flux_rtol=flux_rtol, atol=atol,
+                       min_time=min_time, action=action)
+
+    def configure(self, **options):
+        """Set detection options (window, rtol, flux_rtol, atol, min_time, action).
+
+        Raises:
+            ValueError: If an option is unknown or out of range
+        """
+        unknown = set(options) - {'window', 'rtol', 'flux_rtol', 'atol', 'min_time', 'action'}
+        if unknown:
+            raise ValueError(f"Unknown steady-state options: {sorted(unknown)}")
+        window = int(options.get('window', getattr(self, 'window', self.DEFAULT_WINDOW)))
+        if window < 4:
+            raise ValueError(f"Steady-state window must be at least 4 steps, got {window}")
+        for name in ('rtol', 'flux_rtol', 'atol', 'min_time'):
+            if name in options and options[name] < 0:
+                raise ValueError(f"Steady-state {name} must be non-negative, got {options[name]}")
+        self.window = window
+        self.rtol = float(options.get('rtol', getattr(self, 'rtol', self.DEFAULT_RTOL)))
+        self.flux_rtol = float(options.get('flux_rtol', getattr(self, 'flux_rtol', self.DEFAULT_FLUX_RTOL)))
+        self.atol = float(options.get('atol', getattr(self, 'atol', self.DEFAULT_ATOL)))
+        self.min_time = float(options.get('min_time', getattr(self, 'min_time', 0.0)))
+        self.action = SteadyStateAction(options.get('action', getattr(self, 'action', SteadyStateAction.REPORT)))
+        self.reset()
+
+    def reset(self):
+        """Forget the window and the result of the current run."""
+        self.reached = False
+        self.time_to_steady_state = None
+        self.marking_change = float('nan')
+        self.flux_change = float('nan')
+        self._count = 0
+        self._place_ids = None
+        self._transition_index: Dict[Any, int] = {}
+        self._markings = None
+        self._fluxes = None
+
+    def _allocate(self, places: Sequence, transitions: Sequence):
+        self._place_ids = [place.id for place in places]
+        self._transition_index = {transition.id: i for i, transition in enumerate(transitions)}
+        self._markings = np.zeros((self.window, len(places)))
+        self._fluxes = np.zeros((self.window, len(transitions)))
+        self._count = 0
+
+    def update(self, time: float, places: Sequence, transitions: Sequence,
+               batch=None, dt: float = 0.0) -> bool:
+        """Add the state after one step.
+
+        Args:
+            time: Simulation time after the step
+            places: Model places (marking read from place.tokens)
+            transitions: Model transitions (flux vector order)
+            batch: FiringBatch of the step's firings, or None
+            dt: Step size, used to turn discrete firings into rates
+
+        Returns:
+            True if steady state was reached at this step
+        """
+        if self.reached:
+            return False
+        if self._markings is None or len(places) != len(self._place_ids) \
+                or len(transitions) != len(self._transition_index):
+            self._allocate(places, transitions)  # First step, or the model changed
+
+        row = self._count % self.window
+        marking = self._markings[row]
+        for i, place in enumerate(places):
+            marking[i] = place.tokens
+        flux = self._fluxes[row]
+        flux.fill(0.0)
+        if batch:
+            discrete_rate = 1.0 / dt if dt > 0 else 0.0
+            index = self._transition_index
+            for (transition, _, _), rate in zip(batch, batch.rates):
+                i = index.get(transition.id)
+                if i is not None:
+                    flux[i] += discrete_rate if rate != rate else rate  # NaN: discrete firing
+        self._count += 1
+
+        if self._count < self.window:
+            return False
+        self.marking_change = float(np.linalg.norm(self._markings - marking, axis=1).max()
+                                    / max(np.linalg.norm(marking), self.atol))
+        order = (np.arange(self.window) + self._count) % self.window  # Oldest first
+        half = self.window // 2
+        older = self._fluxes[order[:half]].mean(axis=0)
+        newer = self._fluxes[order[half:]].mean(axis=0)
+        self.flux_change = float(np.linalg.norm(newer - older) / max(np.linalg.norm(newer), self.atol))
+
+        if time >= self.min_time and self.marking_change <= self.rtol and self.flux_change <= self.flux_rtol:
+            self.reached = True
+            self.time_to_steady_state = time
+            return True
+        return False
+
+    def window_flux(self) -> Optional[Dict[Any, float]]:
+        """Mean flux of every transition over the window, or None until it fills.
+
+        After steady state is reached this is the steady-state flux.
+        """
+        if self._fluxes is None or self._count < self.window:
+            return None
+        means = self._fluxes.mean(axis=0)
+        return {transition_id: float(means[i]) for transition_id, i in self._transition_index.items()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Detection state as a dict."""
+        return {
+            'enabled': self.enabled,
+            'action': self.action.value,
+            'reached': self.reached,
+            'time_to_steady_state': self.time_to_steady_state,
+            'marking_change': self.marking_change,
+            'flux_change': self.flux_change,
+        }
@@ -0,0 +1,359 @@
+"""
+Chunked On-Disk Trajectory Store
+
+Streams the recorded states of a simulation (time, marking of every place,
+cumulative firing count of every transition) to a directory of NumPy
+chunks, so long runs of large models are bounded by disk, not RAM:
+
+    <name>.traj/
+        manifest.json          place/transition ids, chunk row counts,
+                               metadata, complete flag
+        times_000000.npy       float64 (rows,)
+        markings_000000.npy    float64 (places, rows)   - place-major
+        firings_000000.npy     int64 (transitions, rows)
+        ...
+
+Rows are buffered in memory and written one chunk at a time; the manifest
+is replaced atomically after every chunk, so an interrupted run stays
+readable up to its last chunk. Chunks are place-major, so the series of
+one place is a contiguous read from each chunk. TrajectoryStore opens the
+chunks with np.load(mmap_mode='r') and only touches what a query needs.
+
+Example:
+    writer = TrajectoryWriter(path, place_ids, transition_ids)
+    writer.append_state(controller.time, model.places, model.transitions)
+    writer.close()
+
+    store = TrajectoryStore(path)
+    times, tokens = store.place_series('P1')
+    for times, markings, firings in store.iter_chunks():
+        ...
+"""
+import json
+import logging
+import os
+import shutil
+import weakref
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+TRAJECTORY_SUFFIX = '.traj'
+
+MANIFEST_NAME = 'manifest.json'
+
+# Target chunk size; rows per chunk follow from the number of columns
+CHUNK_BYTES = 16 * 1024 * 1024
+MIN_CHUNK_ROWS = 256
+
+
+def _chunk_file(path: str, column: str, index: int) -> str:
+    return os.path.join(path, f'{column}_{index:06d}.npy')
+
+
+class _Trajectory:
+    """Chunk queries shared by TrajectoryStore and TrajectoryWriter."""
+
+    def __init__(self, path: str, place_ids: List[Any], transition_ids: List[Any]):
+        self.path = path
+        self.place_ids = place_ids
+        self.transition_ids = transition_ids
+        self._place_index = {place_id: i for i, place_id in enumerate(place_ids)}
+        self._transition_index = {transition_id: i for i, transition_id in enumerate(transition_ids)}
+        self._chunk_rows: List[int] = []
+        self._maps: Dict[Tuple[str, int], np.ndarray] = {}
+        self._times: Optional[np.ndarray] = None
+
+    def _tail(self) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Rows not written to a chunk yet (writer only)."""
+        return None
+
+    def _chunk(self, column: str, index: int) -> np.ndarray:
+        key = (column, index)
+        array = self._maps.get(key)
+        if array is None:
+            array = self._maps[key] = np.load(_chunk_file(self.path, column, index), mmap_mode='r')
+        return array
+
+    def __len__(self) -> int:
+        tail = self._tail()
+        return sum(self._chunk_rows) + (len(tail[0]) if tail else 0)
+
+    def iter_chunks(self) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Yield (times, markings, firings) per chunk; markings are (places, rows)."""
+        for index in range(len(self._chunk_rows)):
+            yield self._chunk('times', index), self._chunk('markings', index), self._chunk('firings', index)
+        tail = self._tail()
+        if tail:
+            yield tail
+
+    @property
+    def times(self) -> np.ndarray:
+        """All time points (float64)."""
+        tail = self._tail()
+        if self._times is None or len(self._times) != sum(self._chunk_rows):
+            parts = [self._chunk('times', index) for index in range(len(self._chunk_rows))]
+            self._times = np.concatenate(parts) if parts else np.empty(0)
+        return np.concatenate((self._times, tail[0])) if tail else self._times
+
+    def _series(self, column: str, row: int, start: int, stop: Optional[int]) -> np.ndarray:
+        total = len(self)
+        start, stop, _ = slice(start, stop).indices(total)
+        parts = []
+        offset = 0
+        for times, markings, firings in self.iter_chunks():
+            rows = len(times)
+            if offset + rows > start and offset < stop:
+                data = markings if column == 'markings' else firings
+                parts.append(data[row, max(start - offset, 0):min(stop - offset, rows)])
+            offset += rows
+            if offset >= stop:
+                break
+        dtype = np.float64 if column == 'markings' else np.int64
+        return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+    def place_series(self, place_id, start: int = 0, stop: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(times, tokens) of one place, optionally for rows start:stop.
+
+        Raises:
+            KeyError: If the place is not in the trajectory
+        """
+        values = self._series('markings', self._place_index[place_id], start, stop)
+        return self.times[start:stop], values
+
+    def transition_series(self, transition_id, start: int = 0, stop: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(times, cumulative firing counts) of one transition.
+
+        Raises:
+            KeyError: If the transition is not in the trajectory
+        """
+        values = self._series('firings', self._transition_index[transition_id], start, stop)
+        return self.times[start:stop], values
+
+    def marking(self, row: int) -> Dict[Any, float]:
+        """Marking of every place at one row (negative rows count from the end)."""
+        row = range(len(self))[row]
+        offset = 0
+        for times, markings, _ in self.iter_chunks():
+            if row < offset + len(times):
+                return dict(zip(self.place_ids, markings[:, row - offset].tolist()))
+            offset += len(times)
+
+    def rows_between(self, start_time: float, end_time: float) -> Tuple[int, int]:
+        """Row range [start, stop) of the time points within [start_time, end_time]."""
+        times = self.times
+        return int(np.searchsorted(times, start_time, 'left')), int(np.searchsorted(times, end_time, 'right'))
+
+
+class TrajectoryStore(_Trajectory):
+    """Read-only view of a trajectory directory.
+
+    Attributes:
+        path: Trajectory directory
+        place_ids: Place ids, in marking row order
+        transition_ids: Transition ids, in firing row order
+        metadata: Metadata stored by the writer
+        complete: False if the writer was not closed (interrupted run)
+    """
+
+    def __init__(self, path: str):
+        """Open a trajectory.
+
+        Raises:
+            FileNotFoundError: If path has no manifest
+            ValueError: If the manifest has an unknown format version
+        """
+        with open(os.path.join(path, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported trajectory format {manifest.get('format')!r} in {path}")
+        super().__init__(path, manifest['place_ids'], manifest['transition_ids'])
+        self._chunk_rows = list(manifest['chunks'])
+        self.metadata = manifest.get('metadata', {})
+        self.complete = manifest.get('complete', False)
+
+    def __repr__(self) -> str:
+        return f"TrajectoryStore({self.path!r}, {len(self)} rows, {len(self.place_ids)} places)"
+
+
+class TrajectoryWriter(_Trajectory):
+    """Append-only trajectory writer; also answers queries while writing.
+
+    Attributes:
+        path: Trajectory directory
+        chunk_rows: Rows per chunk
+        metadata: Metadata written to the manifest
+    """
+
+    def __init__(self, path: str, place_ids: Sequence[Any], transition_ids: Sequence[Any],
+                 chunk_rows: Optional[int] = None, metadata: Optional[Dict[str, Any]] = None):
+        """Create a new trajectory directory.
+
+        Args:
+            path: Directory to create (must not hold a trajectory yet)
+            place_ids: Places, in marking order
+            transition_ids: Transitions, in firing count order
+            chunk_rows: Rows per chunk (default: about CHUNK_BYTES per chunk)
+            metadata: JSON-serializable metadata
+
+        Raises:
+            FileExistsError: If path already holds a trajectory
+        """
+        if os.path.exists(os.path.join(path, MANIFEST_NAME)):
+            raise FileExistsError(f"Trajectory already exists: {path}")
+        super().__init__(path, list(place_ids), list(transition_ids))
+        if chunk_rows is None:
+            row_bytes = 8 * (1 + len(self.place_ids) + len(self.transition_ids))
+            chunk_rows = max(MIN_CHUNK_ROWS, CHUNK_BYTES // row_bytes)
+        self.chunk_rows = int(chunk_rows)
+        self.metadata = dict(metadata or {})
+        self.closed = False
+        self._buffer_times = np.empty(self.chunk_rows)
+        self._buffer_markings = np.empty((len(self.place_ids), self.chunk_rows))
+        self._buffer_firings = np.empty((len(self.transition_ids), self.chunk_rows), dtype=np.int64)
+        self._rows = 0
+        os.makedirs(path, exist_ok=True)
+        self._write_manifest()
+
+    def _tail(self):
+        if self._rows == 0:
+            return None
+        n = self._rows
+        return self._buffer_times[:n], self._buffer_markings[:, :n], self._buffer_firings[:, :n]
+
+    def append(self, time: float, marking: Sequence[float], firings: Sequence[int]):
+        """Add one row (marking and firing counts in id order).
+
+        Raises:
+            ValueError: If the writer is closed
+        """
+        if self.closed:
+            raise ValueError(f"Trajectory writer is closed: {self.path}")
+        row = self._rows
+        self._buffer_times[row] = time
+        self._buffer_markings[:, row] = marking
+        self._buffer_firings[:, row] = firings
+        self._rows += 1
+        if self._rows == self.chunk_rows:
+            self._write_chunk()
+
+    def append_state(self, time: float, places: Sequence, transitions: Sequence):
+        """Add the current model state (place.tokens, transition.firing_count)."""
+        self.append(time,
+                    [place.tokens for place in places],
+                    [getattr(transition, 'firing_count', 0) for transition in transitions])
+
+    def _write_chunk(self):
+        index, n = len(self._chunk_rows), self._rows
+        np.save(_chunk_file(self.path, 'times', index), self._buffer_times[:n])
+        np.save(_chunk_file(self.path, 'markings', index), np.ascontiguousarray(self._buffer_markings[:, :n]))
+        np.save(_chunk_file(self.path, 'firings', index), np.ascontiguousarray(self._buffer_firings[:, :n]))
+        self._chunk_rows.append(n)
+        self._rows = 0
+        self._write_manifest()
+
+    def _write_manifest(self):
+        manifest = {
+            'format': FORMAT_VERSION,
+            'place_ids': self.place_ids,
+            'transition_ids': self.transition_ids,
+            'chunks': self._chunk_rows,
+            'complete': self.closed,
+            'metadata': self.metadata,
+        }
+        target = os.path.join(self.path, MANIFEST_NAME)
+        with open(target + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(target + '.tmp', target)
+
+    def close(self):
+        """Write the buffered rows and mark the trajectory complete."""
+        if self.closed:
+            return
+        if self._rows:
+            self._write_chunk()
+        self.closed = True
+        self._write_manifest()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"TrajectoryWriter({self.path!r}, {len(self)} rows, {len(self._chunk_rows)} chunks)"
+
+
+def new_trajectory_path(directory: str, name: Optional[str] = None) -> str:
+    """Unused trajectory path in directory (default name: the current time)."""
+    base = name or datetime.now().strftime('run_%Y%m%d_%H%M%S')
+    path = os.path.join(directory, base + TRAJECTORY_SUFFIX)
+    counter = 1
+    while os.path.exists(path):
+        counter += 1
+        path = os.path.join(directory, f'{base}_{counter}{TRAJECTORY_SUFFIX}')
+    return path
+
+
+def list_trajectories(directory: Optional[str]) -> List[str]:
+    """Trajectory directories in directory, oldest first."""
+    if not directory or not os.path.isdir(directory):
+        return []
+    paths = [os.path.join(directory, name) for name in os.listdir(directory)
+             if name.endswith(TRAJECTORY_SUFFIX)
+             and os.path.isfile(os.path.join(directory, name, MANIFEST_NAME))]
+    return sorted(paths, key=os.path.getmtime)
+
+
+# Trajectory path -> objects referring to it (e.g. report snapshots)
+_pins: Dict[str, 'weakref.WeakSet'] = {}
+
+
+def pin_trajectory(path: str, owner: Any):
+    """Protect a trajectory from prune_trajectories() while owner is alive.
+
+    Args:
+        path: Trajectory directory
+        owner: Object referring to it (held weakly; see unpin_trajectory)
+    """
+    _pins.setdefault(os.path.abspath(path), weakref.WeakSet()).add(owner)
+
+
+def unpin_trajectory(path: str, owner: Any):
+    """Drop owner's reference to a trajectory (see pin_trajectory)."""
+    key = os.path.abspath(path)
+    owners = _pins.get(key)
+    if owners is not None:
+        owners.discard(owner)
+        if not owners:
+            del _pins[key]
+
+
+def is_pinned(path: str) -> bool:
+    """True if a live owner refers to the trajectory."""
+    return bool(_pins.get(os.path.abspath(path)))
+
+
+def prune_trajectories(directory: Optional[str], keep: int) -> List[str]:
+    """Delete all but the newest keep trajectories in directory.
+
+    Pinned trajectories are never deleted (and not counted in keep).
+
+    Returns:
+        The deleted trajectory paths
+    """
+    paths = [path for path in list_trajectories(directory) if not is_pinned(path)]
+    stale = paths[:max(len(paths) - max(keep, 0), 0)]
+    if stale:
+        logger.info(f"Deleting {len(stale)} old trajectories in {directory} "
+                    f"(keeping the newest {keep} and any in use)")
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+    return stale
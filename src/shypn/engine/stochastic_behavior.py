@@ -19,6 +19,7 @@ import random
 import math
 import logging
 from .transition_behavior import TransitionBehavior
+from .expression_compiler import compile_expression
 
 
 class StochasticBehavior(TransitionBehavior):
@@ -158,7 +159,7 @@ class StochasticBehavior(TransitionBehavior):
                     context[f'P{place_id}'] = tokens
             
             # Evaluate formula
-            result = eval(self.rate_function_expr, {"__builtins__": {}}, context)
+            result = eval(compile_expression(self.rate_function_expr), {"__builtins__": {}}, context)
             rate = float(result)
             
             # Ensure positive rate (required for exponential distribution)
@@ -342,6 +342,7 @@ class TransitionBehavior(ABC):
         if isinstance(guard_expr, str):
             try:
                 from shypn.engine.function_catalog import FUNCTION_CATALOG
+                from shypn.engine.expression_compiler import compile_expression
                 
                 # Build evaluation context
                 context = {'t': self._get_current_time()}
@@ -359,7 +360,7 @@ class TransitionBehavior(ABC):
                             context[f'P{place_id}'] = place.tokens
                 
                 # Evaluate expression safely
-                result = eval(guard_expr, {"__builtins__": {}}, context)
+                result = eval(compile_expression(guard_expr), {"__builtins__": {}}, context)
                 passes = bool(result)
                 return passes, f"guard-expr-{passes}"
             except Exception as e:
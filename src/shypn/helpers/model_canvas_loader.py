@@ -4372,6 +4372,7 @@ class ModelCanvasLoader:
             ('Layout: Solar System (SSCC)', lambda: self._on_layout_solar_system_clicked(menu, drawing_area, manager)),
             ('Layout: Circular', lambda: self._on_layout_circular_clicked(menu, drawing_area, manager)),
             ('Layout: Orthogonal', lambda: self._on_layout_orthogonal_clicked(menu, drawing_area, manager)),
+            ('Layout: Multilevel (Large)', lambda: self._on_layout_multilevel_clicked(menu, drawing_area, manager)),
             None,  # Separator
             ('Center View', lambda: self._on_center_view_clicked(menu, drawing_area, manager)),
             ('Clear Canvas', lambda: self._on_clear_canvas_clicked(menu, drawing_area, manager)),
@@ -4483,60 +4484,7 @@ class ModelCanvasLoader:
 
     def _on_layout_auto_clicked(self, menu, drawing_area, manager):
         """Apply automatic layout (best algorithm for graph topology)."""
-        try:
-            from shypn.edit.graph_layout import LayoutEngine
-            
-            # Check if there are nodes to layout
-            if not manager.places and not manager.transitions:
-                self._show_layout_message("No objects to layout", drawing_area)
-                return
-            
-            # Calculate current center of objects (to preserve relative position)
-            all_objs = list(manager.places) + list(manager.transitions)
-            if all_objs:
-                center_x = sum(obj.x for obj in all_objs) / len(all_objs)
-                center_y = sum(obj.y for obj in all_objs) / len(all_objs)
-            else:
-                pass
-                # Default to canvas center
-                center_x = manager.canvas_width / 2
-                center_y = manager.canvas_height / 2
-            
-            # Create engine and apply layout
-            engine = LayoutEngine(manager)
-            result = engine.apply_layout('auto')
-            
-            # The layout algorithms center at (0, 0), so we need to offset
-            # back to the original center or canvas center
-            all_objs = list(manager.places) + list(manager.transitions)
-            if all_objs:
-                pass
-                # Calculate new center after layout
-                new_center_x = sum(obj.x for obj in all_objs) / len(all_objs)
-                new_center_y = sum(obj.y for obj in all_objs) / len(all_objs)
-                
-                # Calculate offset needed
-                offset_x = center_x - new_center_x
-                offset_y = center_y - new_center_y
-                
-                # Apply offset to all objects
-                for obj in all_objs:
-                    obj.x += offset_x
-                    obj.y += offset_y
-            
-            # Show result
-            message = (f"Applied {result['algorithm']} layout\n"
-                      f"Moved {result['nodes_moved']} objects\n"
-                      f"Reason: {result['reason']}")
-            self._show_layout_message(message, drawing_area)
-            
-            # Redraw
-            drawing_area.queue_draw()
-            
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            self._show_layout_message(f"Layout error: {str(e)}", drawing_area)
+        self._start_background_layout(manager, drawing_area, 'auto', 'Auto')
     
     def _on_layout_hierarchical_clicked(self, menu, drawing_area, manager):
         """Apply hierarchical (Sugiyama) layout."""
@@ -4548,65 +4496,16 @@ class ModelCanvasLoader:
     
     def _on_layout_solar_system_clicked(self, menu, drawing_area, manager):
         """Apply Solar System (SSCC) layout with unified physics."""
-        try:
-            from shypn.layout.sscc import SolarSystemLayoutEngine
-            
-            # Check if there are nodes to layout
-            if not manager.places and not manager.transitions:
-                self._show_layout_message("No objects to layout", drawing_area)
-                return
-            
-            # Create engine with unified physics (all forces active)
-            engine = SolarSystemLayoutEngine(
-                iterations=1000,
-                use_arc_weight=True,
-                scc_radius=50.0,
-                planet_orbit=300.0,
-                satellite_orbit=50.0
-            )
-            
-            # Apply layout
-            positions = engine.apply_layout(
-                places=list(manager.places),
-                transitions=list(manager.transitions),
-                arcs=list(manager.arcs)
-            )
-            
-            # Update object positions
-            for obj_id, (x, y) in positions.items():
-                pass
-                # Find object by ID
-                obj = None
-                for place in manager.places:
-                    if place.id == obj_id:
-                        obj = place
-                        break
-                if not obj:
-                    for transition in manager.transitions:
-                        if transition.id == obj_id:
-                            obj = transition
-                            break
-                
-                if obj:
-                    obj.x = x
-                    obj.y = y
-            
-            # Get statistics
-            stats = engine.get_statistics()
-            message = f"Applied Solar System (SSCC) layout\n"
-            message += f"Physics: {stats['physics_model']}\n"
-            message += f"SCCs found: {stats['num_sccs']}\n"
-            message += f"Nodes in SCCs: {stats['num_nodes_in_sccs']}\n"
-            message += f"Free places: {stats['num_free_places']}"
-            self._show_layout_message(message, drawing_area)
-            
-            # Redraw
-            drawing_area.queue_draw()
-            
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            self._show_layout_message(f"Solar System layout error: {str(e)}", drawing_area)
+        # Unified physics (all forces active); starts from current positions
+        self._start_background_layout(
+            manager, drawing_area, 'solar_system', 'Solar System (SSCC)',
+            preserve_center=False,
+            iterations=1000,
+            use_arc_weight=True,
+            scc_radius=50.0,
+            planet_orbit=300.0,
+            satellite_orbit=50.0
+        )
     
     def _on_layout_circular_clicked(self, menu, drawing_area, manager):
         """Apply circular layout."""
@@ -4616,6 +4515,10 @@ class ModelCanvasLoader:
         """Apply orthogonal (grid-aligned) layout."""
         self._apply_specific_layout(manager, drawing_area, 'orthogonal', 'Orthogonal')
     
+    def _on_layout_multilevel_clicked(self, menu, drawing_area, manager):
+        """Apply multilevel (coarsen-layout-refine) layout for large pathways."""
+        self._apply_specific_layout(manager, drawing_area, 'multilevel', 'Multilevel')
+    
     def _apply_specific_layout(self, manager, drawing_area, algorithm, algorithm_name):
         """Apply a specific layout algorithm.
         
@@ -4625,6 +4528,34 @@ class ModelCanvasLoader:
             algorithm: Algorithm name ('hierarchical', 'force_directed', etc.)
             algorithm_name: Human-readable name for messages
         """
+        # Try to get layout parameters from SBML Import panel (if available)
+        layout_params = {}
+        try:
+            if hasattr(self, 'sbml_panel') and self.sbml_panel:
+                layout_params = self.sbml_panel.get_layout_parameters_for_algorithm(algorithm) or {}
+        except Exception as e:
+            pass  # If we can't get params from SBML panel, just use defaults
+        
+        self._start_background_layout(manager, drawing_area, algorithm, algorithm_name, **layout_params)
+    
+    def _start_background_layout(self, manager, drawing_area, algorithm, algorithm_name,
+                                 preserve_center=True, **layout_params):
+        """Compute a layout in a worker process with animated preview.
+        
+        The canvas stays responsive while the layout runs: intermediate
+        positions are drawn as they arrive, a floating bar offers Cancel
+        (which restores the original positions), and the final positions
+        are applied in one step followed by a single redraw.
+        
+        Args:
+            manager: ModelCanvasManager instance
+            drawing_area: GtkDrawingArea widget
+            algorithm: Algorithm name ('auto', 'solar_system', 'hierarchical', ...)
+            algorithm_name: Human-readable name for messages
+            preserve_center: Keep the current centroid of the objects
+            **layout_params: Algorithm-specific parameters
+        """
+        progress_box = None
         try:
             from shypn.edit.graph_layout import LayoutEngine
             
@@ -4633,63 +4564,83 @@ class ModelCanvasLoader:
                 self._show_layout_message("No objects to layout", drawing_area)
                 return
             
-            # Calculate current center of objects (to preserve relative position)
-            all_objs = list(manager.places) + list(manager.transitions)
-            if all_objs:
-                center_x = sum(obj.x for obj in all_objs) / len(all_objs)
-                center_y = sum(obj.y for obj in all_objs) / len(all_objs)
-            else:
-                pass
-                # Default to canvas center
-                center_x = manager.canvas_width / 2
-                center_y = manager.canvas_height / 2
+            # One layout job per canvas: drop the one already running (restores
+            # its original positions at once, without blocking the main loop)
+            if not hasattr(self, '_layout_jobs'):
+                self._layout_jobs = {}
+            previous_job = self._layout_jobs.get(drawing_area)
+            if previous_job is not None and previous_job.running:
+                previous_job.discard()
             
-            # Try to get layout parameters from SBML Import panel (if available)
-            layout_params = {}
-            try:
-                pass
-                # Check if sbml_panel is available (set during initialization)
-                if hasattr(self, 'sbml_panel') and self.sbml_panel:
-                    layout_params = self.sbml_panel.get_layout_parameters_for_algorithm(algorithm)
-                    if layout_params:
-                        pass  # Use these params
-            except Exception as e:
-                pass  # If we can't get params from SBML panel, just use defaults
+            def on_preview(job, iteration, total):
+                progress_bar.set_fraction(min(1.0, iteration / total) if total else 0.0)
+                drawing_area.queue_draw()
             
-            # Create engine and apply layout with parameters
-            engine = LayoutEngine(manager)
-            result = engine.apply_layout(algorithm, **layout_params)
+            def on_complete(job, result):
+                cleanup()
+                message = (f"Applied {algorithm_name} layout\n"
+                           f"Moved {result['nodes_moved']} objects")
+                if result.get('reason'):
+                    message += f"\nReason: {result['reason']}"
+                if layout_params:
+                    message += f"\nParameters: {layout_params}"
+                self._show_layout_message(message, drawing_area)
+                drawing_area.queue_draw()
             
-            # The layout algorithms center at (0, 0), so we need to offset
-            # back to the original center or canvas center
-            all_objs = list(manager.places) + list(manager.transitions)
-            if all_objs:
-                pass
-                # Calculate new center after layout
-                new_center_x = sum(obj.x for obj in all_objs) / len(all_objs)
-                new_center_y = sum(obj.y for obj in all_objs) / len(all_objs)
-                
-                # Calculate offset needed
-                offset_x = center_x - new_center_x
-                offset_y = center_y - new_center_y
-                
-                # Apply offset to all objects
-                for obj in all_objs:
-                    obj.x += offset_x
-                    obj.y += offset_y
+            def on_cancelled(job):
+                cleanup()
+                self._show_layout_message(f"{algorithm_name} layout cancelled", drawing_area)
+                drawing_area.queue_draw()
             
-            # Show result
-            message = f"Applied {algorithm_name} layout\nMoved {result['nodes_moved']} objects"
-            if layout_params:
-                message += f"\nParameters: {layout_params}"
-            self._show_layout_message(message, drawing_area)
+            def on_error(job, message):
+                cleanup()
+                self._show_layout_message(f"Layout error: {message}", drawing_area)
+                drawing_area.queue_draw()
             
-            # Redraw
-            drawing_area.queue_draw()
+            # Floating progress bar with Cancel button over the canvas
+            progress_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+            progress_box.set_halign(Gtk.Align.CENTER)
+            progress_box.set_valign(Gtk.Align.START)
+            progress_box.set_margin_top(8)
+            progress_box.get_style_context().add_class('app-notification')
+            progress_label = Gtk.Label(label=f"Computing {algorithm_name} layout…")
+            progress_bar = Gtk.ProgressBar()
+            progress_bar.set_valign(Gtk.Align.CENTER)
+            cancel_button = Gtk.Button(label="Cancel")
+            progress_box.pack_start(progress_label, False, False, 0)
+            progress_box.pack_start(progress_bar, False, False, 0)
+            progress_box.pack_start(cancel_button, False, False, 0)
+            
+            overlay_manager = self.overlay_managers.get(drawing_area)
+            overlay_widget = getattr(overlay_manager, 'overlay_widget', None)
+            if overlay_widget is not None:
+                overlay_widget.add_overlay(progress_box)
+                progress_box.show_all()
+            
+            def cleanup():
+                if self._layout_jobs.get(drawing_area) is job:
+                    del self._layout_jobs[drawing_area]
+                progress_box.destroy()
+            
+            engine = LayoutEngine(manager)
+            job = engine.apply_layout_async(
+                algorithm,
+                on_preview=on_preview,
+                on_complete=on_complete,
+                on_cancelled=on_cancelled,
+                on_error=on_error,
+                preserve_center=preserve_center,
+                **layout_params
+            )
+            self._layout_jobs[drawing_area] = job
+            cancel_button.connect('clicked', lambda button: job.cancel())
+            GLib.timeout_add(50, job.poll)
             
         except Exception as e:
             import traceback
             traceback.print_exc()
+            if progress_box is not None:
+                progress_box.destroy()
             self._show_layout_message(f"Layout error: {str(e)}", drawing_area)
     
     def _show_layout_message(self, message, drawing_area):
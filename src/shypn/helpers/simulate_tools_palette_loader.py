@@ -25,9 +25,10 @@ import os
 import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, Gdk, GObject, GLib
-from shypn.engine.simulation import SimulationController
+from shypn.engine.simulation import SimulationController, SimulationEvent
 from shypn.engine.simulation.buffered import BufferedSimulationSettings
 from shypn.analyses import SimulationDataCollector
+from shypn.data.project_models import get_project_manager
 from shypn.utils.time_utils import TimeUnits, TimeFormatter
 
 class SimulateToolsPaletteLoader(GObject.GObject):
@@ -119,6 +120,8 @@ class SimulateToolsPaletteLoader(GObject.GObject):
             controller: SimulationController instance or None
         """
         self._simulation = controller
+        # Lets analysis views (e.g. step performance stats) find the controller
+        self.data_collector.controller = controller
         
         # Recreate BufferedSimulationSettings with new controller's settings
         if controller is not None:
@@ -487,10 +490,18 @@ class SimulateToolsPaletteLoader(GObject.GObject):
         # PHASE 1-2 FIX: Do NOT overwrite controller.data_collector
         # The controller creates its own DataCollector (for Report Panel tables)
         # This palette has its own SimulationDataCollector (for real-time plots)
-        # Both need to coexist - just register our collector as a step listener
+        # Both need to coexist - just subscribe our collector to steps and firings
         # DO NOT OVERWRITE: self.simulation.data_collector = self.data_collector
-        self.simulation.add_step_listener(self._on_simulation_step)
-        self.simulation.add_step_listener(self.data_collector.on_simulation_step)
+        self.simulation.subscribe(SimulationEvent.STEP, self._on_simulation_step)
+        self.simulation.subscribe(SimulationEvent.STEP, self.data_collector.on_simulation_step)
+        self.simulation.subscribe(SimulationEvent.FIRING, self.data_collector.on_firings)
+        
+        # Stream runs to the open project, so long runs are bounded by disk
+        project = get_project_manager().current_project
+        if project is not None and project.get_simulations_dir():
+            self.simulation.data_collector.stream_to(
+                project.get_simulations_dir(),
+                memory_rows=self.simulation.data_collector.DEFAULT_MEMORY_ROWS)
         
         # Apply default UI values to simulation settings
         self._apply_ui_defaults_to_settings()
@@ -548,6 +559,7 @@ class SimulateToolsPaletteLoader(GObject.GObject):
             controller: The SimulationController instance
             time: Current simulation time
         """
+        controller.profiler.count('redraw_requests')
         self.emit('step-executed', time)
         self._update_progress_display()
 
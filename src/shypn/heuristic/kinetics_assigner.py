@@ -18,6 +18,7 @@ import logging
 from .assignment_result import AssignmentResult, ConfidenceLevel, AssignmentSource
 from .metadata import KineticsMetadata
 from .factory import EstimatorFactory
+from shypn.utils.arc_index import build_arc_index, arcs_of
 
 # Import hybrid API for enzyme kinetics lookup
 try:
@@ -54,6 +55,9 @@ class KineticsAssigner:
         self.logger = logging.getLogger(__name__)
         self.offline_mode = offline_mode
         
+        # EC number → database entry, only while assign_bulk() runs
+        self._lookup_memo = None
+        
         # Initialize hybrid API database
         if API_AVAILABLE:
             self.database = EnzymeKineticsAPI(offline_mode=offline_mode)
@@ -242,9 +246,15 @@ class KineticsAssigner:
         
         ec_number = ec_numbers[0]  # Use first EC number
         
-        # Lookup in database (tries cache → API → fallback)
+        # Lookup in database (tries cache → API → fallback), once per
+        # EC number during assign_bulk()
         try:
-            db_entry = self.database.lookup(ec_number)
+            if self._lookup_memo is not None and ec_number in self._lookup_memo:
+                db_entry = self._lookup_memo[ec_number]
+            else:
+                db_entry = self.database.lookup(ec_number)
+                if self._lookup_memo is not None:
+                    self._lookup_memo[ec_number] = db_entry
         except Exception as e:
             self.logger.error(f"Database lookup error for EC {ec_number}: {e}")
             return AssignmentResult.failed(f"Database error: {e}")
@@ -548,32 +558,54 @@ class KineticsAssigner:
         self,
         transitions: List,
         reactions: List,
-        source: str = 'kegg'
+        source: str = 'kegg',
+        arcs: Optional[List] = None
     ) -> Dict[str, AssignmentResult]:
         """
         Assign kinetics to multiple transitions.
         
+        Each distinct EC number is looked up once for the whole batch, and
+        substrate/product places come from an arc index built in one pass.
+        
         Args:
             transitions: List of transitions
             reactions: List of corresponding reactions
             source: Data source
+            arcs: Optional model arcs (to pass substrate/product places)
         
         Returns:
             Dict mapping transition.name → AssignmentResult
         """
         results = {}
+        arc_index = build_arc_index(arcs) if arcs is not None else None
         
-        for i, transition in enumerate(transitions):
-            reaction = reactions[i] if i < len(reactions) else None
-            
-            result = self.assign(
-                transition,
-                reaction,
-                substrate_places=None,  # TODO: Extract from transition arcs
-                product_places=None,
-                source=source
-            )
-            
-            results[transition.name] = result
+        self._lookup_memo = {}
+        try:
+            for i, transition in enumerate(transitions):
+                reaction = reactions[i] if i < len(reactions) else None
+                
+                substrate_places = None
+                product_places = None
+                if arc_index is not None:
+                    input_arcs, output_arcs = arcs_of(arc_index, transition)
+                    substrate_places = [arc.source for arc in input_arcs]
+                    product_places = [arc.target for arc in output_arcs]
+                
+                result = self.assign(
+                    transition,
+                    reaction,
+                    substrate_places=substrate_places,
+                    product_places=product_places,
+                    source=source
+                )
+                
+                results[transition.name] = result
+        finally:
+            self._lookup_memo = None
         
         return results
+    
+    def close(self):
+        """Release the enzyme kinetics database (its cache connections)."""
+        if self.database is not None:
+            self.database.close()
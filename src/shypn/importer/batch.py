@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""Batch import of SBML and KGML files into .shy models.
+
+Runs the same pipeline as the import panels (parse → layout → convert with
+kinetics → save) over many files, without GTK, in a process pool. Each file
+is imported independently; failures are recorded and do not stop the batch.
+
+    SBML: SBMLParser.parse_file → PathwayPostProcessor → PathwayConverter
+          (SBML kinetic laws are integrated during conversion)
+    KGML: KGMLParser.parse → convert_pathway_enhanced
+          (heuristic kinetics, layout optimization, metadata)
+
+Usage:
+    from shypn.importer.batch import batch_import, ImportOptions
+
+    report = batch_import('data/biomodels_test', 'workspace/models',
+                          ImportOptions(offline=True), max_workers=4)
+    print(report.summary())
+
+Command line:
+    python -m shypn.importer.batch data/biomodels_test -o /tmp/models -j 4
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+# File extensions picked up when scanning directories
+SOURCE_EXTENSIONS = ('.xml', '.sbml', '.kgml')
+
+# Bytes read to tell SBML from KGML for .xml files
+SNIFF_SIZE = 4096
+
+
+@dataclass
+class ImportOptions:
+    """Options shared by all files of a batch."""
+
+    scale_factor: float = 1.0
+    """SBML: concentration → tokens multiplier."""
+
+    coordinate_scale: float = 2.5
+    """KGML: coordinate scaling factor."""
+
+    include_cofactors: bool = True
+    """KGML: keep common cofactors (ATP, NADH, ...)."""
+
+    apply_layout: bool = True
+    """Compute a layout (SBML) / optimize the KEGG layout (KGML)."""
+
+    offline: bool = False
+    """Never touch the network (cached responses and local data only)."""
+
+    compression: Optional[str] = None
+    """.shy compression: None, 'gzip' or 'zstd'."""
+
+    skip_unchanged: bool = False
+    """Skip files whose .shy output is newer than the source."""
+
+
+@dataclass
+class FileImportResult:
+    """Outcome of importing one file."""
+
+    source: str
+    output: Optional[str] = None
+    format: Optional[str] = None
+    success: bool = False
+    skipped: bool = False
+    error: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    places: int = 0
+    transitions: int = 0
+    arcs: int = 0
+
+    @property
+    def total_time(self) -> float:
+        """Wall time spent on this file (seconds)."""
+        return sum(self.timings.values())
+
+
+@dataclass
+class BatchImportReport:
+    """Results of a batch import."""
+
+    results: List[FileImportResult] = field(default_factory=list)
+    wall_time: float = 0.0
+    workers: int = 1
+
+    @property
+    def succeeded(self) -> List[FileImportResult]:
+        return [r for r in self.results if r.success and not r.skipped]
+
+    @property
+    def failed(self) -> List[FileImportResult]:
+        return [r for r in self.results if not r.success]
+
+    @property
+    def skipped(self) -> List[FileImportResult]:
+        return [r for r in self.results if r.skipped]
+
+    def summary(self) -> str:
+        """Multi-line, human-readable report (failures listed last)."""
+        lines = []
+        for result in self.results:
+            name = os.path.basename(result.source)
+            if result.skipped:
+                lines.append(f"  -  {name}: unchanged, skipped")
+            elif result.success:
+                phases = ', '.join(f"{phase} {seconds:.2f}s" for phase, seconds in result.timings.items())
+                lines.append(
+                    f"  ✓  {name} [{result.format}]: {result.places}P/{result.transitions}T/"
+                    f"{result.arcs}A in {result.total_time:.2f}s ({phases})"
+                )
+        for result in self.failed:
+            lines.append(f"  ✗  {os.path.basename(result.source)}: {result.error}")
+
+        lines.append(
+            f"Imported {len(self.succeeded)}, skipped {len(self.skipped)}, "
+            f"failed {len(self.failed)} of {len(self.results)} files "
+            f"in {self.wall_time:.2f}s ({self.workers} workers)"
+        )
+        return '\n'.join(lines)
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable report."""
+        return {
+            'wall_time': self.wall_time,
+            'workers': self.workers,
+            'succeeded': len(self.succeeded),
+            'skipped': len(self.skipped),
+            'failed': len(self.failed),
+            'results': [asdict(result) for result in self.results],
+        }
+
+
+def detect_format(path: Union[str, Path]) -> Optional[str]:
+    """Tell whether a file is SBML or KGML.
+
+    Returns:
+        'sbml', 'kgml', or None if neither
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.kgml':
+        return 'kgml'
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(SNIFF_SIZE)
+    except OSError:
+        return None
+    if b'<sbml' in head:
+        return 'sbml'
+    if b'<pathway' in head or b'KGML' in head:
+        return 'kgml'
+    return None
+
+
+def collect_sources(inputs: Iterable[Union[str, Path]], recursive: bool = False) -> List[Path]:
+    """Expand files and directories into the list of source files.
+
+    Directories contribute their .xml/.sbml/.kgml files (sorted).
+    """
+    sources = []
+    seen = set()
+    for item in inputs:
+        item = Path(item)
+        if item.is_dir():
+            pattern = '**/*' if recursive else '*'
+            candidates = sorted(
+                p for p in item.glob(pattern)
+                if p.is_file() and p.suffix.lower() in SOURCE_EXTENSIONS
+            )
+        else:
+            candidates = [item]
+        for path in candidates:
+            key = path.resolve()
+            if key not in seen:
+                seen.add(key)
+                sources.append(path)
+    return sources
+
+
+def output_path_for(source: Path, output_dir: Path, root: Optional[Path] = None) -> Path:
+    """.shy path for a source, mirroring sub-directories below root."""
+    relative = source.relative_to(root).parent if root is not None else Path()
+    return output_dir / relative / f"{source.stem}.shy"
+
+
+def _unclaimed_output(output: Path, source: Path, claimed: set) -> Path:
+    """output, or a variant of it no earlier source claimed.
+
+    foo.xml and foo.kgml would both write foo.shy; the first keeps it and
+    the next gets foo_kgml.shy (then foo_kgml_2.shy, ...). Input order
+    decides, so repeated runs map each source to the same file.
+    """
+    candidate = output
+    extension = source.suffix.lstrip('.').lower()
+    counter = 1
+    while os.path.normcase(os.path.abspath(candidate)) in claimed:
+        counter += 1
+        suffix = extension if counter == 2 else f"{extension}_{counter - 1}"
+        candidate = output.with_name(f"{output.stem}_{suffix}.shy")
+    claimed.add(os.path.normcase(os.path.abspath(candidate)))
+    return candidate
+
+
+def import_file(source: Union[str, Path], output: Union[str, Path],
+                options: Optional[ImportOptions] = None) -> FileImportResult:
+    """Import one SBML/KGML file and save it as .shy.
+
+    Never raises: errors are reported in the result.
+    """
+    options = options or ImportOptions()
+    source, output = Path(source), Path(output)
+    result = FileImportResult(source=str(source), output=str(output))
+
+    try:
+        if options.skip_unchanged and output.exists() \
+                and output.stat().st_mtime >= source.stat().st_mtime:
+            result.success = result.skipped = True
+            return result
+
+        result.format = detect_format(source)
+        if result.format == 'sbml':
+            document = _import_sbml(source, options, result.timings)
+        elif result.format == 'kgml':
+            document = _import_kgml(source, options, result.timings)
+        else:
+            raise ValueError("not an SBML or KGML file")
+
+        started = time.perf_counter()
+        output.parent.mkdir(parents=True, exist_ok=True)
+        document.save_to_file(str(output), compression=options.compression)
+        result.timings['save'] = time.perf_counter() - started
+
+        result.places, result.transitions, result.arcs = document.get_object_count()
+        result.success = True
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        logger.warning(f"Import failed for {source}: {result.error}")
+
+    return result
+
+
+def _import_sbml(source: Path, options: ImportOptions, timings: Dict[str, float]):
+    """SBML → DocumentModel (same steps as the SBML import panel)."""
+    from shypn.data.pathway.sbml_parser import SBMLParser
+    from shypn.data.pathway.pathway_postprocessor import PathwayPostProcessor
+    from shypn.data.pathway.pathway_converter import PathwayConverter
+
+    started = time.perf_counter()
+    pathway = SBMLParser().parse_file(str(source))
+    timings['parse'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    postprocessor = PathwayPostProcessor(scale_factor=options.scale_factor,
+                                         apply_layout=options.apply_layout)
+    processed = postprocessor.process(pathway)
+    timings['layout'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    document = PathwayConverter().convert(processed)
+    timings['convert'] = time.perf_counter() - started
+    return document
+
+
+def _import_kgml(source: Path, options: ImportOptions, timings: Dict[str, float]):
+    """KGML → DocumentModel (same steps as the KEGG import panel)."""
+    from shypn.importer.kegg.kgml_parser import KGMLParser
+    from shypn.importer.kegg.pathway_converter import convert_pathway_enhanced
+    from shypn.pathway.options import EnhancementOptions
+
+    started = time.perf_counter()
+    pathway = KGMLParser().parse(source.read_text(encoding='utf-8'))
+    timings['parse'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    enhancement_options = EnhancementOptions(
+        enable_layout_optimization=options.apply_layout,
+        enable_arc_routing=False,  # KEGG import: always straight arcs
+        enable_metadata_enhancement=True
+    )
+    document = convert_pathway_enhanced(
+        pathway,
+        coordinate_scale=options.coordinate_scale,
+        include_cofactors=options.include_cofactors,
+        enhancement_options=enhancement_options
+    )
+    timings['convert'] = time.perf_counter() - started
+    return document
+
+
+def _init_worker(offline: bool, log_level: int):
+    """Process pool initializer."""
+    logging.basicConfig(level=log_level)
+    if offline:
+        from shypn.utils.http_cache import set_offline
+        set_offline(True)
+
+
+def batch_import(inputs: Union[str, Path, Iterable[Union[str, Path]]],
+                 output_dir: Union[str, Path],
+                 options: Optional[ImportOptions] = None,
+                 max_workers: Optional[int] = None,
+                 recursive: bool = False,
+                 progress_callback: Optional[Callable[[int, int, FileImportResult], None]] = None
+                 ) -> BatchImportReport:
+    """Import many SBML/KGML files into .shy models in parallel.
+
+    Args:
+        inputs: File or directory, or an iterable of them
+        output_dir: Directory for the .shy files (sub-directories of an
+            input directory are mirrored; inputs that would write the same
+            file, e.g. foo.xml and foo.kgml, get foo.shy and foo_kgml.shy)
+        options: Import options (defaults if None)
+        max_workers: Worker processes (default: CPU count; 1 imports in
+            this process)
+        recursive: Scan input directories recursively
+        progress_callback: Called as (done, total, result) after each file
+
+    Returns:
+        BatchImportReport, results in input order
+    """
+    options = options or ImportOptions()
+    if isinstance(inputs, (str, Path)):
+        inputs = [inputs]
+    inputs = [Path(item) for item in inputs]
+    output_dir = Path(output_dir)
+
+    jobs = []
+    claimed = set()
+    for item in inputs:
+        root = item if item.is_dir() else None
+        for source in collect_sources([item], recursive):
+            default = output_path_for(source, output_dir, root)
+            output = _unclaimed_output(default, source, claimed)
+            if output != default:
+                logger.warning(f"{source}: {default.name} is written by another input, "
+                               f"using {output.name}")
+            jobs.append((source, output))
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    workers = max(1, min(max_workers, len(jobs)))
+    report = BatchImportReport(workers=workers)
+    results: List[Optional[FileImportResult]] = [None] * len(jobs)
+    started = time.perf_counter()
+
+    def finished(index, result):
+        results[index] = result
+        if progress_callback:
+            done = sum(1 for r in results if r is not None)
+            progress_callback(done, len(jobs), result)
+
+    if workers == 1:
+        if options.offline:
+            from shypn.utils.http_cache import get_http_cache
+            cache = get_http_cache()
+            previous, cache.offline = cache.offline, True
+        try:
+            for index, (source, output) in enumerate(jobs):
+                finished(index, import_file(source, output, options))
+        finally:
+            if options.offline:
+                cache.offline = previous
+    else:
+        # Largest files first, so one big model does not finish last;
+        # 'spawn' is safe in the GTK process (no forked GLib state)
+        order = sorted(range(len(jobs)), key=lambda i: _file_size(jobs[i][0]), reverse=True)
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=context,
+                                 initializer=_init_worker,
+                                 initargs=(options.offline, logging.getLogger().level)) as executor:
+            futures = {
+                executor.submit(import_file, jobs[i][0], jobs[i][1], options): i
+                for i in order
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker died (e.g. crash in a native library)
+                    result = FileImportResult(source=str(jobs[index][0]),
+                                              error=f"{type(e).__name__}: {e}")
+                finished(index, result)
+
+    report.results = results
+    report.wall_time = time.perf_counter() - started
+    return report
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def main(argv=None) -> int:
+    """Command line entry point (exit status 1 if any file failed)."""
+    parser = argparse.ArgumentParser(
+        description='Batch import SBML/KGML files into .shy models'
+    )
+    parser.add_argument('inputs', nargs='+', type=Path,
+                        help='SBML/KGML files or directories')
+    parser.add_argument('-o', '--output-dir', type=Path, required=True,
+                        help='Directory for the .shy files')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('-r', '--recursive', action='store_true',
+                        help='Scan directories recursively')
+    parser.add_argument('--scale-factor', type=float, default=1.0,
+                        help='SBML concentration → tokens multiplier (default: 1.0)')
+    parser.add_argument('--coordinate-scale', type=float, default=2.5,
+                        help='KGML coordinate scaling factor (default: 2.5)')
+    parser.add_argument('--no-cofactors', action='store_true',
+                        help='KGML: leave out common cofactors')
+    parser.add_argument('--no-layout', action='store_true',
+                        help='Skip layout computation/optimization')
+    parser.add_argument('--offline', action='store_true',
+                        help='Do not access the network (cached data only)')
+    parser.add_argument('--compression', choices=['gzip', 'zstd'], default=None,
+                        help='Compress the .shy files')
+    parser.add_argument('--changed-only', action='store_true',
+                        help='Skip files whose .shy is newer than the source')
+    parser.add_argument('--report', type=Path, default=None,
+                        help='Write a JSON report to this file')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Only print the summary line')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    options = ImportOptions(
+        scale_factor=args.scale_factor,
+        coordinate_scale=args.coordinate_scale,
+        include_cofactors=not args.no_cofactors,
+        apply_layout=not args.no_layout,
+        offline=args.offline,
+        compression=args.compression,
+        skip_unchanged=args.changed_only,
+    )
+
+    def progress(done, total, result):
+        if not args.quiet:
+            status = 'skipped' if result.skipped else ('ok' if result.success else 'FAILED')
+            print(f"[{done}/{total}] {os.path.basename(result.source)}: {status}", flush=True)
+
+    report = batch_import(args.inputs, args.output_dir, options,
+                          max_workers=args.jobs, recursive=args.recursive,
+                          progress_callback=progress)
+
+    if not report.results:
+        print("No SBML/KGML files found.")
+        return 1
+
+    summary = report.summary()
+    print(summary if not args.quiet else summary.splitlines()[-1])
+
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report.to_dict(), indent=2), encoding='utf-8')
+
+    return 1 if report.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
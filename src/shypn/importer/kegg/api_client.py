@@ -3,6 +3,12 @@
 This module provides functions to access the KEGG REST API
 and retrieve KGML (KEGG Markup Language) data for pathways.
 
+Requests go through the shared HTTP response cache (keep-alive
+connections, on-disk responses) and a token bucket shared by all clients.
+Flat-file entries are fetched in bulk, up to 10 ids per `get` request,
+and independent requests run concurrently on a small thread pool. Every
+bulk method also has an asyncio variant (suffix `_async`).
+
 API Documentation: https://www.kegg.jp/kegg/rest/keggapi.html
 
 ⚠️ ACADEMIC USE ONLY:
@@ -10,36 +16,137 @@ The KEGG API is provided for academic use only. Users must comply
 with KEGG's usage policies and cite KEGG appropriately in publications.
 """
 
-import urllib.request
-import urllib.error
-from typing import Optional, List, Tuple
-import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from shypn.utils.http_cache import HTTPCache, HTTPCacheError, get_http_cache
+from shypn.utils.rate_limit import RateLimiter
+
+
+logger = logging.getLogger(__name__)
+
+# KEGG asks clients to stay around 3 requests per second
+KEGG_RATE = 3.0
+KEGG_BURST = 3
+
+# Limiter shared by all clients (KEGG's limit applies per host, not per client)
+_shared_rate_limiter = RateLimiter(KEGG_RATE, burst=KEGG_BURST)
+
+
+def split_entries(text: str) -> Dict[str, str]:
+    """Split a multi-entry KEGG flat-file response into entries.
+    
+    Entries are terminated by a "///" line. Each entry is keyed by the
+    lower-cased identifiers on its ENTRY line (e.g. "r00710" for a
+    reaction, both "ec" and "2.7.1.1" for an enzyme), so callers can
+    match it against the ids they asked for.
+    
+    Args:
+        text: Response of a KEGG `get` request
+        
+    Returns:
+        Dict mapping identifier → entry text
+    """
+    entries = {}
+    block = []
+    for line in text.splitlines():
+        if line.strip() == '///':
+            _add_entry(entries, block)
+            block = []
+        else:
+            block.append(line)
+    _add_entry(entries, block)
+    return entries
+
+
+def _add_entry(entries: Dict[str, str], block: List[str]):
+    """Add one entry block to entries, keyed by its ENTRY line ids."""
+    for line in block:
+        if line.startswith('ENTRY'):
+            entry = '\n'.join(block) + '\n'
+            for token in line.split()[1:3]:
+                entries.setdefault(token.lower(), entry)
+            return
+
+
+def _bare_id(kegg_id: str) -> str:
+    """Lower-cased id without its database prefix ("rn:R00710" → "r00710")."""
+    return kegg_id.split(':', 1)[-1].strip().lower()
 
 
 class KEGGAPIClient:
-    """Client for accessing KEGG REST API."""
+    """Client for accessing KEGG REST API.
+    
+    Thread-safe. Sync methods block; `*_async` methods run the same
+    requests on the client's thread pool and can be awaited concurrently.
+    """
     
     BASE_URL = "https://rest.kegg.jp"
     
-    def __init__(self, timeout: int = 30):
+    # KEGG's limit on entries per `get` request
+    MAX_ENTRIES_PER_GET = 10
+    
+    # Concurrent requests per client (the rate limiter still applies)
+    DEFAULT_MAX_WORKERS = 4
+    
+    def __init__(self,
+                 timeout: int = 30,
+                 cache: Optional[HTTPCache] = None,
+                 rate: Optional[float] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
         """Initialize KEGG API client.
         
         Args:
             timeout: Request timeout in seconds (default: 30)
+            cache: HTTP response cache (default: shared cache under ~/.shypn/cache)
+            rate: Requests per second for this client alone
+                  (default: the limiter shared by all clients, 3/s)
+            max_workers: Maximum concurrent requests
         """
         self.timeout = timeout
-        self._last_request_time = 0.0
-        self._min_request_interval = 0.5  # Minimum 0.5s between requests (be nice to API)
+        self.cache = cache if cache is not None else get_http_cache()
+        self.rate_limiter = (
+            _shared_rate_limiter if rate is None else RateLimiter(rate, burst=KEGG_BURST)
+        )
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
     
     def _rate_limit(self):
         """Enforce rate limiting to be respectful to KEGG API."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        self.rate_limiter.acquire()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the client's thread pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="kegg-api"
+                )
+            return self._executor
+    
+    def _map(self, func: Callable, items: List) -> List:
+        """Apply func to items concurrently, preserving order."""
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        return list(self._get_executor().map(func, items))
+    
+    def close(self):
+        """Stop the client's thread pool."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
     
     def _make_request(self, url: str) -> Optional[str]:
-        """Make HTTP request with error handling.
+        """Make HTTP request (through the response cache) with error handling.
+        
+        Cached responses are returned without rate limiting; only requests
+        that reach the network are spaced out.
         
         Args:
             url: Full URL to request
@@ -47,17 +154,14 @@ class KEGGAPIClient:
         Returns:
             Response text or None on error
         """
-        self._rate_limit()
-        
         try:
-            with urllib.request.urlopen(url, timeout=self.timeout) as response:
-                return response.read().decode('utf-8')
-        except HTTPError as e:
+            response = self.cache.get(url, timeout=self.timeout, before_request=self._rate_limit)
+        except HTTPCacheError:
             return None
-        except URLError as e:
-            return None
-        except Exception as e:
+        
+        if not response.ok:
             return None
+        return response.text
     
     def fetch_kgml(self, pathway_id: str) -> Optional[str]:
         """Fetch KGML (XML) data for a pathway.
@@ -92,6 +196,113 @@ class KEGGAPIClient:
         url = f"{self.BASE_URL}/get/{pathway_id}"
         return self._make_request(url)
     
+    def get_entries(self,
+                    kegg_ids: Iterable[str],
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, str]:
+        """Fetch flat-file entries in bulk.
+        
+        Ids are sent MAX_ENTRIES_PER_GET at a time ("get/id1+id2+..."),
+        and the requests run concurrently under the rate limiter.
+        
+        Args:
+            kegg_ids: KEGG ids, with or without database prefix
+                      (e.g. "R00710", "rn:R00710", "cpd:C00031", "hsa00010")
+            progress_callback: Optional callback(completed_ids, total_ids)
+                               called as requests complete
+            
+        Returns:
+            Dict mapping each requested id that KEGG returned → entry text.
+            Ids that do not exist, or whose request failed, are absent.
+        """
+        ids = list(dict.fromkeys(kegg_ids))
+        chunks = [ids[i:i + self.MAX_ENTRIES_PER_GET]
+                  for i in range(0, len(ids), self.MAX_ENTRIES_PER_GET)]
+        completed = 0
+        lock = threading.Lock()
+        
+        def fetch_chunk(chunk):
+            nonlocal completed
+            found = self._get_chunk(chunk)
+            if progress_callback:
+                with lock:
+                    completed += len(chunk)
+                    progress_callback(completed, len(ids))
+            return found
+        
+        entries = {}
+        for found in self._map(fetch_chunk, chunks):
+            entries.update(found)
+        return entries
+    
+    def _get_chunk(self, chunk: List[str]) -> Dict[str, str]:
+        """Fetch up to MAX_ENTRIES_PER_GET entries with one request."""
+        url = f"{self.BASE_URL}/get/{'+'.join(chunk)}"
+        try:
+            response = self.cache.get(url, timeout=self.timeout, before_request=self._rate_limit)
+        except HTTPCacheError as e:
+            logger.warning(f"KEGG bulk get failed for {len(chunk)} ids: {e}")
+            return {}
+        
+        if response.status_code == 404:
+            return {}  # None of the ids exist
+        if not response.ok:
+            logger.warning(f"KEGG bulk get returned HTTP {response.status_code}")
+            return {}
+        
+        by_id = split_entries(response.text)
+        return {
+            kegg_id: by_id[_bare_id(kegg_id)]
+            for kegg_id in chunk if _bare_id(kegg_id) in by_id
+        }
+    
+    def fetch_kgml_many(self, pathway_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Fetch KGML for several pathways concurrently.
+        
+        KEGG serves one KGML document per request, so these are not
+        batched, only overlapped.
+        
+        Args:
+            pathway_ids: KEGG pathway IDs
+            
+        Returns:
+            Dict mapping pathway_id → KGML XML string (None on error)
+        """
+        ids = list(dict.fromkeys(pathway_ids))
+        return dict(zip(ids, self._map(self.fetch_kgml, ids)))
+    
+    async def _run_async(self, func: Callable, *args):
+        """Run a blocking client call on the client's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+    
+    async def fetch_kgml_async(self, pathway_id: str) -> Optional[str]:
+        """Asyncio variant of fetch_kgml()."""
+        return await self._run_async(self.fetch_kgml, pathway_id)
+    
+    async def fetch_pathway_info_async(self, pathway_id: str) -> Optional[str]:
+        """Asyncio variant of fetch_pathway_info()."""
+        return await self._run_async(self.fetch_pathway_info, pathway_id)
+    
+    async def fetch_kgml_many_async(self, pathway_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Asyncio variant of fetch_kgml_many()."""
+        ids = list(dict.fromkeys(pathway_ids))
+        results = await asyncio.gather(*(self.fetch_kgml_async(pid) for pid in ids))
+        return dict(zip(ids, results))
+    
+    async def get_entries_async(self, kegg_ids: Iterable[str]) -> Dict[str, str]:
+        """Asyncio variant of get_entries()."""
+        ids = list(dict.fromkeys(kegg_ids))
+        chunks = [ids[i:i + self.MAX_ENTRIES_PER_GET]
+                  for i in range(0, len(ids), self.MAX_ENTRIES_PER_GET)]
+        entries = {}
+        for found in await asyncio.gather(*(self._run_async(self._get_chunk, c) for c in chunks)):
+            entries.update(found)
+        return entries
+    
+    async def list_pathways_async(self, organism: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Asyncio variant of list_pathways()."""
+        return await self._run_async(self.list_pathways, organism)
+    
     def list_pathways(self, organism: Optional[str] = None) -> List[Tuple[str, str]]:
         """List available pathways.
         
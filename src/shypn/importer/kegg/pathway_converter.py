@@ -10,6 +10,7 @@ from .models import KEGGPathway, KEGGEntry
 from shypn.crossfetch.inference import HeuristicInferenceEngine
 from shypn.crossfetch.models import TransitionType
 from shypn.data.kegg_ec_fetcher import fetch_ec_numbers_parallel
+from shypn.utils.arc_index import build_arc_index, arcs_of
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -460,6 +461,9 @@ class StandardConversionStrategy(ConversionStrategy):
             }
         }
         
+        organism = pathway.org if hasattr(pathway, 'org') else "Homo sapiens"
+        targets = []
+        
         for transition in document.transitions:
             # Skip source/sink transitions
             if hasattr(transition, 'is_source') and transition.is_source:
@@ -488,14 +492,30 @@ class StandardConversionStrategy(ConversionStrategy):
                 if hasattr(reaction, 'id'):
                     transition.reaction_id = reaction.id
             
-            # Infer parameters using new engine
+            targets.append(transition)
+        
+        # Infer parameters for all transitions at once (shared lookups,
+        # stoichiometry from one pass over the arcs)
+        arc_index = build_arc_index(document.arcs)
+        try:
+            results = engine.infer_batch(
+                targets,
+                organism=organism,
+                arcs=document.arcs,
+                use_cache=False  # Don't use cache for import (fresh inference)
+            )
+        except Exception as e:
+            enhancement_stats['failed'] += len(targets)
+            logger.warning(f"Failed to enhance transitions: {e}", exc_info=True)
+            targets, results = [], []
+        
+        for transition, result in zip(targets, results):
+            if result.inference_metadata.get('error'):
+                # infer_batch isolates failures per transition
+                enhancement_stats['failed'] += 1
+                logger.warning(f"Failed to enhance {transition.name}: {result.inference_metadata['error']}")
+                continue
             try:
-                result = engine.infer_parameters(
-                    transition=transition,
-                    organism=pathway.org if hasattr(pathway, 'org') else "Homo sapiens",
-                    use_cache=False  # Don't use cache for import (fresh inference)
-                )
-                
                 # Apply inferred parameters to transition
                 params = result.parameters
                 
@@ -509,9 +529,9 @@ class StandardConversionStrategy(ConversionStrategy):
                         transition.properties['vmax'] = params.vmax
                         transition.properties['km'] = params.km
                         # Build rate function string
-                        substrate_places = [arc.source for arc in document.arcs if arc.target == transition]
-                        if substrate_places:
-                            s_id = substrate_places[0].id
+                        input_arcs, _ = arcs_of(arc_index, transition)
+                        if input_arcs:
+                            s_id = input_arcs[0].source.id
                             rate_func = f"({params.vmax} * {s_id}) / ({params.km} + {s_id})"
                             transition.properties['rate_function'] = rate_func
                     enhancement_stats['by_type']['continuous'] += 1
@@ -16,6 +16,7 @@ Main entry point:
 from shypn.layout.sscc.solar_system_layout_engine import SolarSystemLayoutEngine
 from shypn.layout.sscc.scc_detector import SCCDetector, StronglyConnectedComponent
 from shypn.layout.sscc.graph_builder import GraphBuilder
+from shypn.layout.sscc.csr_graph import CSRGraph
 from shypn.layout.sscc.mass_assigner import MassAssigner
 from shypn.layout.sscc.gravitational_simulator import GravitationalSimulator
 from shypn.layout.sscc.orbit_stabilizer import OrbitStabilizer
@@ -25,6 +26,7 @@ __all__ = [
     'SCCDetector',
     'StronglyConnectedComponent',
     'GraphBuilder',
+    'CSRGraph',
     'MassAssigner',
     'GravitationalSimulator',
     'OrbitStabilizer',
@@ -0,0 +1,374 @@
+"""CSR Graph - Array-backed adjacency for Petri net graph algorithms.
+
+This module provides a compressed sparse row (CSR) representation of the
+place/transition graph. It is built once per layout or analysis run and
+shared by the SCC detector, the mass assigners and the topology analyzers,
+instead of each of them rebuilding dict or NetworkX adjacency from arcs.
+
+Layout:
+    - Nodes are numbered 0..n-1 (places first, then transitions)
+    - indptr[i]:indptr[i+1] is the slice of `indices` holding the
+      successors of node i (arc order is preserved within a node)
+    - weights[k] is the weight of the arc stored at CSR position k
+
+Node identity is the Python object, not its id, so a place and a transition
+that happen to share an id never collapse into one node.
+
+Time complexity: O(V + E) to build, O(V + E) for SCC detection.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+
+
+KIND_PLACE = 0
+KIND_TRANSITION = 1
+
+
+class CSRGraph:
+    """Directed graph stored as CSR arrays.
+
+    Attributes:
+        node_ids: List mapping node index to object ID
+        objects: List mapping node index to Place/Transition object (or None)
+        kinds: uint8 array, KIND_PLACE or KIND_TRANSITION per node
+        indptr: int64 array of length n + 1
+        indices: int32 array of successor node indices (length m)
+        weights: float64 array of arc weights in CSR order (length m)
+        edge_arcs: List mapping CSR position to Arc object (or None)
+    """
+
+    def __init__(self,
+                 node_ids: List,
+                 kinds: np.ndarray,
+                 indptr: np.ndarray,
+                 indices: np.ndarray,
+                 weights: np.ndarray,
+                 objects: Optional[List] = None,
+                 edge_arcs: Optional[List] = None,
+                 arc_order: Optional[np.ndarray] = None):
+        """Initialize from prebuilt arrays (use the from_* constructors).
+
+        Args:
+            node_ids: Object ID per node index
+            kinds: Node kind per node index
+            indptr: CSR row pointer
+            indices: CSR column indices (successors)
+            weights: Edge weights in CSR order
+            objects: Optional object per node index
+            edge_arcs: Optional Arc per CSR position
+            arc_order: Optional CSR position of each edge in insertion order
+        """
+        self.node_ids = node_ids
+        self.kinds = kinds
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.objects = objects if objects is not None else [None] * len(node_ids)
+        self.edge_arcs = edge_arcs if edge_arcs is not None else [None] * len(indices)
+        self._arc_order = arc_order
+        self._index: Optional[Dict] = None
+        self._reverse: Optional['CSRGraph'] = None
+
+    @classmethod
+    def from_petri_net(cls, places, transitions, arcs) -> 'CSRGraph':
+        """Build CSR graph from Petri net objects.
+
+        Arcs whose source or target is not among the given places and
+        transitions are ignored.
+
+        Args:
+            places: Iterable of Place objects
+            transitions: Iterable of Transition objects
+            arcs: Iterable of Arc objects
+
+        Returns:
+            CSRGraph with objects and edge_arcs populated
+        """
+        objects = list(places)
+        num_places = len(objects)
+        objects.extend(transitions)
+        n = len(objects)
+
+        position = {id(obj): i for i, obj in enumerate(objects)}
+        kinds = np.full(n, KIND_TRANSITION, dtype=np.uint8)
+        kinds[:num_places] = KIND_PLACE
+
+        sources = []
+        targets = []
+        weights = []
+        edge_arcs = []
+        for arc in arcs:
+            source = position.get(id(arc.source))
+            target = position.get(id(arc.target))
+            if source is None or target is None:
+                continue
+            sources.append(source)
+            targets.append(target)
+            weights.append(getattr(arc, 'weight', 1))
+            edge_arcs.append(arc)
+
+        graph = cls._from_edge_lists(
+            [obj.id for obj in objects], kinds, sources, targets, weights, edge_arcs
+        )
+        graph.objects = objects
+        return graph
+
+    @classmethod
+    def from_id_references(cls, places, transitions, arcs) -> 'CSRGraph':
+        """Build CSR graph from objects whose arcs reference endpoints by ID.
+
+        Used for analysis models (topology analyzers) where arcs expose
+        source_id/target_id rather than object references. Nodes are keyed
+        by object ID; arcs with unknown endpoint IDs are ignored.
+
+        Args:
+            places: Iterable of objects with .id
+            transitions: Iterable of objects with .id
+            arcs: Iterable of objects with .source_id and .target_id
+
+        Returns:
+            CSRGraph with objects and edge_arcs populated
+        """
+        objects = list(places)
+        num_places = len(objects)
+        objects.extend(transitions)
+        n = len(objects)
+
+        position = {}
+        for i, obj in enumerate(objects):
+            position.setdefault(obj.id, i)
+        kinds = np.full(n, KIND_TRANSITION, dtype=np.uint8)
+        kinds[:num_places] = KIND_PLACE
+
+        sources = []
+        targets = []
+        weights = []
+        edge_arcs = []
+        for arc in arcs:
+            source = position.get(arc.source_id)
+            target = position.get(arc.target_id)
+            if source is None or target is None:
+                continue
+            sources.append(source)
+            targets.append(target)
+            weights.append(getattr(arc, 'weight', 1))
+            edge_arcs.append(arc)
+
+        graph = cls._from_edge_lists(
+            [obj.id for obj in objects], kinds, sources, targets, weights, edge_arcs
+        )
+        graph.objects = objects
+        return graph
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Dict, kinds: Optional[Dict] = None) -> 'CSRGraph':
+        """Build CSR graph from a dict adjacency list {node_id: [target_ids]}.
+
+        Targets that are not keys of the adjacency dict are ignored.
+
+        Args:
+            adjacency: Dict mapping node ID to list of target IDs
+            kinds: Optional dict mapping node ID to KIND_PLACE/KIND_TRANSITION
+
+        Returns:
+            CSRGraph (objects and edge_arcs are None)
+        """
+        node_ids = list(adjacency.keys())
+        position = {node_id: i for i, node_id in enumerate(node_ids)}
+
+        sources = []
+        targets = []
+        for node_id, successors in adjacency.items():
+            source = position[node_id]
+            for target_id in successors:
+                target = position.get(target_id)
+                if target is not None:
+                    sources.append(source)
+                    targets.append(target)
+
+        kind_array = np.full(len(node_ids), KIND_PLACE, dtype=np.uint8)
+        if kinds:
+            for node_id, kind in kinds.items():
+                if node_id in position:
+                    kind_array[position[node_id]] = kind
+
+        return cls._from_edge_lists(
+            node_ids, kind_array, sources, targets, [1.0] * len(sources), None
+        )
+
+    @classmethod
+    def _from_edge_lists(cls, node_ids, kinds, sources, targets, weights, edge_arcs) -> 'CSRGraph':
+        """Assemble CSR arrays from parallel edge lists (stable per source)."""
+        n = len(node_ids)
+        source_array = np.asarray(sources, dtype=np.int64)
+        target_array = np.asarray(targets, dtype=np.int32)
+        weight_array = np.asarray(weights, dtype=np.float64)
+
+        # Stable sort keeps arc order among the successors of each node
+        order = np.argsort(source_array, kind='stable')
+        counts = np.bincount(source_array, minlength=n) if n else np.zeros(0, dtype=np.int64)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        csr_arcs = [edge_arcs[k] for k in order.tolist()] if edge_arcs is not None else None
+        arc_order = np.empty_like(order)
+        arc_order[order] = np.arange(len(order))
+
+        return cls(
+            node_ids=node_ids,
+            kinds=kinds,
+            indptr=indptr,
+            indices=target_array[order],
+            weights=weight_array[order],
+            edge_arcs=csr_arcs,
+            arc_order=arc_order
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of edges (parallel arcs are counted separately)."""
+        return len(self.indices)
+
+    def index_of(self, node_id) -> Optional[int]:
+        """Get the node index for an object ID (first match), or None."""
+        if self._index is None:
+            self._index = {}
+            for i, node_id_at in enumerate(self.node_ids):
+                self._index.setdefault(node_id_at, i)
+        return self._index.get(node_id)
+
+    def out_degree(self) -> np.ndarray:
+        """Out-degree per node index."""
+        return np.diff(self.indptr)
+
+    def in_degree(self) -> np.ndarray:
+        """In-degree per node index."""
+        return np.bincount(self.indices, minlength=self.num_nodes)
+
+    def successors(self, i: int) -> np.ndarray:
+        """Successor node indices of node i."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def reverse(self) -> 'CSRGraph':
+        """Transposed graph (all edges reversed), cached."""
+        if self._reverse is None:
+            sources = np.repeat(np.arange(self.num_nodes, dtype=np.int64), self.out_degree())
+            self._reverse = CSRGraph._from_edge_lists(
+                self.node_ids, self.kinds,
+                self.indices.astype(np.int64), sources.astype(np.int32),
+                self.weights, self.edge_arcs
+            )
+            self._reverse.objects = self.objects
+        return self._reverse
+
+    def iter_edges(self) -> Iterator[Tuple[int, int, float, object]]:
+        """Iterate (source_index, target_index, weight, arc) in insertion order."""
+        sources = np.repeat(np.arange(self.num_nodes), self.out_degree()).tolist()
+        indices = self.indices.tolist()
+        weights = self.weights.tolist()
+        order = self._arc_order.tolist() if self._arc_order is not None else range(len(indices))
+        for k in order:
+            yield sources[k], indices[k], weights[k], self.edge_arcs[k]
+
+    def to_adjacency_dict(self) -> Dict:
+        """Dict adjacency list {node_id: [target_ids]} (legacy format)."""
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        node_ids = self.node_ids
+        return {
+            node_ids[i]: [node_ids[j] for j in indices[indptr[i]:indptr[i + 1]]]
+            for i in range(self.num_nodes)
+        }
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """Find strongly connected components with an iterative Tarjan.
+
+        Uses an explicit call stack and per-node edge cursors instead of
+        recursion, so arbitrarily long chains do not hit Python's recursion
+        limit. Components are returned in the same order as the recursive
+        formulation (reverse topological order of the condensation).
+
+        Returns:
+            List of components, each a list of node indices
+        """
+        n = self.num_nodes
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+
+        index = [-1] * n
+        lowlink = [0] * n
+        on_stack = [False] * n
+        cursor = [0] * n
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            cursor[root] = indptr[root]
+            call_stack = [root]
+
+            while call_stack:
+                v = call_stack[-1]
+                e = cursor[v]
+                end = indptr[v + 1]
+                descended = False
+
+                while e < end:
+                    w = indices[e]
+                    e += 1
+                    if index[w] == -1:
+                        # Tree edge: "recurse" into w
+                        cursor[v] = e
+                        index[w] = lowlink[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        cursor[w] = indptr[w]
+                        call_stack.append(w)
+                        descended = True
+                        break
+                    elif on_stack[w] and index[w] < lowlink[v]:
+                        lowlink[v] = index[w]
+
+                if descended:
+                    continue
+
+                # All successors of v done: "return" to parent
+                call_stack.pop()
+                if call_stack:
+                    parent = call_stack[-1]
+                    if lowlink[v] < lowlink[parent]:
+                        lowlink[parent] = lowlink[v]
+
+                if lowlink[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+
+        return components
+
+    def get_graph_stats(self) -> Dict[str, float]:
+        """Get node count, edge count and average degree."""
+        return {
+            'num_nodes': self.num_nodes,
+            'num_edges': self.num_edges,
+            'avg_degree': self.num_edges / self.num_nodes if self.num_nodes > 0 else 0
+        }
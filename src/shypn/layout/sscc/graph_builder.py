@@ -2,10 +2,15 @@
 
 This module builds a directed graph representation from Petri net objects
 (places, transitions, arcs) for use in SCC detection and layout algorithms.
+
+The primary representation is a CSRGraph (array-backed adjacency), built
+once per layout run and shared by the SCC detector and mass assigners.
+The dict adjacency list is kept for callers that expect it.
 """
 
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 from shypn.netobjs import Place, Transition, Arc
+from shypn.layout.sscc.csr_graph import CSRGraph
 
 
 class GraphBuilder:
@@ -22,6 +27,25 @@ class GraphBuilder:
         """Initialize graph builder."""
         self._graph: Dict[int, List[int]] = {}
         self.id_to_object: Dict[int, any] = {}  # Public: expose for SCC detector
+        self.csr: Optional[CSRGraph] = None  # Public: last built CSR graph
+    
+    def build_csr(self, places: List[Place], transitions: List[Transition],
+                  arcs: List[Arc]) -> CSRGraph:
+        """Build array-backed (CSR) directed graph from Petri net objects.
+        
+        Args:
+            places: List of Place objects
+            transitions: List of Transition objects
+            arcs: List of Arc objects connecting places and transitions
+            
+        Returns:
+            CSRGraph with node objects and arc references
+        """
+        self.csr = CSRGraph.from_petri_net(places, transitions, arcs)
+        self.id_to_object = {}
+        for obj in self.csr.objects:
+            self.id_to_object[obj.id] = obj
+        return self.csr
     
     def build_graph(self, places: List[Place], transitions: List[Transition], 
                     arcs: List[Arc]) -> Dict[int, List[int]]:
@@ -42,26 +66,7 @@ class GraphBuilder:
                 3: []       # Node 3 has no outgoing edges
             }
         """
-        self._graph = {}
-        self.id_to_object = {}
-        
-        # Add all nodes (places and transitions)
-        for place in places:
-            self._graph[place.id] = []
-            self.id_to_object[place.id] = place
-        
-        for transition in transitions:
-            self._graph[transition.id] = []
-            self.id_to_object[transition.id] = transition
-        
-        # Add all edges (arcs)
-        for arc in arcs:
-            source_id = arc.source.id
-            target_id = arc.target.id
-            
-            if source_id in self._graph:
-                self._graph[source_id].append(target_id)
-        
+        self._graph = self.build_csr(places, transitions, arcs).to_adjacency_dict()
         return self._graph
     
     def get_object_by_id(self, obj_id: int):
@@ -6,8 +6,9 @@ When no SCCs (cycles) are detected, this assigns higher masses to hub nodes
 This is an ADAPTATION for networks without feedback loops.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from shypn.netobjs import Place, Transition, Arc
+from shypn.layout.sscc.csr_graph import CSRGraph
 from shypn.layout.sscc.strongly_connected_component import StronglyConnectedComponent
 
 
@@ -47,7 +48,8 @@ class HubBasedMassAssigner:
     def assign_masses(self, sccs: List[StronglyConnectedComponent],
                       places: List[Place], 
                       transitions: List[Transition],
-                      arcs: List[Arc]) -> Dict[int, float]:
+                      arcs: List[Arc],
+                      graph: Optional[CSRGraph] = None) -> Dict[int, float]:
         """Assign masses based on hub detection.
         
         Args:
@@ -55,6 +57,8 @@ class HubBasedMassAssigner:
             places: List of Place objects
             transitions: List of Transition objects
             arcs: List of Arc objects (to calculate degree)
+            graph: Optional prebuilt CSRGraph of the same net; degrees are
+                then read from its arrays instead of rescanning arcs
             
         Returns:
             Dict mapping object ID to mass value
@@ -71,7 +75,10 @@ class HubBasedMassAssigner:
                     masses[node_id] = self.MASS_SCC_NODE
         
         # Calculate node degrees
-        in_degree, out_degree = self._calculate_degrees(places, transitions, arcs)
+        if graph is not None:
+            in_degree, out_degree = self._degrees_from_graph(graph)
+        else:
+            in_degree, out_degree = self._calculate_degrees(places, transitions, arcs)
         
         # Assign masses to places based on degree
         for place in places:
@@ -150,6 +157,20 @@ class HubBasedMassAssigner:
         
         return in_degree, out_degree
     
+    def _degrees_from_graph(self, graph: CSRGraph) -> tuple:
+        """Read in-degree and out-degree for all nodes from a CSR graph.
+        
+        Args:
+            graph: CSRGraph built from the same places/transitions/arcs
+            
+        Returns:
+            Tuple of (in_degree dict, out_degree dict)
+        """
+        node_ids = graph.node_ids
+        in_degree = dict(zip(node_ids, graph.in_degree().tolist()))
+        out_degree = dict(zip(node_ids, graph.out_degree().tolist()))
+        return in_degree, out_degree
+    
     def get_hub_statistics(self) -> Dict[str, List[tuple]]:
         """Get hub classification statistics.
         
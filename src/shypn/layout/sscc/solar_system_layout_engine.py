@@ -45,7 +45,9 @@ class SolarSystemLayoutEngine:
                  scc_radius: float = 50.0,
                  planet_orbit: float = 300.0,
                  satellite_orbit: float = 50.0,
-                 progress_callback: Optional[Callable[[str, float], None]] = None):
+                 progress_callback: Optional[Callable[[str, float], None]] = None,
+                 preview_callback: Optional[Callable[[int, int, Dict], None]] = None,
+                 preview_interval: int = 50):
         """Initialize Solar System Layout engine.
         
         Args:
@@ -56,6 +58,9 @@ class SolarSystemLayoutEngine:
             planet_orbit: Base orbital radius for places (default: 300.0)
             satellite_orbit: Orbital radius for transitions (default: 50.0)
             progress_callback: Optional callback(stage, progress) for UI updates
+            preview_callback: Optional callback(iteration, total, positions) with
+                intermediate physics positions (for animated preview)
+            preview_interval: Iterations between preview callbacks (default: 50)
         """
         self.iterations = iterations
         self.use_arc_weight = use_arc_weight
@@ -64,6 +69,8 @@ class SolarSystemLayoutEngine:
         self.planet_orbit = planet_orbit
         self.satellite_orbit = satellite_orbit
         self.progress_callback = progress_callback
+        self.preview_callback = preview_callback
+        self.preview_interval = preview_interval
         
         # Initialize components
         self.graph_builder = GraphBuilder()
@@ -131,18 +138,19 @@ class SolarSystemLayoutEngine:
             transitions: List of transitions
             arcs: List of arcs
         """
-        # Build directed graph
-        graph = self.graph_builder.build_graph(places, transitions, arcs)
-        id_to_object = self.graph_builder.id_to_object
+        # Build directed graph once (CSR arrays), shared by all phases below
+        graph = self.graph_builder.build_csr(places, transitions, arcs)
         
         # Detect strongly connected components (cycles)
-        self.sccs = self.scc_detector.find_sccs(graph, id_to_object)
+        self.sccs = self.scc_detector.find_sccs(graph)
         
         # Assign gravitational masses
         if self.use_hub_masses:
             # NEW: Use hub-based mass assignment
             # High-degree nodes get higher masses, making them gravitational centers
-            self.masses = self.hub_mass_assigner.assign_masses(self.sccs, places, transitions, arcs)
+            self.masses = self.hub_mass_assigner.assign_masses(
+                self.sccs, places, transitions, arcs, graph=graph
+            )
         else:
             # Original: Simple SCC-based mass assignment
             self.masses = self.mass_assigner.assign_masses(self.sccs, places, transitions)
@@ -180,7 +188,9 @@ class SolarSystemLayoutEngine:
             masses=self.masses,
             iterations=self.iterations,
             progress_callback=self.progress_callback,
-            sccs=self.sccs  # Pass SCCs for cohesion forces (black hole effect)
+            sccs=self.sccs,  # Pass SCCs for cohesion forces (black hole effect)
+            preview_callback=self.preview_callback,
+            preview_interval=self.preview_interval
         )
     
     def _stabilize_orbits(self, places: List[Place], transitions: List[Transition]):
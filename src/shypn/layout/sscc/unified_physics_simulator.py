@@ -239,7 +239,9 @@ class UnifiedPhysicsSimulator:
                  masses: Dict[int, float],
                  iterations: int = 1000,
                  progress_callback=None,
-                 sccs: List = None) -> Dict[int, Tuple[float, float]]:
+                 sccs: List = None,
+                 preview_callback=None,
+                 preview_interval: int = 50) -> Dict[int, Tuple[float, float]]:
         """Run physics simulation to optimize layout.
         
         Args:
@@ -249,6 +251,11 @@ class UnifiedPhysicsSimulator:
             iterations: Number of simulation steps
             progress_callback: Optional callback(iteration, total)
             sccs: Optional list of SCCs for cohesion forces
+            preview_callback: Optional callback(iteration, total, positions)
+                called every preview_interval iterations with the live
+                positions dict (used for animated preview of background
+                layouts; may raise to abort the simulation)
+            preview_interval: Iterations between preview callbacks
         
         Returns:
             Optimized positions {node_id: (x, y)}
@@ -310,6 +317,10 @@ class UnifiedPhysicsSimulator:
             # Progress callback
             if progress_callback and iteration % 10 == 0:
                 progress_callback(iteration, iterations)
+            
+            # Intermediate positions for animated preview
+            if preview_callback and preview_interval > 0 and (iteration + 1) % preview_interval == 0:
+                preview_callback(iteration + 1, iterations, positions)
         
         return positions
     
@@ -140,6 +140,8 @@ def _get_loader(offline_mode: bool = False) -> KineticsEnhancementLoader:
     """
     global _loader, _offline_mode
     if _loader is None or _offline_mode != offline_mode:
+        if _loader is not None:
+            _loader.assigner.close()
         _loader = KineticsEnhancementLoader(offline_mode=offline_mode)
         _offline_mode = offline_mode
     return _loader
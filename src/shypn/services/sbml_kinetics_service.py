@@ -20,6 +20,7 @@ from typing import List, Dict, Optional, Tuple
 import logging
 
 from shypn.data.pathway.pathway_data import PathwayData, Reaction, KineticLaw
+from shypn.engine.expression_compiler import rename_identifiers
 from shypn.data.kinetics import (
     SBMLKineticMetadata,
     KineticMetadata,
@@ -222,16 +223,23 @@ class SBMLKineticsIntegrationService:
         
         return species_map
     
-    def _translate_formula_to_petri_net(self, formula: str) -> str:
+    def _translate_formula_to_petri_net(self, formula: str, used_species: Optional[set] = None) -> str:
         """
         Translate SBML formula from biological names to Petri net place names.
         
+        The formula is parsed once and each identifier is looked up in the
+        species map (whole identifiers only: "ADP" but not "ADPK" or "mADP").
+        Replacements are not re-scanned, so a species named like a place
+        ("P5") cannot be renamed twice. The compiled result is cached for
+        the simulation engine.
+        
         Example:
             Input:  "cytosol * V10m * ADP * PEP / ((K10PEP + PEP) * (K10ADP + ADP))"
             Output: "cytosol * V10m * P5 * P8 / ((K10PEP + P8) * (K10ADP + P5))"
         
         Args:
             formula: SBML formula with species names
+            used_species: Optional set; receives the species ids found in the formula
         
         Returns:
             Translated formula with place names (P1, P2, P3...)
@@ -239,22 +247,7 @@ class SBMLKineticsIntegrationService:
         if not formula or not self.species_to_place_map:
             return formula
         
-        translated = formula
-        
-        # Sort species by length (descending) to avoid partial replacements
-        # Example: Replace "ATP" before "AT" to avoid "ATP" → "P3P"
-        sorted_species = sorted(self.species_to_place_map.keys(), key=len, reverse=True)
-        
-        for species_id in sorted_species:
-            place_name = self.species_to_place_map[species_id]
-            
-            # Use word boundary replacement to avoid partial matches
-            # Replace "ADP" but not "ADPK" or "mADP"
-            import re
-            pattern = r'\b' + re.escape(species_id) + r'\b'
-            translated = re.sub(pattern, place_name, translated)
-        
-        return translated
+        return rename_identifiers(formula, self.species_to_place_map, used_species)
     
     def _should_preserve_existing(self, transition) -> bool:
         """
@@ -340,12 +333,18 @@ class SBMLKineticsIntegrationService:
                 transition.properties['rate_function_display'] = kinetic_law.formula
                 
                 # Translate formula to Petri net notation (for simulation)
-                translated_formula = self._translate_formula_to_petri_net(kinetic_law.formula)
+                used_species = set()
+                translated_formula = self._translate_formula_to_petri_net(
+                    kinetic_law.formula, used_species
+                )
                 transition.properties['rate_function'] = translated_formula
                 
-                # Store species mapping for reference
+                # Store mapping of the species this formula uses, for reference
                 if self.species_to_place_map:
-                    transition.properties['species_map'] = self.species_to_place_map.copy()
+                    transition.properties['species_map'] = {
+                        species_id: self.species_to_place_map[species_id]
+                        for species_id in sorted(used_species)
+                    }
                 
                 self.logger.debug(
                     f"Set rate formulas for {transition.name}:"
@@ -4,6 +4,10 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 import time
 
+import networkx as nx
+
+from shypn.layout.sscc.csr_graph import CSRGraph, KIND_PLACE
+
 from .analysis_result import AnalysisResult
 from .exceptions import InvalidModelError
 
@@ -44,6 +48,8 @@ class TopologyAnalyzer(ABC):
         self._cache: Dict[str, Any] = {}
         self._dirty: bool = True
         self._last_analysis_time: Optional[float] = None
+        self._graph: Optional[nx.DiGraph] = None
+        self._csr_graph: Optional[CSRGraph] = None
     
     @abstractmethod
     def analyze(self, **kwargs) -> AnalysisResult:
@@ -70,6 +76,8 @@ class TopologyAnalyzer(ABC):
         """
         self._cache.clear()
         self._dirty = True
+        self._graph = None
+        self._csr_graph = None
     
     def invalidate(self) -> None:
         """Mark cache as dirty without clearing.
@@ -78,6 +86,8 @@ class TopologyAnalyzer(ABC):
         that just marks the cache as needing refresh.
         """
         self._dirty = True
+        self._graph = None
+        self._csr_graph = None
     
     def is_cached(self, key: str) -> bool:
         """Check if a result is cached.
@@ -114,6 +124,57 @@ class TopologyAnalyzer(ABC):
         self._cache[key] = value
         self._dirty = False
     
+    def _get_csr_graph(self) -> CSRGraph:
+        """Get the array-backed (CSR) graph of the model.
+        
+        Built once per analyzer and reused by every query until
+        clear_cache() or invalidate() is called.
+        
+        Returns:
+            CSRGraph of places/transitions/arcs
+        """
+        if self._csr_graph is None:
+            self._csr_graph = CSRGraph.from_id_references(
+                self.model.places, self.model.transitions, self.model.arcs
+            )
+        return self._csr_graph
+    
+    def _build_graph(self) -> nx.DiGraph:
+        """Build directed graph from Petri net.
+        
+        Creates a NetworkX DiGraph where:
+        - Nodes are places and transitions (identified by ID)
+        - Edges are arcs (source → target)
+        - Node attributes include type ('place' or 'transition') and object reference
+        - Edge attributes include arc object reference and weight
+        
+        The graph is assembled in bulk from the shared CSR graph and cached
+        until clear_cache() or invalidate() is called, so analyzers that
+        answer many per-node queries do not rebuild it each time.
+        Callers must not mutate the returned graph.
+        
+        Returns:
+            NetworkX DiGraph representation of the Petri net
+        """
+        if self._graph is None:
+            csr = self._get_csr_graph()
+            node_ids = csr.node_ids
+            graph = nx.DiGraph()
+            graph.add_nodes_from(
+                (node_id, {
+                    'type': 'place' if kind == KIND_PLACE else 'transition',
+                    'obj': obj,
+                    'name': getattr(obj, 'name', f"{'P' if kind == KIND_PLACE else 'T'}{node_id}")
+                })
+                for node_id, kind, obj in zip(node_ids, csr.kinds.tolist(), csr.objects)
+            )
+            graph.add_edges_from(
+                (node_ids[source], node_ids[target], {'obj': arc, 'weight': getattr(arc, 'weight', 1)})
+                for source, target, _, arc in csr.iter_edges()
+            )
+            self._graph = graph
+        return self._graph
+    
     def _start_timer(self) -> float:
         """Start timing analysis.
         
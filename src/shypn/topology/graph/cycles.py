@@ -130,49 +130,6 @@ class CycleAnalyzer(TopologyAnalyzer):
                 metadata={'analysis_time': self._end_timer(start_time)}
             )
     
-    def _build_graph(self) -> nx.DiGraph:
-        """Build directed graph from Petri net.
-        
-        Creates a NetworkX DiGraph where:
-        - Nodes are places and transitions (identified by ID)
-        - Edges are arcs (source → target)
-        - Node attributes include type ('place' or 'transition') and object reference
-        - Edge attributes include arc object reference
-        
-        Returns:
-            NetworkX DiGraph representation of the Petri net
-        """
-        graph = nx.DiGraph()
-        
-        # Add place nodes
-        for place in self.model.places:
-            graph.add_node(
-                place.id,
-                type='place',
-                obj=place,
-                name=getattr(place, 'name', f'P{place.id}')
-            )
-        
-        # Add transition nodes
-        for transition in self.model.transitions:
-            graph.add_node(
-                transition.id,
-                type='transition',
-                obj=transition,
-                name=getattr(transition, 'name', f'T{transition.id}')
-            )
-        
-        # Add arc edges
-        for arc in self.model.arcs:
-            graph.add_edge(
-                arc.source_id,
-                arc.target_id,
-                obj=arc,
-                weight=getattr(arc, 'weight', 1)
-            )
-        
-        return graph
-    
     def _analyze_cycle(self, cycle_nodes: List[int]) -> Dict[str, Any]:
         """Analyze a single cycle.
         
@@ -256,39 +256,6 @@ class PathAnalyzer(TopologyAnalyzer):
                 metadata={'analysis_time': self._end_timer(start_time)}
             )
     
-    def _build_graph(self) -> nx.DiGraph:
-        """Build directed graph from Petri net."""
-        graph = nx.DiGraph()
-        
-        # Add place nodes
-        for place in self.model.places:
-            graph.add_node(
-                place.id,
-                type='place',
-                obj=place,
-                name=getattr(place, 'name', f'P{place.id}')
-            )
-        
-        # Add transition nodes
-        for transition in self.model.transitions:
-            graph.add_node(
-                transition.id,
-                type='transition',
-                obj=transition,
-                name=getattr(transition, 'name', f'T{transition.id}')
-            )
-        
-        # Add arc edges
-        for arc in self.model.arcs:
-            graph.add_edge(
-                arc.source_id,
-                arc.target_id,
-                obj=arc,
-                weight=getattr(arc, 'weight', 1)
-            )
-        
-        return graph
-    
     def _analyze_path(self, path_nodes: List[int], graph: nx.DiGraph) -> Dict[str, Any]:
         """Analyze a single path.
         
@@ -345,21 +312,26 @@ class PathAnalyzer(TopologyAnalyzer):
         start_time: float
     ) -> AnalysisResult:
         """Analyze general path properties of the network."""
+        # Strong connectivity from the shared CSR graph (iterative Tarjan)
+        csr = self._get_csr_graph()
+        components = csr.strongly_connected_components()
+        is_connected = len(components) == 1
+        
         # Calculate diameter (longest shortest path)
         try:
-            if nx.is_strongly_connected(graph):
+            if is_connected:
                 diameter = nx.diameter(graph)
             else:
                 # For disconnected graphs, use largest component
-                largest_cc = max(nx.strongly_connected_components(graph), key=len)
-                subgraph = graph.subgraph(largest_cc)
+                largest_cc = max(components, key=len)
+                subgraph = graph.subgraph(csr.node_ids[i] for i in largest_cc)
                 diameter = nx.diameter(subgraph) if len(largest_cc) > 1 else 0
         except:
             diameter = 0
         
         # Calculate average shortest path length
         try:
-            if nx.is_strongly_connected(graph):
+            if is_connected:
                 avg_path_length = nx.average_shortest_path_length(graph)
             else:
                 avg_path_length = 0
@@ -374,7 +346,7 @@ class PathAnalyzer(TopologyAnalyzer):
             data={
                 'diameter': diameter,
                 'average_path_length': avg_path_length,
-                'is_connected': nx.is_strongly_connected(graph),
+                'is_connected': is_connected,
             },
             summary=summary,
             metadata={
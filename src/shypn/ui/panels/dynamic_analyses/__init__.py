@@ -7,6 +7,7 @@ during simulation, organized into collapsible categories:
 1. Transitions - Real-time transition firing rates/counts
 2. Places - Real-time place marking evolution  
 3. Diagnostics - Runtime performance metrics
+4. Performance - Simulation step timings and counters
 
 Author: Simão Eugénio
 Date: 2025-10-29
@@ -16,10 +17,12 @@ from .dynamic_analyses_panel import DynamicAnalysesPanel
 from .transitions_category import TransitionsCategory
 from .places_category import PlacesCategory
 from .diagnostics_category import DiagnosticsCategory
+from .performance_category import PerformanceCategory
 
 __all__ = [
     'DynamicAnalysesPanel',
     'TransitionsCategory',
     'PlacesCategory',
     'DiagnosticsCategory',
+    'PerformanceCategory',
 ]
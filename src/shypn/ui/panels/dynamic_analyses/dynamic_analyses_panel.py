@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """Dynamic Analyses Panel - Main container for real-time visualization.
 
-This panel contains three categories:
+This panel contains four categories:
 1. Transitions - Real-time transition firing rate plots
 2. Places - Real-time place token evolution plots
 3. Diagnostics - Runtime performance metrics
+4. Performance - Simulation step timings and counters
 
 Author: Simão Eugénio
 Date: 2025-10-29
@@ -17,15 +18,17 @@ from gi.repository import Gtk
 from .transitions_category import TransitionsCategory
 from .places_category import PlacesCategory
 from .diagnostics_category import DiagnosticsCategory
+from .performance_category import PerformanceCategory
 
 
 class DynamicAnalysesPanel(Gtk.Box):
-    """Main dynamic analyses panel with three categories.
+    """Main dynamic analyses panel with four categories.
     
     Organizes real-time visualization into categories:
     - Transitions: Firing rate plots with search
     - Places: Token evolution plots with search
     - Diagnostics: Performance metrics
+    - Performance: Simulation step timings and counters
     
     Each category is collapsible and can be expanded independently.
     """
@@ -88,11 +91,18 @@ class DynamicAnalysesPanel(Gtk.Box):
             expanded=True  # Expanded by default
         )
         
+        self.performance_category = PerformanceCategory(
+            model=self.model,
+            data_collector=self.data_collector,
+            expanded=False  # Collapsed: timings are off until enabled
+        )
+        
         # Store categories in list for easy iteration
         self.categories = [
             self.transitions_category,
             self.places_category,
             self.diagnostics_category,
+            self.performance_category,
         ]
         
         # Set parent panel reference for all categories (for report notifications)
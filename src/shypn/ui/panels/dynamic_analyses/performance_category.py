@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Performance Category - Live simulation step timings and counters.
+
+This category shows the controller's StepProfiler: steps per second,
+time per step phase and event counters, refreshed while a simulation
+runs. Collection is off until enabled here, and a cProfile capture of
+the next steps can be requested.
+"""
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, GLib, Pango
+
+from .base_dynamic_category import BaseDynamicCategory
+
+
+class PerformanceCategory(BaseDynamicCategory):
+    """Category for live simulation performance statistics.
+
+    The simulation controller is taken from the data collector, which
+    records the controller driving it on every step.
+
+    Features:
+    - Toggle for per-phase step timers and counters
+    - Text view refreshed every REFRESH_MS while collecting
+    - Capture button: cProfile over the next CAPTURE_STEPS steps
+    """
+
+    REFRESH_MS = 500
+    CAPTURE_STEPS = 200
+
+    def __init__(self, model=None, data_collector=None, expanded=False):
+        """Initialize performance category.
+
+        Args:
+            model: ModelCanvasManager instance (optional)
+            data_collector: SimulationDataCollector instance (optional)
+            expanded: Whether category starts expanded
+        """
+        self.update_timer = None
+        self._capture_view = None  # None, 'pending' or 'report'
+        super().__init__(
+            title='PERFORMANCE',
+            model=model,
+            data_collector=data_collector,
+            expanded=expanded
+        )
+
+    def _build_content(self):
+        """Build performance category content.
+
+        Returns:
+            Gtk.Box: Content widget with controls and statistics text
+        """
+        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        content_box.set_margin_top(6)
+        content_box.set_margin_bottom(6)
+        content_box.set_margin_start(6)
+        content_box.set_margin_end(6)
+
+        controls = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        self.enable_check = Gtk.CheckButton(label='Collect step timings')
+        self.enable_check.connect('toggled', self._on_enable_toggled)
+        controls.pack_start(self.enable_check, False, False, 0)
+
+        self.reset_button = Gtk.Button(label='Reset')
+        self.reset_button.connect('clicked', self._on_reset_clicked)
+        controls.pack_end(self.reset_button, False, False, 0)
+
+        self.capture_button = Gtk.Button(label='Profile')
+        self.capture_button.set_tooltip_text(
+            f'Run cProfile over the next {self.CAPTURE_STEPS} simulation steps')
+        self.capture_button.connect('clicked', self._on_capture_clicked)
+        controls.pack_end(self.capture_button, False, False, 0)
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_min_content_height(200)
+
+        self.textview = Gtk.TextView()
+        self.textview.set_editable(False)
+        self.textview.set_cursor_visible(False)
+        self.textview.set_left_margin(6)
+        self.textview.set_top_margin(6)
+        self.textview.override_font(Pango.FontDescription('Monospace 9'))
+        scrolled.add(self.textview)
+
+        content_box.pack_start(controls, False, False, 0)
+        content_box.pack_start(scrolled, True, True, 0)
+
+        self._set_text('Enable "Collect step timings" and run a simulation')
+        content_box.show_all()
+        return content_box
+
+    def _get_profiler(self):
+        """StepProfiler of the controller feeding the data collector, or None."""
+        controller = getattr(self.data_collector, 'controller', None)
+        return getattr(controller, 'profiler', None)
+
+    def _set_text(self, text):
+        self.textview.get_buffer().set_text(text)
+
+    def _on_enable_toggled(self, check):
+        self._capture_view = None
+        profiler = self._get_profiler()
+        if profiler:
+            profiler.enabled = check.get_active()
+        if check.get_active():
+            self._start_updates()
+        elif not (profiler and profiler.capture_pending):
+            self._stop_updates()
+        self.refresh()
+
+    def _on_reset_clicked(self, button):
+        profiler = self._get_profiler()
+        if profiler:
+            profiler.reset()
+        self._capture_view = None
+        self.refresh()
+
+    def _on_capture_clicked(self, button):
+        profiler = self._get_profiler()
+        if profiler is None:
+            self._set_text('No simulation has run in this document yet')
+            return
+        profiler.capture(steps=self.CAPTURE_STEPS)
+        self._capture_view = 'pending'
+        self._set_text(f'Profiling the next {self.CAPTURE_STEPS} steps...')
+        self._start_updates()
+
+    def _start_updates(self):
+        if self.update_timer is None:
+            self.update_timer = GLib.timeout_add(self.REFRESH_MS, self._on_update_timer)
+
+    def _stop_updates(self):
+        if self.update_timer is not None:
+            GLib.source_remove(self.update_timer)
+            self.update_timer = None
+
+    def _on_update_timer(self):
+        profiler = self._get_profiler()
+        if profiler and self.enable_check.get_active() and not profiler.enabled:
+            profiler.enabled = True  # Controller appeared after the toggle
+        self.refresh()
+        keep_running = self.enable_check.get_active() or bool(profiler and profiler.capture_pending)
+        if not keep_running:
+            self.update_timer = None
+        return keep_running
+
+    def refresh(self):
+        """Refresh statistics, or show the capture report once it is ready.
+
+        The report stays up until Reset or the timings toggle is used.
+        """
+        profiler = self._get_profiler()
+        if profiler is None:
+            return
+        if self._capture_view == 'pending' and not profiler.capture_pending:
+            self._capture_view = 'report'
+            self._set_text(profiler.capture_report(limit=30))
+        if self._capture_view:
+            return
+        if profiler.enabled or profiler.steps:
+            self._set_text(profiler.format_stats())
+
+    def set_data_collector(self, data_collector):
+        """Set data collector (the document's simulation changed).
+
+        Args:
+            data_collector: SimulationDataCollector instance
+        """
+        super().set_data_collector(data_collector)
+        profiler = self._get_profiler()
+        if profiler and self.enable_check.get_active():
+            profiler.enabled = True
+            self._start_updates()
+        self.refresh()
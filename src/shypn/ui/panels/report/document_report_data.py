@@ -9,6 +9,48 @@ Each canvas tab (document) has its own DocumentReportData instance that stores:
 
 The Report Panel displays data from the currently active document.
 """
+import os
+
+
+class SimulationSnapshot:
+    """Data collector view of a captured simulation, for the analyzers.
+    
+    Series come from the run's trajectory when one was streamed (the
+    captured lists then hold only the last in-memory steps), otherwise
+    from the captured lists.
+    """
+    
+    def __init__(self, sim_data, model):
+        """Initialize snapshot.
+        
+        Args:
+            sim_data: DocumentReportData.last_simulation_data
+            model: Model providing places and transitions
+        """
+        self.time_points = sim_data['time_points']
+        self.place_data = sim_data['place_data']
+        self.transition_data = sim_data['transition_data']
+        self.model = model
+        self.store = None
+        path = sim_data['metadata'].get('trajectory_path')
+        if path and os.path.isdir(path):
+            from shypn.engine.simulation.trajectory_store import TrajectoryStore
+            try:
+                self.store = TrajectoryStore(path)
+            except (OSError, ValueError):
+                self.store = None  # Deleted or unreadable; use the captured steps
+    
+    def get_place_series(self, place_id):
+        """Get time series for a place."""
+        if self.store is not None and place_id in self.store.place_ids:
+            return self.store.place_series(place_id)
+        return self.time_points, self.place_data.get(place_id, [])
+    
+    def get_transition_series(self, transition_id):
+        """Get time series for a transition."""
+        if self.store is not None and transition_id in self.store.transition_ids:
+            return self.store.transition_series(transition_id)
+        return self.time_points, self.transition_data.get(transition_id, [])
 
 
 class DocumentReportData:
@@ -84,13 +126,20 @@ class DocumentReportData:
             self.last_duration = target_duration
             self.last_time_scale = time_scale
         
-        # Capture data collector state (make a snapshot)
+        # Capture data collector state (make a snapshot); when the run was
+        # streamed, the lists hold only the recent steps and the analyzers
+        # read the full run from trajectory_path (see SimulationSnapshot)
+        get_point_count = getattr(data_collector, 'get_point_count', None)
+        trajectory_path = getattr(data_collector, 'trajectory_path', None)
+        self._pin_trajectory(trajectory_path)
         self.last_simulation_data = {
             'time_points': list(data_collector.time_points),
             'place_data': {k: list(v) for k, v in data_collector.place_data.items()},
             'transition_data': {k: list(v) for k, v in data_collector.transition_data.items()},
             'metadata': {
                 'timestamp': self.last_simulation_time.strftime("%Y-%m-%d %H:%M:%S"),
+                'trajectory_path': trajectory_path,
+                'num_time_points': get_point_count() if get_point_count else len(data_collector.time_points),
                 'time_step': time_step,
                 'target_duration': target_duration,
                 'duration': actual_duration,
@@ -107,6 +156,15 @@ class DocumentReportData:
             self.num_transitions = len(getattr(model, 'transitions', []))
             self.num_arcs = len(getattr(model, 'arcs', []))
     
+    def _pin_trajectory(self, path):
+        """Keep the captured run's trajectory from being pruned while referenced."""
+        from shypn.engine.simulation.trajectory_store import pin_trajectory, unpin_trajectory
+        previous = (self.last_simulation_data or {}).get('metadata', {}).get('trajectory_path')
+        if previous and previous != path:
+            unpin_trajectory(previous, self)
+        if path:
+            pin_trajectory(path, self)
+    
     def has_simulation_data(self):
         """Check if this document has simulation data.
         
@@ -129,7 +187,7 @@ class DocumentReportData:
         time_str = self.last_simulation_time.strftime("%Y-%m-%d %H:%M:%S") if self.last_simulation_time else "Unknown"
         
         data = self.last_simulation_data
-        num_time_points = len(data['time_points'])
+        num_time_points = data['metadata'].get('num_time_points', len(data['time_points']))
         
         # Calculate total firings
         total_firings = 0
@@ -275,7 +275,7 @@ class DynamicAnalysesCategory(BaseReportCategory):
             data_collector = self.controller.data_collector
             if data_collector.has_data():
                 duration = self.controller.settings.duration or 0.0
-                num_time_points = len(data_collector.time_points)
+                num_time_points = data_collector.get_point_count()
                 summary_lines.append(f"<b>Simulation:</b> {duration:.2f}s duration, {num_time_points} time points collected")
         
         # Set summary text
@@ -545,25 +545,10 @@ class DynamicAnalysesCategory(BaseReportCategory):
         # print("[DEBUG_TABLES] Analyzing species...")
         try:
             pass
-            # Create a temporary data collector wrapper that provides stored data
-            # but still has access to the model for analyzers
-            class DataCollectorSnapshot:
-                """Wrapper that provides stored simulation data with model access."""
-                def __init__(self, sim_data, controller):
-                    self.time_points = sim_data['time_points']
-                    self.place_data = sim_data['place_data']
-                    self.transition_data = sim_data['transition_data']
-                    self.model = controller.model  # Access to model for places/transitions
-                
-                def get_place_series(self, place_id):
-                    """Get time series for a place."""
-                    return self.time_points, self.place_data.get(place_id, [])
-                
-                def get_transition_series(self, transition_id):
-                    """Get time series for a transition."""
-                    return self.time_points, self.transition_data.get(transition_id, [])
-            
-            data_snapshot = DataCollectorSnapshot(sim_data, self.controller)
+            # Wrapper that provides stored simulation data (the full run from
+            # its trajectory when streamed) with model access for analyzers
+            from shypn.ui.panels.report.document_report_data import SimulationSnapshot
+            data_snapshot = SimulationSnapshot(sim_data, self.controller.model)
             
             species_analyzer = SpeciesAnalyzer(data_snapshot)
             species_metrics = species_analyzer.analyze_all_species(duration)
@@ -592,7 +577,8 @@ class DynamicAnalysesCategory(BaseReportCategory):
         # Analyze reactions
         # print("[DEBUG_TABLES] Analyzing reactions...")
         try:
-            reaction_analyzer = ReactionAnalyzer(data_snapshot)
+            reaction_analyzer = ReactionAnalyzer(data_snapshot,
+                                                 firing_log=self._find_firing_log())
             reaction_metrics = reaction_analyzer.analyze_all_reactions(duration)
             # print(f"[DEBUG_TABLES] Got {len(reaction_metrics)} reaction metrics")
             
@@ -613,7 +599,7 @@ class DynamicAnalysesCategory(BaseReportCategory):
         # Update status
         num_species = len(species_metrics)
         num_reactions = len(reaction_metrics)
-        num_time_points = len(sim_data['time_points'])
+        num_time_points = sim_data['metadata'].get('num_time_points', len(sim_data['time_points']))
         
         self.simulation_status_label.set_markup(
             f"<i>Analyzed {num_species} species and {num_reactions} reactions "
@@ -651,6 +637,15 @@ class DynamicAnalysesCategory(BaseReportCategory):
         
         # print("[DEBUG_TABLES] All widgets shown and expanders expanded")
     
+    def _find_firing_log(self):
+        """Firing log of the analyses data collector listening to the controller, if any."""
+        for listener in getattr(self.controller, 'step_listeners', []):
+            owner = getattr(listener, '__self__', listener)
+            firing_log = getattr(owner, 'firing_log', None)
+            if firing_log is not None:
+                return firing_log
+        return None
+    
     def _update_summary(self, duration: float, sim_data: dict):
         """Update Summary section with simulation metadata.
         
@@ -692,7 +687,7 @@ class DynamicAnalysesCategory(BaseReportCategory):
             
             
             # Get data statistics from stored data
-            num_time_points = len(sim_data['time_points'])
+            num_time_points = sim_data['metadata'].get('num_time_points', len(sim_data['time_points']))
             total_steps = num_time_points - 1 if num_time_points > 0 else 0
             
             # Calculate total firings from stored data
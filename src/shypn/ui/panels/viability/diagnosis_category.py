@@ -134,8 +134,7 @@ class DiagnosisCategory(BaseViabilityCategory):
         suggestions = []
         
         # Get input arcs and places
-        input_arcs = [arc for arc in kb.arcs.values() 
-                     if arc.target_id == trans_id and arc.arc_type == "place_to_transition"]
+        input_arcs = kb.get_input_arcs_for_transition(trans_id)
         
         if not input_arcs:
             # SOURCE transition (no inputs) - check if it should be a source
@@ -341,24 +340,15 @@ class DiagnosisCategory(BaseViabilityCategory):
             List[str]: IDs of competing transitions
         """
         competitors = []
-        input_place_ids = {arc.source_id for arc in input_arcs}
+        input_place_ids = dict.fromkeys(arc.source_id for arc in input_arcs)
         
         # Find other transitions that also consume from these places
-        for other_trans_id, other_trans in kb.transitions.items():
-            if other_trans_id == trans_id:
-                continue
-            
-            # Check if this transition has arcs from same input places
-            other_input_arcs = [arc for arc in kb.arcs.values()
-                               if arc.target_id == other_trans_id and arc.arc_type == "place_to_transition"]
-            
-            other_input_places = {arc.source_id for arc in other_input_arcs}
-            
-            # If they share input places, they're competing
-            if input_place_ids & other_input_places:
-                competitors.append(other_trans_id)
+        for place_id in input_place_ids:
+            for arc in kb.get_output_arcs_for_place(place_id):
+                if arc.target_id != trans_id:
+                    competitors.append(arc.target_id)
         
-        return competitors
+        return list(dict.fromkeys(competitors))
     
     def _build_content(self):
         """Build diagnosis category content."""
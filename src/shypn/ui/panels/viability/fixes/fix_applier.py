@@ -292,23 +292,42 @@ class FixApplier:
         applied_fix.previous_state['arc_weights'] = {}
         
         # Get input and output arcs
-        input_arcs = [arc for arc in self.kb.arcs.values() 
-                      if hasattr(arc, 'target') and arc.target == transition_id]
-        output_arcs = [arc for arc in self.kb.arcs.values() 
-                       if hasattr(arc, 'source') and arc.source == transition_id]
+        if hasattr(self.kb, 'get_input_arcs_for_transition'):
+            # Indexed lookups (O(degree))
+            input_arcs = self.kb.get_input_arcs_for_transition(transition_id)
+            output_arcs = self.kb.get_output_arcs_for_transition(transition_id)
+        else:
+            input_arcs = [arc for arc in self.kb.arcs.values() 
+                          if hasattr(arc, 'target') and arc.target == transition_id]
+            output_arcs = [arc for arc in self.kb.arcs.values() 
+                           if hasattr(arc, 'source') and arc.source == transition_id]
         
         # Calculate average weights
         if input_arcs and output_arcs:
-            avg_input = sum(getattr(arc, 'weight', 1) for arc in input_arcs) / len(input_arcs)
-            avg_output = sum(getattr(arc, 'weight', 1) for arc in output_arcs) / len(output_arcs)
+            avg_input = sum(self._get_arc_weight(arc) for arc in input_arcs) / len(input_arcs)
+            avg_output = sum(self._get_arc_weight(arc) for arc in output_arcs) / len(output_arcs)
             
             # Balance to average
             target_weight = (avg_input + avg_output) / 2
             
             for arc in input_arcs + output_arcs:
-                arc_id = getattr(arc, 'id', str(arc))
-                applied_fix.previous_state['arc_weights'][arc_id] = getattr(arc, 'weight', 1)
-                arc.weight = target_weight
+                arc_id = getattr(arc, 'arc_id', None) or getattr(arc, 'id', str(arc))
+                applied_fix.previous_state['arc_weights'][arc_id] = self._get_arc_weight(arc)
+                self._set_arc_weight(arc, target_weight)
+    
+    @staticmethod
+    def _get_arc_weight(arc):
+        """Weight of a knowledge base arc (ArcKnowledge.current_weight) or of arc.weight."""
+        if hasattr(arc, 'current_weight'):
+            return arc.current_weight
+        return getattr(arc, 'weight', 1)
+    
+    @staticmethod
+    def _set_arc_weight(arc, weight):
+        if hasattr(arc, 'current_weight'):
+            arc.current_weight = weight
+        else:
+            arc.weight = weight
     
     def _add_arc(self, transition_id: str, place_id: str, arc_type: str, applied_fix: AppliedFix):
         """Add a new arc."""
@@ -426,7 +445,7 @@ class FixApplier:
             for arc_id, old_weight in state['arc_weights'].items():
                 arc = self.kb.arcs.get(arc_id)
                 if arc:
-                    arc.weight = old_weight
+                    self._set_arc_weight(arc, old_weight)
         
         # Restore rates
         if 'rate' in state:
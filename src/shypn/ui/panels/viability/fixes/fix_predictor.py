@@ -438,6 +438,8 @@ class FixPredictor:
     
     def _get_input_arcs(self, transition_id: str) -> List:
         """Get input arcs for a transition."""
+        if hasattr(self.kb, 'get_input_arcs_for_transition'):
+            return self.kb.get_input_arcs_for_transition(transition_id)  # Indexed
         if not hasattr(self.kb, 'arcs'):
             return []
         
@@ -446,12 +448,35 @@ class FixPredictor:
     
     def _get_output_arcs(self, transition_id: str) -> List:
         """Get output arcs for a transition."""
+        if hasattr(self.kb, 'get_output_arcs_for_transition'):
+            return self.kb.get_output_arcs_for_transition(transition_id)  # Indexed
         if not hasattr(self.kb, 'arcs'):
             return []
         
         return [arc for arc in self.kb.arcs.values()
                 if hasattr(arc, 'source') and arc.source == transition_id]
     
+    def _get_place_arcs(self, place_id: str) -> List:
+        """Get arcs leaving and entering a place."""
+        if hasattr(self.kb, 'get_output_arcs_for_place'):
+            return (self.kb.get_output_arcs_for_place(place_id)
+                    + self.kb.get_input_arcs_for_place(place_id))  # Indexed
+        if not hasattr(self.kb, 'arcs'):
+            return []
+        
+        return [arc for arc in self.kb.arcs.values()
+                if getattr(arc, 'source', None) == place_id or getattr(arc, 'target', None) == place_id]
+    
+    @staticmethod
+    def _arc_source(arc) -> Optional[str]:
+        """Source id of a knowledge base arc (ArcKnowledge.source_id) or of arc.source."""
+        return getattr(arc, 'source_id', None) or getattr(arc, 'source', None)
+    
+    @staticmethod
+    def _arc_target(arc) -> Optional[str]:
+        """Target id of a knowledge base arc (ArcKnowledge.target_id) or of arc.target."""
+        return getattr(arc, 'target_id', None) or getattr(arc, 'target', None)
+    
     def _get_downstream_transitions(self, transition_id: str) -> List[str]:
         """Get transitions downstream of given transition.
         
@@ -470,16 +495,16 @@ class FixPredictor:
             # Get output places
             output_arcs = self._get_output_arcs(current)
             for arc in output_arcs:
-                place_id = getattr(arc, 'target', None)
+                place_id = self._arc_target(arc)
                 if not place_id:
                     continue
                 
                 # Get transitions consuming from this place
-                consuming_arcs = [a for a in self.kb.arcs.values()
-                                 if hasattr(a, 'source') and a.source == place_id]
+                consuming_arcs = [a for a in self._get_place_arcs(place_id)
+                                  if self._arc_source(a) == place_id]
                 
                 for cons_arc in consuming_arcs:
-                    trans_id = getattr(cons_arc, 'target', None)
+                    trans_id = self._arc_target(cons_arc)
                     if trans_id and trans_id not in visited:
                         downstream.append(trans_id)
                         visited.add(trans_id)
@@ -500,21 +525,20 @@ class FixPredictor:
             output_arcs = self._get_output_arcs(element_id)
             
             for arc in input_arcs:
-                if hasattr(arc, 'source'):
-                    connected.append(arc.source)
+                if self._arc_source(arc):
+                    connected.append(self._arc_source(arc))
             
             for arc in output_arcs:
-                if hasattr(arc, 'target'):
-                    connected.append(arc.target)
+                if self._arc_target(arc):
+                    connected.append(self._arc_target(arc))
         
         # If element is place, get connected transitions
         elif element_id in self.kb.places:
-            for arc in self.kb.arcs.values():
-                if hasattr(arc, 'source') and arc.source == element_id:
-                    if hasattr(arc, 'target'):
-                        connected.append(arc.target)
-                elif hasattr(arc, 'target') and arc.target == element_id:
-                    if hasattr(arc, 'source'):
-                        connected.append(arc.source)
+            for arc in self._get_place_arcs(element_id):
+                if self._arc_source(arc) == element_id:
+                    if self._arc_target(arc):
+                        connected.append(self._arc_target(arc))
+                elif self._arc_source(arc):
+                    connected.append(self._arc_source(arc))
         
         return connected
@@ -301,8 +301,7 @@ class StructuralCategory(BaseViabilityCategory):
         suggestions = []
         
         # Get input arcs and places
-        input_arcs = [arc for arc in kb.arcs.values() 
-                     if arc.target_id == trans_id and arc.arc_type == "place_to_transition"]
+        input_arcs = kb.get_input_arcs_for_transition(trans_id)
         
         if not input_arcs:
             # SOURCE transition (no inputs) - check if it should be a source
@@ -515,23 +514,15 @@ class StructuralCategory(BaseViabilityCategory):
         Returns:
             List[str]: IDs of competing transitions
         """
-        competitors = []
+        competitors = set()
         input_place_ids = {arc.source_id for arc in input_arcs}
         
         # Find other transitions that also consume from these places
-        for other_trans_id, other_trans in kb.transitions.items():
-            if other_trans_id == trans_id:
-                continue
-            
-            # Check if this transition has arcs from same input places
-            other_input_arcs = [arc for arc in kb.arcs.values()
-                               if arc.target_id == other_trans_id and arc.arc_type == "place_to_transition"]
-            
-            other_input_places = {arc.source_id for arc in other_input_arcs}
-            
-            # If they share input places, they're competing
-            if input_place_ids & other_input_places:  # Set intersection
-                competitors.append(other_trans_id)
+        for place_id in input_place_ids:
+            for arc in kb.get_output_arcs_for_place(place_id):
+                if arc.target_id != trans_id and arc.target_id in kb.transitions:
+                    competitors.add(arc.target_id)
         
-        return competitors
+        # Same order as kb.transitions
+        return [other_trans_id for other_trans_id in kb.transitions if other_trans_id in competitors]
 
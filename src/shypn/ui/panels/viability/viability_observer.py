@@ -15,13 +15,26 @@ Events monitored:
 The observer never stops at first failure - it gathers data from ALL sources
 and combines them intelligently.
 
+Evaluation is incremental: each rule declares the knowledge keys it reads
+("section.key", e.g. "simulation_state.dead_transitions"), and an event only
+re-runs the rules whose inputs it changed. Rule outputs are memoized, and
+high-frequency events (simulation steps, token changes, firings) are
+debounced so the observer does not slow down the simulation it watches.
+
 Author: Simão Eugénio
 Date: November 10, 2025
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Callable, Any, Optional
+from typing import Dict, List, Set, Callable, Any, Optional, FrozenSet
 from datetime import datetime
+import time
+
+try:
+    from gi.repository import GLib
+except ImportError:
+    GLib = None
 
 # Import pattern recognition engine
 try:
@@ -37,6 +50,16 @@ except ImportError:
     print("[OBSERVER] Warning: Pattern recognition engine not available")
 
 
+# Events kept in the observer's ring buffer
+MAX_EVENTS = 1000
+
+# Events that may arrive every simulation step; their evaluation is debounced
+HIGH_FREQUENCY_EVENTS = frozenset({'simulation_step', 'token_change', 'transition_fired'})
+
+# Minimum time between debounced evaluations (seconds)
+DEBOUNCE_INTERVAL = 0.5
+
+
 @dataclass
 class ObservationEvent:
     """Event captured by the observer.
@@ -64,6 +87,8 @@ class ObservationRule:
         action: Function that generates suggestions
         priority: Rule priority (1=high, 3=low)
         enabled: Whether rule is active
+        reads: Knowledge keys the rule depends on, as "section" or
+            "section.key" (None = everything; re-evaluated on every change)
     """
     rule_id: str
     category: str
@@ -71,6 +96,17 @@ class ObservationRule:
     action: Callable[[Dict[str, Any]], List[Any]]  # Returns Issue list
     priority: int = 2
     enabled: bool = True
+    reads: Optional[FrozenSet[str]] = None
+    
+    def depends_on(self, changed: Set[str]) -> bool:
+        """Check whether any changed knowledge key is an input of this rule."""
+        if self.reads is None:
+            return True
+        for key in changed:
+            for read in self.reads:
+                if key == read or key.startswith(read + '.') or read.startswith(key + '.'):
+                    return True
+        return False
 
 
 class ViabilityObserver:
@@ -82,15 +118,35 @@ class ViabilityObserver:
     
     Architecture:
     1. Event Stream: Captures events from throughout the application
-    2. Rule Engine: Applies rules to generate suggestions
+       (bounded ring buffer of the latest events)
+    2. Rule Engine: Applies rules to generate suggestions, re-running only
+       the rules whose declared inputs changed
     3. Knowledge Accumulation: Builds understanding over time
     4. Dynamic Update: Notifies categories when suggestions change
     """
     
-    def __init__(self):
-        """Initialize the observer."""
-        self.events: List[ObservationEvent] = []
+    def __init__(self, max_events: int = MAX_EVENTS,
+                 debounce_interval: float = DEBOUNCE_INTERVAL):
+        """Initialize the observer.
+        
+        Args:
+            max_events: Number of recent events kept
+            debounce_interval: Minimum seconds between evaluations
+                triggered by high-frequency events (0 = no debouncing)
+        """
+        self.events: deque = deque(maxlen=max_events)
+        self.debounce_interval = debounce_interval
         self.rules: Dict[str, ObservationRule] = {}
+        
+        # Incremental evaluation state
+        self._rule_outputs: Dict[str, List[Any]] = {}   # rule_id -> memoized issues
+        self._stale_rules: Set[str] = set()             # never evaluated / invalidated
+        self._changed_keys: Set[str] = set()            # changed since last evaluation
+        self._sorted_rules: Optional[List[ObservationRule]] = None
+        self._last_evaluation = 0.0
+        self._timer_id = None
+        self.stats = {'events': 0, 'evaluations': 0, 'rule_runs': 0, 'deferred': 0}
+
         self.knowledge: Dict[str, Any] = {
             'topology_state': {},
             'simulation_state': {},
@@ -113,7 +169,8 @@ class ViabilityObserver:
             category="structural",
             condition=lambda data: 'liveness_status' in data and len(data['liveness_status']) > 0,
             action=self._analyze_dead_transitions_liveness,
-            priority=1
+            priority=1,
+            reads=frozenset({'topology_state.liveness_status'})
         ))
         
         self.add_rule(ObservationRule(
@@ -121,7 +178,8 @@ class ViabilityObserver:
             category="structural",
             condition=lambda data: 'simulation_state' in data and data['simulation_state'].get('has_data', False) and len(data['simulation_state'].get('dead_transitions', [])) > 0,
             action=self._analyze_dead_transitions_simulation,
-            priority=1
+            priority=1,
+            reads=frozenset({'simulation_state.has_data', 'simulation_state.dead_transitions'})
         ))
         
         self.add_rule(ObservationRule(
@@ -129,7 +187,8 @@ class ViabilityObserver:
             category="structural",
             condition=lambda data: 'siphons' in data and len(data['siphons']) > 0,
             action=self._analyze_siphons,
-            priority=2
+            priority=2,
+            reads=frozenset({'topology_state.siphons'})
         ))
         
         # KINETIC RULES
@@ -138,7 +197,8 @@ class ViabilityObserver:
             category="kinetic",
             condition=lambda data: 'transitions' in data,
             action=self._analyze_missing_rates,
-            priority=1
+            priority=1,
+            reads=frozenset({'kinetic_state.transitions'})
         ))
         
         self.add_rule(ObservationRule(
@@ -146,7 +206,9 @@ class ViabilityObserver:
             category="kinetic",
             condition=lambda data: 'simulation_state' in data and data['simulation_state'].get('has_data', False) and len(data['simulation_state'].get('zero_firing_transitions', [])) > 0,
             action=self._analyze_zero_firings,
-            priority=1
+            priority=1,
+            reads=frozenset({'simulation_state.has_data', 'simulation_state.zero_firing_transitions',
+                             'simulation_state.total_firings'})
         ))
         
         self.add_rule(ObservationRule(
@@ -154,7 +216,8 @@ class ViabilityObserver:
             category="kinetic",
             condition=lambda data: 'kinetic_parameters' in data,
             action=self._analyze_rate_confidence,
-            priority=3
+            priority=3,
+            reads=frozenset({'kinetic_state.parameters'})
         ))
         
         # BIOLOGICAL RULES
@@ -163,7 +226,8 @@ class ViabilityObserver:
             category="biological",
             condition=lambda data: 'places' in data and 'compounds' in data,
             action=self._analyze_compound_mapping,
-            priority=2
+            priority=2,
+            reads=frozenset({'biological_state.places', 'biological_state.compounds'})
         ))
         
         self.add_rule(ObservationRule(
@@ -171,7 +235,8 @@ class ViabilityObserver:
             category="biological",
             condition=lambda data: 'arcs' in data and 'reactions' in data,
             action=self._analyze_stoichiometry,
-            priority=1
+            priority=1,
+            reads=frozenset({'biological_state.arcs', 'biological_state.reactions'})
         ))
         
         self.add_rule(ObservationRule(
@@ -179,7 +244,8 @@ class ViabilityObserver:
             category="biological",
             condition=lambda data: 'simulation_state' in data and data['simulation_state'].get('has_data', False) and len(data['simulation_state'].get('inactive_places', [])) > 0,
             action=self._analyze_compound_activity,
-            priority=2
+            priority=2,
+            reads=frozenset({'simulation_state.has_data', 'simulation_state.inactive_places'})
         ))
     
     def add_rule(self, rule: ObservationRule):
@@ -189,6 +255,9 @@ class ViabilityObserver:
             rule: Rule to add
         """
         self.rules[rule.rule_id] = rule
+        self._rule_outputs.pop(rule.rule_id, None)
+        self._stale_rules.add(rule.rule_id)
+        self._sorted_rules = None
     
     def remove_rule(self, rule_id: str):
         """Remove observation rule.
@@ -197,11 +266,20 @@ class ViabilityObserver:
             rule_id: Rule identifier
         """
         if rule_id in self.rules:
+            category = self.rules[rule_id].category
             del self.rules[rule_id]
+            self._sorted_rules = None
+            self._stale_rules.discard(rule_id)
+            if self._rule_outputs.pop(rule_id, None):
+                self._publish({category})
     
     def record_event(self, event_type: str, data: Dict[str, Any], source: str = "unknown"):
         """Record an observation event.
         
+        Knowledge is updated immediately. Rules are evaluated right away,
+        except for high-frequency events, which are evaluated at most once
+        per debounce interval (a pending evaluation is scheduled).
+        
         Args:
             event_type: Type of event
             data: Event data
@@ -214,169 +292,234 @@ class ViabilityObserver:
             source=source
         )
         self.events.append(event)
+        self.stats['events'] += 1
         
         # Update knowledge based on event
-        self._update_knowledge(event)
+        self._changed_keys |= self._update_knowledge(event)
+        if not self._changed_keys and not self._stale_rules:
+            return
         
         # Trigger rule evaluation
-        self._evaluate_rules()
+        if (event_type in HIGH_FREQUENCY_EVENTS and
+                time.monotonic() - self._last_evaluation < self.debounce_interval):
+            self.stats['deferred'] += 1
+            self._schedule_flush()
+        else:
+            self._evaluate_rules()
+    
+    def invalidate(self, keys: Optional[Set[str]] = None):
+        """Mark knowledge as changed after editing self.knowledge directly.
+        
+        Args:
+            keys: Changed "section.key" paths (None = all rules are re-run
+                on the next evaluation)
+        """
+        if keys is None:
+            self._stale_rules.update(self.rules)
+        else:
+            self._changed_keys.update(keys)
+    
+    def flush(self):
+        """Run any pending (debounced) evaluation now."""
+        self._cancel_timer()
+        if self._changed_keys or self._stale_rules:
+            self._evaluate_rules()
+    
+    def _schedule_flush(self):
+        """Schedule one deferred evaluation at the end of the debounce interval."""
+        if GLib is None or self._timer_id is not None:
+            # Without a main loop the next immediate event or flush() evaluates
+            return
+        remaining = self.debounce_interval - (time.monotonic() - self._last_evaluation)
+        
+        def on_timeout():
+            self._timer_id = None
+            self.flush()
+            return False
+        
+        self._timer_id = GLib.timeout_add(max(1, int(remaining * 1000)), on_timeout)
     
-    def _update_knowledge(self, event: ObservationEvent):
+    def _cancel_timer(self):
+        if self._timer_id is not None:
+            if GLib is not None:
+                GLib.source_remove(self._timer_id)
+            self._timer_id = None
+    
+    def _set_knowledge(self, section: str, key: str, value: Any, changed: Set[str]):
+        """Store a knowledge value, recording "section.key" if it changed."""
+        state = self.knowledge.setdefault(section, {})
+        if key in state:
+            old = state[key]
+            if old is value:
+                return
+            try:
+                if not (old != value):
+                    return
+            except Exception:
+                # e.g. arrays without a truth value: treat as changed
+                pass
+        state[key] = value
+        changed.add(f"{section}.{key}")
+    
+    def _update_knowledge(self, event: ObservationEvent) -> Set[str]:
         """Update accumulated knowledge from event.
         
         Args:
             event: Observation event
+        
+        Returns:
+            Set of "section.key" paths whose value changed
         """
+        changed: Set[str] = set()
+        
         if event.event_type == "topology_complete":
-            self.knowledge['topology_state'].update(event.data)
+            for key, value in event.data.items():
+                self._set_knowledge('topology_state', key, value, changed)
         
         elif event.event_type == "simulation_step":
-            self.knowledge['simulation_state'].update(event.data)
+            for key, value in event.data.items():
+                self._set_knowledge('simulation_state', key, value, changed)
         
         elif event.event_type == "simulation_complete":
             # Extract simulation data
             sim_data = event.data.get('simulation_data', {})
-            
-            print(f"[OBSERVER_DEBUG] ========== SIMULATION_COMPLETE EVENT ==========")
-            print(f"[OBSERVER_DEBUG] sim_data type: {type(sim_data)}")
-            print(f"[OBSERVER_DEBUG] sim_data keys: {list(sim_data.keys())}")
-            print(f"[OBSERVER_DEBUG] dead_transitions type: {type(sim_data.get('dead_transitions', []))}")
-            print(f"[OBSERVER_DEBUG] dead_transitions length: {len(sim_data.get('dead_transitions', []))}")
-            if sim_data.get('dead_transitions'):
-                dt_list = sim_data.get('dead_transitions', [])
-                print(f"[OBSERVER_DEBUG] First 3 dead_transitions:")
-                for i, dt in enumerate(dt_list[:3]):
-                    print(f"[OBSERVER_DEBUG]   [{i}] type={type(dt)}, repr={repr(dt)}")
-            
-            self.knowledge['simulation_state'].update(sim_data)
+            for key, value in sim_data.items():
+                self._set_knowledge('simulation_state', key, value, changed)
             
             # Update biological state
             if 'places' in event.data:
-                if 'places' not in self.knowledge['biological_state']:
-                    self.knowledge['biological_state']['places'] = {}
-                for place_id, place_obj in event.data['places'].items():
-                    self.knowledge['biological_state']['places'][place_id] = {
-                        'compound_id': getattr(place_obj, 'compound_id', None)
-                    }
+                self._merge_places(event.data['places'], changed)
             
             if 'compounds' in event.data:
-                self.knowledge['biological_state']['compounds'] = event.data['compounds']
+                self._set_knowledge('biological_state', 'compounds', event.data['compounds'], changed)
             
             if 'arcs' in event.data:
-                self.knowledge['biological_state']['arcs'] = event.data['arcs']
+                self._set_knowledge('biological_state', 'arcs', event.data['arcs'], changed)
             
             if 'reactions' in event.data:
-                self.knowledge['biological_state']['reactions'] = event.data['reactions']
+                self._set_knowledge('biological_state', 'reactions', event.data['reactions'], changed)
             
             # Update kinetic state
             if 'transitions' in event.data:
-                if 'transitions' not in self.knowledge['kinetic_state']:
-                    self.knowledge['kinetic_state']['transitions'] = {}
-                for trans_id, trans_obj in event.data['transitions'].items():
-                    self.knowledge['kinetic_state']['transitions'][trans_id] = {
-                        'rate': getattr(trans_obj, 'rate', 0.0)
-                    }
+                self._merge_transitions(event.data['transitions'], changed)
             
             if 'kinetic_parameters' in event.data:
-                self.knowledge['kinetic_state']['parameters'] = event.data['kinetic_parameters']
+                self._set_knowledge('kinetic_state', 'parameters', event.data['kinetic_parameters'], changed)
         
         elif event.event_type == "kb_updated":
             # Update topology state
             if 'liveness_status' in event.data:
-                self.knowledge['topology_state']['liveness_status'] = event.data['liveness_status']
+                self._set_knowledge('topology_state', 'liveness_status', event.data['liveness_status'], changed)
             if 'siphons' in event.data:
-                self.knowledge['topology_state']['siphons'] = event.data['siphons']
+                self._set_knowledge('topology_state', 'siphons', event.data['siphons'], changed)
             
             # Update biological state
             if 'compounds' in event.data:
-                self.knowledge['biological_state']['compounds'] = event.data['compounds']
+                self._set_knowledge('biological_state', 'compounds', event.data['compounds'], changed)
             if 'places' in event.data:
-                if 'places' not in self.knowledge['biological_state']:
-                    self.knowledge['biological_state']['places'] = {}
-                for place_id, place_obj in event.data['places'].items():
-                    self.knowledge['biological_state']['places'][place_id] = {
-                        'compound_id': getattr(place_obj, 'compound_id', None)
-                    }
+                self._merge_places(event.data['places'], changed)
             
             # Update kinetic state
             if 'kinetic_parameters' in event.data:
-                self.knowledge['kinetic_state']['parameters'] = event.data['kinetic_parameters']
+                self._set_knowledge('kinetic_state', 'parameters', event.data['kinetic_parameters'], changed)
             if 'transitions' in event.data:
-                if 'transitions' not in self.knowledge['kinetic_state']:
-                    self.knowledge['kinetic_state']['transitions'] = {}
-                for trans_id, trans_obj in event.data['transitions'].items():
-                    self.knowledge['kinetic_state']['transitions'][trans_id] = {
-                        'rate': getattr(trans_obj, 'rate', 0.0)
-                    }
+                self._merge_transitions(event.data['transitions'], changed)
+        
+        return changed
+    
+    def _merge_places(self, places: Dict[str, Any], changed: Set[str]):
+        """Merge place compound mappings into the biological state."""
+        known = self.knowledge['biological_state'].setdefault('places', {})
+        for place_id, place_obj in places.items():
+            entry = {'compound_id': getattr(place_obj, 'compound_id', None)}
+            if known.get(place_id) != entry:
+                known[place_id] = entry
+                changed.add('biological_state.places')
+    
+    def _merge_transitions(self, transitions: Dict[str, Any], changed: Set[str]):
+        """Merge transition rates into the kinetic state."""
+        known = self.knowledge['kinetic_state'].setdefault('transitions', {})
+        for trans_id, trans_obj in transitions.items():
+            entry = {'rate': getattr(trans_obj, 'rate', 0.0)}
+            if known.get(trans_id) != entry:
+                known[trans_id] = entry
+                changed.add('kinetic_state.transitions')
     
     def _evaluate_rules(self):
-        """Evaluate all rules against current knowledge.
+        """Evaluate the rules affected by knowledge changes.
         
-        This is the core of the intelligent analysis - it NEVER stops
-        at the first failure. It evaluates ALL rules and gathers ALL
-        applicable suggestions.
+        Rules whose declared inputs did not change keep their memoized
+        output. Like a full evaluation, it NEVER stops at the first
+        failure: every affected rule is evaluated.
         """
-        suggestions_by_category = {
-            'structural': [],
-            'biological': [],
-            'kinetic': [],
-            'diagnosis': []
-        }
-        
-        # Sort rules by priority
-        sorted_rules = sorted(self.rules.values(), key=lambda r: r.priority)
-        
-        # Evaluate EVERY rule (never stop early)
-        rules_evaluated = 0
-        rules_triggered = 0
-        for rule in sorted_rules:
-            if not rule.enabled:
+        self._cancel_timer()
+        changed, self._changed_keys = self._changed_keys, set()
+        stale, self._stale_rules = self._stale_rules, set()
+        self._last_evaluation = time.monotonic()
+        self.stats['evaluations'] += 1
+        
+        # Evaluate affected rules (never stop early)
+        updated_categories = set()
+        for rule in self.rules.values():
+            if rule.rule_id not in stale and not (changed and rule.depends_on(changed)):
                 continue
             
-            rules_evaluated += 1
-            try:
-                # Check if rule applies
-                applies = rule.condition(self.knowledge)
-                
-                if applies:
-                    # Generate suggestions
-                    issues = rule.action(self.knowledge)
-                    if issues:
-                        rules_triggered += 1
-                        suggestions_by_category[rule.category].extend(issues)
-            except Exception as e:
-                import traceback
-                print(f"[OBSERVER] ❌ Error evaluating rule {rule.rule_id}: {e}")
-                traceback.print_exc()
-                # Continue to next rule (never stop!)
-                continue
-        
-        # Notify subscribers of updates
-        for category, issues in suggestions_by_category.items():
+            issues = self._run_rule(rule)
+            if issues != self._rule_outputs.get(rule.rule_id, []):
+                updated_categories.add(rule.category)
             if issues:
-                print(f"[OBSERVER] Notifying subscribers for category '{category}'...")
-                self._notify_subscribers(category, issues)
+                self._rule_outputs[rule.rule_id] = issues
+            else:
+                self._rule_outputs.pop(rule.rule_id, None)
+        
+        self._publish(updated_categories)
+    
+    def _run_rule(self, rule: ObservationRule) -> List[Any]:
+        """Evaluate one rule against the current knowledge."""
+        if not rule.enabled:
+            return []
+        
+        self.stats['rule_runs'] += 1
+        try:
+            # Check if rule applies, then generate suggestions
+            if rule.condition(self.knowledge):
+                return list(rule.action(self.knowledge) or [])
+        except Exception as e:
+            import traceback
+            print(f"[OBSERVER] ❌ Error evaluating rule {rule.rule_id}: {e}")
+            traceback.print_exc()
+        return []
+    
+    def _publish(self, categories: Set[str]):
+        """Rebuild the suggestions of the given categories and notify subscribers."""
+        if not categories:
+            return
+        
+        if self._sorted_rules is None:
+            self._sorted_rules = sorted(self.rules.values(), key=lambda r: r.priority)
+        
+        for category in categories:
+            # Rule priority order, as in a full evaluation
+            issues = []
+            for rule in self._sorted_rules:
+                if rule.category == category and rule.enabled:
+                    issues.extend(self._rule_outputs.get(rule.rule_id, ()))
+            self._notify_subscribers(category, issues)
     
     def _notify_subscribers(self, category: str, issues: List[Any]):
         """Notify subscribers of updated suggestions.
         
         Args:
             category: Category name
-            issues: List of issues/suggestions
+            issues: List of issues/suggestions (empty when they were cleared)
         """
-        print(f"[OBSERVER] _notify_subscribers for category '{category}' with {len(issues)} issues")
-        print(f"[OBSERVER] Subscribers for '{category}': {len(self.subscribers.get(category, []))}")
-        
-        if category in self.subscribers:
-            for i, callback in enumerate(self.subscribers[category]):
-                try:
-                    print(f"[OBSERVER] Calling subscriber {i+1}/{len(self.subscribers[category])} for '{category}'...")
-                    callback(issues)
-                    print(f"[OBSERVER]   ✅ Subscriber {i+1} called successfully")
-                except Exception as e:
-                    import traceback
-                    print(f"[OBSERVER]   ❌ Error notifying subscriber {i+1}: {e}")
-                    traceback.print_exc()
+        for callback in self.subscribers.get(category, []):
+            try:
+                callback(issues)
+            except Exception as e:
+                import traceback
+                print(f"[OBSERVER]   ❌ Error notifying subscriber for '{category}': {e}")
+                traceback.print_exc()
     
     def subscribe(self, category: str, callback: Callable[[List[Any]], None]):
         """Subscribe to suggestion updates for a category.
@@ -392,23 +535,22 @@ class ViabilityObserver:
     def get_current_suggestions(self, category: str) -> List[Any]:
         """Get current suggestions for a category.
         
+        Pending changes are evaluated first; otherwise the memoized rule
+        outputs are returned without re-running any rule.
+        
         Args:
             category: Category name
             
         Returns:
             List of current issues/suggestions
         """
-        # Evaluate rules for this category only
+        self.flush()
+        if self._sorted_rules is None:
+            self._sorted_rules = sorted(self.rules.values(), key=lambda r: r.priority)
         suggestions = []
-        for rule in self.rules.values():
+        for rule in self._sorted_rules:
             if rule.category == category and rule.enabled:
-                try:
-                    if rule.condition(self.knowledge):
-                        issues = rule.action(self.knowledge)
-                        if issues:
-                            suggestions.extend(issues)
-                except:
-                    continue
+                suggestions.extend(self._rule_outputs.get(rule.rule_id, ()))
         return suggestions
     
     def generate_suggestions_for_locality(self, locality_knowledge: Dict) -> List[Dict]:
@@ -518,7 +660,6 @@ class ViabilityObserver:
         
         # STRUCTURAL SUGGESTIONS - Use smart diagnosis for dead transitions
         for trans_id in inactive_transitions:
-            print(f"[OBSERVER] Diagnosing dead transition: {trans_id}")
             diagnosis = self._diagnose_dead_transition(kb, trans_id)
             
             if diagnosis:
@@ -534,7 +675,6 @@ class ViabilityObserver:
                     'metadata': diagnosis.get('suggestions', [])
                 }
                 all_suggestions['structural'].append(suggestion)
-                print(f"[OBSERVER]   → {diagnosis['reason']}")
         
         # KINETIC SUGGESTIONS - for transitions without rates
         for trans_id, trans_obj in kb.transitions.items():
@@ -716,16 +856,6 @@ class ViabilityObserver:
         # Get input arcs from KB (this is the correct way!)
         input_arcs = kb.get_input_arcs_for_transition(trans_id)
         
-        # Debug: Log diagnosis info
-        has_rate = (
-            (hasattr(transition, 'current_rate') and transition.current_rate is not None and transition.current_rate > 0) or
-            (hasattr(transition, 'kinetic_law') and transition.kinetic_law)
-        )
-        rate_str = transition.kinetic_law if hasattr(transition, 'kinetic_law') and transition.kinetic_law else (
-            f"rate={transition.current_rate}" if hasattr(transition, 'current_rate') and transition.current_rate else "NO_RATE"
-        )
-        print(f"[DIAGNOSE] {trans_id}: {len(input_arcs)} input arcs, is_source={len(input_arcs) == 0}, has_rate={has_rate}, rate_info={rate_str}")
-        
         # TYPE 1: Source transition (no inputs) - check if it should be a source
         if not input_arcs:
             # Source transitions that didn't fire might be:
@@ -909,16 +1039,11 @@ class ViabilityObserver:
         competing = set()
         place_ids = {p['id'] for p in input_places}
         
-        for other_trans_id, other_trans in kb.transitions.items():
-            if other_trans_id == trans_id:
-                continue
-            
-            other_input_arcs = other_trans.input_arcs if hasattr(other_trans, 'input_arcs') else []
-            other_place_ids = {arc.source for arc in other_input_arcs if hasattr(arc, 'source')}
-            
-            # If shares any input place, it's competing
-            if place_ids & other_place_ids:
-                competing.add(other_trans_id)
+        # Transitions consuming from any of the same places (O(degree) via KB indexes)
+        for place_id in place_ids:
+            for arc in kb.get_output_arcs_for_place(place_id):
+                if arc.target_id != trans_id:
+                    competing.add(arc.target_id)
         
         return list(competing)
     
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Arc Index Utilities.
+
+Groups a model's arcs by the object they connect in a single pass, so
+per-transition code (stoichiometry analysis, rate function building,
+kinetics assignment) can read a transition's input and output arcs in
+O(degree) instead of rescanning the whole arc list for every transition.
+
+The index is keyed by id(obj): places and transitions are not required
+to be hashable, and the same index works for both.
+"""
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+def build_arc_index(arcs: Iterable[Any]) -> Dict[int, Tuple[List[Any], List[Any]]]:
+    """Group arcs by endpoint.
+
+    Args:
+        arcs: Arcs with source and target attributes
+
+    Returns:
+        Dict mapping id(obj) → (input_arcs, output_arcs), where input arcs
+        end at obj and output arcs start at it. Arc order is preserved.
+    """
+    index = {}
+    for arc in arcs:
+        source = getattr(arc, 'source', None)
+        target = getattr(arc, 'target', None)
+        if target is not None:
+            index.setdefault(id(target), ([], []))[0].append(arc)
+        if source is not None:
+            index.setdefault(id(source), ([], []))[1].append(arc)
+    return index
+
+
+def arcs_of(index: Dict[int, Tuple[List[Any], List[Any]]], obj: Any) -> Tuple[List[Any], List[Any]]:
+    """Get (input_arcs, output_arcs) of obj from an index (empty if unconnected)."""
+    return index.get(id(obj), ([], []))
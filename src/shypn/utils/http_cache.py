@@ -0,0 +1,591 @@
+"""On-disk HTTP response cache shared by all external fetchers.
+
+Every GET to an external service (KEGG, SABIO-RK, BioModels, ...) goes
+through one cache under ~/.shypn/cache/http_cache.db, so re-importing the
+same pathways is answered locally:
+
+- Content-addressed: entries are keyed by a SHA-256 of the request
+  (URL plus sorted query parameters)
+- TTLs: fresh entries are served without touching the network; "not
+  found" answers (400/404) are cached too, for a shorter time
+- Revalidation: stale entries with an ETag or Last-Modified are
+  revalidated with a conditional request (304 refreshes the entry); on
+  network errors, 5xx or 429 the stale copy is served instead
+- Size-bounded LRU: least recently used entries are evicted once the
+  cache exceeds max_size bytes
+- Compression: bodies are stored zlib-compressed when that saves space
+- Offline mode: never touch the network; serve stale entries, and raise
+  OfflineError for misses (enable with SHYPN_OFFLINE=1 or .offline = True)
+- Statistics: hits, misses, revalidations, stale serves, evictions
+- Connection reuse: network requests go over keep-alive connections
+  (one per host per thread) and accept gzip-encoded bodies
+
+Usage:
+    cache = get_http_cache()
+    response = cache.get("https://rest.kegg.jp/get/R00710", timeout=10)
+    response.raise_for_status()
+    text = response.text
+"""
+
+import gzip
+import hashlib
+import http.client
+import json
+import logging
+import os
+import socket
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from shypn.utils.sqlite_pool import get_pool
+
+
+# Default location of the shared cache
+DEFAULT_CACHE_DIR = Path.home() / ".shypn" / "cache"
+
+# Seconds a successful response stays fresh
+DEFAULT_TTL = 7 * 24 * 3600
+
+# Seconds a "not found" response (400/404/410) stays fresh
+NEGATIVE_TTL = 24 * 3600
+
+# Total size of stored bodies before LRU eviction starts
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+# Bodies smaller than this are stored uncompressed
+COMPRESS_MIN_SIZE = 1024
+
+# Redirect statuses followed by the transport, and the maximum chain length
+REDIRECT_STATUS = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+
+# Statuses that are cached (with NEGATIVE_TTL for the client errors)
+CACHEABLE_STATUS = {200: None, 400: NEGATIVE_TTL, 404: NEGATIVE_TTL, 410: NEGATIVE_TTL}
+
+
+class HTTPCacheError(Exception):
+    """Base class for errors raised by HTTPCache.get()."""
+
+
+class HTTPTimeoutError(HTTPCacheError):
+    """The request timed out and no cached copy was available."""
+
+
+class HTTPConnectionError(HTTPCacheError):
+    """The request failed at the network level and no cached copy was available."""
+
+
+class OfflineError(HTTPCacheError):
+    """Offline mode is on and the request is not cached."""
+
+
+class HTTPStatusError(HTTPCacheError):
+    """Raised by CachedResponse.raise_for_status() for 4xx/5xx responses."""
+
+    def __init__(self, message: str, response: 'CachedResponse'):
+        super().__init__(message)
+        self.response = response
+
+
+class _ConnectionPool:
+    """Keep-alive HTTP(S) connections, one per (scheme, host) per thread.
+
+    http.client connections are not thread-safe, so each thread keeps its
+    own; a connection the server has closed is reopened once.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._ssl_context = ssl.create_default_context()
+
+    def request(self, url: str, headers: Dict[str, str], timeout: float):
+        """GET url on a pooled connection.
+
+        Returns:
+            (status, body, headers)
+        """
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        connections = self._local.__dict__.setdefault('connections', {})
+
+        while True:
+            conn = connections.get(key)
+            fresh = conn is None
+            if fresh:
+                conn = self._connect(parts, timeout)
+                connections[key] = conn
+            else:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (ConnectionResetError, BrokenPipeError,
+                    http.client.BadStatusLine, http.client.CannotSendRequest):
+                conn.close()
+                del connections[key]
+                if fresh:
+                    raise
+                continue  # Stale keep-alive connection: retry on a new one
+            except BaseException:
+                conn.close()
+                del connections[key]
+                raise
+
+            if response.will_close:
+                conn.close()
+                del connections[key]
+            return response.status, body, dict(response.getheaders())
+
+    def _connect(self, parts: urllib.parse.SplitResult, timeout: float) -> http.client.HTTPConnection:
+        """Open a connection for a URL's scheme and host."""
+        if parts.scheme == 'https':
+            return http.client.HTTPSConnection(parts.netloc, timeout=timeout, context=self._ssl_context)
+        if parts.scheme == 'http':
+            return http.client.HTTPConnection(parts.netloc, timeout=timeout)
+        raise urllib.error.URLError(f"Unsupported URL scheme: {parts.scheme}")
+
+
+@dataclass
+class CachedResponse:
+    """HTTP response, from the network or the cache.
+
+    Mirrors the parts of requests.Response the fetchers use.
+    """
+    url: str
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+    stale: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True for status codes below 400."""
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        """Body decoded as UTF-8 (undecodable bytes replaced)."""
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        """Body parsed as JSON."""
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        """Raise HTTPStatusError for 4xx/5xx responses."""
+        if not self.ok:
+            raise HTTPStatusError(f"HTTP {self.status_code} for {self.url}", self)
+
+
+class HTTPCache:
+    """SQLite-backed HTTP GET cache (thread-safe, shared between processes).
+
+    Attributes:
+        db_path: Path to the cache database
+        max_size: Maximum total size of stored bodies in bytes
+        default_ttl: Seconds a successful response stays fresh
+        offline: If True, never touch the network
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[Path] = None,
+                 max_size: int = DEFAULT_MAX_SIZE,
+                 default_ttl: float = DEFAULT_TTL,
+                 offline: Optional[bool] = None):
+        """Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory for the cache database (default: ~/.shypn/cache)
+            max_size: Maximum total size of stored bodies in bytes
+            default_ttl: Seconds a successful response stays fresh
+            offline: Offline mode (default: SHYPN_OFFLINE environment variable)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = cache_dir / "http_cache.db"
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        if offline is None:
+            offline = os.environ.get('SHYPN_OFFLINE', '').lower() in ('1', 'true', 'yes')
+        self.offline = offline
+
+        self._pool = get_pool(self.db_path)
+        self._connections = _ConnectionPool()
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            ('hits', 'misses', 'revalidated', 'stale', 'stored', 'evicted', 'errors'), 0
+        )
+        self._init_schema()
+        self._total_size = self._pool.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def _init_schema(self):
+        """Create the responses table."""
+        with self._pool.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    body BLOB NOT NULL,
+                    compressed INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_responses_last_access
+                ON responses(last_access)
+            """)
+
+    @staticmethod
+    def request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Content address of a GET request.
+
+        Args:
+            url: Request URL (may already contain a query string)
+            params: Optional extra query parameters
+
+        Returns:
+            Hex SHA-256 of the canonical request
+        """
+        parts = urllib.parse.urlsplit(url)
+        query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if params:
+            query.extend((str(k), str(v)) for k, v in params.items())
+        canonical = urllib.parse.urlunsplit((
+            parts.scheme.lower(), parts.netloc.lower(), parts.path,
+            urllib.parse.urlencode(sorted(query)), ''
+        ))
+        return hashlib.sha256(f"GET {canonical}".encode('utf-8')).hexdigest()
+
+    def get(self,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: float = 30,
+            ttl: Optional[float] = None,
+            before_request: Optional[Callable[[], None]] = None) -> CachedResponse:
+        """GET a URL through the cache.
+
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            headers: Optional request headers
+            timeout: Network timeout in seconds
+            ttl: Seconds the response stays fresh (default: default_ttl)
+            before_request: Called right before a network request (e.g., a
+                            rate limiter); never called for cache hits
+
+        Returns:
+            CachedResponse (4xx/5xx responses are returned, not raised;
+            a 5xx or 429 reply is replaced by the stale copy if there is one)
+
+        Raises:
+            OfflineError: Offline and not cached
+            HTTPTimeoutError: Timed out and not cached
+            HTTPConnectionError: Network error and not cached
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        key = self.request_key(url, params)
+        entry = self._load(key)
+        now = time.time()
+
+        if entry is not None and (entry['expires_at'] > now or self.offline):
+            stale = entry['expires_at'] <= now
+            self._touch(key, now)
+            self._count('stale' if stale else 'hits')
+            return self._to_response(entry, stale=stale)
+
+        if self.offline:
+            self._count('misses')
+            raise OfflineError(f"Offline and not cached: {url}")
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry['etag']:
+                request_headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        if params:
+            separator = '&' if urllib.parse.urlsplit(url).query else '?'
+            full_url = f"{url}{separator}{urllib.parse.urlencode(params)}"
+        else:
+            full_url = url
+
+        if before_request is not None:
+            before_request()
+
+        try:
+            status, body, response_headers = self._request(full_url, request_headers, timeout)
+        except (socket.timeout, TimeoutError) as e:
+            return self._network_failure(entry, key, HTTPTimeoutError(f"Timed out: {url} ({e})"))
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+            return self._network_failure(entry, key, HTTPConnectionError(f"Request failed: {url} ({e})"))
+
+        if status == 304 and entry is not None:
+            self._refresh(key, now + ttl, now)
+            self._count('revalidated')
+            return self._to_response(entry)
+
+        response = CachedResponse(url=full_url, status_code=status, content=body, headers=response_headers)
+        if entry is not None and (status >= 500 or status == 429):
+            # Server trouble or throttling: the stale copy is still the best answer
+            return self._network_failure(entry, key, HTTPStatusError(f"HTTP {status}: {url}", response))
+
+        self._count('misses')
+        if status in CACHEABLE_STATUS:
+            status_ttl = CACHEABLE_STATUS[status]
+            self._store(key, response, now, now + (ttl if status_ttl is None else min(ttl, status_ttl)))
+        return response
+
+    def _request(self, url: str, headers: Dict[str, str], timeout: float):
+        """Perform the network GET (keep-alive, redirects followed, gzip decoded).
+
+        Returns:
+            (status, body, headers)
+        """
+        headers = dict(headers)
+        headers.setdefault('Accept-Encoding', 'gzip')
+        headers.setdefault('User-Agent', 'shypn')
+
+        for _ in range(MAX_REDIRECTS + 1):
+            host = urllib.parse.urlsplit(url).hostname or ''
+            if self._uses_proxy(url, host):
+                status, body, response_headers = self._request_urllib(url, headers, timeout)
+            else:
+                status, body, response_headers = self._connections.request(url, headers, timeout)
+
+            location = {k.lower(): v for k, v in response_headers.items()}.get('location')
+            if status in REDIRECT_STATUS and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            break
+
+        encoding = {k.lower(): v for k, v in response_headers.items()}.get('content-encoding', '')
+        if encoding.lower() == 'gzip' and body:
+            body = gzip.decompress(body)
+            response_headers = {
+                k: v for k, v in response_headers.items()
+                if k.lower() not in ('content-encoding', 'content-length')
+            }
+        return status, body, response_headers
+
+    @staticmethod
+    def _uses_proxy(url: str, host: str) -> bool:
+        """True if a proxy is configured for this URL (handled by urllib)."""
+        scheme = urllib.parse.urlsplit(url).scheme
+        return scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(host)
+
+    def _request_urllib(self, url: str, headers: Dict[str, str], timeout: float):
+        """GET through urllib (proxies; redirects followed by urllib).
+
+        Returns:
+            (status, body, headers)
+        """
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return response.status, response.read(), dict(response.headers.items())
+        except urllib.error.HTTPError as e:
+            body = e.read() if e.fp is not None else b''
+            return e.code, body, dict(e.headers.items()) if e.headers else {}
+
+    def _network_failure(self, entry: Optional[Dict[str, Any]], key: str, error: HTTPCacheError) -> CachedResponse:
+        """Serve the stale copy if there is one, otherwise raise error."""
+        self._count('errors')
+        if entry is None:
+            raise error
+        self.logger.warning(f"{error}; serving stale cached copy")
+        self._touch(key, time.time())
+        self._count('stale')
+        return self._to_response(entry, stale=True)
+
+    # ==================== Storage ====================
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an entry (body decompressed), or None."""
+        row = self._pool.execute(
+            "SELECT url, status, body, compressed, headers, etag, last_modified, expires_at "
+            "FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        url, status, body, compressed, headers, etag, last_modified, expires_at = row
+        return {
+            'url': url,
+            'status': status,
+            'body': zlib.decompress(body) if compressed else bytes(body),
+            'headers': json.loads(headers),
+            'etag': etag,
+            'last_modified': last_modified,
+            'expires_at': expires_at,
+        }
+
+    def _store(self, key: str, response: CachedResponse, now: float, expires_at: float):
+        """Insert or replace an entry, then evict if over max_size."""
+        body = response.content
+        compressed = False
+        if len(body) >= COMPRESS_MIN_SIZE:
+            packed = zlib.compress(body, 6)
+            if len(packed) < len(body):
+                body, compressed = packed, True
+
+        headers = {k.lower(): v for k, v in response.headers.items()}
+        with self._pool.transaction() as conn:
+            old = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            conn.execute("""
+                INSERT OR REPLACE INTO responses
+                (key, url, status, body, compressed, headers, etag, last_modified,
+                 stored_at, expires_at, last_access, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                key, response.url, response.status_code, body, int(compressed),
+                json.dumps(headers), headers.get('etag'), headers.get('last-modified'),
+                now, expires_at, now, len(body)
+            ))
+
+        with self._lock:
+            self._total_size += len(body) - (old[0] if old else 0)
+            self._stats['stored'] += 1
+            over = self._total_size > self.max_size
+        if over:
+            self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries down to 90% of max_size."""
+        target = self.max_size * 0.9
+        evicted = 0
+        with self._pool.transaction() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            while total > target:
+                rows = conn.execute(
+                    "SELECT key, size FROM responses ORDER BY last_access LIMIT 64"
+                ).fetchall()
+                if not rows:
+                    break
+                victims = []
+                for key, size in rows:
+                    if total <= target:
+                        break
+                    victims.append((key,))
+                    total -= size
+                conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+                evicted += len(victims)
+
+        with self._lock:
+            self._total_size = total
+            self._stats['evicted'] += evicted
+        self.logger.debug(f"Evicted {evicted} cached responses")
+
+    def _touch(self, key: str, now: float):
+        """Record an access (for LRU order)."""
+        self._pool.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+
+    def _refresh(self, key: str, expires_at: float, now: float):
+        """Extend an entry's freshness after a 304."""
+        self._pool.execute(
+            "UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?",
+            (expires_at, now, key)
+        )
+
+    def _to_response(self, entry: Dict[str, Any], stale: bool = False) -> CachedResponse:
+        """Build a CachedResponse from a stored entry."""
+        return CachedResponse(
+            url=entry['url'],
+            status_code=entry['status'],
+            content=entry['body'],
+            headers=entry['headers'],
+            from_cache=True,
+            stale=stale
+        )
+
+    def _count(self, name: str):
+        """Increment a statistics counter."""
+        with self._lock:
+            self._stats[name] += 1
+
+    # ==================== Management ====================
+
+    def invalidate(self, url: str, params: Optional[Dict[str, Any]] = None):
+        """Drop the cached response for a request."""
+        key = self.request_key(url, params)
+        with self._pool.transaction() as conn:
+            row = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        if row:
+            with self._lock:
+                self._total_size -= row[0]
+
+    def clear(self):
+        """Drop all cached responses."""
+        self._pool.execute("DELETE FROM responses")
+        with self._lock:
+            self._total_size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with counters since creation (hits, misses, revalidated,
+            stale, stored, evicted, errors), hit_rate, and the current
+            number of entries and stored size in bytes
+        """
+        entries, size = self._pool.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        with self._lock:
+            stats = dict(self._stats)
+        served = stats['hits'] + stats['stale'] + stats['revalidated']
+        requests = served + stats['misses']
+        stats.update({
+            'hit_rate': served / requests if requests else 0.0,
+            'entries': entries,
+            'size_bytes': size,
+            'max_size_bytes': self.max_size,
+            'offline': self.offline,
+        })
+        return stats
+
+
+_default_cache: Optional[HTTPCache] = None
+_default_lock = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache:
+    """Get the shared cache under ~/.shypn/cache (created on first use)."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = HTTPCache()
+        return _default_cache
+
+
+def set_offline(offline: bool = True):
+    """Switch the shared cache's offline mode."""
+    get_http_cache().offline = offline
@@ -0,0 +1,229 @@
+"""Deferred loading of panels and heavy modules, and import-time profiling.
+
+Keeps application startup down to what the main window needs:
+
+- lazy_import: module proxy that imports the module on first attribute access
+- PanelRegistry: panel factories registered by name, built on first use
+- ImportProfiler: per-module import timings, like ``python -X importtime``
+"""
+import importlib
+import logging
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Example:
+        nx = lazy_import('networkx')   # nothing imported yet
+        graph = nx.DiGraph()           # networkx imported here
+    """
+
+    __slots__ = ('_name', '_module')
+
+    def __init__(self, name: str):
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_module', None)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self):
+        """Import the module (once) and return it."""
+        if self._module is None:
+            object.__setattr__(self, '_module', importlib.import_module(self._name))
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __setattr__(self, attr: str, value: Any):
+        setattr(self.load(), attr, value)
+
+    def __dir__(self):
+        return dir(self.load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.is_loaded else 'not loaded'
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str):
+    """Return the module if already imported, else a LazyModule for it."""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+class PanelRegistry:
+    """Panels registered by name and built on first use.
+
+    A factory takes no arguments and returns the panel loader, or None if
+    the panel is unavailable. It runs once, on the first get(); the result
+    (including a failure, logged and stored as None) is cached for the
+    session. Wiring that needs the built panel is registered with
+    on_built() and runs right after the factory.
+
+    Example:
+        panels = PanelRegistry()
+        panels.register('topology', lambda: TopologyPanelLoader(model=None))
+        panels.on_built('topology', lambda loader: loader.set_model_canvas_loader(canvas))
+        ...
+        loader = panels.get('topology')   # built here, on first show
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._panels: Dict[str, Any] = {}
+        self._listeners: Dict[str, List[Callable[[Any], None]]] = {}
+        self.build_times: Dict[str, float] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        if name in self._factories:
+            raise ValueError(f"Panel {name!r} is already registered")
+        self._factories[name] = factory
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._factories
+
+    def names(self) -> List[str]:
+        return list(self._factories)
+
+    def is_built(self, name: str) -> bool:
+        return name in self._panels
+
+    def peek(self, name: str) -> Optional[Any]:
+        """The panel if it has been built, without building it."""
+        return self._panels.get(name)
+
+    def get(self, name: str) -> Optional[Any]:
+        """The panel, building it on first call (None if it failed to load)."""
+        if name in self._panels:
+            return self._panels[name]
+        factory = self._factories[name]
+
+        start = time.perf_counter()
+        try:
+            panel = factory()
+        except Exception as e:
+            logger.warning('Failed to load %s panel: %s', name, e)
+            panel = None
+        self.build_times[name] = time.perf_counter() - start
+        self._panels[name] = panel
+        logger.debug('Built %s panel in %.1f ms', name, self.build_times[name] * 1000)
+
+        for callback in self._listeners.pop(name, []):
+            if panel is None:
+                break
+            try:
+                callback(panel)
+            except Exception as e:
+                logger.warning('Failed to wire %s panel: %s', name, e)
+        return panel
+
+    def provider(self, name: str) -> Callable[[], Optional[Any]]:
+        """Zero-argument callable that returns (and if needed builds) the panel."""
+        return lambda: self.get(name)
+
+    def on_built(self, name: str, callback: Callable[[Any], None]):
+        """Run callback(panel) once the panel is built (now, if it already is)."""
+        if name in self._panels:
+            if self._panels[name] is not None:
+                callback(self._panels[name])
+        else:
+            self._listeners.setdefault(name, []).append(callback)
+
+    def built(self) -> Dict[str, Any]:
+        """Panels built so far that loaded successfully."""
+        return {name: panel for name, panel in self._panels.items() if panel is not None}
+
+
+class ImportProfiler:
+    """Times every module import while installed.
+
+    Hooks the import machinery's load step, so imports from ``import``
+    statements, ``from ... import`` of submodules and importlib.import_module
+    are all covered. As with ``python -X importtime``, each module has a
+    self time and a cumulative time that includes the imports it triggered;
+    modules already in sys.modules are not counted.
+
+    Example:
+        profiler = ImportProfiler().install()
+        import heavy_stuff
+        profiler.uninstall()
+        print(profiler.report(limit=20))
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, Tuple[float, float]] = {}  # name -> (self, cumulative)
+        self.order: List[str] = []
+        self._children: List[float] = []
+        self._original = None
+        self._bootstrap = None
+
+    @property
+    def installed(self) -> bool:
+        return self._original is not None
+
+    def install(self) -> 'ImportProfiler':
+        if self._original is None:
+            bootstrap = sys.modules.get('importlib._bootstrap')
+            if bootstrap is None or not hasattr(bootstrap, '_find_and_load'):
+                logger.warning('Import profiling is not supported on this Python')
+                return self
+            self._bootstrap = bootstrap
+            self._original = bootstrap._find_and_load
+            bootstrap._find_and_load = self._find_and_load
+        return self
+
+    def uninstall(self):
+        if self._original is not None:
+            self._bootstrap._find_and_load = self._original
+            self._original = None
+
+    def __enter__(self) -> 'ImportProfiler':
+        return self.install()
+
+    def __exit__(self, *exc_info):
+        self.uninstall()
+
+    def _find_and_load(self, name, import_):
+        if name in sys.modules:
+            return self._original(name, import_)
+
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original(name, import_)
+        finally:
+            cumulative = time.perf_counter() - start
+            nested = self._children.pop()
+            if self._children:
+                self._children[-1] += cumulative
+            if name not in self.timings:
+                self.order.append(name)
+            self.timings[name] = (cumulative - nested, cumulative)
+
+    @property
+    def total(self) -> float:
+        """Seconds spent importing (sum of self times)."""
+        return sum(own for own, _ in self.timings.values())
+
+    def top(self, limit: Optional[int] = None) -> List[Tuple[str, float, float]]:
+        """(module, self seconds, cumulative seconds), slowest cumulative first."""
+        rows = sorted(((name, own, cumulative)
+                       for name, (own, cumulative) in self.timings.items()),
+                      key=lambda row: row[2], reverse=True)
+        return rows if limit is None else rows[:limit]
+
+    def report(self, limit: Optional[int] = 30) -> str:
+        """Text table in the layout of ``python -X importtime`` (microseconds)."""
+        lines = [f"Import time: {len(self.timings)} modules, {self.total * 1000:.0f} ms",
+                 'import time:  self [us] | cumulative | imported package']
+        for name, own, cumulative in self.top(limit):
+            lines.append(f"import time: {own * 1e6:10.0f} | {cumulative * 1e6:10.0f} | {name}")
+        return '\n'.join(lines)
@@ -0,0 +1,61 @@
+"""Token-bucket rate limiting.
+
+Shared by the HTTP clients that must respect a per-service request rate
+(crossfetch's ConcurrentFetcher, the KEGG API client). Thread-safe, so
+one limiter can pace several worker threads.
+
+Usage:
+    limiter = RateLimiter(rate=3.0, burst=3)
+    limiter.acquire()            # waits for a token
+    limiter.acquire(timeout=0)   # False instead of waiting
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Token bucket limiting the call rate to one source (thread-safe).
+
+    Allows bursts of up to `burst` calls, refilled at `rate` calls per second.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize rate limiter.
+
+        Args:
+            rate: Sustained calls per second
+            burst: Maximum calls allowed back-to-back
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Take one token, waiting for it if necessary.
+
+        Args:
+            timeout: Maximum seconds to wait (None = wait as long as needed)
+
+        Returns:
+            True if a token was taken, False if the wait would exceed timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return True
+                wait_time = (1.0 - self._tokens) / self.rate
+
+            if deadline is not None and now + wait_time > deadline:
+                return False
+            time.sleep(wait_time)
@@ -0,0 +1,230 @@
+"""Pooled, persistent SQLite connections.
+
+Opening a SQLite file costs far more than a cached lookup in it, so the
+local caches (HeuristicDatabase, EnzymeKineticsAPI, PersistentECCache)
+share one manager per database file instead of calling sqlite3.connect
+for every query:
+
+- One long-lived connection per thread (sqlite3 connections are not
+  shared between threads); reopened transparently after close() or fork.
+  close() only closes the calling thread's connection; other threads
+  close their own on next use, never under a running transaction.
+  Connections of finished threads are closed when the next thread
+  connects, so short-lived threads do not leak file descriptors
+- Shared pools are reference counted: get_pool() acquires, release()
+  closes the pool once the last holder let go
+- WAL journal mode: readers never block the writer and commits only
+  append to the log
+- Prepared statements: each connection keeps a compiled-statement cache
+  (cached_statements), which only pays off because connections live on
+- Explicit transactions: transaction() wraps a block in BEGIN/COMMIT
+  (ROLLBACK on error) and nests; executemany() batches writes in one
+
+Usage:
+    pool = get_pool('/path/to/cache.db', row_factory=sqlite3.Row)
+
+    row = pool.execute("SELECT * FROM t WHERE id = ?", (1,)).fetchone()
+
+    with pool.transaction() as conn:
+        conn.execute("INSERT INTO t VALUES (?)", (2,))
+
+    pool.executemany("INSERT INTO t VALUES (?)", [(3,), (4,)])
+
+    pool.release()  # Holder is done (instead of close(), which other holders share)
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+
+class SQLitePool:
+    """Per-thread persistent connections to one SQLite database file.
+
+    Attributes:
+        db_path: Path to the database file
+        row_factory: Row factory applied to every connection (or None)
+    """
+
+    # Compiled statements kept per connection
+    CACHED_STATEMENTS = 256
+
+    # Seconds to wait for a lock held by another connection
+    BUSY_TIMEOUT = 30.0
+
+    def __init__(self, db_path: str, row_factory: Optional[Callable] = None):
+        """Create a pool (connections are opened lazily, per thread).
+
+        Args:
+            db_path: Path to SQLite database file
+            row_factory: Optional row factory (e.g., sqlite3.Row)
+        """
+        self.db_path = str(db_path)
+        self.row_factory = row_factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._holders = 0
+        self._generation = 0
+        self._pid = os.getpid()
+
+    def connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use.
+
+        Connections run in autocommit mode; use transaction() to group
+        statements.
+        """
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        if conn is not None and local.pid == os.getpid():
+            if local.generation == self._generation or conn.in_transaction:
+                return conn
+            # Marked stale by close() on another thread: close it here,
+            # where no transaction can be running on it
+            self._close_all([conn])
+
+        if self._pid != os.getpid():
+            # Forked child: never touch the parent's connections
+            with self._lock:
+                self._connections = {}
+                self._pid = os.getpid()
+
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.BUSY_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.CACHED_STATEMENTS
+        )
+        if self.row_factory is not None:
+            conn.row_factory = self.row_factory
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self._lock:
+            dead = [thread for thread in self._connections if not thread.is_alive()]
+            finished = [self._connections.pop(thread) for thread in dead]
+            self._connections[threading.current_thread()] = conn
+            local.generation = self._generation
+        local.conn = conn
+        local.pid = os.getpid()
+        self._close_all(finished)
+        return conn
+
+    @property
+    def open_connections(self) -> int:
+        """Number of connections currently open in this process."""
+        with self._lock:
+            return len(self._connections)
+
+    @contextmanager
+    def transaction(self):
+        """Run a block in one transaction on this thread's connection.
+
+        Commits on success, rolls back on error. Nested calls join the
+        outer transaction.
+
+        Yields:
+            sqlite3.Connection
+        """
+        conn = self.connection()
+        if conn.in_transaction:
+            yield conn
+            return
+
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        else:
+            if conn.in_transaction:
+                conn.commit()
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """Execute one statement on this thread's connection (autocommit)."""
+        return self.connection().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Sequence[Any]]) -> int:
+        """Execute a statement for each parameter set in one transaction.
+
+        Returns:
+            Total number of rows modified
+        """
+        with self.transaction() as conn:
+            return conn.executemany(sql, seq_of_parameters).rowcount
+
+    def acquire(self) -> 'SQLitePool':
+        """Register a holder of the pool (get_pool() does this)."""
+        with self._lock:
+            self._holders += 1
+        return self
+
+    def release(self) -> None:
+        """Drop a holder; the last one to release closes the connections."""
+        with self._lock:
+            self._holders = max(self._holders - 1, 0)
+            last = self._holders == 0
+        if last:
+            self.close()
+
+    def close(self) -> None:
+        """Close this thread's connection and mark the others stale.
+
+        Another thread may be in the middle of a transaction on its
+        connection, so each live thread closes its own (once its
+        transaction is done) on its next use; connections of finished
+        threads are closed here. Every thread reconnects on its next use.
+        """
+        current = threading.current_thread()
+        with self._lock:
+            self._generation += 1
+            if self._pid != os.getpid():
+                return
+            closing = [thread for thread in self._connections
+                       if thread is current or not thread.is_alive()]
+            connections = [self._connections.pop(thread) for thread in closing]
+        self._local.conn = None
+        self._close_all(connections)
+
+    @staticmethod
+    def _close_all(connections: Iterable[sqlite3.Connection]) -> None:
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+
+_pools: Dict[Tuple[str, Optional[Callable]], SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path, row_factory: Optional[Callable] = None) -> SQLitePool:
+    """Get (and acquire) the shared pool for a database file.
+
+    All callers using the same file and row factory share connections;
+    a holder that is done calls release(), not close().
+    ':memory:' is kept as is (each thread then has its own database).
+
+    Args:
+        db_path: Path to SQLite database file
+        row_factory: Optional row factory (e.g., sqlite3.Row)
+
+    Returns:
+        SQLitePool instance
+    """
+    path = str(db_path)
+    if path != ':memory:':
+        path = os.path.abspath(path)
+    key = (path, row_factory)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SQLitePool(key[0], row_factory)
+            _pools[key] = pool
+        return pool.acquire()
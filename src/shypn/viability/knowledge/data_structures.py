@@ -240,6 +240,7 @@ class SimulationTrace:
     final_marking: Dict[str, int] = field(default_factory=dict)
     total_firings: Dict[str, int] = field(default_factory=dict)    # transition_id -> count
     reached_steady_state: bool = False
+    time_to_steady_state: Optional[float] = None                   # seconds
 
 
 # ============================================================================
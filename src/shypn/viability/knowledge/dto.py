@@ -285,12 +285,18 @@ class SimulationResultDTO:
     initial_marking: Dict[str, int] = field(default_factory=dict)
     final_marking: Dict[str, int] = field(default_factory=dict)
     
+    # Steady state (from the controller's SteadyStateDetector)
+    reached_steady_state: bool = False
+    time_to_steady_state: Optional[float] = None
+    
     @classmethod
-    def from_data_collector(cls, data_collector) -> 'SimulationResultDTO':
+    def from_data_collector(cls, data_collector, steady_state=None) -> 'SimulationResultDTO':
         """Create DTO from DataCollector object.
         
         Args:
             data_collector: DataCollector instance with simulation data
+            steady_state: SteadyStateDetector of the run (default: the one of
+                data_collector.controller, if any)
             
         Returns:
             SimulationResultDTO with normalized data
@@ -305,12 +311,16 @@ class SimulationResultDTO:
         if hasattr(data_collector, 'time_points'):
             time_points = list(data_collector.time_points)
         
+        # Streamed runs may keep only recent steps in memory
+        trajectory = getattr(data_collector, 'trajectory', None)
+        first_marking = trajectory.marking(0) if trajectory is not None and len(trajectory) else {}
+        
         # Extract place data
         if hasattr(data_collector, 'place_data'):
             for place_id, values in data_collector.place_data.items():
                 if values:
                     place_traces[str(place_id)] = [int(v) for v in values]
-                    initial_marking[str(place_id)] = int(values[0])
+                    initial_marking[str(place_id)] = int(first_marking.get(place_id, values[0]))
                     final_marking[str(place_id)] = int(values[-1])
         
         # Extract transition firing counts
@@ -320,12 +330,17 @@ class SimulationResultDTO:
                     # Assuming cumulative counts
                     total_firings[str(trans_id)] = int(values[-1])
         
+        if steady_state is None:
+            steady_state = getattr(getattr(data_collector, 'controller', None), 'steady_state', None)
+        
         return cls(
             time_points=time_points,
             place_traces=place_traces,
             total_firings=total_firings,
             initial_marking=initial_marking,
-            final_marking=final_marking
+            final_marking=final_marking,
+            reached_steady_state=bool(getattr(steady_state, 'reached', False)),
+            time_to_steady_state=getattr(steady_state, 'time_to_steady_state', None)
         )
 
 
@@ -60,6 +60,46 @@ from .data_structures import (
 )
 
 
+class _VersionedDict(dict):
+    """Dict that counts its mutations, so derived indexes can detect edits."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+    
+    def __setitem__(self, key, value):
+        self.version += 1
+        super().__setitem__(key, value)
+    
+    def __delitem__(self, key):
+        self.version += 1
+        super().__delitem__(key)
+    
+    def __ior__(self, other):
+        self.version += 1
+        return super().__ior__(other)
+    
+    def clear(self):
+        self.version += 1
+        super().clear()
+    
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+    
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+    
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+    
+    def update(self, *args, **kwargs):
+        self.version += 1
+        super().update(*args, **kwargs)
+
+
 class ModelKnowledgeBase:
     """Unified knowledge repository for a single Petri Net model.
     
@@ -133,6 +173,17 @@ class ModelKnowledgeBase:
         self.last_updated: Dict[str, datetime] = {}  # domain -> timestamp
         self.confidence: Dict[str, float] = {}  # knowledge_item -> confidence score
         self.version = "1.0"
+        
+        # ====================================================================
+        # 8. INDEXES (kept in sync by the update methods)
+        # ====================================================================
+        self._arcs_by_source: Dict[str, List[ArcKnowledge]] = {}  # node_id -> arcs leaving it
+        self._arcs_by_target: Dict[str, List[ArcKnowledge]] = {}  # node_id -> arcs entering it
+        self._indexed_arcs = None  # (arcs dict, version) the indexes were built from
+        self._place_p_invariants: Dict[str, List[int]] = {}      # place_id -> P-invariant indices
+        self._transition_t_invariants: Dict[str, List[int]] = {} # transition_id -> T-invariant indices
+        self._place_siphons: Dict[str, List[int]] = {}           # place_id -> siphon indices
+        self._place_traps: Dict[str, List[int]] = {}             # place_id -> trap indices
     
     # ========================================================================
     # UPDATE METHODS (Called by Panels)
@@ -165,7 +216,10 @@ class ModelKnowledgeBase:
                     label=place_dto.label,
                     current_marking=place_dto.initial_marking,
                     compound_id=place_dto.compound_id,
-                    compound_name=place_dto.compound_name
+                    compound_name=place_dto.compound_name,
+                    in_p_invariants=list(self._place_p_invariants.get(place_id, ())),
+                    in_siphons=list(self._place_siphons.get(place_id, ())),
+                    in_traps=list(self._place_traps.get(place_id, ()))
                 )
             else:
                 # Update existing
@@ -188,7 +242,8 @@ class ModelKnowledgeBase:
                     reaction_name=trans_dto.reaction_name,
                     ec_number=trans_dto.ec_number,
                     current_rate=trans_dto.rate,
-                    kinetic_law=trans_dto.kinetic_law
+                    kinetic_law=trans_dto.kinetic_law,
+                    in_t_invariants=list(self._transition_t_invariants.get(trans_id, ()))
                 )
             else:
                 # Update existing
@@ -206,36 +261,61 @@ class ModelKnowledgeBase:
                     self.transitions[trans_id].kinetic_law = trans_dto.kinetic_law
         
         # Update arcs using DTOs
+        self._ensure_arc_index()
         for arc_dto in arcs:
             arc_id = arc_dto.arc_id
             
             if arc_id not in self.arcs:
-                self.arcs[arc_id] = ArcKnowledge(
+                arc = ArcKnowledge(
                     arc_id=arc_id,
                     source_id=arc_dto.source_id,
                     target_id=arc_dto.target_id,
                     arc_type=arc_dto.arc_type,
                     current_weight=arc_dto.weight
                 )
+                self.arcs[arc_id] = arc
+                self._index_arc(arc)
             else:
                 # Update existing
                 self.arcs[arc_id].current_weight = arc_dto.weight
-        
-        # Debug: Log arc type distribution
-        arc_types = {}
-        for arc in self.arcs.values():
-            arc_types[arc.arc_type] = arc_types.get(arc.arc_type, 0) + 1
-        
-        # Debug: Check which transitions have NO input arcs
-        transitions_with_no_inputs = []
-        for trans_id in self.transitions.keys():
-            input_arcs = [a for a in self.arcs.values() 
-                         if a.target_id == trans_id and a.arc_type == "place_to_transition"]
-            if len(input_arcs) == 0:
-                transitions_with_no_inputs.append(trans_id)
+        self._indexed_arcs = (self.arcs, self.arcs.version)
         
         self.last_updated['structural'] = datetime.now()
     
+    def _index_arc(self, arc: ArcKnowledge):
+        """Add an arc to the adjacency indexes."""
+        self._arcs_by_source.setdefault(arc.source_id, []).append(arc)
+        self._arcs_by_target.setdefault(arc.target_id, []).append(arc)
+    
+    @property
+    def arcs(self) -> Dict[str, ArcKnowledge]:
+        """Arcs by id; direct edits are picked up by the adjacency queries."""
+        return self._arcs
+    
+    @arcs.setter
+    def arcs(self, arcs: Dict[str, ArcKnowledge]):
+        self._arcs = _VersionedDict(arcs)
+    
+    def _ensure_arc_index(self):
+        """Rebuild the adjacency indexes if self.arcs was changed directly."""
+        indexed = self._indexed_arcs
+        if indexed is not None and indexed[0] is self._arcs and indexed[1] == self._arcs.version:
+            return
+        self._arcs_by_source.clear()
+        self._arcs_by_target.clear()
+        for arc in self._arcs.values():
+            self._index_arc(arc)
+        self._indexed_arcs = (self._arcs, self._arcs.version)
+    
+    @staticmethod
+    def _membership_index(groups, attribute: str) -> Dict[str, List[int]]:
+        """Map element id -> indices of the groups (invariants, siphons) containing it."""
+        index: Dict[str, List[int]] = {}
+        for idx, group in enumerate(groups):
+            for element_id in dict.fromkeys(getattr(group, attribute)):
+                index.setdefault(element_id, []).append(idx)
+        return index
+    
     def update_p_invariants(self, invariants: List[PInvariant]):
         """Update P-invariants from topology analysis.
         
@@ -243,13 +323,11 @@ class ModelKnowledgeBase:
             invariants: List of P-invariant objects
         """
         self.p_invariants = invariants
+        self._place_p_invariants = self._membership_index(invariants, 'place_ids')
         
         # Update place knowledge - mark which invariants each place belongs to
-        for idx, inv in enumerate(invariants):
-            for place_id in inv.place_ids:
-                if place_id in self.places:
-                    if idx not in self.places[place_id].in_p_invariants:
-                        self.places[place_id].in_p_invariants.append(idx)
+        for place_id, place in self.places.items():
+            place.in_p_invariants = list(self._place_p_invariants.get(place_id, ()))
         
         self.last_updated['p_invariants'] = datetime.now()
     
@@ -260,13 +338,11 @@ class ModelKnowledgeBase:
             invariants: List of T-invariant objects
         """
         self.t_invariants = invariants
+        self._transition_t_invariants = self._membership_index(invariants, 'transition_ids')
         
         # Update transition knowledge
-        for idx, inv in enumerate(invariants):
-            for trans_id in inv.transition_ids:
-                if trans_id in self.transitions:
-                    if idx not in self.transitions[trans_id].in_t_invariants:
-                        self.transitions[trans_id].in_t_invariants.append(idx)
+        for trans_id, transition in self.transitions.items():
+            transition.in_t_invariants = list(self._transition_t_invariants.get(trans_id, ()))
         
         self.last_updated['t_invariants'] = datetime.now()
     
@@ -279,19 +355,13 @@ class ModelKnowledgeBase:
         """
         self.siphons = siphons
         self.traps = traps
+        self._place_siphons = self._membership_index(siphons, 'place_ids')
+        self._place_traps = self._membership_index(traps, 'place_ids')
         
         # Update place knowledge
-        for idx, siphon in enumerate(siphons):
-            for place_id in siphon.place_ids:
-                if place_id in self.places:
-                    if idx not in self.places[place_id].in_siphons:
-                        self.places[place_id].in_siphons.append(idx)
-        
-        for idx, trap in enumerate(traps):
-            for place_id in trap.place_ids:
-                if place_id in self.places:
-                    if idx not in self.places[place_id].in_traps:
-                        self.places[place_id].in_traps.append(idx)
+        for place_id, place in self.places.items():
+            place.in_siphons = list(self._place_siphons.get(place_id, ()))
+            place.in_traps = list(self._place_traps.get(place_id, ()))
         
         self.last_updated['siphons_traps'] = datetime.now()
     
@@ -550,7 +620,8 @@ class ModelKnowledgeBase:
             transition_firings={},  # Not provided in DTO, use total_firings instead
             final_marking=sim_dto.final_marking,
             total_firings=sim_dto.total_firings,
-            reached_steady_state=False  # Could be detected from trace analysis
+            reached_steady_state=sim_dto.reached_steady_state,
+            time_to_steady_state=sim_dto.time_to_steady_state
         )
         
         self.add_simulation_trace(trace)
@@ -654,21 +725,7 @@ class ModelKnowledgeBase:
         Returns:
             List of ArcKnowledge objects where target_id == transition_id
         """
-        input_arcs = [
-            arc for arc in self.arcs.values()
-            if arc.target_id == transition_id and arc.arc_type == "place_to_transition"
-        ]
-        
-        # Debug: Show what we found
-        if transition_id in ['T5', 'T6', 'T35', 'T36']:  # Sample transitions
-            print(f"[KB_QUERY] get_input_arcs_for_transition({transition_id}):")
-            print(f"[KB_QUERY]   Total arcs in KB: {len(self.arcs)}")
-            print(f"[KB_QUERY]   Arcs targeting {transition_id}: {len([a for a in self.arcs.values() if a.target_id == transition_id])}")
-            print(f"[KB_QUERY]   Input arcs (place→trans): {len(input_arcs)}")
-            for arc in input_arcs:
-                print(f"[KB_QUERY]     - {arc.arc_id}: {arc.source_id} → {arc.target_id}")
-        
-        return input_arcs
+        return self._adjacent_arcs(self._arcs_by_target, transition_id, "place_to_transition")
     
     def get_output_arcs_for_transition(self, transition_id: str) -> List[ArcKnowledge]:
         """Get all output arcs (transition → place) for a transition.
@@ -679,10 +736,7 @@ class ModelKnowledgeBase:
         Returns:
             List of ArcKnowledge objects where source_id == transition_id
         """
-        return [
-            arc for arc in self.arcs.values()
-            if arc.source_id == transition_id and arc.arc_type == "transition_to_place"
-        ]
+        return self._adjacent_arcs(self._arcs_by_source, transition_id, "transition_to_place")
     
     def is_source_transition(self, transition_id: str) -> bool:
         """Check if transition is a source (has no input arcs).
@@ -705,10 +759,7 @@ class ModelKnowledgeBase:
         Returns:
             List of ArcKnowledge objects where target_id == place_id
         """
-        return [
-            arc for arc in self.arcs.values()
-            if arc.target_id == place_id and arc.arc_type == "transition_to_place"
-        ]
+        return self._adjacent_arcs(self._arcs_by_target, place_id, "transition_to_place")
     
     def get_output_arcs_for_place(self, place_id: str) -> List[ArcKnowledge]:
         """Get all output arcs (place → transition) for a place.
@@ -719,10 +770,13 @@ class ModelKnowledgeBase:
         Returns:
             List of ArcKnowledge objects where source_id == place_id
         """
-        return [
-            arc for arc in self.arcs.values()
-            if arc.source_id == place_id and arc.arc_type == "place_to_transition"
-        ]
+        return self._adjacent_arcs(self._arcs_by_source, place_id, "place_to_transition")
+    
+    def _adjacent_arcs(self, index: Dict[str, List[ArcKnowledge]], node_id: str,
+                       arc_type: str) -> List[ArcKnowledge]:
+        """Arcs of one type at a node, from an adjacency index (O(degree))."""
+        self._ensure_arc_index()
+        return [arc for arc in index.get(node_id, ()) if arc.arc_type == arc_type]
     
     # === BIOLOGICAL QUERIES ===
     
@@ -796,8 +850,23 @@ class ModelKnowledgeBase:
     
     def is_in_siphon(self, place_id: str) -> bool:
         """Check if place is in any siphon."""
-        place = self.places.get(place_id)
-        return bool(place and place.in_siphons)
+        return bool(self._place_siphons.get(place_id))
+    
+    def get_p_invariants_for_place(self, place_id: str) -> List[PInvariant]:
+        """Get the P-invariants containing a place."""
+        return [self.p_invariants[idx] for idx in self._place_p_invariants.get(place_id, ())]
+    
+    def get_t_invariants_for_transition(self, transition_id: str) -> List[TInvariant]:
+        """Get the T-invariants containing a transition."""
+        return [self.t_invariants[idx] for idx in self._transition_t_invariants.get(transition_id, ())]
+    
+    def get_siphons_for_place(self, place_id: str) -> List[Siphon]:
+        """Get the siphons containing a place."""
+        return [self.siphons[idx] for idx in self._place_siphons.get(place_id, ())]
+    
+    def get_traps_for_place(self, place_id: str) -> List[Siphon]:
+        """Get the traps containing a place."""
+        return [self.traps[idx] for idx in self._place_traps.get(place_id, ())]
     
     # === ISSUE QUERIES ===
     
@@ -856,8 +925,8 @@ class ModelKnowledgeBase:
         
         # STRATEGY 2: Check if place is in empty siphon
         if place.in_siphons:
-            for siphon in self.siphons:
-                if place_id in siphon.place_ids and not siphon.is_properly_marked:
+            for siphon in self.get_siphons_for_place(place_id):
+                if not siphon.is_properly_marked:
                     # Empty siphon needs tokens to prevent deadlock
                     tokens = 5  # Conservative initial value
                     confidence = 0.8
@@ -866,13 +935,10 @@ class ModelKnowledgeBase:
         
         # STRATEGY 3: Check if downstream transitions are dead
         # Find transitions that this place feeds (output arcs from place to transition)
-        output_transition_ids = []
-        for arc_id, arc in self.arcs.items():
-            if arc.source_id == place_id and arc.arc_type == "place_to_transition":
-                output_transition_ids.append(arc.target_id)
+        output_transition_ids = [arc.target_id for arc in self.get_output_arcs_for_place(place_id)]
         
         if output_transition_ids:
-            dead_transitions = self.get_dead_transitions()
+            dead_transitions = set(self.get_dead_transitions())
             has_dead_output = any(tid in dead_transitions for tid in output_transition_ids)
             if has_dead_output and place.current_marking == 0:
                 tokens = 3
@@ -1022,10 +1088,7 @@ class ModelKnowledgeBase:
             transition = self.transitions.get(trans_id)
             if transition:
                 # Find input places for this transition (arcs from place to transition)
-                input_place_ids = []
-                for arc_id, arc in self.arcs.items():
-                    if arc.target_id == trans_id and arc.arc_type == "place_to_transition":
-                        input_place_ids.append(arc.source_id)
+                input_place_ids = [arc.source_id for arc in self.get_input_arcs_for_transition(trans_id)]
                 
                 for place_id in input_place_ids:
                     place = self.places.get(place_id)
@@ -0,0 +1,77 @@
+"""
+Benchmark tests for the topology analyzers on synthetic models.
+
+P-invariants scale polynomially and are measured at 10^2-10^4 nodes.
+Reachability, T-invariants and siphons are exponential in the net size, so
+they are measured on small rings below their size guards; the guards
+themselves are measured at 10^4 nodes, where they must answer at once.
+"""
+
+import pytest
+
+from synthetic_models import cyclic_pathway, size_params
+
+from shypn.topology.behavioral.reachability import ReachabilityAnalyzer
+from shypn.topology.structural.p_invariants import PInvariantAnalyzer
+from shypn.topology.structural.t_invariants import TInvariantAnalyzer
+from shypn.topology.structural.siphons import SiphonAnalyzer
+
+
+def _marked_rings(n_nodes, transition_type='continuous'):
+    model = cyclic_pathway(n_nodes, transition_type, tokens=1)
+    for place in model.places:
+        place.marking = place.tokens  # ReachabilityAnalyzer reads place.marking
+    return model
+
+
+@pytest.mark.parametrize('n_nodes', size_params(stress=(10000,)))
+def test_p_invariants(benchmark, n_nodes):
+    """Minimal P-invariants of independent rings (one per ring)."""
+    model = _marked_rings(n_nodes)
+    result = benchmark(lambda: PInvariantAnalyzer(model).analyze(max_invariants=n_nodes))
+
+    assert result.success and result.data['count'] == n_nodes // 10
+
+
+@pytest.mark.parametrize('n_nodes', size_params((20, 40), slow=(40,)))
+def test_t_invariants(benchmark, n_nodes):
+    """T-invariants of small rings (Farkas enumeration grows exponentially)."""
+    model = _marked_rings(n_nodes)
+    result = benchmark.pedantic(lambda: TInvariantAnalyzer(model).analyze(), rounds=3)
+
+    assert result.success and result.data['count'] >= n_nodes // 10
+
+
+@pytest.mark.parametrize('n_nodes', size_params((20, 30)))
+def test_siphons(benchmark, n_nodes):
+    """Siphon enumeration below the 20-place guard."""
+    model = _marked_rings(n_nodes)
+    result = benchmark(lambda: SiphonAnalyzer(model).analyze())
+
+    assert result.success and result.data['count'] >= n_nodes // 10
+
+
+@pytest.mark.parametrize('n_nodes', size_params((20, 40, 60), slow=(40,), stress=(60,)))
+def test_reachability(benchmark, n_nodes):
+    """Full reachability graph of rings with one token each (5^rings states)."""
+    model = _marked_rings(n_nodes, 'immediate')
+    result = benchmark(lambda: ReachabilityAnalyzer(model).analyze(max_states=100000))
+
+    assert result.success and result.data['total_states'] == 5 ** (n_nodes // 10)
+
+
+def test_siphon_size_guard(benchmark):
+    """A 10^4-node model is rejected without enumerating anything."""
+    model = _marked_rings(10000)
+    result = benchmark(lambda: SiphonAnalyzer(model).analyze())
+
+    assert not result.success
+
+
+@pytest.mark.xfail(raises=OverflowError, reason='State estimate (tokens + 1) ** places overflows a float')
+def test_reachability_size_guard(benchmark):
+    """A 10^4-node model is rejected without exploring any state."""
+    model = _marked_rings(10000, 'immediate')
+    result = benchmark(lambda: ReachabilityAnalyzer(model).analyze())
+
+    assert not result.success
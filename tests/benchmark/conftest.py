@@ -0,0 +1,229 @@
+"""
+Shared configuration for the benchmark suite (pytest-benchmark).
+
+- Collects ``bench_*.py`` files under tests/benchmark
+- Registers the ``slow`` (seconds per round) and ``stress`` (minutes per
+  round) markers
+- Compares every benchmark against tests/benchmark/baselines.json
+
+Baselines are stored relative to a fixed pure-Python calibration workload
+timed at session start, so a baseline recorded on one machine still means
+something on another. A benchmark regresses when its median exceeds the
+baseline by more than the threshold (default REGRESSION_THRESHOLD, or the
+per-benchmark 'threshold' in the file).
+
+    pytest tests/benchmark -m "not slow and not stress"      # quick run
+    pytest tests/benchmark --baseline-check                  # fail on regressions
+    pytest tests/benchmark --baseline-update                 # record new baselines
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+try:
+    import pytest_benchmark  # noqa: F401
+    BENCHMARK_AVAILABLE = True
+except ImportError:
+    BENCHMARK_AVAILABLE = False
+
+
+BASELINE_FILE = Path(__file__).with_name('baselines.json')
+
+REGRESSION_THRESHOLD = 0.25
+
+CALIBRATION_ROUNDS = 7
+
+_BENCHMARK_DIR = Path(__file__).parent
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('shypn-baselines', 'SHYpn benchmark baselines')
+    group.addoption('--baseline-check', action='store_true', default=False,
+                    help='Fail benchmarks slower than their stored baseline')
+    group.addoption('--baseline-update', action='store_true', default=False,
+                    help=f'Write the measured medians to {BASELINE_FILE.name}')
+    group.addoption('--regression-threshold', type=float, default=None,
+                    help=f'Allowed slowdown over baseline (default {REGRESSION_THRESHOLD})')
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'slow: benchmark cases taking seconds per round')
+    config.addinivalue_line('markers', 'stress: benchmark cases taking minutes per round')
+
+
+def pytest_collect_file(file_path, parent):
+    """Collect bench_*.py (not matched by the default test_*.py pattern)."""
+    if (BENCHMARK_AVAILABLE and file_path.suffix == '.py'
+            and file_path.name.startswith('bench_')
+            and not parent.session.isinitpath(file_path)):
+        return pytest.Module.from_parent(parent, path=file_path)
+    return None
+
+
+@pytest.fixture
+def bench_simulation(benchmark):
+    """Benchmark ``steps`` controller steps on a fresh model each round.
+
+    Returns:
+        function: (build_model, steps, time_step, rounds) -> the controller
+            of the last round
+    """
+    from shypn.engine.simulation.controller import SimulationController
+
+    def _run(build_model, steps=10, time_step=0.01, rounds=3):
+        def setup():
+            return (SimulationController(build_model()),), {}
+
+        def run(controller):
+            for _ in range(steps):
+                controller.step(time_step)
+            return controller
+
+        return benchmark.pedantic(run, setup=setup, rounds=rounds, iterations=1)
+
+    return _run
+
+
+# ----------------------------------------------------------------------
+# Baselines
+# ----------------------------------------------------------------------
+
+def _calibration_workload():
+    """Fixed mix of dict iteration, float arithmetic and sorting (~5 ms)."""
+    tokens = {f'P{i}': float(i % 7) for i in range(2000)}
+    total = 0.0
+    for _ in range(20):
+        for name, value in tokens.items():
+            total += value * 0.5
+        ordered = sorted(tokens.values(), reverse=True)
+        total += sum(ordered[:100])
+    return total
+
+
+def _measure_calibration():
+    best = float('inf')
+    for _ in range(CALIBRATION_ROUNDS):
+        started = time.perf_counter()
+        _calibration_workload()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+class BaselineStore:
+    """Stored baselines plus the results of this session."""
+
+    def __init__(self, path, threshold=None):
+        self.path = path
+        self.data = {'benchmarks': {}}
+        if path.exists():
+            with open(path) as f:
+                self.data = json.load(f)
+        self.threshold = threshold if threshold is not None else \
+            self.data.get('threshold', REGRESSION_THRESHOLD)
+        self.calibration = _measure_calibration()
+        self.results = {}      # name -> median seconds
+        self.regressions = {}  # name -> (median, allowed)
+
+    def allowed(self, name):
+        """Allowed median for a benchmark on this machine, or None."""
+        entry = self.data['benchmarks'].get(name)
+        if entry is None:
+            return None
+        threshold = entry.get('threshold', self.threshold)
+        return entry['relative'] * self.calibration * (1.0 + threshold)
+
+    def record(self, name, median):
+        """Store a result; returns (median, allowed) if it is a regression."""
+        self.results[name] = median
+        allowed = self.allowed(name)
+        if allowed is not None and median > allowed:
+            self.regressions[name] = (median, allowed)
+            return median, allowed
+        return None
+
+    def save(self):
+        benchmarks = dict(self.data.get('benchmarks', {}))
+        for name, median in self.results.items():
+            entry = benchmarks.setdefault(name, {})
+            entry['median'] = median
+            entry['relative'] = median / self.calibration
+        self.data = {
+            'threshold': self.data.get('threshold', REGRESSION_THRESHOLD),
+            'calibration': self.calibration,
+            'recorded': datetime.now().isoformat(timespec='seconds'),
+            'machine': f'{platform.machine()} {platform.python_implementation()} {platform.python_version()}',
+            'benchmarks': dict(sorted(benchmarks.items())),
+        }
+        with open(self.path, 'w') as f:
+            json.dump(self.data, f, indent=2)
+            f.write('\n')
+
+
+@pytest.fixture(scope='session')
+def baseline_store(request):
+    store = BaselineStore(BASELINE_FILE, request.config.getoption('--regression-threshold'))
+    request.config._baseline_store = store  # For the session hooks below
+    return store
+
+
+def _baseline_name(item):
+    """Node id relative to tests/benchmark, e.g. 'io/bench_shy_io.py::test_save[1000]'."""
+    path = Path(str(item.path)).resolve()
+    try:
+        relative = path.relative_to(_BENCHMARK_DIR.resolve()).as_posix()
+    except ValueError:
+        relative = path.name
+    return f'{relative}::{item.name}'
+
+
+@pytest.fixture(autouse=True)
+def _compare_with_baseline(request, baseline_store):
+    """Check the median of each benchmark against its baseline."""
+    if 'benchmark' not in request.fixturenames:
+        yield
+        return
+    benchmark = request.getfixturevalue('benchmark')
+    yield
+    metadata = getattr(benchmark, 'stats', None)
+    if not metadata or not getattr(metadata, 'stats', None):
+        return  # Skipped, failed or --benchmark-disable
+    regression = baseline_store.record(_baseline_name(request.node), metadata.stats.median)
+    config = request.config
+    if regression and config.getoption('--baseline-check') and not config.getoption('--baseline-update'):
+        median, allowed = regression
+        pytest.fail(f'Performance regression: median {median * 1000:.3f} ms, '
+                    f'baseline allows {allowed * 1000:.3f} ms', pytrace=False)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    store = getattr(session.config, '_baseline_store', None)
+    if store is not None and session.config.getoption('--baseline-update') and store.results:
+        store.save()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    store = getattr(config, '_baseline_store', None)
+    if store is None or not store.results:
+        return
+    terminalreporter.section('benchmark baselines')
+    terminalreporter.write_line(
+        f'calibration {store.calibration * 1000:.2f} ms, threshold {store.threshold:.0%}, '
+        f'{len(store.results)} measured, {len(store.regressions)} over baseline')
+    for name, (median, allowed) in sorted(store.regressions.items()):
+        terminalreporter.write_line(
+            f'  SLOWER {name}: {median * 1000:.3f} ms (allowed {allowed * 1000:.3f} ms)')
+    missing = [name for name in store.results if store.allowed(name) is None]
+    if missing and not config.getoption('--baseline-update'):
+        terminalreporter.write_line(f'  {len(missing)} without baseline (run with --baseline-update)')
+    if config.getoption('--baseline-update'):
+        terminalreporter.write_line(f'  baselines written to {store.path}')
@@ -0,0 +1,20 @@
+"""
+Benchmark tests for hybrid models (all four transition types in one net).
+
+Each ring mixes immediate, timed, stochastic and continuous transitions,
+so one step exercises every phase of SimulationController.step().
+"""
+
+import pytest
+
+from synthetic_models import hybrid_model, size_params
+
+
+@pytest.mark.parametrize('n_nodes', size_params(stress=(10000,)))
+def test_hybrid_rings(bench_simulation, n_nodes):
+    """10 steps over rings of mixed transition types."""
+    controller = bench_simulation(lambda: hybrid_model(n_nodes))
+
+    model = controller.model
+    assert controller.time == pytest.approx(0.1)
+    assert sum(p.tokens for p in model.places) == pytest.approx(10 * (len(model.transitions) // 5))
@@ -7,7 +7,7 @@ Tests measure firing performance under various conditions.
 import pytest
 
 
-def test_single_firing_performance(benchmark, ptp_model, run_simulation):
+def test_single_firing_performance(bench_firing, ptp_model):
     """
     Benchmark single firing of immediate transition.
     
@@ -15,17 +15,16 @@ def test_single_firing_performance(benchmark, ptp_model, run_simulation):
     Performance target: < 1ms
     """
     model, P1, T1, P2, A1, A2 = ptp_model
-    P1.tokens = 1
     
-    # Benchmark
-    result = benchmark(run_simulation, model, max_time=1.0)
+    # Benchmark (P1 is refilled before each round)
+    result = bench_firing(ptp_model, 1, max_time=1.0)
     
     # Verify correctness
     assert P2.tokens == 1
     assert len(result['firings']) == 1
 
 
-def test_multiple_firings_performance(benchmark, ptp_model, run_simulation):
+def test_multiple_firings_performance(bench_firing, ptp_model):
     """
     Benchmark multiple firings of immediate transition.
     
@@ -33,10 +32,9 @@ def test_multiple_firings_performance(benchmark, ptp_model, run_simulation):
     Performance target: < 10ms
     """
     model, P1, T1, P2, A1, A2 = ptp_model
-    P1.tokens = 100
     
-    # Benchmark
-    result = benchmark(run_simulation, model, max_time=1.0)
+    # Benchmark (P1 is refilled before each round)
+    result = bench_firing(ptp_model, 100, max_time=1.0)
     
     # Verify correctness
     assert P2.tokens == 100
@@ -44,7 +42,7 @@ def test_multiple_firings_performance(benchmark, ptp_model, run_simulation):
 
 
 @pytest.mark.slow
-def test_high_volume_firing_performance(benchmark, ptp_model, run_simulation):
+def test_high_volume_firing_performance(bench_firing, ptp_model):
     """
     Benchmark high-volume firing (1000 firings).
     
@@ -52,17 +50,16 @@ def test_high_volume_firing_performance(benchmark, ptp_model, run_simulation):
     Performance target: < 100ms
     """
     model, P1, T1, P2, A1, A2 = ptp_model
-    P1.tokens = 1000
     
-    # Benchmark
-    result = benchmark(run_simulation, model, max_time=10.0)
+    # Benchmark (P1 is refilled before each round)
+    result = bench_firing(ptp_model, 1000, max_time=10.0, rounds=3)
     
     # Verify correctness
     assert P2.tokens == 1000
     assert len(result['firings']) == 1000
 
 
-def test_firing_with_empty_input(benchmark, ptp_model, run_simulation):
+def test_firing_with_empty_input(bench_firing, ptp_model):
     """
     Benchmark handling of disabled transition.
     
@@ -70,10 +67,9 @@ def test_firing_with_empty_input(benchmark, ptp_model, run_simulation):
     Performance target: < 0.1ms
     """
     model, P1, T1, P2, A1, A2 = ptp_model
-    P1.tokens = 0
     
-    # Benchmark
-    result = benchmark(run_simulation, model, max_time=1.0)
+    # Benchmark (P1 is refilled before each round)
+    result = bench_firing(ptp_model, 0, max_time=1.0)
     
     # Verify correctness
     assert P2.tokens == 0
@@ -81,7 +77,7 @@ def test_firing_with_empty_input(benchmark, ptp_model, run_simulation):
 
 
 @pytest.mark.stress
-def test_sequential_firings_stress(benchmark, ptp_model, run_simulation):
+def test_sequential_firings_stress(bench_firing, ptp_model):
     """
     Stress test with 10000 sequential firings.
     
@@ -89,10 +85,9 @@ def test_sequential_firings_stress(benchmark, ptp_model, run_simulation):
     Performance target: < 1s
     """
     model, P1, T1, P2, A1, A2 = ptp_model
-    P1.tokens = 10000
     
-    # Benchmark
-    result = benchmark(run_simulation, model, max_time=100.0)
+    # Benchmark (P1 is refilled before each round)
+    result = bench_firing(ptp_model, 10000, max_time=100.0, rounds=1)
     
     # Verify correctness
     assert P2.tokens == 10000
@@ -0,0 +1,20 @@
+"""
+Benchmark tests for immediate transitions on synthetic models of 10^2-10^4 nodes.
+
+A single token runs down a linear pathway; immediate exhaustion fires the
+chain within one step (up to the controller's per-step limit).
+"""
+
+import pytest
+
+from synthetic_models import linear_pathway, size_params
+
+
+@pytest.mark.parametrize('n_nodes', size_params(slow=(1000,), stress=(10000,)))
+def test_immediate_chain_exhaustion(bench_simulation, n_nodes):
+    """Immediate chain fired to exhaustion in one step."""
+    controller = bench_simulation(
+        lambda: linear_pathway(n_nodes, 'immediate', tokens=1), steps=1)
+
+    assert sum(p.tokens for p in controller.model.places) == 1
+    assert controller.model.places[0].tokens == 0
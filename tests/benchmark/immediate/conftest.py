@@ -124,14 +124,21 @@ def run_simulation():
         # Step-based execution for benchmarking
         time_step = 0.001
         
+        # One entry per transition firing (immediate transitions can fire
+        # several times within a single step)
+        counts = {t.id: t.firing_count for t in manager.transitions}
+        
         while controller.time < max_time and steps < max_steps:
-            fired = controller.step(time_step=time_step)
+            controller.step(time_step=time_step)
             
-            if fired:
-                firings.append({
-                    'time': controller.time,
-                    'step': steps
-                })
+            for t in manager.transitions:
+                for _ in range(t.firing_count - counts[t.id]):
+                    firings.append({
+                        'time': controller.time,
+                        'step': steps,
+                        'transition': t.id
+                    })
+                counts[t.id] = t.firing_count
             
             steps += 1
             
@@ -150,6 +157,31 @@ def run_simulation():
     return _run
 
 
+@pytest.fixture
+def bench_firing(benchmark, run_simulation):
+    """
+    Benchmark draining P1 of a P-T-P model, refilled before every round.
+    
+    pytest-benchmark calls the target repeatedly on the same model; without
+    the refill every round after the first would start from an empty P1.
+    
+    Returns:
+        function: (ptp_model, tokens, max_time, rounds) -> last round's results
+    """
+    def _bench(ptp, tokens, max_time=1.0, rounds=5):
+        manager, P1, T1, P2, A1, A2 = ptp
+        
+        def setup():
+            P1.tokens = tokens
+            P2.tokens = 0
+            return (manager,), {'max_time': max_time}
+        
+        return benchmark.pedantic(run_simulation, setup=setup,
+                                  rounds=rounds, iterations=1)
+    
+    return _bench
+
+
 @pytest.fixture
 def benchmark_config():
     """
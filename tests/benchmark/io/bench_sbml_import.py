@@ -0,0 +1,45 @@
+"""
+Benchmark tests for SBML import of the models bundled with the repository.
+
+Runs the import pipeline of shypn.importer.batch (parse, post-process with
+layout, convert with kinetics) on data/biomodels_test and the test
+glycolysis model. Skipped when python-libsbml is not installed.
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('libsbml')
+
+from shypn.data.pathway.sbml_parser import SBMLParser
+from shypn.data.pathway.pathway_postprocessor import PathwayPostProcessor
+from shypn.data.pathway.pathway_converter import PathwayConverter
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+BUNDLED_MODELS = sorted(
+    [*(REPO_ROOT / 'data' / 'biomodels_test').glob('*.xml'),
+     REPO_ROOT / 'tests' / 'pathway' / 'simple_glycolysis.sbml'],
+    key=lambda path: path.name
+)
+
+
+@pytest.mark.parametrize('source', BUNDLED_MODELS, ids=lambda path: path.stem)
+def test_sbml_parse(benchmark, source):
+    pathway = benchmark(SBMLParser().parse_file, str(source))
+
+    assert pathway.species and pathway.reactions
+
+
+@pytest.mark.parametrize('source', BUNDLED_MODELS, ids=lambda path: path.stem)
+def test_sbml_import(benchmark, source):
+    """Parse, layout and conversion to a DocumentModel."""
+    def import_model():
+        pathway = SBMLParser().parse_file(str(source))
+        processed = PathwayPostProcessor(apply_layout=True).process(pathway)
+        return PathwayConverter().convert(processed)
+
+    document = benchmark.pedantic(import_model, rounds=5)
+    assert document.places and document.transitions
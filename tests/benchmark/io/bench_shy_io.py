@@ -0,0 +1,42 @@
+"""
+Benchmark tests for .shy save and load on hybrid models of 10^2-10^4 nodes.
+
+Covers the plain JSON file, gzip compression and the NumPy columnar
+sidecar (see shypn.data.canvas.shy_io).
+"""
+
+import pytest
+
+from synthetic_models import hybrid_model, size_params
+
+from shypn.data.canvas.document_model import DocumentModel
+
+
+FORMATS = {
+    'plain': {},
+    'gzip': {'compression': 'gzip'},
+    'columns': {'columns': True},
+}
+
+
+@pytest.mark.parametrize('fmt', sorted(FORMATS))
+@pytest.mark.parametrize('n_nodes', size_params())
+def test_save(benchmark, tmp_path, n_nodes, fmt):
+    model = hybrid_model(n_nodes)
+    path = tmp_path / 'model.shy'
+    benchmark(model.save_to_file, str(path), **FORMATS[fmt])
+
+    assert path.stat().st_size > 0
+
+
+@pytest.mark.parametrize('fmt', sorted(FORMATS))
+@pytest.mark.parametrize('n_nodes', size_params())
+def test_load(benchmark, tmp_path, n_nodes, fmt):
+    model = hybrid_model(n_nodes)
+    path = tmp_path / 'model.shy'
+    model.save_to_file(str(path), **FORMATS[fmt])
+    loaded = benchmark(DocumentModel.load_from_file, str(path))
+
+    assert len(loaded.arcs) == len(model.arcs)
+    assert sorted(t.transition_type for t in loaded.transitions) == \
+        sorted(t.transition_type for t in model.transitions)
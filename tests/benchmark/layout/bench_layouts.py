@@ -0,0 +1,68 @@
+"""
+Benchmark tests for SCC detection, the Solar System (SSCC) layout and the
+graph layout algorithms on galaxy models of 10^2-10^4 nodes.
+
+Layout algorithms use the parameters LayoutSelector recommends for the
+graph, as the Layout menu does. The O(n^2) force simulations (SSCC,
+force-directed) are limited to 10^3 nodes.
+"""
+
+import pytest
+
+from synthetic_models import galaxy_model, size_params
+
+from shypn.layout.sscc import CSRGraph, SCCDetector, SolarSystemLayoutEngine
+from shypn.edit.graph_layout.engine import LayoutEngine
+
+
+SSCC_ITERATIONS = 50
+
+
+@pytest.mark.parametrize('n_nodes', size_params())
+def test_scc_detection(benchmark, n_nodes):
+    """CSR graph construction plus Tarjan SCC detection."""
+    model = galaxy_model(n_nodes)
+
+    def detect():
+        csr = CSRGraph.from_petri_net(model.places, model.transitions, model.arcs)
+        return SCCDetector().find_sccs(csr)
+
+    sccs = benchmark(detect)
+    assert sccs == []  # Galaxies are acyclic
+
+
+@pytest.mark.parametrize('n_nodes', size_params((100, 1000), slow=(1000,)))
+def test_solar_system_layout(benchmark, n_nodes):
+    """SSCC structure analysis and SSCC_ITERATIONS physics iterations."""
+    model = galaxy_model(n_nodes)
+
+    def layout():
+        engine = SolarSystemLayoutEngine(iterations=SSCC_ITERATIONS)
+        return engine.apply_layout(model.places, model.transitions, model.arcs)
+
+    positions = benchmark.pedantic(layout, rounds=3)
+    assert len(positions) == len(model.places) + len(model.transitions)
+
+
+def _layout_params(algorithm, sizes):
+    return [pytest.param(algorithm, *param.values, marks=param.marks, id=f'{algorithm}-{param.id}')
+            for param in sizes]
+
+
+@pytest.mark.parametrize('algorithm,n_nodes', [
+    *_layout_params('hierarchical', size_params(slow=(10000,))),
+    *_layout_params('circular', size_params()),
+    *_layout_params('multilevel', size_params(slow=(10000,))),
+    *_layout_params('force_directed', size_params((100, 1000), slow=(1000,))),
+])
+def test_graph_layout(benchmark, algorithm, n_nodes):
+    """LayoutEngine graph build plus one algorithm with recommended parameters."""
+    engine = LayoutEngine(galaxy_model(n_nodes))
+
+    def layout():
+        graph = engine.build_graph()
+        parameters = engine.selector.recommend_parameters(graph, algorithm)
+        return engine.algorithms[algorithm].compute(graph, **parameters)
+
+    positions = benchmark.pedantic(layout, rounds=3)
+    assert len(positions) == engine.build_graph().number_of_nodes()
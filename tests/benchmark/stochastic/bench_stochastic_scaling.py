@@ -0,0 +1,22 @@
+"""
+Benchmark tests for stochastic transitions on synthetic models of 10^2-10^4 nodes.
+
+Stochastic transitions sample exponential delays at
+DEFAULT_RATES['stochastic']; firing counts vary between rounds, token
+totals do not.
+"""
+
+import pytest
+
+from synthetic_models import cyclic_pathway, size_params
+
+
+@pytest.mark.parametrize('n_nodes', size_params(stress=(10000,)))
+def test_stochastic_rings(bench_simulation, n_nodes):
+    """10 steps over independent stochastic rings."""
+    controller = bench_simulation(lambda: cyclic_pathway(n_nodes, 'stochastic'))
+
+    model = controller.model
+    assert controller.time == pytest.approx(0.1)
+    # Rings conserve tokens (10 per ring)
+    assert sum(p.tokens for p in model.places) == pytest.approx(10 * (len(model.transitions) // 5))
@@ -0,0 +1,183 @@
+"""
+Synthetic Petri net generators for the benchmark suite.
+
+Every generator builds a DocumentModel with (approximately) ``n_nodes``
+places + transitions, deterministically for a given seed, so the same
+benchmark always measures the same net:
+
+- linear_pathway: P0 -> T0 -> P1 -> ... chain (no cycles)
+- cyclic_pathway: Independent rings of RING_SIZE nodes (conservative,
+  one P-invariant and one T-invariant per ring)
+- hub_constellation: Hub transitions with orbiting input/output places
+  (after scripts/generate_test_models.py)
+- galaxy_model: Clusters of hubs joined by shared places, no links
+  between clusters (after scripts/generate_galaxy_model.py)
+- hybrid_model: Rings whose transitions cycle through all four types
+
+Positions follow a grid so layouts and .shy files start from realistic
+coordinates.
+"""
+
+import random
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from shypn.data.canvas.document_model import DocumentModel
+from shypn.netobjs import Place, Transition, Arc
+
+
+SIZES = (100, 1000, 10000)
+
+TRANSITION_TYPES = ('immediate', 'timed', 'stochastic', 'continuous')
+
+RING_SIZE = 10
+
+# Default rate per type: timed uses it as the firing delay
+DEFAULT_RATES = {
+    'immediate': 1.0,
+    'timed': 0.05,
+    'stochastic': 5.0,
+    'continuous': 1.0,
+}
+
+GRID_SPACING = 80.0
+
+
+class _Builder:
+    """Appends places, transitions and arcs with sequential ids."""
+
+    def __init__(self, columns):
+        self.model = DocumentModel()
+        self.columns = max(1, columns)
+        self._next_id = 1
+
+    def _position(self):
+        index = self._next_id - 1
+        return ((index % self.columns) * GRID_SPACING,
+                (index // self.columns) * GRID_SPACING)
+
+    def place(self, tokens=0):
+        x, y = self._position()
+        place = Place(x, y, f'P{self._next_id}', f'P{self._next_id}')
+        place.tokens = tokens
+        place.initial_marking = tokens
+        self._next_id += 1
+        self.model.places.append(place)
+        return place
+
+    def transition(self, transition_type='continuous', rate=None):
+        x, y = self._position()
+        transition = Transition(x, y, f'T{self._next_id}', f'T{self._next_id}')
+        transition.transition_type = transition_type
+        transition.rate = DEFAULT_RATES[transition_type] if rate is None else rate
+        self._next_id += 1
+        self.model.transitions.append(transition)
+        return transition
+
+    def arc(self, source, target, weight=1):
+        arc = Arc(source, target, f'A{len(self.model.arcs) + 1}',
+                  f'A{len(self.model.arcs) + 1}', weight=weight)
+        self.model.arcs.append(arc)
+        return arc
+
+
+def _columns(n_nodes):
+    return int(n_nodes ** 0.5) + 1
+
+
+def linear_pathway(n_nodes, transition_type='continuous', tokens=100):
+    """Chain of n_nodes // 2 place/transition pairs; the first place is marked."""
+    builder = _Builder(_columns(n_nodes))
+    previous = builder.place(tokens)
+    for _ in range(max(1, n_nodes // 2 - 1)):
+        transition = builder.transition(transition_type)
+        place = builder.place()
+        builder.arc(previous, transition)
+        builder.arc(transition, place)
+        previous = place
+    return builder.model
+
+
+def cyclic_pathway(n_nodes, transition_type='continuous', tokens=10):
+    """Independent rings of RING_SIZE nodes, one marked place per ring."""
+    builder = _Builder(_columns(n_nodes))
+    for _ in range(max(1, n_nodes // RING_SIZE)):
+        places = [builder.place(tokens if i == 0 else 0) for i in range(RING_SIZE // 2)]
+        for i, place in enumerate(places):
+            transition = builder.transition(transition_type)
+            builder.arc(place, transition)
+            builder.arc(transition, places[(i + 1) % len(places)])
+    return builder.model
+
+
+def hub_constellation(n_nodes, satellites=6, tokens=10):
+    """Hub transitions, each consuming from half its satellites and producing
+    into the other half."""
+    builder = _Builder(_columns(n_nodes))
+    for _ in range(max(1, n_nodes // (satellites + 1))):
+        hub = builder.transition('continuous')
+        for i in range(satellites):
+            place = builder.place(tokens if i < satellites // 2 else 0)
+            if i < satellites // 2:
+                builder.arc(place, hub)
+            else:
+                builder.arc(hub, place)
+    return builder.model
+
+
+def galaxy_model(n_nodes, hubs_per_galaxy=3, satellites=4, seed=0, tokens=10):
+    """Galaxies of hubs; hubs of a galaxy share places, galaxies are disjoint."""
+    rng = random.Random(seed)
+    builder = _Builder(_columns(n_nodes))
+    galaxy_size = hubs_per_galaxy * (satellites + 1) + hubs_per_galaxy - 1
+    for _ in range(max(1, n_nodes // galaxy_size)):
+        hubs = []
+        for _ in range(hubs_per_galaxy):
+            hub = builder.transition('continuous')
+            for i in range(satellites):
+                place = builder.place(rng.randint(0, tokens) if i < satellites // 2 else 0)
+                if i < satellites // 2:
+                    builder.arc(place, hub)
+                else:
+                    builder.arc(hub, place)
+            hubs.append(hub)
+        for upstream, downstream in zip(hubs, hubs[1:]):
+            shared = builder.place()
+            builder.arc(upstream, shared)
+            builder.arc(shared, downstream)
+    return builder.model
+
+
+def hybrid_model(n_nodes, tokens=10):
+    """Rings whose transitions cycle immediate/timed/stochastic/continuous."""
+    model = cyclic_pathway(n_nodes, tokens=tokens)
+    for i, transition in enumerate(model.transitions):
+        transition.transition_type = TRANSITION_TYPES[i % len(TRANSITION_TYPES)]
+        transition.rate = DEFAULT_RATES[transition.transition_type]
+    return model
+
+
+GENERATORS = {
+    'linear': linear_pathway,
+    'cyclic': cyclic_pathway,
+    'hub': hub_constellation,
+    'galaxy': galaxy_model,
+    'hybrid': hybrid_model,
+}
+
+
+def size_params(sizes=SIZES, slow=(), stress=()):
+    """pytest parameters for sizes, marking the slow and stress ones."""
+    params = []
+    for size in sizes:
+        marks = []
+        if size in slow:
+            marks.append(pytest.mark.slow)
+        if size in stress:
+            marks.append(pytest.mark.stress)
+        params.append(pytest.param(size, marks=marks, id=str(size)))
+    return params
@@ -0,0 +1,21 @@
+"""
+Benchmark tests for timed transitions on synthetic models of 10^2-10^4 nodes.
+
+Timed transitions fire once their delay (DEFAULT_RATES['timed']) has
+elapsed; 10 steps of 0.01 cover several firing windows per ring.
+"""
+
+import pytest
+
+from synthetic_models import cyclic_pathway, size_params
+
+
+@pytest.mark.parametrize('n_nodes', size_params(stress=(10000,)))
+def test_timed_rings(bench_simulation, n_nodes):
+    """10 steps over independent timed rings."""
+    controller = bench_simulation(lambda: cyclic_pathway(n_nodes, 'timed'))
+
+    model = controller.model
+    assert controller.time == pytest.approx(0.1)
+    # Rings conserve tokens (10 per ring)
+    assert sum(p.tokens for p in model.places) == pytest.approx(10 * (len(model.transitions) // 5))
@@ -0,0 +1,175 @@
+"""Tests for background (worker process) layout computation.
+
+Verifies that layouts computed on a geometry snapshot stream preview
+positions, apply final positions atomically, and restore the original
+positions when cancelled or discarded.
+"""
+
+import sys
+import os
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from shypn.edit.graph_layout import LayoutEngine, LayoutSnapshot, compute_snapshot_layout
+from shypn.edit.graph_layout.background import LayoutCancelled, STATE_DONE, STATE_CANCELLED
+from shypn.netobjs import Place, Transition, Arc
+
+
+class FakeManager:
+    """Minimal ModelCanvasManager stand-in (places/transitions/arcs + mark_dirty)."""
+
+    def __init__(self, places, transitions, arcs):
+        self.places = places
+        self.transitions = transitions
+        self.arcs = arcs
+        self.dirty = False
+
+    def mark_dirty(self):
+        self.dirty = True
+
+
+def create_chain_manager(length=20):
+    """Create P0 → T0 → P1 → T1 → ... chain with all objects at the origin."""
+    places = [Place(x=0.0, y=0.0, id=f"P{i}", name=f"P{i}") for i in range(length + 1)]
+    transitions = [Transition(x=0.0, y=0.0, id=f"T{i}", name=f"T{i}") for i in range(length)]
+    arcs = []
+    for i, transition in enumerate(transitions):
+        arcs.append(Arc(places[i], transition, f"A{2 * i}", f"A{2 * i}", 1))
+        arcs.append(Arc(transition, places[i + 1], f"A{2 * i + 1}", f"A{2 * i + 1}", 1))
+    return FakeManager(places, transitions, arcs)
+
+
+def test_snapshot_roundtrip():
+    """Snapshot captures geometry and rebuilds detached objects."""
+    manager = create_chain_manager(3)
+    manager.places[0].x = 10.0
+    snapshot, key_to_object = LayoutSnapshot.from_document(manager)
+
+    assert snapshot.node_count == 7
+    assert len(snapshot.arcs) == 6
+    assert key_to_object[('place', 'P0')] is manager.places[0]
+    assert snapshot.original_positions()[('place', 'P0')] == (10.0, 0.0)
+
+    places, transitions, arcs, object_to_key = snapshot.rebuild()
+    assert len(places) == 4 and len(transitions) == 3 and len(arcs) == 6
+    assert places[0] is not manager.places[0]
+    assert object_to_key[places[0]] == ('place', 'P0')
+
+
+def test_force_directed_streams_previews():
+    """Force-directed layout reports intermediate positions every N iterations."""
+    manager = create_chain_manager(10)
+    snapshot, _ = LayoutSnapshot.from_document(manager)
+    previews = []
+
+    result = compute_snapshot_layout(
+        snapshot, 'force_directed', {'iterations': 100},
+        preview_interval=25,
+        preview_callback=lambda it, total, pos: previews.append((it, total, len(pos)))
+    )
+
+    assert [p[0] for p in previews] == [25, 50, 75]
+    assert all(p[1] == 100 and p[2] == snapshot.node_count for p in previews)
+    assert len(result['positions']) == snapshot.node_count
+    # Centroid of the snapshot (origin) is preserved
+    xs = [x for x, _ in result['positions'].values()]
+    assert abs(sum(xs) / len(xs)) < 1e-6
+
+
+def test_solar_system_streams_previews_and_cancels():
+    """Solar System physics reports previews and stops when cancelled."""
+    manager = create_chain_manager(5)
+    snapshot, _ = LayoutSnapshot.from_document(manager)
+    previews = []
+
+    def on_preview(iteration, total, positions):
+        previews.append(iteration)
+
+    try:
+        compute_snapshot_layout(
+            snapshot, 'solar_system', {'iterations': 200},
+            preview_interval=20,
+            preview_callback=on_preview,
+            is_cancelled=lambda: len(previews) >= 2
+        )
+        assert False, "Expected LayoutCancelled"
+    except LayoutCancelled:
+        pass
+
+    assert previews == [20, 40]
+
+
+def test_background_job_applies_final_positions():
+    """Worker-process job applies final positions and marks document dirty."""
+    manager = create_chain_manager(8)
+    engine = LayoutEngine(manager)
+    completed = []
+
+    job = engine.apply_layout_async(
+        'hierarchical',
+        on_complete=lambda job, result: completed.append(result)
+    )
+    assert job.wait(timeout=60)
+
+    assert job.state == STATE_DONE
+    assert len(completed) == 1
+    assert completed[0]['nodes_moved'] == 17
+    assert manager.dirty
+    assert len({(p.x, p.y) for p in manager.places}) > 1
+
+
+def test_background_job_cancel_restores_positions():
+    """Cancelling restores the positions captured at snapshot time."""
+    manager = create_chain_manager(30)
+    for i, place in enumerate(manager.places):
+        place.x = float(i)
+    original = [(obj.x, obj.y) for obj in manager.places + manager.transitions]
+    engine = LayoutEngine(manager)
+    cancelled = []
+
+    job = engine.apply_layout_async(
+        'solar_system',
+        on_cancelled=lambda job: cancelled.append(True),
+        preview_interval=1,
+        preserve_center=False,
+        iterations=100000
+    )
+    job.cancel()
+    assert job.wait(timeout=60)
+
+    assert job.state == STATE_CANCELLED
+    assert cancelled == [True]
+    assert not manager.dirty
+    assert [(obj.x, obj.y) for obj in manager.places + manager.transitions] == original
+
+
+def test_discard_restores_at_once_and_ignores_the_worker():
+    """Discarding never waits for the worker and drops its late result."""
+    manager = create_chain_manager(30)
+    for i, place in enumerate(manager.places):
+        place.x = float(i)
+    original = [(obj.x, obj.y) for obj in manager.places + manager.transitions]
+    engine = LayoutEngine(manager)
+    events = []
+
+    job = engine.apply_layout_async(
+        'solar_system',
+        on_complete=lambda job, result: events.append('complete'),
+        on_cancelled=lambda job: events.append('cancelled'),
+        preview_interval=1,
+        preserve_center=False,
+        iterations=100000
+    )
+    while job.preview_count == 0:  # Let previews move the objects
+        assert job.poll()
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    job.discard()
+    assert time.monotonic() - started < 0.5
+
+    assert job.state == STATE_CANCELLED and events == ['cancelled']
+    assert [(obj.x, obj.y) for obj in manager.places + manager.transitions] == original
+    assert not job.poll() and job.result is None and not manager.dirty
@@ -0,0 +1,95 @@
+"""Tests for the headless batch SBML/KGML importer."""
+
+import sys
+import os
+import json
+import shutil
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.importer.batch import (
+    ImportOptions, batch_import, detect_format, import_file, main
+)
+from shypn.data.canvas.document_model import DocumentModel
+
+
+EXAMPLES = Path(__file__).parent.parent / 'workspace' / 'examples' / 'pathways'
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Two KGML pathways (one in a sub-directory) and one broken file."""
+    src = tmp_path / 'src'
+    (src / 'sub').mkdir(parents=True)
+    shutil.copy(EXAMPLES / 'hsa00020.kgml', src / 'hsa00020.kgml')
+    shutil.copy(EXAMPLES / 'hsa00030.kgml', src / 'sub' / 'hsa00030.xml')
+    (src / 'broken.xml').write_text('<sbml><model')
+    return src
+
+
+def test_detect_format(sources):
+    assert detect_format(sources / 'hsa00020.kgml') == 'kgml'
+    assert detect_format(sources / 'sub' / 'hsa00030.xml') == 'kgml'
+    assert detect_format(sources / 'broken.xml') == 'sbml'
+
+
+def test_import_file_writes_loadable_model(sources, tmp_path):
+    output = tmp_path / 'out' / 'tca.shy'
+    result = import_file(sources / 'hsa00020.kgml', output, ImportOptions(offline=True))
+
+    assert result.success, result.error
+    assert {'parse', 'convert', 'save'} <= set(result.timings)
+    document = DocumentModel.load_from_file(str(output))
+    assert len(document.transitions) == result.transitions > 0
+
+
+def test_parallel_batch_reports_failures(sources, tmp_path):
+    out = tmp_path / 'out'
+    progress = []
+    report = batch_import(sources, out, ImportOptions(offline=True), max_workers=2,
+                          recursive=True,
+                          progress_callback=lambda done, total, r: progress.append((done, total)))
+
+    assert [Path(r.source).name for r in report.results] == ['broken.xml', 'hsa00020.kgml', 'hsa00030.xml']
+    assert len(report.succeeded) == 2 and len(report.failed) == 1
+    assert (out / 'hsa00020.shy').exists()
+    assert (out / 'sub' / 'hsa00030.shy').exists()
+    assert progress[-1] == (3, 3)
+    assert 'failed 1 of 3' in report.summary()
+
+
+def test_same_stem_inputs_get_distinct_outputs(sources, tmp_path):
+    out = tmp_path / 'out'
+    shutil.copy(sources / 'sub' / 'hsa00030.xml', sources / 'hsa00020.xml')
+    report = batch_import([sources / 'hsa00020.kgml', sources / 'hsa00020.xml'], out,
+                          ImportOptions(offline=True), max_workers=1)
+
+    assert [Path(r.output).name for r in report.results] == ['hsa00020.shy', 'hsa00020_xml.shy']
+    assert len(report.succeeded) == 2
+    pentose = DocumentModel.load_from_file(str(out / 'hsa00020_xml.shy'))
+    tca = DocumentModel.load_from_file(str(out / 'hsa00020.shy'))
+    assert len(pentose.transitions) != len(tca.transitions)
+
+
+def test_changed_only_skips_up_to_date_models(sources, tmp_path):
+    out = tmp_path / 'out'
+    options = ImportOptions(offline=True, skip_unchanged=True)
+    batch_import(sources / 'hsa00020.kgml', out, options, max_workers=1)
+    report = batch_import(sources / 'hsa00020.kgml', out, options, max_workers=1)
+    assert len(report.skipped) == 1
+
+
+def test_cli_writes_json_report(sources, tmp_path, capsys):
+    report_path = tmp_path / 'report.json'
+    status = main([str(sources / 'hsa00020.kgml'), str(sources / 'broken.xml'),
+                   '-o', str(tmp_path / 'out'), '-j', '1', '--offline', '-q',
+                   '--report', str(report_path)])
+
+    assert status == 1
+    report = json.loads(report_path.read_text())
+    assert (report['succeeded'], report['failed']) == (1, 1)
+    assert 'Imported 1' in capsys.readouterr().out
@@ -0,0 +1,186 @@
+"""Tests for concurrent multi-source fetching in the EnrichmentPipeline.
+
+Uses local stub fetchers (no network) to cover concurrency, timeouts,
+per-source rate limits, early completion and request coalescing.
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.crossfetch.core import EnrichmentPipeline, ConcurrentFetcher, RateLimiter, RequestCoalescer
+from shypn.crossfetch.fetchers import BaseFetcher
+from shypn.crossfetch.models import EnrichmentRequest, FetchStatus
+
+
+class StubFetcher(BaseFetcher):
+    """Fetcher returning canned data after a delay."""
+
+    def __init__(self, name, delay=0.0, reliability=0.5, available=True, error=None):
+        super().__init__(source_name=name, source_reliability=reliability)
+        self.delay = delay
+        self.available = available
+        self.error = error
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def fetch(self, pathway_id, data_type, **kwargs):
+        with self._lock:
+            self.calls.append(time.monotonic())
+        time.sleep(self.delay)
+        if self.error:
+            raise RuntimeError(self.error)
+        return self._create_success_result(
+            data={"value": self.source_name},
+            data_type=data_type,
+            fields_filled=["value"]
+        )
+
+    def is_available(self):
+        return self.available
+
+    def get_supported_data_types(self):
+        return ["concentrations"]
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = EnrichmentPipeline()
+    for name in list(pipeline.fetchers):
+        pipeline.unregister_fetcher(name)
+    yield pipeline
+    pipeline.concurrent_fetcher.shutdown()
+
+
+def fetch(pipeline, **request_options):
+    request = EnrichmentRequest.create_simple("stub00001", ["concentrations"])
+    for key, value in request_options.items():
+        setattr(request, key, value)
+    return pipeline._fetch_from_sources(request, "concentrations")
+
+
+def test_sources_are_fetched_concurrently(pipeline):
+    """Three 0.2 s sources finish in about 0.2 s, results in registration order."""
+    for name in ("A", "B", "C"):
+        pipeline.register_fetcher(StubFetcher(name, delay=0.2))
+    pipeline.register_fetcher(StubFetcher("Down", available=False))
+    pipeline.register_fetcher(StubFetcher("Broken", error="boom"))
+
+    started = time.monotonic()
+    results = fetch(pipeline)
+    elapsed = time.monotonic() - started
+
+    assert [r.attribution.source_name for r in results] == ["A", "B", "C"]
+    assert elapsed < 0.45
+
+
+def test_slow_source_times_out(pipeline):
+    """A source exceeding its timeout is reported as TIMEOUT without blocking."""
+    pipeline.register_fetcher(StubFetcher("Fast", delay=0.0))
+    pipeline.register_fetcher(StubFetcher("Slow", delay=1.0))
+    pipeline.set_source_limits("Slow", timeout=0.1)
+
+    started = time.monotonic()
+    results = fetch(pipeline)
+
+    assert time.monotonic() - started < 0.5
+    assert results[0].status == FetchStatus.SUCCESS
+    assert results[1].status == FetchStatus.TIMEOUT
+
+
+def test_early_completion_on_sufficient_quality(pipeline):
+    """A result above the QualityScorer threshold ends the wait for others."""
+    pipeline.register_fetcher(StubFetcher("Slow", delay=1.0, reliability=0.5))
+    pipeline.register_fetcher(StubFetcher("Good", delay=0.05, reliability=1.0))
+
+    started = time.monotonic()
+    results = fetch(pipeline)
+
+    assert time.monotonic() - started < 0.5
+    assert [r.attribution.source_name for r in results] == ["Good"]
+
+    pipeline.early_completion = False
+    assert len(fetch(pipeline)) == 2
+
+
+def test_rate_limiter_spaces_calls():
+    """A 20/s bucket with burst 1 spaces calls by about 50 ms."""
+    limiter = RateLimiter(rate=20.0)
+    started = time.monotonic()
+    for _ in range(4):
+        assert limiter.acquire()
+    assert time.monotonic() - started >= 0.14
+
+    # The bucket is empty: a zero timeout gives up instead of waiting
+    assert not limiter.acquire(timeout=0.0)
+
+
+def test_rate_limit_applies_per_source():
+    """Successive fetches from one rate-limited source are spaced out."""
+    stub = StubFetcher("Limited")
+    fetcher = ConcurrentFetcher()
+    fetcher.set_rate_limit("Limited", rate=10.0)
+
+    for i in range(3):
+        fetcher.fetch_all([stub], f"pathway{i}", "concentrations")
+    fetcher.shutdown()
+
+    gaps = [b - a for a, b in zip(stub.calls, stub.calls[1:])]
+    assert all(gap >= 0.08 for gap in gaps)
+
+
+def test_identical_requests_are_coalesced():
+    """Concurrent identical requests run one fetch and share its result."""
+    stub = StubFetcher("Shared", delay=0.2)
+    fetcher = ConcurrentFetcher()
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.extend(
+            fetcher.fetch_all([stub], "stub00001", "concentrations")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    fetcher.shutdown()
+
+    assert len(stub.calls) == 1
+    assert len(results) == 4
+    assert all(result is results[0] for result in results)
+
+
+def test_coalescer_shares_exceptions():
+    """Waiting callers see the owner's exception; nothing is cached afterwards."""
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    errors = []
+
+    def failing():
+        release.wait()
+        raise ValueError("bad")
+
+    def call():
+        try:
+            coalescer.run("key", failing)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3
+    assert coalescer.in_flight() == 0
+    assert coalescer.run("key", lambda: 42) == 42
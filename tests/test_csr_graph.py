@@ -0,0 +1,101 @@
+"""Tests for the CSR graph and iterative SCC detection used by the layouts.
+
+Verifies that SCC detection no longer recurses (long chains), agrees with
+NetworkX on random graphs, and that hub masses computed from the shared
+CSR graph match the arc-scanning implementation.
+"""
+
+import random
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import networkx as nx
+
+from shypn.layout.sscc import CSRGraph, GraphBuilder, SCCDetector
+from shypn.layout.sscc.hub_based_mass_assigner import HubBasedMassAssigner
+from shypn.netobjs import Place, Transition, Arc
+
+
+def create_chain(length):
+    """Create P0 → T0 → P1 → ... → P(length) and close it into one big cycle."""
+    places = [Place(x=0, y=0, id=f"P{i}", name=f"P{i}") for i in range(length)]
+    transitions = [Transition(x=0, y=0, id=f"T{i}", name=f"T{i}") for i in range(length)]
+    arcs = []
+    for i in range(length):
+        arcs.append(Arc(places[i], transitions[i], f"A{2 * i}", f"A{2 * i}", 1))
+        arcs.append(Arc(transitions[i], places[(i + 1) % length], f"A{2 * i + 1}", f"A{2 * i + 1}", 2))
+    return places, transitions, arcs
+
+
+def test_csr_structure():
+    """CSR arrays hold successors in arc order with weights."""
+    places, transitions, arcs = create_chain(3)
+    graph = CSRGraph.from_petri_net(places, transitions, arcs)
+
+    assert graph.num_nodes == 6
+    assert graph.num_edges == 6
+    assert graph.out_degree().tolist() == [1] * 6
+    assert graph.in_degree().tolist() == [1] * 6
+    p0 = graph.index_of("P0")
+    t0 = graph.index_of("T0")
+    assert graph.successors(p0).tolist() == [t0]
+    assert graph.to_adjacency_dict()["T0"] == ["P1"]
+    assert sorted(w for _, _, w, _ in graph.iter_edges()) == [1, 1, 1, 2, 2, 2]
+    assert graph.reverse().successors(t0).tolist() == [p0]
+
+
+def test_long_cycle_does_not_hit_recursion_limit():
+    """A 40k-node cycle is found as one SCC without recursion."""
+    length = 20000
+    assert 2 * length > sys.getrecursionlimit()
+    places, transitions, arcs = create_chain(length)
+
+    builder = GraphBuilder()
+    graph = builder.build_csr(places, transitions, arcs)
+    sccs = SCCDetector().find_sccs(graph)
+
+    assert len(sccs) == 1
+    assert sccs[0].size == 2 * length
+
+
+def test_matches_networkx_on_random_graphs():
+    """Component partition agrees with networkx for dict adjacency input."""
+    rng = random.Random(7)
+    for _ in range(20):
+        n = rng.randint(1, 60)
+        adjacency = {i: [] for i in range(n)}
+        for _ in range(rng.randint(0, 3 * n)):
+            adjacency[rng.randrange(n)].append(rng.randrange(n))
+
+        detector = SCCDetector()
+        detector.find_sccs(adjacency, {i: i for i in range(n)})
+        ours = sorted(sorted(c) for c in detector._sccs)
+
+        nx_graph = nx.DiGraph()
+        nx_graph.add_nodes_from(adjacency)
+        nx_graph.add_edges_from((u, v) for u, targets in adjacency.items() for v in targets)
+        expected = sorted(sorted(c) for c in nx.strongly_connected_components(nx_graph))
+
+        assert ours == expected
+
+
+def test_hub_masses_from_graph_match_arc_scan():
+    """Degrees read from the CSR graph give the same masses as scanning arcs."""
+    hub = Place(x=0, y=0, id="HUB", name="HUB")
+    places = [hub] + [Place(x=0, y=0, id=f"P{i}", name=f"P{i}") for i in range(8)]
+    transitions = [Transition(x=0, y=0, id=f"T{i}", name=f"T{i}") for i in range(8)]
+    arcs = []
+    for i, transition in enumerate(transitions):
+        arcs.append(Arc(hub, transition, f"H{i}", f"H{i}", 1))
+        arcs.append(Arc(transition, places[i + 1], f"A{i}", f"A{i}", 1))
+
+    graph = CSRGraph.from_petri_net(places, transitions, arcs)
+    sccs = SCCDetector().find_sccs(graph)
+    from_arcs = HubBasedMassAssigner().assign_masses(sccs, places, transitions, arcs)
+    from_graph = HubBasedMassAssigner().assign_masses(sccs, places, transitions, arcs, graph=graph)
+
+    assert from_graph == from_arcs
+    assert from_graph["HUB"] == HubBasedMassAssigner.MASS_SUPER_HUB
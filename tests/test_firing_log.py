@@ -0,0 +1,97 @@
+"""Tests for the struct-of-arrays firing log and the collector built on it."""
+
+import sys
+import os
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pytest
+
+from shypn.analyses.firing_log import FiringLog, KIND_FIRED, KIND_FLOW
+from shypn.analyses.data_collector import SimulationDataCollector
+from shypn.engine.simulation.analysis.reaction_analyzer import ReactionAnalyzer
+
+
+def fire(collector, transition_id, time, details):
+    collector.on_transition_fired(SimpleNamespace(id=transition_id), time, details)
+
+
+def test_record_and_query_columns():
+    log = FiringLog(chunk_size=4)
+    for step in range(10):
+        log.record_details('C', step * 0.1, {'consumed': {'P1': 0.5}, 'produced': {'P2': 0.5},
+                                             'rate': float(step)})
+    log.record_details('D', 0.35, {'consumed': {'P2': 1}, 'produced': {'P3': 2}})
+
+    assert len(log) == 11
+    assert log.times.dtype == np.float64 and log.transitions.dtype == np.int32
+    assert log.kinds.dtype == np.uint8 and log.rates.dtype == np.float32
+    assert log.is_continuous('C') and not log.is_continuous('D')
+    np.testing.assert_allclose(log.event_rates('C'), np.arange(10))
+    assert list(log.counts()) == [10, 1]
+    np.testing.assert_allclose(log.total_flows(), [5.0, 2.0])
+    assert log.details(10) == {'consumed': {'P2': 1.0}, 'produced': {'P3': 2.0}}
+    assert log.kinds[10] == KIND_FIRED and log.kinds[0] == KIND_FLOW
+
+
+def test_discard_compacts_columns_and_deltas():
+    log = FiringLog(chunk_size=4)
+    for step in range(6):
+        transition_id = 'A' if step % 2 else 'B'
+        log.record(transition_id, float(step), produced={f'P{step}': step})
+
+    log.discard('A')
+    assert len(log) == 3 and log.count('A') == 0
+    np.testing.assert_array_equal(log.event_times('B'), [0.0, 2.0, 4.0])
+    assert [log.details(row)['produced'] for row in log.rows('B')] == [
+        {'P0': 0.0}, {'P2': 2.0}, {'P4': 4.0}]
+
+
+def test_spill_to_disk_keeps_events(tmp_path):
+    log = FiringLog(chunk_size=8, spill_dir=str(tmp_path), spill_threshold=20)
+    for step in range(100):
+        log.record('T', float(step), KIND_FLOW, rate=2.0)
+    assert log.is_spilled and any(tmp_path.iterdir())
+    assert isinstance(log.times.base, np.memmap) or isinstance(log.times, np.memmap)
+    np.testing.assert_array_equal(log.event_times('T'), np.arange(100.0))
+
+    log.clear()
+    assert len(log) == 0 and not any(tmp_path.iterdir())
+
+
+def test_collector_keeps_every_event_and_old_tuple_view():
+    collector = SimulationDataCollector(downsample_threshold=10)
+    for step in range(50):
+        fire(collector, 'T1', step * 0.1, {'consumed': {}, 'produced': {'P': 1}, 'rate': 1.5})
+
+    events = collector.get_transition_data('T1')
+    assert len(events) == 50  # no downsampling of firing events
+    time, event_type, details = events[-1]
+    assert (round(time, 6), event_type, details['rate']) == (4.9, 'fired', 1.5)
+    assert len(events[-5:]) == 5
+    assert list(collector.transition_data) == ['T1']
+    assert collector.get_transition_data('missing') is not None
+    assert len(collector.get_transition_data('missing')) == 0
+
+    collector.clear_transition('T1')
+    assert collector.get_firing_count('T1') == 0
+    assert collector.get_statistics()['total_transition_events'] == 0
+
+
+def test_reaction_analyzer_reads_counts_and_flux_from_log():
+    t1, t2 = SimpleNamespace(id='T1', label='T1'), SimpleNamespace(id='T2', label='T2')
+    model = SimpleNamespace(transitions=[t1, t2],
+                            arcs=[SimpleNamespace(source=t1, weight=3)])
+    collector = SimulationDataCollector()
+    collector.model = model
+    for step in range(4):
+        fire(collector, 'T1', float(step), {'consumed': {}, 'produced': {'P': 2}})
+
+    metrics = {m.transition_id: m for m in ReactionAnalyzer(collector).analyze_all_reactions(4.0)}
+    assert (metrics['T1'].firing_count, metrics['T1'].total_flux) == (4, 8)
+    assert metrics['T1'].average_rate == pytest.approx(1.0)
+    # T2 has no log events: falls back to the engine collector series
+    assert metrics['T2'].firing_count == 0
@@ -0,0 +1,183 @@
+"""Tests for batched heuristic parameter inference.
+
+Covers infer_batch() against per-transition infer_parameters(), the
+set-based database lookups behind the session memo, the arc index used
+for stoichiometry, per-transition failure isolation, and bulk kinetics
+assignment.
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.crossfetch.inference.heuristic_engine import HeuristicInferenceEngine
+from shypn.crossfetch.models import TransitionType
+from shypn.heuristic.kinetics_assigner import KineticsAssigner
+from shypn.utils.arc_index import build_arc_index, arcs_of
+
+
+def create_model(n=30):
+    """Chain of reactions P0 → T0 → P1 → T1 → ... with EC numbers on even ones."""
+    places = [SimpleNamespace(id=f"P{i}", name=f"P{i}", initial_marking=i % 3)
+              for i in range(n + 1)]
+    transitions = []
+    arcs = []
+    for i in range(n):
+        transition = SimpleNamespace(
+            id=f"T{i}", name=f"T{i}", label=f"kinase {i}" if i % 4 == 0 else f"step {i}",
+            transition_type='immediate', metadata={},
+            ec_number='2.7.1.1' if i % 2 == 0 else None,
+            reaction_id=f"R{i:05d}"
+        )
+        transitions.append(transition)
+        arcs.append(SimpleNamespace(source=places[i], target=transition, weight=1))
+        arcs.append(SimpleNamespace(source=transition, target=places[i + 1], weight=1 + i % 2))
+    return transitions, arcs
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return HeuristicInferenceEngine(db_path=str(tmp_path / 'heuristic.db'))
+
+
+def summarize(result):
+    params = result.parameters
+    return (result.transition_id, params.transition_type, params.confidence_score,
+            params.notes, getattr(params, 'vmax', None), getattr(params, 'km', None))
+
+
+def test_arc_index_groups_by_endpoint():
+    """Each transition sees exactly its own input and output arcs."""
+    transitions, arcs = create_model(5)
+    index = build_arc_index(arcs)
+
+    inputs, outputs = arcs_of(index, transitions[2])
+    assert [arc.source.id for arc in inputs] == ['P2']
+    assert [arc.target.id for arc in outputs] == ['P3']
+    assert arcs_of(index, object()) == ([], [])
+
+
+def test_batch_matches_single_inference(engine):
+    """infer_batch() gives the same results as infer_parameters() per transition."""
+    transitions, arcs = create_model()
+    index = build_arc_index(arcs)
+    for transition in transitions:
+        transition.input_arcs, transition.output_arcs = arcs_of(index, transition)
+
+    single = [summarize(engine.infer_parameters(t, "Homo sapiens")) for t in transitions]
+    batch = [summarize(r) for r in engine.infer_batch(transitions, "Homo sapiens", arcs=arcs)]
+
+    assert batch == single
+    # Balanced 1:1 chain steps are promoted from immediate to continuous
+    assert batch[1][1] == TransitionType.CONTINUOUS
+
+
+def test_database_parameters_are_memoized(engine):
+    """Database matches are resolved once per key and copied per transition."""
+    db = engine.db
+    db.store_parameter('continuous', 'Homo sapiens', {'vmax': 42.0, 'km': 0.3},
+                       'SABIO-RK', 0.9, biological_semantics='enzyme_kinetics',
+                       ec_number='2.7.1.1')
+    db.store_parameter('continuous', 'Mus musculus', {'vmax': 7.0, 'km': 0.2},
+                       'SABIO-RK', 0.95, biological_semantics='enzyme_kinetics',
+                       reaction_id='R00003')
+    transitions, arcs = create_model(8)
+    for transition in transitions:
+        transition.transition_type = 'continuous'
+        if transition.ec_number:
+            transition.reaction_id = None
+
+    calls = []
+    query = db.query_parameters_batch
+    db.query_parameters_batch = lambda *a, **kw: calls.append(kw) or query(*a, **kw)
+
+    results = engine.infer_batch(transitions, "Homo sapiens", arcs=arcs)
+    engine.infer_batch(transitions, "Homo sapiens", arcs=arcs)
+
+    assert len(calls) == 1
+    # Exact match, refined by stoichiometry (T0's substrate is empty: ×0.7 Vmax)
+    assert results[0].parameters.km == 0.3
+    assert results[0].parameters.vmax == pytest.approx(42.0 * 0.7)
+    # Refining one transition does not leak into the memoized row
+    assert results[2].parameters.vmax == 42.0
+    # Cross-species match (mouse → human) is scaled by compatibility
+    cross = results[3].parameters
+    assert cross.notes.startswith("Cross-species: Mus musculus")
+    assert cross.confidence_score < 0.95
+
+
+def test_failing_transition_does_not_sink_the_batch(engine, monkeypatch):
+    """A transition whose inference raises gets an UNKNOWN result with the error."""
+    transitions, arcs = create_model(6)
+    detect_type = engine.type_detector.detect_type
+
+    def flaky(transition):
+        if transition.id == 'T3':
+            raise ValueError("bad metadata")
+        return detect_type(transition)
+    monkeypatch.setattr(engine.type_detector, 'detect_type', flaky)
+
+    results = engine.infer_batch(transitions, arcs=arcs)
+
+    assert [r.transition_id for r in results] == [t.id for t in transitions]
+    assert results[3].parameters.transition_type == TransitionType.UNKNOWN
+    assert results[3].inference_metadata['error'] == "ValueError: bad metadata"
+    assert all('error' not in r.inference_metadata for i, r in enumerate(results) if i != 3)
+    assert results[1].parameters.transition_type == TransitionType.CONTINUOUS
+
+
+def test_prefetch_failure_falls_back_to_heuristics(engine, monkeypatch):
+    """A failing database prefetch does not fail single or batch inference."""
+    transitions, arcs = create_model(4)
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("database is locked")
+    monkeypatch.setattr(engine, '_prefetch_parameters', broken)
+
+    single = engine.infer_parameters(transitions[0], "Homo sapiens")
+    batch = engine.infer_batch(transitions, "Homo sapiens", arcs=arcs)
+
+    assert 'error' not in single.inference_metadata
+    assert all('error' not in r.inference_metadata for r in batch)
+
+
+def test_parallel_batch_matches_in_process(engine, monkeypatch):
+    """Worker processes produce the same results as in-process inference."""
+    from shypn.crossfetch.inference import heuristic_engine
+    monkeypatch.setattr(heuristic_engine, 'PARALLEL_MIN_TRANSITIONS', 10)
+    transitions, arcs = create_model(24)
+
+    serial = [summarize(r) for r in engine.infer_batch(transitions, arcs=arcs)]
+    parallel = [summarize(r) for r in engine.infer_batch(transitions, arcs=arcs, workers=2)]
+
+    assert parallel == serial
+
+
+def test_assign_bulk_passes_places_and_looks_up_once():
+    """assign_bulk() reads substrate places from arcs and looks up each EC once."""
+    assigner = KineticsAssigner(offline_mode=True)
+    transitions, arcs = create_model(6)
+    for transition in transitions:
+        transition.metadata = {'ec_numbers': ['2.7.1.1']}
+        transition.rate = 1.0
+
+    lookups = []
+    seen_places = []
+    lookup = assigner.database.lookup
+    assigner.database.lookup = lambda ec: lookups.append(ec) or lookup(ec)
+    assign = assigner.assign
+    assigner.assign = lambda t, r, substrate_places=None, **kw: (
+        seen_places.append([p.id for p in substrate_places]) or assign(t, r, substrate_places, **kw)
+    )
+
+    results = assigner.assign_bulk(transitions, [], arcs=arcs)
+
+    assert len(results) == 6
+    assert lookups == ['2.7.1.1']
+    assert seen_places[2] == ['P2']
+    assert assigner._lookup_memo is None
@@ -0,0 +1,184 @@
+"""Tests for the shared on-disk HTTP response cache.
+
+Runs against a local http.server stub (no external network) to cover
+hits and misses, negative caching, conditional revalidation, offline
+mode, stale fallback, compression and LRU eviction.
+"""
+
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.utils.http_cache import HTTPCache, HTTPConnectionError, OfflineError
+from shypn.importer.kegg.api_client import KEGGAPIClient
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves /text/<n>, /etag, /missing; counts requests per path.
+
+    While server.failing_status is set, every path answers with that status.
+    """
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+
+        if server.failing_status:
+            self._reply(server.failing_status, b'try again later')
+        elif self.path.startswith('/missing'):
+            self._reply(404, b'not found')
+        elif self.path.startswith('/etag'):
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+            else:
+                self._reply(200, b'versioned body', {'ETag': '"v1"'})
+        elif self.path.startswith('/big'):
+            self._reply(200, b'ENTRY R00001\n' * 500)
+        else:
+            self._reply(200, f"body for {self.path}".encode('utf-8'))
+
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    httpd.requests = []
+    httpd.failing_status = None
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HTTPCache(cache_dir=tmp_path, offline=False)
+
+
+def test_second_request_is_served_from_disk(server, cache, tmp_path):
+    """A repeated GET (any parameter order) is a hit, also for a new instance."""
+    url = f"{server.base_url}/text/1"
+    first = cache.get(url, params={'a': 1, 'b': 2})
+    second = cache.get(url, params={'b': 2, 'a': 1})
+
+    assert first.text == second.text == "body for /text/1?a=1&b=2"
+    assert not first.from_cache and second.from_cache
+    assert len(server.requests) == 1
+
+    reopened = HTTPCache(cache_dir=tmp_path, offline=False)
+    assert reopened.get(f"{url}?a=1&b=2").from_cache
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+
+
+def test_not_found_is_cached(server, cache):
+    """404 answers are cached (negative TTL) and reported by raise_for_status."""
+    for _ in range(2):
+        response = cache.get(f"{server.base_url}/missing")
+        assert response.status_code == 404 and not response.ok
+    assert len(server.requests) == 1
+
+
+def test_stale_entry_is_revalidated(server, cache):
+    """An expired entry with an ETag is revalidated; 304 keeps the body."""
+    url = f"{server.base_url}/etag"
+    cache.get(url, ttl=0)
+    response = cache.get(url, ttl=60)
+
+    assert response.text == 'versioned body'
+    assert server.requests[1][1].get('If-None-Match') == '"v1"'
+    assert cache.stats()['revalidated'] == 1
+
+    # Refreshed by the 304: no third request
+    assert cache.get(url).from_cache
+    assert len(server.requests) == 2
+
+
+def test_offline_mode(server, cache):
+    """Offline: cached (even stale) entries are served, misses raise."""
+    url = f"{server.base_url}/text/2"
+    cache.get(url, ttl=0)
+    cache.offline = True
+
+    response = cache.get(url)
+    assert response.from_cache and response.stale
+    with pytest.raises(OfflineError):
+        cache.get(f"{server.base_url}/text/3")
+    assert len(server.requests) == 1
+
+
+def test_network_error_serves_stale_copy(server, cache):
+    """When the server is gone, a stale copy is better than nothing."""
+    url = f"{server.base_url}/text/4"
+    cache.get(url, ttl=0)
+    server.shutdown()
+    server.server_close()
+
+    response = cache.get(url, timeout=2)
+    assert response.stale and response.text == "body for /text/4"
+    with pytest.raises(HTTPConnectionError):
+        cache.get(f"{server.base_url}/text/5", timeout=2)
+
+
+@pytest.mark.parametrize('status', [503, 429])
+def test_server_error_serves_stale_copy(server, cache, status):
+    """A 5xx or 429 reply falls back to the stale copy; without one it is returned."""
+    url = f"{server.base_url}/text/6"
+    cache.get(url, ttl=0)
+    server.failing_status = status
+
+    response = cache.get(url)
+    assert response.stale and response.text == "body for /text/6"
+    assert cache.stats()['errors'] == 1
+
+    uncached = cache.get(f"{server.base_url}/text/7")
+    assert uncached.status_code == status and not uncached.from_cache
+
+
+def test_compression_and_lru_eviction(server, tmp_path):
+    """Large bodies are stored compressed; the oldest entries are evicted."""
+    cache = HTTPCache(cache_dir=tmp_path, max_size=2000, offline=False)
+    big = cache.get(f"{server.base_url}/big")
+    assert cache.stats()['size_bytes'] < len(big.content) / 10
+    assert cache.get(f"{server.base_url}/big").content == big.content
+
+    for i in range(200):
+        cache.get(f"{server.base_url}/text/{i}")
+
+    stats = cache.stats()
+    assert stats['evicted'] > 0
+    assert stats['size_bytes'] <= 2000
+    # The most recent entry survived, the first one did not
+    assert cache.get(f"{server.base_url}/text/199").from_cache
+    assert not cache.get(f"{server.base_url}/big").from_cache
+
+
+def test_kegg_client_rate_limits_only_network_requests(server, cache):
+    """Cache hits skip the KEGG client's rate limiter."""
+    client = KEGGAPIClient(cache=cache)
+    client.BASE_URL = server.base_url
+    calls = []
+    client._rate_limit = lambda: calls.append(1)
+
+    assert client.fetch_pathway_info("hsa00010") == "body for /get/hsa00010"
+    assert client.fetch_pathway_info("hsa00010") == "body for /get/hsa00010"
+    assert len(calls) == 1
@@ -0,0 +1,159 @@
+"""Tests for the KEGG API client's bulk, concurrent and asyncio requests.
+
+Runs against a local stub of the KEGG REST API (no external network).
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.importer.kegg.api_client import KEGGAPIClient, split_entries
+from shypn.data.kegg_ec_fetcher import KEGGECFetcher
+from shypn.utils.http_cache import HTTPCache
+
+
+def reaction_entry(rid):
+    number = int(rid[1:])
+    return (f"ENTRY       {rid}                      Reaction\n"
+            f"NAME        reaction {number}\n"
+            f"ENZYME      2.7.1.{number}\n"
+            "///\n")
+
+
+class KEGGStub(BaseHTTPRequestHandler):
+    """Serves /get/<id>+<id>... (R ids exist up to R00099) and /get/<pathway>/kgml."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.ports.add(self.client_address[1])
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(server.delay)
+
+        parts = self.path.strip('/').split('/')
+        if parts[-1] == 'kgml':
+            body = f'<pathway name="path:{parts[1]}"/>'.encode()
+            status = 200
+        else:
+            ids = [i.split(':')[-1] for i in parts[1].split('+')]
+            ids = [i for i in ids if i.startswith('R') and int(i[1:]) < 100]
+            body = ''.join(reaction_entry(i) for i in ids).encode()
+            status = 200 if ids else 404
+
+        with server.lock:
+            server.active -= 1
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), KEGGStub)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.requests, httpd.ports = [], set()
+    httpd.active = httpd.max_active = 0
+    httpd.delay = 0.0
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client(stub, tmp_path):
+    client = KEGGAPIClient(cache=HTTPCache(cache_dir=tmp_path, offline=False), rate=1000.0)
+    client.BASE_URL = f"http://127.0.0.1:{stub.server_address[1]}"
+    yield client
+    client.close()
+
+
+def test_split_entries_keys_by_entry_line():
+    text = reaction_entry("R00001") + "ENTRY       EC 2.7.1.1                  Enzyme\nNAME x\n///\n"
+    entries = split_entries(text)
+    assert entries["r00001"].startswith("ENTRY       R00001")
+    assert "Enzyme" in entries["2.7.1.1"]
+
+
+def test_get_entries_batches_ten_ids_per_request(stub, client):
+    """25 ids take 3 requests; unknown ids are absent; prefixes are accepted."""
+    ids = [f"rn:R{i:05d}" for i in range(24)] + ["R00500"]
+    entries = client.get_entries(ids)
+
+    assert len(stub.requests) == 3
+    assert all(len(path.split('+')) <= 10 for path in stub.requests)
+    assert set(entries) == set(ids[:24])
+    assert "ENZYME      2.7.1.7" in entries["rn:R00007"]
+
+    # Repeated bulk requests are answered by the response cache
+    client.get_entries(ids)
+    assert len(stub.requests) == 3
+
+
+def test_requests_run_concurrently_on_reused_connections(stub, client):
+    stub.delay = 0.1
+    started = time.monotonic()
+    kgml = client.fetch_kgml_many([f"hsa{i:05d}" for i in range(8)])
+
+    assert time.monotonic() - started < 0.6
+    assert stub.max_active > 1
+    assert kgml["hsa00003"] == '<pathway name="path:hsa00003"/>'
+    # Keep-alive: no more connections than worker threads
+    assert len(stub.ports) <= client.max_workers
+
+
+def test_rate_limiter_paces_network_requests(stub, tmp_path):
+    client = KEGGAPIClient(cache=HTTPCache(cache_dir=tmp_path, offline=False), rate=20.0)
+    client.BASE_URL = f"http://127.0.0.1:{stub.server_address[1]}"
+    started = time.monotonic()
+    client.fetch_kgml_many([f"map{i:05d}" for i in range(8)])
+    client.close()
+
+    # Burst of 3, then 20/s for the remaining 5
+    assert time.monotonic() - started >= 0.2
+
+
+def test_async_interface(stub, client):
+    async def main():
+        kgml, entries = await asyncio.gather(
+            client.fetch_kgml_many_async(["hsa00010", "hsa00020"]),
+            client.get_entries_async([f"R{i:05d}" for i in range(15)])
+        )
+        return kgml, entries
+
+    kgml, entries = asyncio.run(main())
+    assert set(kgml) == {"hsa00010", "hsa00020"}
+    assert len(entries) == 15
+
+
+def test_ec_fetcher_uses_bulk_requests(stub, client):
+    fetcher = KEGGECFetcher(use_persistent_cache=False, http_cache=client.cache)
+    fetcher.base_url = client.BASE_URL
+    progress = []
+    results = fetcher.fetch_ec_numbers_parallel(
+        [f"R{i:05d}" for i in range(1, 31)],
+        progress_callback=lambda done, total: progress.append((done, total))
+    )
+    names = fetcher.fetch_reaction_names(["R00005", "R00999"])
+
+    assert results["R00012"] == ["2.7.1.12"]
+    assert len(stub.requests) == 3 + 1
+    assert progress[-1] == (30, 30)
+    assert names == {"R00005": "reaction 5", "R00999": None}
@@ -4,11 +4,16 @@ Unit tests for KEGG EC Number Fetcher
 Tests the KEGGECFetcher class that fetches EC numbers from KEGG REST API.
 """
 
+import json
+import tempfile
 import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import Mock, patch
-import requests
+from shypn.utils.http_cache import HTTPStatusError, HTTPTimeoutError
 from shypn.data.kegg_ec_fetcher import (
     KEGGECFetcher,
+    PersistentECCache,
     fetch_ec_for_reaction,
     get_default_fetcher,
     reset_default_fetcher
@@ -20,7 +25,7 @@ class TestKEGGECFetcher(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.fetcher = KEGGECFetcher(timeout=5)
+        self.fetcher = KEGGECFetcher(timeout=5, use_persistent_cache=False)
     
     def test_parse_kegg_response_single_ec(self):
         """Test parsing KEGG response with single EC number."""
@@ -87,7 +92,7 @@ ENZYME      2.7.1.-
         self.assertFalse(self.fetcher._is_valid_ec_number("a.b.c.d"))  # Letters
         self.assertFalse(self.fetcher._is_valid_ec_number("2.7.1.x"))  # Invalid char
     
-    @patch('shypn.data.kegg_ec_fetcher.requests.get')
+    @patch('shypn.utils.http_cache.HTTPCache.get')
     def test_fetch_ec_numbers_success(self, mock_get):
         """Test successful EC number fetch from KEGG API."""
         # Mock response
@@ -109,7 +114,7 @@ ENZYME      2.7.1.1
             timeout=5
         )
     
-    @patch('shypn.data.kegg_ec_fetcher.requests.get')
+    @patch('shypn.utils.http_cache.HTTPCache.get')
     def test_fetch_ec_numbers_cache(self, mock_get):
         """Test caching of EC numbers."""
         # Mock response
@@ -130,25 +135,26 @@ ENZYME      2.7.1.1
         self.assertEqual(ec2, ["2.7.1.1"])
         self.assertEqual(mock_get.call_count, 1)  # Still 1 - no new call
     
-    @patch('shypn.data.kegg_ec_fetcher.requests.get')
+    @patch('shypn.utils.http_cache.HTTPCache.get')
     def test_fetch_ec_numbers_timeout(self, mock_get):
         """Test handling of API timeout."""
-        mock_get.side_effect = requests.exceptions.Timeout()
+        mock_get.side_effect = HTTPTimeoutError()
         
         ec_numbers = self.fetcher.fetch_ec_numbers("R00710")
         self.assertEqual(ec_numbers, [])
     
-    @patch('shypn.data.kegg_ec_fetcher.requests.get')
+    @patch('shypn.utils.http_cache.HTTPCache.get')
     def test_fetch_ec_numbers_http_error(self, mock_get):
         """Test handling of HTTP error."""
         mock_response = Mock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+        mock_response.status_code = 500
+        mock_response.raise_for_status.side_effect = HTTPStatusError("HTTP 500", mock_response)
         mock_get.return_value = mock_response
         
         ec_numbers = self.fetcher.fetch_ec_numbers("R00710")
         self.assertEqual(ec_numbers, [])
     
-    @patch('shypn.data.kegg_ec_fetcher.requests.get')
+    @patch('shypn.utils.http_cache.HTTPCache.get')
     def test_fetch_ec_numbers_no_enzyme_field(self, mock_get):
         """Test fetching when no ENZYME field in response."""
         mock_response = Mock()
@@ -162,7 +168,7 @@ PATHWAY     ...
         ec_numbers = self.fetcher.fetch_ec_numbers("R00001")
         self.assertEqual(ec_numbers, [])
     
-    @patch('shypn.data.kegg_ec_fetcher.requests.get')
+    @patch('shypn.utils.http_cache.HTTPCache.get')
     def test_fetch_ec_numbers_normalize_id(self, mock_get):
         """Test normalization of reaction ID (remove rn: prefix)."""
         mock_response = Mock()
@@ -209,7 +215,7 @@ ENZYME      2.7.1.1
 class TestConvenienceFunctions(unittest.TestCase):
     """Test module-level convenience functions."""
     
-    @patch('shypn.data.kegg_ec_fetcher.requests.get')
+    @patch('shypn.utils.http_cache.HTTPCache.get')
     def test_fetch_ec_for_reaction(self, mock_get):
         """Test convenience function."""
         mock_response = Mock()
@@ -240,6 +246,116 @@ ENZYME      2.7.1.1
         self.assertIsNot(fetcher1, fetcher2)  # Different instances
 
 
+class TestPersistentECCache(unittest.TestCase):
+    """Test the SQLite-backed, write-batched PersistentECCache."""
+    
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "ec_cache.db"
+        self.cache = PersistentECCache(cache_file=self.path)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_entries_persist_after_save(self):
+        """Entries reach disk on save(), not on set()."""
+        self.cache.set("R00710", ["2.7.1.1"])
+        self.assertIsNone(PersistentECCache(cache_file=self.path).get("R00710"))
+        self.assertEqual(self.cache.pending_count(), 1)
+        
+        self.cache.save()
+        self.assertEqual(self.cache.pending_count(), 0)
+        self.assertEqual(PersistentECCache(cache_file=self.path).get("R00710"), ["2.7.1.1"])
+    
+    def test_batch_flushes_once(self):
+        """save() calls inside batch() are deferred to one flush at the end."""
+        with patch.object(self.cache._pool, 'executemany',
+                          wraps=self.cache._pool.executemany) as flush:
+            with self.cache.batch():
+                for i in range(50):
+                    self.cache.set(f"R{i:05d}", ["1.1.1.1"])
+                    self.cache.save()
+                self.assertEqual(flush.call_count, 0)
+        
+        self.assertEqual(flush.call_count, 1)
+        self.assertEqual(PersistentECCache(cache_file=self.path).get_stats()['total'], 50)
+    
+    def test_legacy_json_is_imported(self):
+        """A .json cache path is migrated into a .db file next to it."""
+        legacy = Path(self.tmp.name) / "legacy.json"
+        legacy.write_text(json.dumps({
+            "R00299": {"ec_numbers": ["2.7.1.1"], "timestamp": datetime.now().isoformat()}
+        }))
+        
+        cache = PersistentECCache(cache_file=legacy)
+        
+        self.assertEqual(cache.cache_file, legacy.with_suffix('.db'))
+        self.assertEqual(cache.get("R00299"), ["2.7.1.1"])
+        self.assertEqual(PersistentECCache(cache_file=cache.cache_file).get("R00299"), ["2.7.1.1"])
+    
+    def test_legacy_default_json_is_migrated(self):
+        """The former default ~/.shypn/kegg_ec_cache.json is imported on first open."""
+        home = Path(self.tmp.name) / "home"
+        legacy = home / ".shypn" / "kegg_ec_cache.json"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text(json.dumps({
+            "R00299": {"ec_numbers": ["2.7.1.1"], "timestamp": datetime.now().isoformat()}
+        }))
+        
+        with patch.object(Path, 'home', return_value=home):
+            cache = PersistentECCache()
+            self.assertEqual(cache.cache_file, legacy.with_suffix('.db'))
+            self.assertEqual(cache.get("R00299"), ["2.7.1.1"])
+            self.assertFalse(legacy.exists())
+            self.assertTrue(legacy.with_name("kegg_ec_cache.json.migrated").exists())
+            
+            # Not imported again once the database was cleared
+            cache.clear()
+            self.assertIsNone(PersistentECCache().get("R00299"))
+    
+    def test_cleanup_expired_deletes_from_disk(self):
+        """Expired entries are removed from memory and the database."""
+        self.cache.set("R00001", ["1.1.1.1"])
+        self.cache.set("R00002", ["1.1.1.2"])
+        self.cache.cache["R00001"]['timestamp'] = (datetime.now() - timedelta(days=365)).isoformat()
+        self.cache.save()
+        
+        self.cache.cleanup_expired()
+        
+        self.assertEqual(PersistentECCache(cache_file=self.path).get_stats()['total'], 1)
+    
+    @patch('shypn.utils.http_cache.HTTPCache.get')
+    def test_parallel_fetch_flushes_once(self, mock_get):
+        """A parallel prefetch writes all results in a single flush."""
+        def bulk_get(url, **kwargs):
+            ids = url.rsplit('/', 1)[-1].split('+')
+            return Mock(status_code=200, ok=True, text="".join(
+                f"ENTRY       {rid}              Reaction\nENZYME      2.7.1.1\n///\n" for rid in ids
+            ))
+        mock_get.side_effect = bulk_get
+        fetcher = KEGGECFetcher(use_persistent_cache=False)
+        fetcher.persistent_cache = self.cache
+        ids = [f"R{i:05d}" for i in range(40)]
+        
+        with patch.object(self.cache._pool, 'executemany',
+                          wraps=self.cache._pool.executemany) as flush:
+            results = fetcher.fetch_ec_numbers_parallel(ids, max_workers=8)
+        
+        self.assertEqual(len(results), 40)
+        self.assertEqual(results["R00017"], ["2.7.1.1"])
+        self.assertEqual(mock_get.call_count, 4)  # 10 reactions per request
+        self.assertEqual(flush.call_count, 1)
+        self.assertEqual(PersistentECCache(cache_file=self.path).get_stats()['total'], 40)
+        
+        # Second prefetch is served from the persistent cache
+        fresh = KEGGECFetcher(use_persistent_cache=False)
+        fresh.persistent_cache = PersistentECCache(cache_file=self.path)
+        mock_get.reset_mock()
+        fresh.fetch_ec_numbers_parallel(ids)
+        mock_get.assert_not_called()
+
+
 class TestRealKEGGAPI(unittest.TestCase):
     """
     Integration tests with real KEGG API.
@@ -0,0 +1,96 @@
+"""Tests for the adjacency and membership indexes of ModelKnowledgeBase."""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.viability.knowledge.knowledge_base import ModelKnowledgeBase
+from shypn.viability.knowledge.data_structures import (
+    ArcKnowledge, PInvariant, TInvariant, Siphon
+)
+
+
+def chain_data(n):
+    """P0 -> T0 -> P1 -> T1 -> ... -> Pn, plus T0 also consuming from Pn."""
+    places = [{'place_id': f'P{i}', 'initial_marking': 0} for i in range(n + 1)]
+    transitions = [{'transition_id': f'T{i}'} for i in range(n)]
+    arcs = []
+    for i in range(n):
+        arcs.append({'arc_id': f'A{i}in', 'source_id': f'P{i}', 'target_id': f'T{i}',
+                     'arc_type': 'place_to_transition'})
+        arcs.append({'arc_id': f'A{i}out', 'source_id': f'T{i}', 'target_id': f'P{i + 1}',
+                     'arc_type': 'transition_to_place'})
+    arcs.append({'arc_id': 'Aloop', 'source_id': f'P{n}', 'target_id': 'T0',
+                 'arc_type': 'place_to_transition'})
+    return places, transitions, arcs
+
+
+@pytest.fixture
+def kb():
+    kb = ModelKnowledgeBase()
+    kb.update_topology_structural(*chain_data(5))
+    return kb
+
+
+def test_locality_queries(kb):
+    assert sorted(a.arc_id for a in kb.get_input_arcs_for_transition('T0')) == ['A0in', 'Aloop']
+    assert [a.arc_id for a in kb.get_output_arcs_for_transition('T2')] == ['A2out']
+    assert [a.arc_id for a in kb.get_input_arcs_for_place('P3')] == ['A2out']
+    assert [a.arc_id for a in kb.get_output_arcs_for_place('P5')] == ['Aloop']
+    assert kb.get_output_arcs_for_place('P_missing') == []
+    assert not kb.is_source_transition('T4')
+
+
+def test_repeated_update_does_not_duplicate_index(kb):
+    kb.update_topology_structural(*chain_data(5))
+    assert len(kb.get_input_arcs_for_transition('T0')) == 2
+
+
+def test_direct_arc_edits_are_picked_up(kb):
+    kb.arcs['Anew'] = ArcKnowledge(arc_id='Anew', source_id='P0', target_id='T3',
+                                   arc_type='place_to_transition')
+    assert {a.arc_id for a in kb.get_output_arcs_for_place('P0')} == {'A0in', 'Anew'}
+
+
+def test_arc_edits_that_keep_the_count_are_picked_up(kb):
+    del kb.arcs['Aloop']
+    kb.arcs['Aloop'] = ArcKnowledge(arc_id='Aloop', source_id='P5', target_id='T2',
+                                    arc_type='place_to_transition')
+    assert [a.arc_id for a in kb.get_input_arcs_for_transition('T0')] == ['A0in']
+    assert {a.arc_id for a in kb.get_input_arcs_for_transition('T2')} == {'A2in', 'Aloop'}
+
+    kb.arcs = {'Aonly': ArcKnowledge(arc_id='Aonly', source_id='P1', target_id='T0',
+                                     arc_type='place_to_transition')}
+    assert [a.arc_id for a in kb.get_input_arcs_for_transition('T0')] == ['Aonly']
+    assert kb.get_output_arcs_for_place('P5') == []
+
+
+def test_membership_indexes_are_replaced_on_update(kb):
+    kb.update_p_invariants([PInvariant(vector=[1, 1], place_ids=['P0', 'P1'], conserved_value=1)])
+    kb.update_t_invariants([TInvariant(vector=[1, 1], transition_ids=['T0', 'T1'])])
+    kb.update_siphons_traps([Siphon(place_ids=['P2', 'P3'])], [Siphon(place_ids=['P3'])])
+
+    assert kb.get_conserved_places('P0') == ['P1']
+    assert kb.get_cycle_transitions('T1') == ['T0']
+    assert kb.is_in_siphon('P2') and not kb.is_in_siphon('P0')
+    assert len(kb.get_traps_for_place('P3')) == 1
+
+    # New analysis results replace (not extend) the old membership
+    kb.update_p_invariants([PInvariant(vector=[1], place_ids=['P4'], conserved_value=1)])
+    kb.update_siphons_traps([], [])
+    assert kb.places['P0'].in_p_invariants == []
+    assert kb.places['P4'].in_p_invariants == [0]
+    assert kb.places['P2'].in_siphons == []
+    assert not kb.is_in_siphon('P2')
+
+
+def test_places_added_after_analysis_get_membership():
+    kb = ModelKnowledgeBase()
+    kb.update_siphons_traps([Siphon(place_ids=['P1'])], [])
+    kb.update_topology_structural(*chain_data(2))
+    assert kb.places['P1'].in_siphons == [0]
+    assert kb.get_siphons_for_place('P1')[0].place_ids == ['P1']
@@ -0,0 +1,93 @@
+"""Tests for lazy panel/module loading and the import-time profiler."""
+
+import sys
+import os
+import textwrap
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.utils.lazy_loading import ImportProfiler, LazyModule, PanelRegistry, lazy_import
+
+
+@pytest.fixture
+def fake_modules(tmp_path, monkeypatch):
+    """A package 'lazypkg' whose 'outer' module imports 'inner'."""
+    package = tmp_path / 'lazypkg'
+    package.mkdir()
+    (package / '__init__.py').write_text('')
+    (package / 'inner.py').write_text('VALUE = 42\n')
+    (package / 'outer.py').write_text(textwrap.dedent("""
+        import time
+        from lazypkg import inner
+        time.sleep(0.02)
+        VALUE = inner.VALUE + 1
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    for name in [n for n in sys.modules if n.startswith('lazypkg')]:
+        del sys.modules[name]
+
+
+def test_lazy_import_defers_until_attribute_access(fake_modules):
+    module = lazy_import('lazypkg.inner')
+    assert isinstance(module, LazyModule) and not module.is_loaded
+    assert 'lazypkg.inner' not in sys.modules
+
+    assert module.VALUE == 42
+    assert module.is_loaded and 'lazypkg.inner' in sys.modules
+    # Already imported modules are returned as is
+    assert lazy_import('lazypkg.inner') is sys.modules['lazypkg.inner']
+
+
+def test_panel_registry_builds_once_on_first_get():
+    panels = PanelRegistry()
+    builds, wired = [], []
+    panels.register('topology', lambda: builds.append(1) or object())
+    panels.on_built('topology', wired.append)
+
+    assert 'topology' in panels and not panels.is_built('topology')
+    assert panels.peek('topology') is None and not builds
+
+    panel = panels.get('topology')
+    assert panels.get('topology') is panel and builds == [1]
+    assert wired == [panel] and panels.built() == {'topology': panel}
+
+    late = []
+    panels.on_built('topology', late.append)  # Already built: runs immediately
+    assert late == [panel]
+
+    with pytest.raises(ValueError):
+        panels.register('topology', object)
+
+
+def test_failed_panel_is_cached_as_unavailable():
+    panels = PanelRegistry()
+    calls, wired = [], []
+
+    def broken():
+        calls.append(1)
+        raise ImportError('libsbml not installed')
+
+    panels.register('pathways', broken)
+    panels.on_built('pathways', wired.append)
+    assert panels.get('pathways') is None and panels.provider('pathways')() is None
+    assert calls == [1] and not wired and panels.built() == {}
+
+
+def test_import_profiler_reports_self_and_cumulative_times(fake_modules):
+    with ImportProfiler() as profiler:
+        import lazypkg.outer  # noqa: F401
+        import lazypkg.outer  # noqa: F401  (already loaded: not timed again)
+    assert not profiler.installed
+
+    own, cumulative = profiler.timings['lazypkg.outer']
+    inner_own, inner_cumulative = profiler.timings['lazypkg.inner']
+    assert own >= 0.02 and cumulative >= own + inner_cumulative - 1e-9
+    assert profiler.top(1)[0][0] in ('lazypkg', 'lazypkg.outer')
+
+    report = profiler.report(limit=5)
+    assert 'import time:  self [us] | cumulative | imported package' in report
+    assert '| lazypkg.outer' in report
@@ -0,0 +1,148 @@
+"""Tests for the multilevel (coarsen-layout-refine) layout.
+
+Verifies coarsening, that refined layouts keep edges close to the ideal
+length without overlapping nodes, that repulsion work stays linear on
+non-tree graphs, and that the selector switches to the multilevel layout
+above its size threshold.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import networkx as nx
+import numpy as np
+
+from shypn.edit.graph_layout import LayoutSelector, MultilevelLayout
+
+
+def create_grid_graph(side):
+    """Create a side × side grid as a directed graph with integer nodes."""
+    grid = nx.convert_node_labels_to_integers(nx.grid_2d_graph(side, side))
+    return nx.DiGraph(grid)
+
+
+def test_coarsening_shrinks_levels():
+    """Each level is smaller than the previous; parents map into the next level."""
+    layout = MultilevelLayout()
+    graph = create_grid_graph(20)
+    nodes = list(graph.nodes())
+    edges, weights = layout._undirected_edges(graph, nodes)
+
+    levels = layout._coarsen(len(nodes), edges, weights, 30, np.random.default_rng(0))
+
+    assert len(levels) > 2
+    assert levels[-1][0] <= 30
+    for finer, coarser in zip(levels, levels[1:]):
+        parent = coarser[4]
+        assert coarser[0] < finer[0]
+        assert len(parent) == finer[0]
+        assert set(parent.tolist()) == set(range(coarser[0]))
+        # Mass is conserved
+        assert coarser[3].sum() == finer[3].sum()
+
+
+def test_isolated_nodes_are_coarsened():
+    """Graphs with many isolated nodes still coarsen down."""
+    layout = MultilevelLayout()
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(400))
+    nodes = list(graph.nodes())
+    edges, weights = layout._undirected_edges(graph, nodes)
+
+    levels = layout._coarsen(400, edges, weights, 50, np.random.default_rng(0))
+
+    assert levels[-1][0] <= 50
+
+
+def test_grid_layout_quality():
+    """A grid is laid out with edges near the requested spacing."""
+    graph = create_grid_graph(25)
+    positions = MultilevelLayout().compute(graph, spacing=100.0)
+
+    assert len(positions) == graph.number_of_nodes()
+    points = np.array(list(positions.values()))
+    assert np.isfinite(points).all()
+    assert np.allclose(points.mean(axis=0), 0.0, atol=1e-6)
+
+    lengths = [np.hypot(positions[u][0] - positions[v][0], positions[u][1] - positions[v][1])
+               for u, v in graph.edges()]
+    assert 60.0 < np.median(lengths) < 160.0
+
+    # No two nodes collapse onto each other
+    distance = np.hypot(points[:, None, 0] - points[None, :, 0], points[:, None, 1] - points[None, :, 1])
+    np.fill_diagonal(distance, np.inf)
+    assert distance.min() > 20.0
+
+
+def test_deterministic_and_preview():
+    """Same seed gives the same layout; previews cover all original nodes."""
+    graph = nx.DiGraph(nx.barabasi_albert_graph(300, 1, seed=3))
+    previews = []
+
+    first = MultilevelLayout().compute(graph, seed=7,
+                                       preview_callback=lambda level, total, pos: previews.append((level, total, pos)))
+    second = MultilevelLayout().compute(graph, seed=7)
+
+    assert first == second
+    assert previews
+    for level, total, pos in previews:
+        assert 0 < level < total
+        assert set(pos) == set(graph.nodes())
+
+
+def test_selector_uses_multilevel_for_large_graphs():
+    """Above the threshold the selector picks multilevel without cycle analysis."""
+    selector = LayoutSelector()
+    large = nx.DiGraph(nx.cycle_graph(LayoutSelector.MULTILEVEL_THRESHOLD))
+    small = nx.DiGraph(nx.path_graph(20))
+
+    assert selector.select(large) == 'multilevel'
+    assert selector.select(small) != 'multilevel'
+
+    result = selector.select_with_explanation(large)
+    assert result['algorithm'] == 'multilevel'
+    assert result['metrics']['node_count'] == LayoutSelector.MULTILEVEL_THRESHOLD
+
+    params = selector.recommend_parameters(large, 'multilevel')
+    assert 'spacing' in params
+
+
+def test_repulsion_work_scales_linearly_on_random_graphs():
+    """Repulsion pairs grow ~linearly on non-tree graphs, which pull the layout dense."""
+    def repulsion_pairs(n):
+        layout = MultilevelLayout()
+        counted = []
+        cell_pairs = layout._cell_pairs
+
+        def counting(*args):
+            pairs = cell_pairs(*args)
+            counted.append(len(pairs[0]))
+            return pairs
+
+        layout._cell_pairs = counting
+        graph = nx.DiGraph(nx.gnm_random_graph(n, int(1.3 * n), seed=1))
+        positions = layout.compute(graph, refine_iterations=10)
+        assert len(positions) == n
+        return sum(counted)
+
+    assert repulsion_pairs(4000) < 6 * repulsion_pairs(1000)
+
+
+def test_crowded_cells_are_sampled():
+    """Pairs of an overfull cell are sampled with an unbiased weight."""
+    layout = MultilevelLayout()
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(0.0, 10.0, size=(400, 2))  # One cell at k = 100
+    mass_scale = np.ones(400)
+
+    i, j, scale = layout._cell_pairs(np.array([0]), np.array([400]), np.array([0]), np.array([400]), rng)
+    assert len(i) == MultilevelLayout.CELL_PAIR_LIMIT
+    assert np.allclose(scale, 400 * 400 / MultilevelLayout.CELL_PAIR_LIMIT)
+
+    # Sampled forces average out to the exact all-pairs repulsion
+    exact = layout._exact_repulsion(positions, mass_scale, 100.0)
+    sampled = np.mean([layout._grid_repulsion(positions, mass_scale, 100.0, rng) for _ in range(200)], axis=0)
+    assert np.corrcoef(exact.ravel(), sampled.ravel())[0, 1] > 0.9
@@ -0,0 +1,99 @@
+"""Tests for incremental statistics and the rate calculator built on them."""
+
+import sys
+import os
+import statistics
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pytest
+
+from shypn.analyses.online_stats import RunningStats, SlidingWindow
+from shypn.analyses.rate_calculator import RateCalculator
+from shypn.analyses.data_collector import SimulationDataCollector
+
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(1)
+    times = np.cumsum(rng.uniform(0.0, 0.05, 2000))
+    values = rng.integers(0, 100, times.size)
+    return list(zip(times.tolist(), values.tolist()))
+
+
+def test_running_stats_match_batch(samples):
+    stats = RunningStats()
+    values = [v for _, v in samples]
+    for value in values:
+        stats.push(value)
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+    assert (stats.min, stats.max) == (min(values), max(values))
+
+
+def test_sliding_window_matches_brute_force(samples):
+    window = SlidingWindow(0.5)
+    for i, (time, value) in enumerate(samples):
+        window.push(time, value)
+        inside = [(t, v) for t, v in samples[:i + 1] if time - t <= 0.5]
+        assert window.count == len(inside)
+        assert window.min == min(v for _, v in inside)
+        assert window.max == max(v for _, v in inside)
+        assert window.mean == pytest.approx(statistics.mean(v for _, v in inside))
+        assert window.rate() == pytest.approx(
+            RateCalculator.calculate_token_rate(samples[:i + 1], time_window=0.5))
+
+
+def test_rate_calculator_documented_examples():
+    data = [(0.0, 10), (0.1, 10), (0.2, 12), (0.3, 15)]
+    assert RateCalculator.calculate_token_rate(data, time_window=0.1) == pytest.approx(30.0)
+    assert RateCalculator.calculate_firing_rate([0.1, 0.3, 0.5, 0.6, 0.8, 1.0],
+                                                current_time=1.0, time_window=1.0) == 6.0
+    assert RateCalculator.moving_average([1.0, 5.0, 2.0, 4.0, 3.0], window_size=3) == \
+        pytest.approx([1.0, 3.0, 8 / 3, 11 / 3, 3.0])
+    series = RateCalculator.calculate_token_rate_series(
+        [(0.0, 10), (0.1, 12), (0.2, 15), (0.3, 14)], time_window=0.1)
+    assert [t for t, _ in series] == [0.1, 0.2, 0.3]
+    assert [r for _, r in series] == pytest.approx([20.0, 30.0, -10.0])
+
+
+def test_token_rate_series_matches_pointwise_rates(samples):
+    series = RateCalculator.calculate_token_rate_series(samples, time_window=0.2)
+    for i, (time, rate) in enumerate(series, start=1):
+        assert rate == pytest.approx(RateCalculator.calculate_token_rate(samples[:i + 1], 0.2))
+
+
+def test_collector_windows_are_backfilled_then_incremental():
+    collector = SimulationDataCollector()
+    place = SimpleNamespace(id='P1', tokens=0)
+    controller = SimpleNamespace(model=SimpleNamespace(places=[place]))
+    transition = SimpleNamespace(id='T1')
+
+    def step(i):
+        place.tokens = i * 2
+        collector.on_simulation_step(controller, i * 0.1)
+        if i % 3 == 0:
+            collector.on_transition_fired(transition, i * 0.1, {'consumed': {}, 'produced': {}})
+
+    for i in range(50):
+        step(i)
+    # Windows requested mid-run start from the stored history
+    assert collector.get_token_rate('P1', time_window=1.0) == pytest.approx(20.0)
+    times = collector.get_firing_times('T1').tolist()
+    assert collector.get_firing_rate('T1', current_time=4.9, time_window=1.0) == \
+        RateCalculator.calculate_firing_rate(times, 4.9, 1.0) == 4.0
+
+    for i in range(50, 100):
+        step(i)
+    times = collector.get_firing_times('T1').tolist()
+    assert collector.get_firing_rate('T1', 9.9, 1.0) == \
+        RateCalculator.calculate_firing_rate(times, 9.9, 1.0)
+    assert collector.get_place_window('P1', 1.0).max == 198
+    assert collector.get_place_stats('P1').mean == pytest.approx(99.0)
+
+    collector.clear()
+    assert collector.get_place_stats('P1') is None
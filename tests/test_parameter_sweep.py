@@ -0,0 +1,121 @@
+"""Tests for headless parameter sweeps and finite-difference sensitivities."""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pytest
+
+from shypn.data.canvas.document_model import DocumentModel
+from shypn.netobjs.place import Place
+from shypn.netobjs.transition import Transition
+from shypn.netobjs.arc import Arc
+from shypn.analyses.parameter_sweep import (
+    SweepOptions, apply_parameters, get_parameters, latin_hypercube, main,
+    parameter_grid, read_columns, run_sweep, sensitivity_analysis
+)
+
+
+OPTIONS = SweepOptions(duration=200.0, time_step=0.1, steady_state_window=20)
+
+
+def _steady_p1(vmax, km):
+    """P1 where michaelis_menten(P1, vmax, km) balances the constant back flow 0.5."""
+    return 0.5 * km / (vmax - 0.5)
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    """P1 -(T1: michaelis_menten(P1, vmax=1.0, km=5.0))-> P2 -(T2: 0.5)-> P1."""
+    document = DocumentModel()
+    p1, p2 = Place(100, 100, 'P1', 'P1'), Place(200, 100, 'P2', 'P2')
+    p1.initial_marking = p1.tokens = 20
+    document.places = [p1, p2]
+    t1 = Transition(150, 50, 'T1', 'T1')
+    t2 = Transition(150, 150, 'T2', 'T2')
+    t1.set_rate('michaelis_menten(P1, vmax=1.0, km=5.0)')
+    t2.set_rate(0.5)
+    document.transitions = [t1, t2]
+    document.arcs = [Arc(p1, t1, 'A1', 'A1'), Arc(t1, p2, 'A2', 'A2'),
+                     Arc(p2, t2, 'A3', 'A3'), Arc(t2, p1, 'A4', 'A4')]
+    path = tmp_path / 'mm.shy'
+    document.save_to_file(str(path))
+    return path
+
+
+def test_parameters_by_name(model_path):
+    document = DocumentModel.load_from_file(str(model_path))
+    apply_parameters(document, {'T1.vmax': 2.0, 'T2.rate': 0.25, 'P1.tokens': 8})
+
+    assert get_parameters(document, ['T1.vmax', 'T1.km', 'T2.rate', 'P1.tokens']) == \
+        {'T1.vmax': 2.0, 'T1.km': 5.0, 'T2.rate': 0.25, 'P1.tokens': 8.0}
+    assert document.transitions[0].properties['rate_function'] == 'michaelis_menten(P1, vmax=2.0, km=5.0)'
+    with pytest.raises(ValueError):
+        apply_parameters(document, {'T1.kcat': 1.0})
+    with pytest.raises(ValueError):
+        get_parameters(document, ['T1.rate'])  # Rate is a function
+
+
+def test_sampling():
+    assert parameter_grid({'a': [1, 2], 'b': [3, 4, 5]})[-1] == {'a': 2, 'b': 5}
+    assert len(parameter_grid({'a': [1, 2], 'b': [3, 4, 5]})) == 6
+
+    points = latin_hypercube({'a': (0, 10), 'b': (1, 1000)}, 20, seed=3, log_scale=['b'])
+    a = np.array([point['a'] for point in points])
+    b = np.array([point['b'] for point in points])
+    assert sorted(np.floor(a / 0.5).astype(int)) == list(range(20))  # One sample per stratum
+    assert sorted(np.floor(np.log10(b) / 0.15).astype(int)) == list(range(20))
+
+
+def test_sweep_reaches_analytic_steady_states(model_path, tmp_path):
+    points = parameter_grid({'T1.vmax': [1.0, 1.5], 'T1.km': [2.0, 5.0]})
+    result = run_sweep(model_path, points, OPTIONS, max_workers=1)
+
+    assert not result.failed and all(run.steady_state for run in result.runs)
+    for run in result.runs:
+        expected = _steady_p1(run.parameters['T1.vmax'], run.parameters['T1.km'])
+        assert run.observables['final.P1'] == pytest.approx(expected, rel=0.02)
+        assert run.observables['peak.P1'] == 20.0
+        assert run.time < OPTIONS.duration
+
+    columns = read_columns(result.save(tmp_path / 'sweep.npz'))
+    assert list(columns['T1.km']) == [2.0, 5.0, 2.0, 5.0]
+    assert columns['steady_state'].all() and len(columns['flux.T1']) == 4
+
+
+def test_sweep_in_process_pool(model_path):
+    points = [{'T1.vmax': 1.0}, {'T1.vmax': 1.5}]
+    serial = run_sweep(model_path, points, OPTIONS, max_workers=1)
+    parallel = run_sweep(model_path, points, OPTIONS, max_workers=2)
+
+    assert parallel.workers == 2
+    assert [run.observables for run in parallel.runs] == [run.observables for run in serial.runs]
+
+
+def test_central_difference_sensitivities(model_path):
+    result = sensitivity_analysis(model_path, ['T1.vmax', 'T1.km'], options=OPTIONS, max_workers=1)
+
+    assert len(result.runs) == 5 and not result.failed
+    by_key = {(s.parameter, s.observable): s for s in result.sensitivities}
+    assert by_key['T1.vmax', 'final.P1'].normalized == pytest.approx(-2.0, rel=0.1)
+    assert by_key['T1.km', 'final.P1'].normalized == pytest.approx(1.0, rel=0.1)
+    assert 'final.P1' in result.summary()
+
+    # At steady state T1 carries the constant back flow of T2, whatever vmax
+    assert by_key['T1.vmax', 'flux.T1'].normalized == pytest.approx(0.0, abs=0.02)
+    assert result.runs[0].observables['flux.T1'] == pytest.approx(0.5, rel=0.01)
+
+
+def test_cli(model_path, tmp_path, capsys):
+    output = tmp_path / 'sweep.csv'
+    status = main([str(model_path), '-p', 'T1.vmax=0.8:2', '-p', 'T1.km=2,5', '--lhs', '3',
+                   '--duration', '200', '--dt', '0.1', '-j', '1', '-q', '-o', str(output)])
+
+    assert status == 0
+    assert 'Ran 6 points of 2 parameters' in capsys.readouterr().out
+    assert len(read_columns(output)['final.P1']) == 6
+
+    assert main([str(model_path), '-p', 'T1.kcat=1,2', '-j', '1', '-o', str(output)]) == 1
@@ -0,0 +1,92 @@
+"""Tests for min/max-preserving (M4) decimation of plotted series."""
+
+import sys
+import os
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pytest
+
+from shypn.analyses.decimation import DecimationCache, M4Aggregate, m4_indices
+from shypn.analyses.data_collector import SimulationDataCollector
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.uniform(0.0, 100.0, 200_000))
+    y = rng.normal(size=x.size)
+    y[[1234, 98765, 150001]] = [50.0, -40.0, 75.0]  # isolated spikes
+    return x, y
+
+
+def brute_force_extremes(x, y, x_range, columns):
+    lo, hi = x_range
+    cols = np.clip(((x - lo) * columns / (hi - lo)).astype(int), 0, columns - 1)
+    return {c: (y[cols == c].min(), y[cols == c].max()) for c in np.unique(cols)}
+
+
+def test_every_column_keeps_its_extremes(series):
+    x, y = series
+    idx = m4_indices(x, y, (0.0, 100.0), 500)
+    assert len(idx) <= 4 * 500
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+
+    kept_cols = np.clip((x[idx] * 500 / 100.0).astype(int), 0, 499)
+    for col, (low, high) in brute_force_extremes(x, y, (0.0, 100.0), 500).items():
+        values = y[idx][kept_cols == col]
+        assert values.min() == low and values.max() == high
+    assert {50.0, -40.0, 75.0} <= set(y[idx])
+
+
+def test_incremental_updates_match_one_shot(series):
+    x, y = series
+    aggregate = M4Aggregate((0.0, 100.0), 300)
+    for end in (10, 5000, 5001, 120_000, len(x)):
+        assert aggregate.extends(x[:end], y[:end])
+        aggregate.update(x[:end], y[:end])
+    np.testing.assert_array_equal(aggregate.indices(), m4_indices(x, y, (0.0, 100.0), 300))
+
+
+def test_cache_reuses_aggregates_per_zoom_level(series):
+    x, y = series
+    cache = DecimationCache()
+    half = len(x) // 2
+    cache.decimate('T1', x[:half], y[:half], (0.0, 100.0), 400)
+    cache.decimate('T1', x, y, (0.0, 100.0), 400)          # same view: extended
+    zoomed_x, zoomed_y = cache.decimate('T1', x, y, (10.0, 20.0), 400)
+    assert len(cache._entries) == 2
+
+    # The zoomed line runs just past both edges of the view
+    assert zoomed_x[0] < 10.0 <= zoomed_x[1] and zoomed_x[-2] <= 20.0 < zoomed_x[-1]
+
+    # A series that is not an extension (e.g. after a reset) is rebuilt
+    reset_x, reset_y = x[:1000] + 0.5, y[:1000]
+    out_x, _ = cache.decimate('T1', reset_x, reset_y, (0.0, 100.0), 100)
+    assert out_x[0] == reset_x[0]
+
+    cache.discard('T1')
+    assert not cache._entries
+
+
+def test_short_series_are_returned_unchanged():
+    x = np.arange(10.0)
+    out_x, out_y = DecimationCache().decimate('P', x, x * 2, (0.0, 9.0), 100)
+    assert out_x is x
+
+
+def test_collector_downsampling_keeps_spikes():
+    collector = SimulationDataCollector(downsample_threshold=800)
+    place = SimpleNamespace(id='P1', tokens=0)
+    controller = SimpleNamespace(model=SimpleNamespace(places=[place]))
+    for step in range(5000):
+        place.tokens = 1000 if step == 3333 else step % 7
+        collector.on_simulation_step(controller, step * 0.01)
+
+    data = collector.get_place_data('P1')
+    assert len(data) <= 800
+    assert max(tokens for _, tokens in data) == 1000
+    assert data[-1][0] == pytest.approx(49.99)
@@ -0,0 +1,97 @@
+"""Tests for report snapshots of streamed simulation runs."""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.data.canvas.document_model import DocumentModel
+from shypn.netobjs.place import Place
+from shypn.netobjs.transition import Transition
+from shypn.netobjs.arc import Arc
+from shypn.engine.simulation.data_collector import DataCollector
+from shypn.engine.simulation.trajectory_store import list_trajectories
+from shypn.engine.simulation.analysis import SpeciesAnalyzer
+from shypn.ui.panels.report.document_report_data import DocumentReportData, SimulationSnapshot
+
+
+@pytest.fixture
+def model():
+    """P1 -(T1)-> P2 with P1 holding 100 tokens."""
+    model = DocumentModel()
+    p1, p2 = Place(100, 100, 'P1', 'P1'), Place(200, 100, 'P2', 'P2')
+    p1.tokens = 100
+    t1 = Transition(150, 100, 'T1', 'T1')
+    model.places, model.transitions = [p1, p2], [t1]
+    model.arcs = [Arc(p1, t1, 'A1', 'A1'), Arc(t1, p2, 'A2', 'A2')]
+    return model
+
+
+def _run(model, steps, collector):
+    p1, p2 = model.places
+    t1 = model.transitions[0]
+    collector.start_collection()
+    collector.record_state(0.0)
+    for step in range(1, steps + 1):
+        p1.tokens -= 1
+        p2.tokens += 1
+        t1.firing_count += 1
+        collector.record_state(step * 0.1)
+    collector.stop_collection()
+
+
+class _Controller:
+    def __init__(self, collector):
+        self.data_collector = collector
+        self.model = collector.model
+        self.time = 5.0
+
+
+def test_snapshot_covers_the_whole_streamed_run(model, tmp_path):
+    collector = DataCollector(model, trajectory_dir=str(tmp_path), chunk_rows=8, memory_rows=10)
+    _run(model, 50, collector)
+    assert len(collector.time_points) < 51 and collector.get_point_count() == 51
+
+    report = DocumentReportData()
+    report.capture_simulation_results(_Controller(collector))
+    data = report.last_simulation_data
+    assert data['metadata']['num_time_points'] == 51
+    assert '<b>Time Points:</b> 51' in report.get_summary()
+    assert '<b>Total Firings:</b> 50' in report.get_summary()
+
+    metrics = {m.place_id: m for m in
+               SpeciesAnalyzer(SimulationSnapshot(data, model)).analyze_all_species(5.0)}
+    assert metrics['P1'].initial_tokens == 100 and metrics['P1'].max_tokens == 100
+    assert metrics['P1'].final_tokens == 50
+
+
+def test_snapshot_without_trajectory_uses_captured_steps(model):
+    collector = DataCollector(model)
+    _run(model, 5, collector)
+
+    report = DocumentReportData()
+    report.capture_simulation_results(_Controller(collector))
+    snapshot = SimulationSnapshot(report.last_simulation_data, model)
+    assert snapshot.store is None
+    assert snapshot.get_place_series('P1')[1] == [100, 99, 98, 97, 96, 95]
+
+
+def test_captured_trajectory_is_not_pruned(model, tmp_path):
+    collector = DataCollector(model, trajectory_dir=str(tmp_path), max_trajectories=1)
+    _run(model, 5, collector)
+    report = DocumentReportData()
+    report.capture_simulation_results(_Controller(collector))
+    captured = collector.trajectory_path
+
+    _run(model, 5, collector)
+    assert set(list_trajectories(str(tmp_path))) == {captured, collector.trajectory_path}
+    assert SimulationSnapshot(report.last_simulation_data, model).store is not None
+
+    # Capturing the next run releases the previous one
+    report.capture_simulation_results(_Controller(collector))
+    second = collector.trajectory_path
+    _run(model, 5, collector)
+    assert len(list_trajectories(str(tmp_path))) == 2 and os.path.isdir(second)
@@ -0,0 +1,67 @@
+"""Tests for single-pass SBML formula translation and the expression cache."""
+
+import sys
+import os
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from shypn.engine import expression_compiler
+from shypn.engine.expression_compiler import compile_expression, rename_identifiers
+from shypn.engine.continuous_behavior import ContinuousBehavior
+from shypn.services.sbml_kinetics_service import SBMLKineticsIntegrationService
+
+
+def test_rename_whole_identifiers_only():
+    used = set()
+    result = rename_identifiers(
+        "cytosol * V10m * ADP * PEP / ((K10PEP + PEP) * (K10ADP + ADP))",
+        {"ADP": "P5", "PEP": "P8", "AD": "P1"},
+        used
+    )
+    assert result == "cytosol * V10m * P5 * P8 / ((K10PEP + P8) * (K10ADP + P5))"
+    assert used == {"ADP", "PEP"}
+
+
+def test_rename_is_not_chained():
+    """A species named like a place is not renamed a second time."""
+    result = rename_identifiers("k * P5 * X", {"X": "P5", "P5": "P9"})
+    assert result == "k * P9 * P5"
+
+
+def test_rename_keeps_attributes_and_formatting():
+    result = rename_identifiers("math.exp(-k*A)  +  A**2", {"A": "P1", "exp": "P2", "math": "P3"})
+    assert result == "P3.exp(-k*P1)  +  P1**2"
+
+
+def test_unparseable_formula_falls_back_to_token_pass():
+    result = rename_identifiers("k * A ^ 2 +", {"A": "P1", "k": "kf"})
+    assert result == "kf * P1 ^ 2 +"
+
+
+def test_translated_formula_is_precompiled():
+    translated = rename_identifiers("Vmax * S / (Km + S)", {"S": "P42"})
+    assert translated in expression_compiler._code_cache
+    assert compile_expression(translated) is compile_expression(translated)
+
+
+def test_service_translation_records_used_species_only():
+    service = SBMLKineticsIntegrationService()
+    service.species_to_place_map = {f"S{i}": f"P{i}" for i in range(500)}
+    used = set()
+    assert service._translate_formula_to_petri_net("k1 * S3 * S12", used) == "k1 * P3 * P12"
+    assert used == {"S3", "S12"}
+
+
+def test_continuous_rate_uses_compiled_expression():
+    transition = SimpleNamespace(
+        id="T1", name="T1", properties={"rate_function": "2 * P1 + t"},
+        kinetic_metadata=None
+    )
+    model = SimpleNamespace(places={}, arcs={})
+    behavior = ContinuousBehavior(transition, model)
+    places = {"P1": SimpleNamespace(tokens=3.0, name="P1")}
+
+    assert behavior.rate_function(places, 1.0) == 7.0
+    assert "2 * P1 + t" in expression_compiler._code_cache
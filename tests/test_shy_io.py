@@ -0,0 +1,155 @@
+"""Tests for compact, compressed and streaming .shy serialization.
+
+Covers the incremental JSON member reader, round-trips through every save
+mode, backward compatibility with indented files, and the memory-mapped
+columnar sidecar.
+"""
+
+import sys
+import os
+import io
+import json
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pytest
+
+from shypn.data.canvas import shy_io
+from shypn.data.canvas.document_model import DocumentModel
+
+
+def create_document():
+    """Small net: P1 → T1 → P2 with a marking and a weighted arc."""
+    doc = DocumentModel()
+    p1 = doc.create_place(100.0, 200.0, label="Input")
+    p1.set_tokens(3)
+    p1.initial_marking = 3
+    t1 = doc.create_transition(200.0, 200.0, label="Process")
+    p2 = doc.create_place(300.0, 250.0, label="Output {\"quoted\"} ünïcode")
+    doc.create_arc(p1, t1, weight=2)
+    doc.create_arc(t1, p2, weight=1)
+    doc.view_state = {"zoom": 1.5, "pan_x": -12.25, "pan_y": 40.0}
+    return doc
+
+
+def collect(text, chunk_size):
+    """Materialize iter_members output into a plain dict."""
+    result = {}
+    for key, value in shy_io.iter_members(io.StringIO(text), chunk_size=chunk_size):
+        result[key] = list(value) if key in shy_io.STREAMED_SECTIONS else value
+    return result
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 64, 1 << 20])
+def test_iter_members_matches_json_load(chunk_size):
+    """Streaming decode equals json.loads for any chunk boundary."""
+    data = create_document().to_dict()
+    data["numbers"] = [123456789, -0.000125, 1e300, True, None]
+    for text in (json.dumps(data), json.dumps(data, indent=2)):
+        assert collect(text, chunk_size) == json.loads(text)
+
+
+def test_unconsumed_sections_are_skipped():
+    """Members after a streamed section are still reached if it is not read."""
+    text = json.dumps({"places": [{"a": [1, 2]}, {"b": "]"}], "version": "2.0"})
+    keys = [key for key, _ in shy_io.iter_members(io.StringIO(text), chunk_size=4)]
+    assert keys == ["places", "version"]
+
+
+def test_invalid_document_raises():
+    """Non-object documents and truncated files raise ValueError."""
+    with pytest.raises(ValueError):
+        list(shy_io.iter_members(io.StringIO('[1, 2]')))
+    with pytest.raises(ValueError):
+        collect('{"places": [{"id": "P1"}', chunk_size=8)
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {'compact': False},
+    {'compact': True},
+    {'compression': 'gzip'},
+])
+def test_save_load_round_trip(tmp_path, options):
+    """Every save mode loads back to the same document."""
+    doc = create_document()
+    filepath = str(tmp_path / 'model.shy')
+
+    doc.save_to_file(filepath, **options)
+    loaded = DocumentModel.load_from_file(filepath)
+
+    original = doc.to_dict()
+    restored = loaded.to_dict()
+    for key in ('places', 'transitions', 'arcs', 'view_state'):
+        assert restored[key] == original[key]
+    assert loaded.arcs[0].source is loaded.places[0]
+    assert loaded.arcs[1].target is loaded.places[1]
+
+    if options.get('compression') == 'gzip':
+        assert shy_io.detect_compression(filepath) == 'gzip'
+
+
+def test_compact_is_default_for_large_documents(tmp_path):
+    """Small documents keep the indented format, large ones are compact."""
+    small = create_document()
+    small_path = str(tmp_path / 'small.shy')
+    small.save_to_file(small_path)
+    with open(small_path, encoding='utf-8') as f:
+        assert '\n  ' in f.read()
+
+    large = DocumentModel()
+    for i in range(DocumentModel.COMPACT_SAVE_THRESHOLD):
+        large.create_place(float(i), 0.0)
+    large_path = str(tmp_path / 'large.shy')
+    large.save_to_file(large_path)
+    with open(large_path, encoding='utf-8') as f:
+        assert '\n' not in f.read()
+
+
+def test_legacy_file_loads(tmp_path):
+    """Indented files written by json.dump load unchanged; arcs may come first."""
+    data = create_document().to_dict()
+    reordered = {"arcs": data["arcs"], **{k: v for k, v in data.items() if k != "arcs"}}
+    filepath = str(tmp_path / 'legacy.shy')
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(reordered, f, indent=2)
+
+    loaded = DocumentModel.load_from_file(filepath)
+
+    assert len(loaded.places) == 2
+    assert len(loaded.arcs) == 2
+    assert loaded.places[0].tokens == 3
+
+
+def test_columns_sidecar(tmp_path):
+    """The sidecar is memory-mapped and invalidated when the file changes."""
+    doc = create_document()
+    filepath = str(tmp_path / 'model.shy')
+
+    assert DocumentModel.load_columns(filepath) is None
+
+    doc.save_to_file(filepath, columns=True)
+    columns = DocumentModel.load_columns(filepath)
+
+    assert isinstance(columns.place_xy, np.memmap)
+    assert columns.place_ids.tolist() == ['P1', 'P2']
+    assert columns.place_xy.tolist() == [[100.0, 200.0], [300.0, 250.0]]
+    assert columns.place_marking.tolist() == [3.0, 0.0]
+    assert columns.transition_xy.tolist() == [[200.0, 200.0]]
+    # Places first, then transitions: T1 is node 2
+    assert columns.arc_source.tolist() == [0, 2]
+    assert columns.arc_target.tolist() == [2, 1]
+    assert columns.arc_weight.tolist() == [2.0, 1.0]
+
+    # Saving without columns removes the sidecar
+    doc.save_to_file(filepath)
+    assert DocumentModel.load_columns(filepath) is None
+    assert not os.path.exists(shy_io.columns_path(filepath))
+
+
+def test_unknown_compression_rejected(tmp_path):
+    """Unknown compression names raise ValueError."""
+    with pytest.raises(ValueError):
+        create_document().save_to_file(str(tmp_path / 'model.shy'), compression='lzma')
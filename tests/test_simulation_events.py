@@ -0,0 +1,116 @@
+"""Tests for typed controller event subscriptions and batched firing dispatch."""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import math
+
+import pytest
+
+from shypn.data.canvas.document_model import DocumentModel
+from shypn.netobjs.place import Place
+from shypn.netobjs.transition import Transition
+from shypn.netobjs.arc import Arc
+from shypn.analyses.data_collector import SimulationDataCollector
+from shypn.engine.simulation import controller as controller_module
+from shypn.engine.simulation.controller import SimulationController
+from shypn.engine.simulation.events import EventDispatcher, FiringBatch, SimulationEvent
+
+
+@pytest.fixture
+def controller():
+    """P1 -(continuous T1)-> P2 -(timed T2)-> P3."""
+    model = DocumentModel()
+    p1, p2, p3 = (Place(100 * i, 100, f'P{i}', f'P{i}') for i in (1, 2, 3))
+    p1.tokens = 50
+    model.places = [p1, p2, p3]
+
+    t1 = Transition(150, 100, 'T1', 'T1')
+    t1.transition_type = 'continuous'
+    t1.rate = 1.0
+    t2 = Transition(250, 100, 'T2', 'T2')
+    t2.transition_type = 'timed'
+    t2.rate = 0.2
+    model.transitions = [t1, t2]
+    model.arcs = [Arc(p1, t1, 'A1', 'A1'), Arc(t1, p2, 'A2', 'A2'),
+                  Arc(p2, t2, 'A3', 'A3'), Arc(t2, p3, 'A4', 'A4')]
+    return SimulationController(model)
+
+
+def test_firings_are_dispatched_once_per_step(controller):
+    steps, batches = [], []
+    controller.subscribe(SimulationEvent.STEP, lambda c, t: steps.append(t))
+    controller.subscribe('firing', lambda c, batch: batches.append((c.time, batch)))
+
+    for _ in range(20):
+        controller.step(0.1)
+
+    assert len(steps) == 20
+    assert 0 < len(batches) <= 20
+    for time, batch in batches:  # Firings carry the time before the step advanced
+        assert len(batch) > 0 and all(0.0 <= t < time for t in batch.times)
+    ids = [tid for _, batch in batches for tid in batch.transition_ids()]
+    assert 'T1' in ids and 'T2' in ids
+
+    for _, batch in batches:
+        for (transition, _, details), rate in zip(batch, batch.rates):
+            assert math.isnan(rate) == (transition.id == 'T2')
+
+
+def test_step_listener_with_collector_records_firings(controller):
+    collector = SimulationDataCollector()
+    controller.add_step_listener(collector.on_simulation_step)
+    controller.add_step_listener(collector.on_simulation_step)  # Ignored
+
+    for _ in range(20):
+        controller.step(0.1)
+
+    assert collector.step_count == 20
+    assert collector.get_firing_count('T1') > 0 and collector.get_firing_count('T2') > 0
+    assert collector.is_continuous('T1') and not collector.is_continuous('T2')
+
+    controller.remove_step_listener(collector.on_simulation_step)
+    assert not controller.events.has_subscribers(SimulationEvent.FIRING)
+    assert controller.step_listeners == []
+
+
+def test_failing_listener_does_not_stop_others(controller):
+    def failing(c, t):
+        raise RuntimeError('listener bug')
+
+    calls = []
+    controller.subscribe(SimulationEvent.STEP, failing)
+    controller.subscribe(SimulationEvent.STEP, lambda c, t: calls.append(t))
+    controller.step(0.1)
+    controller.step(0.1)
+
+    assert len(calls) == 2
+
+
+def test_completion_on_stop(controller, monkeypatch):
+    monkeypatch.setattr(controller_module, 'GLIB_AVAILABLE', False)
+    completed = []
+    controller.on_simulation_complete = lambda: completed.append('legacy')
+    controller.subscribe(SimulationEvent.COMPLETION, lambda c: completed.append(c.time))
+    controller.step(0.1)
+    controller._running = True  # As during run()
+    controller.stop()
+
+    assert completed == ['legacy', controller.time]
+
+
+def test_dispatcher_subscriptions():
+    dispatcher = EventDispatcher()
+    callback = dispatcher.subscribe(SimulationEvent.STEP, lambda *args: None)
+    dispatcher.subscribe('step', callback)
+
+    assert dispatcher.subscribers(SimulationEvent.STEP) == [callback]
+    assert dispatcher.dispatch(SimulationEvent.STEP, None, 0.0) == 1
+    assert dispatcher.dispatch(SimulationEvent.FIRING, None, FiringBatch()) == 0
+    assert dispatcher.unsubscribe('step', callback)
+    assert not dispatcher.unsubscribe('step', callback)
+    with pytest.raises(ValueError):
+        dispatcher.subscribe('tick', callback)
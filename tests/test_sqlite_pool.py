@@ -0,0 +1,205 @@
+"""Tests for the pooled SQLite connection layer.
+
+Covers per-thread connection reuse, cleanup after finished threads,
+WAL mode, transactions, batched writes, closing across threads,
+reference-counted shared pools, and its use by HeuristicDatabase,
+EnzymeKineticsAPI and PersistentECCache.
+"""
+
+import sys
+import os
+import sqlite3
+import threading
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.utils.sqlite_pool import SQLitePool, get_pool
+from shypn.crossfetch.database.heuristic_db import HeuristicDatabase
+from shypn.data.enzyme_kinetics_api import EnzymeKineticsAPI
+from shypn.data.kegg_ec_fetcher import PersistentECCache
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SQLitePool(str(tmp_path / 'test.db'))
+    pool.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield pool
+    pool.close()
+
+
+def test_connection_is_reused_per_thread(pool):
+    """Same thread gets the same connection; other threads get their own."""
+    assert pool.connection() is pool.connection()
+    assert pool.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not pool.connection()
+
+
+def test_connections_of_finished_threads_are_closed(pool):
+    """A new thread's connection closes those of threads that have ended."""
+    pool.connection()
+    opened = []
+    for _ in range(5):
+        thread = threading.Thread(target=lambda: opened.append(pool.connection()))
+        thread.start()
+        thread.join()
+
+    assert pool.open_connections == 2  # This thread and the last one
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened[0].execute("SELECT 1")
+    assert opened[-1].execute("SELECT 1").fetchone()[0] == 1
+
+
+def test_transaction_commits_and_rolls_back(pool):
+    """Errors roll back the whole block; nested blocks join the outer one."""
+    with pool.transaction() as conn:
+        conn.execute("INSERT INTO items (name) VALUES ('a')")
+        with pool.transaction() as inner:
+            assert inner is conn
+            inner.execute("INSERT INTO items (name) VALUES ('b')")
+
+    with pytest.raises(RuntimeError):
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('c')")
+            raise RuntimeError("abort")
+
+    names = [row[0] for row in pool.execute("SELECT name FROM items ORDER BY id")]
+    assert names == ['a', 'b']
+
+
+def test_executemany_returns_rowcount(pool):
+    """Batched writes report the number of modified rows."""
+    assert pool.executemany("INSERT INTO items (name) VALUES (?)", [('x',), ('y',), ('z',)]) == 3
+    assert pool.executemany("UPDATE items SET name = 'w' WHERE name = ?", [('x',), ('nope',)]) == 1
+
+
+def test_close_reconnects(pool):
+    """After close() the next call opens a fresh connection."""
+    first = pool.connection()
+    pool.close()
+    second = pool.connection()
+
+    assert second is not first
+    assert pool.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+
+def test_close_leaves_other_threads_transactions_alone(pool):
+    """close() on one thread never closes a connection another thread is using."""
+    in_transaction = threading.Event()
+    closed = threading.Event()
+    seen = []
+
+    def worker():
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+            in_transaction.set()
+            closed.wait(5)
+            # Stale but mid-transaction: still handed out
+            assert pool.connection() is conn
+            conn.execute("INSERT INTO items (name) VALUES ('b')")
+        seen.append(conn)
+        seen.append(pool.connection())
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    in_transaction.wait(5)
+    pool.close()
+    closed.set()
+    thread.join()
+
+    old, new = seen
+    assert new is not old
+    with pytest.raises(sqlite3.ProgrammingError):
+        old.execute("SELECT 1")
+    assert pool.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+
+
+def test_get_pool_is_shared(tmp_path):
+    """The same file and row factory map to one pool."""
+    path = str(tmp_path / 'shared.db')
+    assert get_pool(path) is get_pool(os.path.join(str(tmp_path), '.', 'shared.db'))
+    assert get_pool(path) is not get_pool(path, row_factory=sqlite3.Row)
+
+
+def test_release_closes_after_last_holder(tmp_path):
+    """One holder closing does not close the pool under the others."""
+    path = str(tmp_path / 'held.db')
+    first = HeuristicDatabase(path)
+    second = HeuristicDatabase(path)
+    pool = first._pool
+    conn = pool.connection()
+
+    first.close()
+    first.close()  # Idempotent: releases once
+    assert pool.connection() is conn
+    assert second.get_parameter(1) is None
+
+    second.close()
+    assert pool.open_connections == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+
+def test_heuristic_database_batches(tmp_path):
+    """Batch usage updates and cache writes land in one call each."""
+    db = HeuristicDatabase(str(tmp_path / 'heuristic.db'))
+    ids = [
+        db.store_parameter('continuous', 'Homo sapiens', {'vmax': float(i)}, 'Heuristic', 0.5)
+        for i in range(3)
+    ]
+
+    db.update_usage_many([ids[0], ids[0], ids[2]])
+    db.cache_queries([('k1', ids[0], [ids[1]], 0.9), ('k2', ids[2], [], 0.4)])
+
+    assert db.get_parameter(ids[0])['usage_count'] == 2
+    assert db.get_parameter(ids[1])['usage_count'] == 0
+    assert db.get_cached_query('k1')['alternatives'] == [ids[1]]
+    assert db.get_cached_query('k2')['recommended_parameter_id'] == ids[2]
+
+    inserted = db.insert_brenda_raw_data([
+        {'ec_number': '2.7.1.1', 'parameter_type': 'Km', 'value': 0.1, 'organism': 'Homo sapiens'},
+        {'ec_number': '2.7.1.1', 'parameter_type': 'Km', 'value': 0.1, 'organism': 'Homo sapiens'},
+    ])
+    assert inserted >= 1
+    db.close()
+
+
+def test_enzyme_kinetics_cache_round_trip(tmp_path):
+    """Kinetics cache reads back what it saved through the pool."""
+    api = EnzymeKineticsAPI(cache_dir=tmp_path, offline_mode=True)
+
+    api._save_to_cache('9.9.9.9', {'enzyme_name': 'Test', '_internal': 1}, 'test', 5)
+    cached = api._get_from_cache('9.9.9.9')
+
+    assert cached['enzyme_name'] == 'Test'
+    assert '_internal' not in cached
+    assert api.get_cache_stats()['total_entries'] == 1
+
+    api.clear_cache()
+    assert api._get_from_cache('9.9.9.9') is None
+
+
+def test_cache_holders_release_their_pool(tmp_path):
+    """EnzymeKineticsAPI and PersistentECCache close() release the shared pool."""
+    api = EnzymeKineticsAPI(cache_dir=tmp_path, offline_mode=True)
+    api._save_to_cache('9.9.9.9', {'enzyme_name': 'Test'}, 'test', 5)
+    api.close()
+    api.close()  # Idempotent: releases once
+    assert api._pool.open_connections == 0
+
+    cache = PersistentECCache(cache_file=tmp_path / 'ec.db')
+    cache.set('R00001', ['1.1.1.1'])
+    cache.close()
+    assert cache._pool.open_connections == 0
+
+    reopened = PersistentECCache(cache_file=tmp_path / 'ec.db')
+    assert reopened.get('R00001') == ['1.1.1.1']  # Saved by close()
+    reopened.close()
@@ -0,0 +1,123 @@
+"""Tests for online steady-state detection in the simulation controller."""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.data.canvas.document_model import DocumentModel
+from shypn.netobjs.place import Place
+from shypn.netobjs.transition import Transition
+from shypn.netobjs.arc import Arc
+from shypn.engine.simulation.controller import SimulationController
+from shypn.engine.simulation.steady_state import SteadyStateAction, SteadyStateDetector
+from shypn.utils.time_utils import TimeUnits
+from shypn.viability.knowledge.dto import SimulationResultDTO
+from shypn.viability.knowledge.knowledge_base import ModelKnowledgeBase
+
+
+@pytest.fixture
+def controller():
+    """P1 <-> P2 by mass action (T1: 1.0*P1, T2: 0.5*P2), relaxing to 10 / 20 tokens."""
+    model = DocumentModel()
+    p1, p2 = Place(100, 100, 'P1', 'P1'), Place(200, 100, 'P2', 'P2')
+    p1.tokens = 30
+    model.places = [p1, p2]
+    t1 = Transition(150, 50, 'T1', 'T1')
+    t2 = Transition(150, 150, 'T2', 'T2')
+    for transition, rate in ((t1, '1.0*P1'), (t2, '0.5*P2')):
+        transition.transition_type = 'continuous'
+        transition.rate = {'rate': rate}
+    model.transitions = [t1, t2]
+    model.arcs = [Arc(p1, t1, 'A1', 'A1'), Arc(t1, p2, 'A2', 'A2'),
+                  Arc(p2, t2, 'A3', 'A3'), Arc(t2, p1, 'A4', 'A4')]
+
+    controller = SimulationController(model)
+    controller.settings.set_duration(100.0, TimeUnits.SECONDS)
+    controller.steady_state.configure(window=10)
+    controller.steady_state.enabled = True
+    return controller
+
+
+def _run(controller, max_steps=1200):
+    steps = 0
+    while steps < max_steps and controller.step(0.1):
+        steps += 1
+    return steps
+
+
+def test_stop_at_steady_state(controller):
+    controller.steady_state.action = SteadyStateAction.STOP
+    steps = _run(controller)
+
+    detector = controller.steady_state
+    assert detector.reached and steps < 200
+    assert detector.time_to_steady_state == pytest.approx(controller.time)
+    p1, p2 = controller.model.places
+    assert p1.tokens + p2.tokens == pytest.approx(30.0)
+    assert p1.tokens == pytest.approx(0.5 * p2.tokens, rel=0.1)  # Euler bias at dt = 0.1
+
+
+def test_fast_forward_to_duration(controller):
+    controller.steady_state.action = SteadyStateAction.FAST_FORWARD
+    controller.data_collector.start_collection()
+    steps = _run(controller)
+
+    assert steps < 200 and controller.time == pytest.approx(100.0)
+    assert controller.steady_state.time_to_steady_state < 20.0
+    assert controller.data_collector.time_points[-1] == pytest.approx(100.0)
+
+
+def test_report_keeps_running(controller):
+    steps = _run(controller)
+
+    assert steps >= 999 and controller.steady_state.reached
+    assert controller.steady_state.time_to_steady_state < 20.0
+
+    controller.reset()
+    assert not controller.steady_state.reached
+    assert controller.steady_state.time_to_steady_state is None
+
+
+def test_disabled_detector_is_not_fed(controller):
+    controller.steady_state.enabled = False
+    controller.steady_state.action = SteadyStateAction.STOP
+    _run(controller, max_steps=200)
+
+    assert controller.time == pytest.approx(20.0)
+    assert controller.steady_state.get_stats()['marking_change'] != controller.steady_state.get_stats()['marking_change']
+
+
+def test_oscillating_marking_is_not_steady():
+    class Node:
+        def __init__(self, id):
+            self.id = id
+            self.tokens = 0
+
+    places, transitions = [Node('P1'), Node('P2')], []
+    detector = SteadyStateDetector(window=8)
+    for step in range(40):
+        places[0].tokens, places[1].tokens = step % 2, 1 - step % 2
+        assert not detector.update(step * 0.1, places, transitions)
+    assert detector.marking_change > detector.rtol
+
+    with pytest.raises(ValueError):
+        detector.configure(window=2)
+    with pytest.raises(ValueError):
+        detector.configure(tolerance=0.1)
+
+
+def test_steady_state_reaches_knowledge_base(controller):
+    controller.steady_state.action = SteadyStateAction.STOP
+    _run(controller)
+
+    dto = SimulationResultDTO.from_data_collector(controller.data_collector, controller.steady_state)
+    assert dto.reached_steady_state and dto.time_to_steady_state == controller.steady_state.time_to_steady_state
+
+    kb = ModelKnowledgeBase()
+    kb.add_simulation_from_dto(dto)
+    assert kb.simulation_traces[-1].reached_steady_state
+    assert kb.simulation_traces[-1].time_to_steady_state == dto.time_to_steady_state
@@ -0,0 +1,97 @@
+"""Tests for per-phase step timers, counters and profiler captures."""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from shypn.data.canvas.document_model import DocumentModel
+from shypn.netobjs.place import Place
+from shypn.netobjs.transition import Transition
+from shypn.netobjs.arc import Arc
+from shypn.engine.simulation.controller import SimulationController
+from shypn.engine.simulation.profiling import COUNTERS, PHASES, StepProfiler
+
+
+@pytest.fixture
+def controller():
+    """P1 -(continuous T1)-> P2 -(timed T2)-> P3, with a step listener."""
+    model = DocumentModel()
+    p1, p2, p3 = (Place(100 * i, 100, f'P{i}', f'P{i}') for i in (1, 2, 3))
+    p1.tokens = 50
+    model.places = [p1, p2, p3]
+
+    t1 = Transition(150, 100, 'T1', 'T1')
+    t1.transition_type = 'continuous'
+    t1.rate = 1.0
+    t2 = Transition(250, 100, 'T2', 'T2')
+    t2.transition_type = 'timed'
+    t2.rate = 0.2  # Fires 0.2 time units after enablement
+    model.transitions = [t1, t2]
+    model.arcs = [Arc(p1, t1, 'A1', 'A1'), Arc(t1, p2, 'A2', 'A2'),
+                  Arc(p2, t2, 'A3', 'A3'), Arc(t2, p3, 'A4', 'A4')]
+
+    controller = SimulationController(model)
+    controller.add_step_listener(lambda c, t: None)
+    return controller
+
+
+def test_disabled_profiler_collects_nothing(controller):
+    for _ in range(10):
+        controller.step(0.1)
+    stats = controller.profiler.get_stats()
+    assert stats['steps'] == 0
+    assert all(timing['total'] == 0.0 for timing in stats['phases'].values())
+    assert all(count == 0 for count in stats['counters'].values())
+
+
+def test_phase_timers_and_counters(controller):
+    profiler = controller.profiler
+    profiler.enabled = True
+    for _ in range(20):
+        controller.step(0.1)
+
+    stats = profiler.get_stats()
+    assert stats['steps'] == 20 and stats['step_rate'] > 0
+    assert set(stats['phases']) == set(PHASES) and set(stats['counters']) == set(COUNTERS)
+    assert sum(t['total'] for t in stats['phases'].values()) <= stats['step_time']
+    assert stats['phases']['continuous']['total'] > 0
+
+    counters = stats['counters']
+    assert counters['rate_evaluations'] == 20      # T1 integrates every step
+    assert counters['listener_calls'] == 20
+    assert counters['firings'] == controller.model.places[2].tokens > 0  # One token per T2 firing
+    assert counters['enablement_checks'] >= 20 * 2
+    assert 'rate_evaluations' in profiler.format_stats()
+
+    controller.reset()
+    assert profiler.get_stats()['steps'] == 0
+
+
+def test_capture_covers_bounded_step_range(controller, tmp_path):
+    profiler = controller.profiler
+    output = tmp_path / 'steps.prof'
+    profiler.capture(steps=5, skip=3, output=str(output))
+    for _ in range(7):
+        controller.step(0.1)
+        assert profiler.last_capture is None
+    assert profiler.capture_pending
+
+    controller.step(0.1)  # 3 skipped + 5 profiled
+    assert not profiler.capture_pending and output.exists()
+    stats = profiler.last_capture
+    step_calls = [calls for (_, _, name), (_, calls, *_) in stats.stats.items() if name == '_step']
+    assert step_calls == [5]
+    assert '_step' in profiler.capture_report(limit=10)
+
+
+def test_capture_rejects_bad_arguments():
+    profiler = StepProfiler()
+    with pytest.raises(ValueError):
+        profiler.capture(steps=0)
+    with pytest.raises(ValueError):
+        profiler.capture(steps=10, engine='perf')
+    assert profiler.capture_report() == ''
@@ -0,0 +1,237 @@
+"""Tests for the shared Sugiyama layered layout pipeline.
+
+Covers network simplex layering (including its incremental pivots),
+crossing counting, crossing reduction (and its work limit),
+Brandes-Köpf coordinates, and the import-time pathway layout that uses
+the same pipeline as the edit-time hierarchical layout.
+"""
+
+import sys
+import os
+import random
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import networkx as nx
+
+from shypn.layout import sugiyama
+from shypn.layout.sugiyama import SugiyamaLayout, count_crossings, group_by_layer, _NetworkSimplex
+from shypn.data.pathway.pathway_data import PathwayData, Species, Reaction
+from shypn.data.pathway.hierarchical_layout import HierarchicalLayoutProcessor
+from shypn.data.pathway.pathway_postprocessor import PathwayPostProcessor
+
+
+def random_dag(n, m, seed):
+    """Random DAG with n nodes and about m edges (edges point to higher ids)."""
+    rng = random.Random(seed)
+    edges = set()
+    while len(edges) < m:
+        u, v = sorted(rng.sample(range(n), 2))
+        edges.add((u, v))
+    return list(range(n)), sorted(edges)
+
+
+def test_layers_respect_edges_and_are_tight():
+    """Every edge points down at least one layer; total edge length is optimal."""
+    nodes, edges = random_dag(30, 50, seed=1)
+    layers = SugiyamaLayout().assign_layers(nodes, edges)
+
+    assert min(layers.values()) == 0
+    for u, v in edges:
+        assert layers[v] >= layers[u] + 1
+
+    # Network simplex never does worse than longest-path layering
+    dag = nx.DiGraph(edges)
+    longest = {}
+    for node in nx.topological_sort(dag):
+        longest[node] = max((longest[u] + 1 for u in dag.predecessors(node)), default=0)
+    simplex_length = sum(layers[v] - layers[u] for u, v in edges)
+    longest_length = sum(longest[v] - longest[u] for u, v in edges)
+    assert simplex_length <= longest_length
+
+
+def _simplex(n, m, seed):
+    """Network simplex on the largest component of a random weighted DAG."""
+    nodes, edges = random_dag(n, m, seed)
+    component = max(nx.weakly_connected_components(nx.DiGraph(edges)), key=len)
+    edges = [(u, v) for u, v in edges if u in component]
+    rng = random.Random(seed)
+    weights = {edge: rng.choice([0.5, 1.0, 2.0]) for edge in edges}
+    successors = [[] for _ in nodes]
+    predecessors = [[] for _ in nodes]
+    for u, v in edges:
+        successors[u].append(v)
+        predecessors[v].append(u)
+    return _NetworkSimplex(sorted(component), successors, predecessors, weights, [0] * n), weights
+
+
+def test_incremental_cut_values_prove_optimality():
+    """Cut values kept up to date by the pivots match a full recomputation, all >= 0."""
+    for seed in range(5):
+        simplex, weights = _simplex(200, 400, seed)
+        simplex.run()
+        incremental = dict(simplex.cut_value)
+
+        simplex._dfs_range(simplex.nodes[0], None, 1)
+        simplex._init_cut_values()
+        assert incremental.keys() == simplex.cut_value.keys()
+        for edge, value in simplex.cut_value.items():
+            assert abs(incremental[edge] - value) < 1e-6
+            assert value > -1e-6  # No improving pivot left
+        assert all(simplex.rank[v] - simplex.rank[u] >= 1 for u, v in weights)
+
+
+def test_work_limit_keeps_a_feasible_ranking(monkeypatch):
+    """Large graphs stop pivoting early and keep an improved feasible ranking."""
+    optimal, weights = _simplex(600, 1000, 3)
+    optimal.run()
+    monkeypatch.setattr(_NetworkSimplex, 'WORK_LIMIT', 3000)
+    limited, _ = _simplex(600, 1000, 3)
+    limited.run()
+
+    def length(simplex):
+        return sum(w * (simplex.rank[v] - simplex.rank[u]) for (u, v), w in weights.items())
+
+    assert limited.work < optimal.work
+    assert all(limited.rank[v] - limited.rank[u] >= 1 for u, v in weights)
+    assert length(optimal) <= length(limited)
+
+
+def test_cycles_are_broken():
+    """Cyclic graphs still get a valid layering; feedback edges are reported."""
+    nodes = ['A', 'B', 'C']
+    edges = [('A', 'B'), ('B', 'C'), ('C', 'A')]
+    layout = SugiyamaLayout()
+
+    layers = layout.assign_layers(nodes, edges)
+    feedback = layout.feedback_edges(nodes, edges)
+
+    assert len(feedback) == 1
+    assert sorted(layers.values()) == [0, 1, 2]
+
+
+def test_count_crossings():
+    """Two edges between swapped endpoints cross once."""
+    assert count_crossings([['a', 'b'], ['c', 'd']], [('a', 'd'), ('b', 'c')]) == 1
+    assert count_crossings([['a', 'b'], ['c', 'd']], [('a', 'c'), ('b', 'd')]) == 0
+
+
+def test_tree_has_no_crossings():
+    """Ordering sweeps untangle a shuffled tree completely."""
+    tree = nx.bfs_tree(nx.balanced_tree(3, 3), 0)
+    nodes = list(tree.nodes())
+    random.Random(4).shuffle(nodes)
+
+    layout = SugiyamaLayout()
+    layers = layout.assign_layers(nodes, tree.edges())
+    groups = group_by_layer(nodes, layers)
+    ordered = layout.order_layers(groups, tree.edges())
+
+    assert count_crossings(ordered, tree.edges()) == 0
+
+
+def test_sweeps_reduce_crossings():
+    """Ordered layers never have more crossings than the input order."""
+    nodes, edges = random_dag(40, 70, seed=7)
+    layout = SugiyamaLayout()
+    layers = layout.assign_layers(nodes, edges)
+    groups = group_by_layer(nodes, layers)
+
+    ordered = layout.order_layers(groups, edges)
+
+    assert sorted(map(sorted, ordered)) == sorted(map(sorted, groups))
+    assert count_crossings(ordered, edges) <= count_crossings(groups, edges)
+
+
+def test_ordering_work_limit_bounds_sweeps(monkeypatch):
+    """Large graphs stop sweeping early and keep the best order so far."""
+    nodes, edges = random_dag(200, 400, seed=11)
+    layout = SugiyamaLayout(patience=100)
+    layers = layout.assign_layers(nodes, edges)
+    groups = group_by_layer(nodes, layers)
+
+    sweeps = []
+    sweep = sugiyama._LayeredGraph.sweep
+    monkeypatch.setattr(sugiyama._LayeredGraph, 'sweep',
+                        lambda graph, downward: sweeps.append(downward) or sweep(graph, downward))
+    layout.order_layers(groups, edges)
+    unlimited = len(sweeps)
+
+    sweeps.clear()
+    monkeypatch.setattr(SugiyamaLayout, 'ORDERING_WORK_LIMIT', 1)
+    ordered = layout.order_layers(groups, edges)
+
+    assert unlimited > 0 and sweeps == []
+    assert ordered == groups  # No budget for a single sweep: input order kept
+
+
+def test_coordinates_are_straight_and_balanced():
+    """A chain is vertical; a diamond splits symmetrically around its spine."""
+    layout = SugiyamaLayout(layer_spacing=150, node_spacing=100)
+
+    chain = layout.compute(['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'C'), ('C', 'D')])
+    assert {x for x, _ in chain.values()} == {0.0}
+    assert [chain[n][1] for n in 'ABCD'] == [0, 150, 300, 450]
+
+    diamond = layout.compute(['A', 'B', 'C', 'D'],
+                             [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')])
+    assert diamond['A'][0] == diamond['D'][0] == 0.0
+    assert sorted([diamond['B'][0], diamond['C'][0]]) == [-50.0, 50.0]
+
+
+def test_nodes_in_a_layer_do_not_overlap():
+    """Nodes sharing a layer are at least node_spacing apart."""
+    nodes, edges = random_dag(60, 90, seed=11)
+    positions = SugiyamaLayout(node_spacing=80).compute(nodes, edges)
+
+    by_y = {}
+    for x, y in positions.values():
+        by_y.setdefault(y, []).append(x)
+    for xs in by_y.values():
+        xs.sort()
+        assert all(b - a >= 80 - 1e-6 for a, b in zip(xs, xs[1:]))
+
+
+def create_branched_pathway():
+    """A → R1 → B, B → R2 → C, B → R3 → D, with enzyme E on R1."""
+    species = [Species(id=s, name=s) for s in ['A', 'B', 'C', 'D', 'E']]
+    reactions = [
+        Reaction(id='R1', name='R1', reactants=[('A', 1.0)], products=[('B', 1.0)], modifiers=['E']),
+        Reaction(id='R2', name='R2', reactants=[('B', 1.0)], products=[('C', 1.0)]),
+        Reaction(id='R3', name='R3', reactants=[('B', 1.0)], products=[('D', 1.0)]),
+    ]
+    return PathwayData(species=species, reactions=reactions, compartments={}, metadata={'name': 'branched'})
+
+
+def test_pathway_layout_places_reactions_between_species():
+    """Reactions sit halfway between their substrate and product layers."""
+    positions = HierarchicalLayoutProcessor(create_branched_pathway()).calculate_hierarchical_layout()
+
+    assert set(positions) == {'A', 'B', 'C', 'D', 'E', 'R1', 'R2', 'R3'}
+    assert positions['A'][1] < positions['R1'][1] < positions['B'][1]
+    assert positions['B'][1] - positions['A'][1] == 150.0
+    assert positions['C'][1] == positions['D'][1]
+    assert positions['C'][0] != positions['D'][0]
+
+
+def test_import_applies_hierarchical_layout():
+    """Post-processing lays out imported pathways unless disabled."""
+    pathway = create_branched_pathway()
+
+    processed = PathwayPostProcessor().process(pathway)
+    assert processed.metadata['layout_type'] == 'hierarchical'
+    assert processed.positions['A'][1] < processed.positions['C'][1]
+
+    placeholder = PathwayPostProcessor(apply_layout=False).process(pathway)
+    assert placeholder.metadata['layout_type'] == 'arbitrary'
+
+
+def test_large_import_skips_hierarchical_layout(monkeypatch):
+    """Pathways above MAX_LAYOUT_ELEMENTS get placeholder positions."""
+    monkeypatch.setattr(PathwayPostProcessor, 'MAX_LAYOUT_ELEMENTS', 5)
+
+    processed = PathwayPostProcessor().process(create_branched_pathway())
+
+    assert processed.metadata['layout_type'] == 'arbitrary'
+    assert {'A', 'R1'} <= set(processed.positions)
@@ -0,0 +1,176 @@
+"""Tests for the chunked on-disk trajectory store and streaming data collection."""
+
+import sys
+import os
+import logging
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pytest
+
+from shypn.data.canvas.document_model import DocumentModel
+from shypn.data.project_models import Project
+from shypn.netobjs.place import Place
+from shypn.netobjs.transition import Transition
+from shypn.netobjs.arc import Arc
+from shypn.engine.simulation.data_collector import DataCollector
+from shypn.engine.simulation.trajectory_store import (
+    TrajectoryStore, TrajectoryWriter, list_trajectories, new_trajectory_path,
+    pin_trajectory, unpin_trajectory
+)
+from shypn.viability.knowledge.dto import SimulationResultDTO
+
+
+def _write(path, rows, chunk_rows):
+    with TrajectoryWriter(path, ['P1', 'P2'], ['T1'], chunk_rows=chunk_rows,
+                          metadata={'model': 'test'}) as writer:
+        for i in range(rows):
+            writer.append(i * 0.5, [i, 2 * i], [i // 3])
+    return writer
+
+
+def test_round_trip_across_chunks(tmp_path):
+    path = str(tmp_path / 'run.traj')
+    _write(path, 25, chunk_rows=10)
+
+    store = TrajectoryStore(path)
+    assert len(store) == 25 and store.complete and store.metadata == {'model': 'test'}
+    assert sorted(os.listdir(path)).count('markings_000002.npy') == 1  # Partial last chunk
+    times, tokens = store.place_series('P2')
+    assert np.array_equal(times, np.arange(25) * 0.5)
+    assert np.array_equal(tokens, 2.0 * np.arange(25))
+    assert np.array_equal(store.transition_series('T1', 8, 13)[1], np.arange(8, 13) // 3)
+    assert store.marking(-1) == {'P1': 24.0, 'P2': 48.0}
+    assert store.rows_between(2.0, 4.0) == (4, 9)
+
+    chunks = list(store.iter_chunks())
+    assert [len(times) for times, _, _ in chunks] == [10, 10, 5]
+    assert isinstance(chunks[0][1], np.memmap) and chunks[0][1].shape == (2, 10)
+    with pytest.raises(KeyError):
+        store.place_series('P3')
+    with pytest.raises(FileExistsError):
+        TrajectoryWriter(path, ['P1'], [])
+
+
+def test_readable_while_writing(tmp_path):
+    path = str(tmp_path / 'run.traj')
+    writer = TrajectoryWriter(path, ['P1'], ['T1'], chunk_rows=4)
+    for i in range(6):
+        writer.append(float(i), [i], [0])
+
+    partial = TrajectoryStore(path)  # What an interrupted run leaves behind
+    assert not partial.complete and len(partial) == 4
+    assert np.array_equal(writer.place_series('P1')[1], np.arange(6.0))  # Includes the buffer
+
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.append(6.0, [6], [0])
+    assert TrajectoryStore(path).complete and len(TrajectoryStore(path)) == 6
+
+
+def test_listing_and_paths(tmp_path):
+    project = Project(name='Demo', base_path=str(tmp_path))
+    assert project.list_simulations() == []
+
+    directory = project.get_simulations_dir()
+    os.makedirs(directory)
+    first = new_trajectory_path(directory, 'run')
+    _write(first, 3, chunk_rows=2)
+    second = new_trajectory_path(directory, 'run')
+    assert second.endswith('run_2.traj')
+    _write(second, 3, chunk_rows=2)
+    os.makedirs(os.path.join(directory, 'stray.traj'))  # No manifest
+
+    assert project.list_simulations() == list_trajectories(directory) == [first, second]
+
+
+@pytest.fixture
+def model():
+    """P1 -(T1)-> P2 with P1 holding 1000 tokens."""
+    model = DocumentModel()
+    p1, p2 = Place(100, 100, 'P1', 'P1'), Place(200, 100, 'P2', 'P2')
+    p1.tokens = 1000
+    t1 = Transition(150, 100, 'T1', 'T1')
+    model.places, model.transitions = [p1, p2], [t1]
+    model.arcs = [Arc(p1, t1, 'A1', 'A1'), Arc(t1, p2, 'A2', 'A2')]
+    return model
+
+
+def _fire(model, steps, collector):
+    p1, p2 = model.places
+    t1 = model.transitions[0]
+    t1.firing_count = 0
+    collector.start_collection()
+    collector.record_state(0.0)
+    for step in range(1, steps + 1):
+        p1.tokens -= 1
+        p2.tokens += 1
+        t1.firing_count += 1
+        collector.record_state(step * 0.1)
+    collector.stop_collection()
+
+
+def test_collector_streams_with_bounded_memory(model, tmp_path):
+    collector = DataCollector(model, trajectory_dir=str(tmp_path), chunk_rows=64, memory_rows=50)
+    _fire(model, 500, collector)
+
+    assert len(collector.time_points) < 100  # Only recent steps in memory
+    assert collector.time_points[-1] == pytest.approx(50.0)
+    times, tokens = collector.get_place_series('P1')
+    assert len(times) == 501 and tokens[0] == 1000 and tokens[-1] == 500
+    assert collector.get_transition_series('T1')[1][-1] == 500
+
+    store = TrajectoryStore(collector.trajectory_path)
+    assert store.complete and len(store) == 501
+    assert SimulationResultDTO.from_data_collector(collector).initial_marking['P1'] == 1000
+
+    # Settings carry over to the collector the controller recreates
+    again = DataCollector(model, **collector.streaming_options())
+    _fire(model, 10, again)
+    assert again.trajectory_path != collector.trajectory_path
+    assert len(list_trajectories(str(tmp_path))) == 2
+
+
+def test_trajectories_are_kept_by_default(model, tmp_path):
+    collector = DataCollector(model, trajectory_dir=str(tmp_path))
+    for _ in range(4):
+        _fire(model, 3, collector)
+
+    assert collector.max_trajectories is None
+    assert len(list_trajectories(str(tmp_path))) == 4
+
+
+def test_old_trajectories_are_pruned(model, tmp_path, caplog):
+    collector = DataCollector(model, trajectory_dir=str(tmp_path), max_trajectories=3)
+    caplog.set_level(logging.INFO)
+    owner = type('Owner', (), {})()
+    paths = []
+    for run in range(5):
+        _fire(model, 3, collector)
+        paths.append(collector.trajectory_path)
+        os.utime(paths[-1], (run, run))  # Distinct mtimes on coarse clocks
+        if run == 0:
+            pin_trajectory(paths[0], owner)
+
+    # The pinned first run survives and does not count against the limit
+    assert list_trajectories(str(tmp_path)) == [paths[0]] + paths[-3:]
+    assert 'Deleting 1 old trajectories' in caplog.text
+
+    unpin_trajectory(paths[0], owner)
+    _fire(model, 3, collector)
+    assert len(list_trajectories(str(tmp_path))) == 3
+    assert DataCollector(model, **collector.streaming_options()).max_trajectories == 3
+    with pytest.raises(ValueError):
+        collector.stream_to(str(tmp_path), max_trajectories=0)
+
+
+def test_collector_without_streaming_is_unchanged(model):
+    collector = DataCollector(model)
+    _fire(model, 20, collector)
+
+    assert collector.trajectory_path is None
+    assert collector.get_place_series('P2') == (collector.time_points, list(range(0, 21)))
+    with pytest.raises(ValueError):
+        collector.stream_to('/tmp', memory_rows=0)
@@ -0,0 +1,94 @@
+"""Tests for incremental rule evaluation in the viability observer."""
+import pytest
+from shypn.ui.panels.viability.viability_observer import (
+    ViabilityObserver, ObservationRule
+)
+
+
+def counting_rule(rule_id, reads, category='kinetic', key='value'):
+    """Rule reporting simulation_state[key]; counts its evaluations."""
+    calls = []
+
+    def action(knowledge):
+        calls.append(1)
+        value = knowledge['simulation_state'].get(key)
+        return [f"{rule_id}:{value}"] if value is not None else []
+
+    rule = ObservationRule(
+        rule_id=rule_id,
+        category=category,
+        condition=lambda knowledge: True,
+        action=action,
+        reads=reads
+    )
+    return rule, calls
+
+
+@pytest.fixture
+def observer():
+    observer = ViabilityObserver(max_events=5, debounce_interval=3600)
+    observer.rules.clear()
+    return observer
+
+
+def test_only_rules_reading_changed_keys_are_reevaluated(observer):
+    rule_a, calls_a = counting_rule('a', frozenset({'simulation_state.value'}))
+    rule_b, calls_b = counting_rule('b', frozenset({'topology_state.siphons'}), category='structural')
+    observer.add_rule(rule_a)
+    observer.add_rule(rule_b)
+
+    observer.record_event('simulation_complete', {'simulation_data': {'value': 1}})
+    assert (len(calls_a), len(calls_b)) == (1, 1)  # both new, both evaluated
+
+    observer.record_event('simulation_complete', {'simulation_data': {'value': 2}})
+    observer.record_event('kb_updated', {'siphons': []})
+    assert (len(calls_a), len(calls_b)) == (2, 2)
+
+    # Unchanged values re-run nothing; outputs stay memoized
+    observer.record_event('simulation_complete', {'simulation_data': {'value': 2}})
+    assert (len(calls_a), len(calls_b)) == (2, 2)
+    assert observer.get_current_suggestions('kinetic') == ['a:2']
+
+
+def test_rules_without_declared_reads_always_run(observer):
+    rule, calls = counting_rule('any', None)
+    observer.add_rule(rule)
+    observer.record_event('kb_updated', {'siphons': [1]})
+    observer.record_event('kb_updated', {'siphons': [2]})
+    assert len(calls) == 2
+
+
+def test_subscribers_are_notified_on_change_only(observer):
+    rule, _ = counting_rule('a', frozenset({'simulation_state'}))
+    observer.add_rule(rule)
+    received = []
+    observer.subscribe('kinetic', received.append)
+
+    observer.record_event('simulation_complete', {'simulation_data': {'value': 1}})
+    observer.record_event('simulation_complete', {'simulation_data': {'other': 5}})
+    observer.record_event('simulation_complete', {'simulation_data': {'value': None}})
+    assert received == [['a:1'], []]
+
+
+def test_high_frequency_events_are_debounced(observer):
+    rule, calls = counting_rule('a', frozenset({'simulation_state.value'}))
+    observer.add_rule(rule)
+    observer.flush()
+    assert len(calls) == 1  # new rule evaluated once (no output yet)
+    runs = observer.stats['rule_runs']
+
+    for step in range(100):
+        observer.record_event('simulation_step', {'value': step})
+    assert observer.stats['rule_runs'] == runs
+    assert observer.stats['deferred'] == 100
+
+    # The pending evaluation sees the latest state
+    assert observer.get_current_suggestions('kinetic') == ['a:99']
+    assert observer.stats['rule_runs'] == runs + 1
+
+
+def test_event_history_is_bounded(observer):
+    for step in range(20):
+        observer.record_event('simulation_step', {'time': step})
+    assert len(observer.events) == 5
+    assert observer.events[-1].data == {'time': 19}